@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark: SalesBot construction time and resident memory per session.
+
+Compares the shared mode (frozen config bundle cache + ComponentRegistry
+engines reused by every session) with the baseline where every session
+re-parses YAML and builds its own classifier engine, dialogue policy and
+fallback tables.
+
+Each session touches the lazily-built classifier engine, the same way the
+first classify() call of a real conversation does. from_snapshot restore is
+measured separately. The LLM is a MagicMock, so no network is needed (TEI
+failures on the first KB load only fall back to keyword retrieval).
+
+Usage:
+    python scripts/benchmark_bot_construction.py
+    python scripts/benchmark_bot_construction.py --sessions 50 --mode shared
+"""
+
+import argparse
+import gc
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Dict, List
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.bot import SalesBot  # noqa: E402
+from src.component_registry import get_component_registry  # noqa: E402
+from src.config_loader import clear_config_bundle_cache  # noqa: E402
+
+
+def _set_mode(mode: str) -> None:
+    registry = get_component_registry()
+    registry.clear()
+    registry.enabled = mode == "shared"
+    clear_config_bundle_cache()
+
+
+def _new_session(llm, mode: str) -> SalesBot:
+    if mode == "baseline":
+        clear_config_bundle_cache()
+    bot = SalesBot(llm=llm)
+    _ = bot.classifier.hybrid
+    return bot
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run(mode: str, sessions: int) -> Dict[str, float]:
+    llm = MagicMock()
+    _set_mode(mode)
+    # Warm-up: first KB load, module imports and (in shared mode) the engines.
+    _new_session(llm, mode)
+
+    construct_ms: List[float] = []
+    for _ in range(sessions):
+        started = time.perf_counter()
+        _new_session(llm, mode)
+        construct_ms.append((time.perf_counter() - started) * 1000)
+
+    snapshot = _new_session(llm, mode).to_snapshot()
+    restore_ms: List[float] = []
+    for _ in range(sessions):
+        if mode == "baseline":
+            clear_config_bundle_cache()
+        started = time.perf_counter()
+        SalesBot.from_snapshot(snapshot, llm=llm)
+        restore_ms.append((time.perf_counter() - started) * 1000)
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    bots = [_new_session(llm, mode) for _ in range(sessions)]
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    grown = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del bots
+
+    return {
+        "construct_avg_ms": statistics.mean(construct_ms),
+        "construct_p95_ms": _percentile(construct_ms, 95),
+        "restore_avg_ms": statistics.mean(restore_ms),
+        "restore_p95_ms": _percentile(restore_ms, 95),
+        "memory_per_session_kb": grown / sessions / 1024,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--mode", choices=["both", "shared", "baseline"], default="both")
+    args = parser.parse_args()
+
+    modes = ["baseline", "shared"] if args.mode == "both" else [args.mode]
+    results = {mode: run(mode, args.sessions) for mode in modes}
+
+    print()
+    print(f"{'metric':<24}" + "".join(f"{mode:>14}" for mode in modes))
+    for metric in next(iter(results.values())):
+        print(f"{metric:<24}" + "".join(f"{results[mode][metric]:>14.2f}" for mode in modes))
+    if len(modes) == 2:
+        base, shared = results["baseline"], results["shared"]
+        print()
+        print(f"construction speedup: {base['construct_avg_ms'] / shared['construct_avg_ms']:.1f}x")
+        print(f"memory per session:   {base['memory_per_session_kb'] / max(shared['memory_per_session_kb'], 1e-9):.1f}x smaller")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark: ProposalValidator + ConflictResolver fast path vs full path.
+
+Replays the proposals of real turns (a SalesBot with a MagicMock LLM runs a
+short dialogue; after each turn the blackboard still holds that turn's
+proposals) through validate() and resolve_with_fallback() with the fast path
+enabled and disabled, and reports how many turns took the fast path.
+
+Usage:
+    python scripts/benchmark_conflict_resolver.py
+    python scripts/benchmark_conflict_resolver.py --rounds 5000
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import Callable, List, Tuple
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.blackboard.conflict_resolver import ConflictResolver  # noqa: E402
+from src.blackboard.proposal_validator import ProposalValidator  # noqa: E402
+from src.bot import SalesBot  # noqa: E402
+
+MESSAGES = (
+    "Привет",
+    "Сколько стоит?",
+    "У нас 10 сотрудников",
+    "Это дорого",
+    "А какие есть интеграции?",
+    "Хорошо, давайте демо",
+    "Не интересно, до свидания",
+)
+
+
+def _capture_turns() -> Tuple[object, List[Tuple[list, str]]]:
+    """Run a dialogue; keep (proposals, state before the turn) per turn."""
+    llm = MagicMock()
+    llm.generate.return_value = "Здравствуйте! Расскажите, пожалуйста, о вашем бизнесе."
+    llm.health_check.return_value = True
+    llm.model = "mock-model"
+    bot = SalesBot(llm=llm)
+    orchestrator = bot._orchestrator
+    turns = []
+    for message in MESSAGES:
+        state = bot.state_machine.state
+        bot.process(message)
+        turns.append((list(orchestrator.blackboard.get_proposals()), state))
+    return orchestrator, turns
+
+
+def _time_us(fn: Callable[[], None], rounds: int) -> float:
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1e6)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    orchestrator, turns = _capture_turns()
+    template = orchestrator._validator
+    results = {}
+    for label, fast_path in (("full", False), ("fast", True)):
+        validator = ProposalValidator(
+            valid_actions=template._valid_actions,
+            valid_states=template._valid_states,
+            fast_path=fast_path,
+        )
+        resolver = ConflictResolver(default_action="continue_current_goal", fast_path=fast_path)
+
+        def replay():
+            for proposals, state in turns:
+                validator.validate(proposals)
+                resolver.resolve_with_fallback(proposals, state, fallback_transition=None)
+
+        replay()
+        results[label] = (_time_us(replay, args.rounds) / len(turns), validator, resolver)
+
+    _, validator, resolver = results["fast"]
+    sizes = [len(proposals) for proposals, _ in turns]
+    print(f"turns: {len(turns)}, proposals per turn: {statistics.mean(sizes):.1f} (max {max(sizes)})")
+    print(f"validator fast/full: {validator.get_stats()}")
+    print(f"resolver  fast/full: {resolver.get_stats()}")
+    print(f"{'path':<8}{'us/turn':>10}")
+    for label in ("full", "fast"):
+        print(f"{label:<8}{results[label][0]:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark: ContextSnapshot allocations per begin_turn, legacy vs copy-on-write.
+
+A SalesBot with a MagicMock LLM runs a short dialogue so the blackboard holds
+realistic collected_data; begin_turn() is then replayed under tracemalloc.
+The legacy mode restores the old behaviour (every dict of the snapshot deep-
+frozen again each turn); the current mode shares unchanged data with the
+previous turn's snapshot and the frozen flow dict across turns.
+
+Every snapshot is kept alive during a run, so the reported block count is
+what a single turn's snapshot allocates and retains.
+
+Usage:
+    python scripts/benchmark_context_snapshot.py
+    python scripts/benchmark_context_snapshot.py --turns 500
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, Iterator
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.blackboard import blackboard as blackboard_module  # noqa: E402
+from src.blackboard.models import deep_freeze_dict  # noqa: E402
+from src.bot import SalesBot  # noqa: E402
+
+MESSAGES = (
+    "Привет",
+    "У нас 10 сотрудников, магазин одежды",
+    "Сколько стоит?",
+    "Меня зовут Анна, телефон +77001234567",
+)
+
+
+def _build_blackboard():
+    llm = MagicMock()
+    llm.generate.return_value = "Здравствуйте! Расскажите, пожалуйста, о вашем бизнесе."
+    llm.health_check.return_value = True
+    llm.model = "mock-model"
+    bot = SalesBot(llm=llm)
+    for message in MESSAGES:
+        bot.process(message)
+    return bot._orchestrator.blackboard
+
+
+@contextmanager
+def _legacy_snapshot(blackboard) -> Iterator[None]:
+    """Deep-freeze every snapshot dict on every turn, as before copy-on-write."""
+
+    def legacy_flow_dict():
+        flow_dict = blackboard._flow_config.to_dict() or {}
+        return deep_freeze_dict(flow_dict)
+
+    with patch.object(
+        blackboard_module, "freeze_dict_shared",
+        lambda d, previous=None: deep_freeze_dict(dict(d)),
+    ), patch.object(
+        blackboard_module, "_read_only", lambda value: deep_freeze_dict(dict(value)),
+    ), patch.object(blackboard, "_snapshot_flow_dict", legacy_flow_dict):
+        yield
+
+
+def _measure(blackboard, turns: int) -> Dict[str, float]:
+    kept = []
+
+    def turn():
+        blackboard.begin_turn(intent="info_provided", extracted_data={})
+        kept.append(blackboard.get_context())
+
+    turn()  # warm caches outside the measurement
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for _ in range(turns):
+        turn()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in stats if stat.count_diff > 0)
+    retained = sum(stat.size_diff for stat in stats if stat.size_diff > 0)
+
+    started = time.perf_counter()
+    for _ in range(turns):
+        turn()
+    elapsed = time.perf_counter() - started
+    kept.clear()
+    return {
+        "blocks": blocks / turns,
+        "kib": retained / turns / 1024,
+        "us": elapsed / turns * 1e6,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--turns", type=int, default=200)
+    args = parser.parse_args()
+
+    blackboard = _build_blackboard()
+    context = blackboard.get_context()
+    print(
+        f"collected_data keys: {len(context.collected_data)}, "
+        f"flow_config keys: {len(context.flow_config)}"
+    )
+
+    results = {}
+    with _legacy_snapshot(blackboard):
+        results["legacy"] = _measure(blackboard, args.turns)
+    results["cow"] = _measure(blackboard, args.turns)
+
+    print(f"{'mode':<8}{'blocks/turn':>13}{'KiB/turn':>10}{'us/turn':>10}")
+    for label, row in results.items():
+        print(
+            f"{label:<8}{row['blocks']:>13.1f}{row['kib']:>10.1f}{row['us']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,470 @@
+#!/usr/bin/env python3
+"""
+Benchmark: DAG node execution, config walking vs compiled graph.
+
+Uses the example DAG flows (src/yaml_config/flows/examples) and executes
+every CHOICE, FORK and JOIN node of each flow once per round:
+
+- legacy: the previous DAGExecutor code (copied below) - is_dag_state() +
+  get_dag_node(), a handler dict built per call, choices/branches read from
+  the state config dicts, join checked by set comparison
+- compiled: DAGExecutor on the CompiledDAG of FlowConfig.dag_graph
+
+Conditions are answered by a stub registry (the example flows reference
+conditions that are not registered); JOIN nodes run with half of their
+branches complete. The script also prints FlowConfig.validate_dag()
+for each flow.
+
+Usage:
+    python scripts/benchmark_dag_executor.py
+    python scripts/benchmark_dag_executor.py --rounds 5000
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+from typing import Any, Dict, List, Tuple
+
+import yaml
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config_loader import FlowConfig  # noqa: E402
+from src.dag.executor import DAGExecutionResult, DAGExecutor  # noqa: E402
+from src.dag.models import (  # noqa: E402
+    BranchStatus,
+    DAGBranch,
+    DAGEvent,
+    DAGExecutionContext,
+    DAGNodeConfig,
+    NodeType,
+)
+from src.conditions.state_machine.registry import sm_registry  # noqa: E402
+
+# Same logger as DAGExecutor, so both variants pay the same logging cost
+logger = logging.getLogger("src.dag.executor")
+
+EXAMPLES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "src", "yaml_config", "flows", "examples",
+)
+
+
+class StubRegistry:
+    """Condition registry answering every condition with False."""
+
+    def evaluate(self, name: str, ctx: Any, trace: Any = None) -> bool:
+        return False
+
+
+class LegacyDAGExecutor(DAGExecutor):
+    """Previous DAGExecutor.execute_node() and CHOICE/FORK/JOIN handlers, verbatim."""
+
+    def execute_node(
+        self,
+        node_id: str,
+        intent: str,
+        ctx: "EvaluatorContext",
+        dag_ctx: DAGExecutionContext,
+    ) -> DAGExecutionResult:
+        # Check if this is a DAG node
+        if not self.flow.is_dag_state(node_id):
+            return DAGExecutionResult(
+                is_dag=False,
+                primary_state=node_id,
+            )
+
+        node = self.flow.get_dag_node(node_id)
+        if not node:
+            return DAGExecutionResult(
+                is_dag=False,
+                primary_state=node_id,
+            )
+
+        # Dispatch by node type
+        handlers = {
+            NodeType.CHOICE: self._execute_choice,
+            NodeType.FORK: self._execute_fork,
+            NodeType.JOIN: self._execute_join,
+            NodeType.PARALLEL: self._execute_parallel,
+        }
+
+        handler = handlers.get(node.node_type)
+        if handler:
+            try:
+                return handler(node, intent, ctx, dag_ctx)
+            except Exception as e:
+                logger.error(f"Error executing DAG node {node_id}: {e}")
+                return DAGExecutionResult(
+                    is_dag=True,
+                    action="dag_error",
+                    primary_state=node_id,
+                    dag_event={
+                        "type": "DAG_ERROR",
+                        "node": node_id,
+                        "error": str(e),
+                    },
+                )
+
+        # Unknown node type - treat as simple
+        return DAGExecutionResult(
+            is_dag=False,
+            primary_state=node_id,
+        )
+
+    def _execute_choice(
+        self,
+        node: DAGNodeConfig,
+        intent: str,
+        ctx: "EvaluatorContext",
+        dag_ctx: DAGExecutionContext,
+    ) -> DAGExecutionResult:
+        logger.debug(f"Executing CHOICE node: {node.node_id}")
+
+        # Evaluate each choice in order
+        for choice in node.choices:
+            condition = choice.get("condition")
+            next_state = choice.get("next")
+
+            if not condition or not next_state:
+                continue
+
+            try:
+                if self.registry.evaluate(condition, ctx):
+                    logger.debug(
+                        f"CHOICE {node.node_id}: condition '{condition}' matched, "
+                        f"going to '{next_state}'"
+                    )
+
+                    dag_ctx.add_event(
+                        DAGEvent.CHOICE_TAKEN,
+                        node.node_id,
+                        condition=condition,
+                        next=next_state,
+                        intent=intent,
+                    )
+
+                    return DAGExecutionResult(
+                        is_dag=True,
+                        action="choice_branch",
+                        primary_state=next_state,
+                        dag_event={
+                            "type": DAGEvent.CHOICE_TAKEN,
+                            "node": node.node_id,
+                            "condition": condition,
+                            "next": next_state,
+                        },
+                    )
+            except Exception as e:
+                logger.warning(
+                    f"Error evaluating condition '{condition}': {e}"
+                )
+                continue
+
+        # No condition matched - use default
+        default_state = node.default_choice
+        if default_state:
+            logger.debug(
+                f"CHOICE {node.node_id}: no condition matched, "
+                f"using default '{default_state}'"
+            )
+
+            dag_ctx.add_event(
+                DAGEvent.CHOICE_DEFAULT,
+                node.node_id,
+                next=default_state,
+                intent=intent,
+            )
+
+            return DAGExecutionResult(
+                is_dag=True,
+                action="choice_default",
+                primary_state=default_state,
+                dag_event={
+                    "type": DAGEvent.CHOICE_DEFAULT,
+                    "node": node.node_id,
+                    "next": default_state,
+                },
+            )
+
+        # No default - error
+        logger.error(f"CHOICE {node.node_id}: no condition matched and no default")
+        raise ValueError(
+            f"No matching choice and no default in CHOICE node '{node.node_id}'"
+        )
+
+    def _execute_fork(
+        self,
+        node: DAGNodeConfig,
+        intent: str,
+        ctx: "EvaluatorContext",
+        dag_ctx: DAGExecutionContext,
+    ) -> DAGExecutionResult:
+        logger.debug(f"Executing FORK node: {node.node_id}")
+
+        branches = {}
+        activated = []
+        skipped = []
+
+        for branch_config in node.branches:
+            branch_id = branch_config.get("id")
+            start_at = branch_config.get("start_at")
+
+            if not branch_id or not start_at:
+                logger.warning(f"Invalid branch config in FORK {node.node_id}")
+                continue
+
+            # Check branch condition (if any)
+            condition = branch_config.get("condition")
+            if condition:
+                try:
+                    if not self.registry.evaluate(condition, ctx):
+                        logger.debug(
+                            f"FORK {node.node_id}: skipping branch '{branch_id}' "
+                            f"(condition '{condition}' not met)"
+                        )
+                        branches[branch_id] = DAGBranch(
+                            branch_id=branch_id,
+                            start_state=start_at,
+                            status=BranchStatus.SKIPPED,
+                        )
+                        skipped.append(branch_id)
+                        continue
+                except Exception as e:
+                    logger.warning(
+                        f"Error evaluating branch condition '{condition}': {e}"
+                    )
+                    # On error, skip the branch
+                    branches[branch_id] = DAGBranch(
+                        branch_id=branch_id,
+                        start_state=start_at,
+                        status=BranchStatus.SKIPPED,
+                    )
+                    skipped.append(branch_id)
+                    continue
+
+            # Activate branch
+            branch = DAGBranch(
+                branch_id=branch_id,
+                start_state=start_at,
+            )
+            branch.activate()
+            branches[branch_id] = branch
+            activated.append(branch_id)
+
+            dag_ctx.add_event(
+                DAGEvent.BRANCH_ACTIVATED,
+                node.node_id,
+                branch_id=branch_id,
+                start_state=start_at,
+            )
+
+        # Start the fork
+        dag_ctx.start_fork(node.node_id, branches)
+
+        # Determine primary state (first active branch)
+        first_active = next(
+            (b for b in branches.values() if b.status == BranchStatus.ACTIVE),
+            None
+        )
+        primary_state = (
+            first_active.current_state
+            if first_active
+            else node.join_at or node.node_id
+        )
+
+        logger.info(
+            f"FORK {node.node_id}: started with {len(activated)} active branches, "
+            f"{len(skipped)} skipped"
+        )
+
+        return DAGExecutionResult(
+            is_dag=True,
+            action="fork_started",
+            primary_state=primary_state,
+            next_states=[b.start_state for b in branches.values() if b.status == BranchStatus.ACTIVE],
+            active_branches=activated,
+            dag_event={
+                "type": DAGEvent.FORK_STARTED,
+                "node": node.node_id,
+                "branches": activated,
+                "skipped": skipped,
+                "join_at": node.join_at,
+            },
+        )
+
+    def _execute_join(
+        self,
+        node: DAGNodeConfig,
+        intent: str,
+        ctx: "EvaluatorContext",
+        dag_ctx: DAGExecutionContext,
+    ) -> DAGExecutionResult:
+        logger.debug(f"Executing JOIN node: {node.node_id}")
+
+        expected = set(node.expects_branches)
+        join_condition = node.join_condition
+
+        # Count completed branches
+        completed = set()
+        for b_id in expected:
+            branch = dag_ctx.get_branch(b_id)
+            if branch and branch.status in (BranchStatus.COMPLETED, BranchStatus.SKIPPED):
+                completed.add(b_id)
+
+        # Check join condition
+        ready_to_join = self._check_join_condition(
+            join_condition, completed, expected
+        )
+
+        if not ready_to_join:
+            logger.debug(
+                f"JOIN {node.node_id}: waiting for branches "
+                f"({len(completed)}/{len(expected)} complete)"
+            )
+
+            dag_ctx.add_event(
+                DAGEvent.JOIN_WAITING,
+                node.node_id,
+                completed=list(completed),
+                expected=list(expected),
+                condition=join_condition.value,
+            )
+
+            return DAGExecutionResult(
+                is_dag=True,
+                action="join_waiting",
+                primary_state=node.node_id,
+                should_continue=False,
+                dag_event={
+                    "type": DAGEvent.JOIN_WAITING,
+                    "node": node.node_id,
+                    "completed": list(completed),
+                    "expected": list(expected),
+                },
+            )
+
+        # Ready to join - aggregate data
+        aggregated_data = {}
+        for b_id in completed:
+            branch = dag_ctx.get_branch(b_id)
+            if branch and branch.status == BranchStatus.COMPLETED:
+                aggregated_data[b_id] = branch.collected_data.copy()
+
+        # Complete the fork
+        dag_ctx.complete_fork(dag_ctx.current_fork or "")
+
+        dag_ctx.add_event(
+            DAGEvent.JOIN_COMPLETE,
+            node.node_id,
+            completed=list(completed),
+            aggregated_keys=list(aggregated_data.keys()),
+        )
+
+        logger.info(
+            f"JOIN {node.node_id}: completed with {len(completed)} branches"
+        )
+
+        # Execute on_join action if defined
+        action = node.on_join_action or "join_complete"
+
+        return DAGExecutionResult(
+            is_dag=True,
+            action=action,
+            primary_state=node.node_id,
+            aggregated_data=aggregated_data,
+            dag_event={
+                "type": DAGEvent.JOIN_COMPLETE,
+                "node": node.node_id,
+                "branches": list(completed),
+            },
+        )
+
+
+
+def _load_flow(path: str) -> FlowConfig:
+    with open(path, encoding="utf-8") as f:
+        data = yaml.safe_load(f)
+    return FlowConfig(
+        name=data.get("flow", {}).get("name", os.path.basename(path)),
+        states=data.get("states", {}),
+        entry_points=data.get("entry_points", {}),
+    )
+
+
+def _join_context(flow: FlowConfig, join_id: str) -> DAGExecutionContext:
+    dag_ctx = DAGExecutionContext(primary_state=join_id)
+    expected = flow.get_dag_node(join_id).expects_branches
+    for i, branch_id in enumerate(expected):
+        branch = DAGBranch(branch_id, "start")
+        if i < len(expected) // 2:
+            branch.complete()
+        else:
+            branch.activate()
+        dag_ctx.active_branches[branch_id] = branch
+    return dag_ctx
+
+
+def _workload(flow: FlowConfig) -> List[Tuple[str, Any]]:
+    items = []
+    for node_id, node in flow.dag_nodes.items():
+        if node.node_type in (NodeType.CHOICE, NodeType.FORK):
+            items.append((node_id, None))
+        elif node.node_type == NodeType.JOIN:
+            items.append((node_id, node_id))
+    return items
+
+
+def _time_us(fn, rounds: int, count: int) -> float:
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1e6 / max(count, 1))
+    return statistics.median(samples)
+
+
+def run(flow: FlowConfig, rounds: int) -> Dict[str, float]:
+    items = _workload(flow)
+    registry = StubRegistry()
+    legacy = LegacyDAGExecutor(flow, condition_registry=registry)
+    compiled = DAGExecutor(flow, condition_registry=registry)
+
+    def runner(executor):
+        def run_all():
+            for node_id, join in items:
+                dag_ctx = _join_context(flow, join) if join else DAGExecutionContext(primary_state=node_id)
+                executor.execute_node(node_id, "intent", None, dag_ctx)
+        return run_all
+
+    for node_id, join in items:
+        a = legacy.execute_node(node_id, "i", None, _join_context(flow, join) if join else DAGExecutionContext(node_id))
+        b = compiled.execute_node(node_id, "i", None, _join_context(flow, join) if join else DAGExecutionContext(node_id))
+        assert (a.action, a.active_branches) == (b.action, b.active_branches), (node_id, a, b)
+
+    legacy_us = _time_us(runner(legacy), rounds, len(items))
+    compiled_us = _time_us(runner(compiled), rounds, len(items))
+    return {"nodes": len(items), "legacy_us": legacy_us, "compiled_us": compiled_us}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'flow':<24}{'nodes':>6}{'legacy us/node':>16}{'compiled us/node':>18}")
+    for name in sorted(os.listdir(EXAMPLES_DIR)):
+        if not name.endswith(".yaml"):
+            continue
+        flow = _load_flow(os.path.join(EXAMPLES_DIR, name))
+        result = run(flow, args.rounds)
+        print(f"{flow.name:<24}{result['nodes']:>6}{result['legacy_us']:>16.2f}{result['compiled_us']:>18.2f}")
+        report = flow.validate_dag(registry=sm_registry)
+        print(f"  validate_dag: {report.to_dict()}")
+
+
+if __name__ == "__main__":
+    main()
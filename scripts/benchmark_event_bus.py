@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-turn DialogueEventBus overhead in DialogueOrchestrator.
+
+Replays the event work of real turns (a SalesBot with a MagicMock LLM runs
+a short dialogue; after each turn the blackboard still holds that turn's
+proposals):
+
+- legacy: the previous emission code - every source's SourceContributedEvent
+  re-scans all proposals of the turn, every event is built, history is a
+  list trimmed with pop(0)
+- current: DialogueOrchestrator._finish_source_run() and emit_lazy() with the
+  proposal index of DialogueBlackboard and a deque history
+
+Bus configurations:
+- off: no subscribers, history_size=0 (tracing and metrics off)
+- history: no subscribers, default history
+- metrics: MetricsCollector subscribed to all events, default history
+
+Usage:
+    python scripts/benchmark_event_bus.py
+    python scripts/benchmark_event_bus.py --rounds 2000
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.blackboard.event_bus import (  # noqa: E402
+    ConflictResolvedEvent,
+    DecisionCommittedEvent,
+    DialogueEventBus,
+    EventType,
+    MetricsCollector,
+    ProposalValidatedEvent,
+    SourceContributedEvent,
+    StateTransitionedEvent,
+    TurnStartedEvent,
+)
+from src.blackboard.source_scheduler import SourceRun  # noqa: E402
+from src.bot import SalesBot  # noqa: E402
+
+MESSAGES = (
+    "Привет",
+    "Сколько стоит?",
+    "У нас 10 сотрудников",
+    "Это дорого",
+    "А какие есть интеграции?",
+)
+
+
+def _capture_turns() -> Tuple[object, List[Tuple[object, List[object], str, str]]]:
+    """Run a dialogue; keep (blackboard proposals, contributing sources) per turn."""
+    llm = MagicMock()
+    llm.generate.return_value = "Здравствуйте! Расскажите, пожалуйста, о вашем бизнесе."
+    llm.health_check.return_value = True
+    llm.model = "mock-model"
+    bot = SalesBot(llm=llm)
+    orchestrator = bot._orchestrator
+    turns = []
+    for message in MESSAGES:
+        state = bot.state_machine.state
+        bot.process(message)
+        blackboard = orchestrator.blackboard
+        proposals = blackboard.get_proposals()
+        names = {p.source_name for p in proposals}
+        sources = [source for source in orchestrator.sources if source.name in names]
+        # Freeze the turn: copy the proposal layer the replay reads from
+        turns.append((
+            (list(blackboard._action_proposals), list(blackboard._transition_proposals),
+             {name: (list(a), list(t)) for name, (a, t) in blackboard._proposals_by_source.items()}),
+            sources,
+            state,
+            bot.state_machine.state,
+        ))
+    return orchestrator, turns
+
+
+def _restore(blackboard, layer) -> None:
+    actions, transitions, by_source = layer
+    blackboard._action_proposals[:] = actions
+    blackboard._transition_proposals[:] = transitions
+    blackboard._proposals_by_source.clear()
+    blackboard._proposals_by_source.update(by_source)
+
+
+def _make_bus(config: str) -> DialogueEventBus:
+    bus = DialogueEventBus(history_size=0 if config == "off" else 100)
+    if config == "metrics":
+        bus.subscribe_all(MetricsCollector().handle_event)
+    return bus
+
+
+def _legacy_turn(orchestrator, bus: DialogueEventBus, history: List, blackboard, sources, state, next_state) -> None:
+    def emit(event):
+        # Previous DialogueEventBus.emit()
+        history.append(event)
+        if len(history) > 100:
+            history.pop(0)
+        if bus._async_mode and bus._event_queue:
+            bus._event_queue.put(event)
+        else:
+            bus._process_event(event)
+
+    emit(TurnStartedEvent(turn_number=1, intent="intent", state=state))
+    for source in sources:
+        # Previous DialogueOrchestrator._finish_source_run() for a contributing source
+        run = SourceRun(source=source, view=blackboard, contributed=True)
+        orchestrator._last_source_timings_ms[source.name] = run.elapsed_ms
+        if run.gate_error is not None:
+            raise run.gate_error
+        if not run.contributed:
+            continue
+        orchestrator._last_source_dispatch["contributed"] += 1
+        error = run.error
+        try:
+            run.merge()
+        except Exception as e:
+            error = error or e
+        if error is not None:
+            continue
+        summary = [str(p) for p in blackboard.get_proposals() if p.source_name == source.name]
+        emit(SourceContributedEvent(
+            turn_number=1, source_name=source.name, proposals_count=len(summary),
+            proposals_summary=summary, execution_time_ms=run.elapsed_ms,
+        ))
+    proposals = blackboard.get_proposals()
+    emit(ProposalValidatedEvent(turn_number=1, valid_count=len(proposals), error_count=0,
+                                warning_count=0, errors=[]))
+    emit(ConflictResolvedEvent(turn_number=1, winning_action="action", winning_transition=next_state,
+                               rejected_count=0, merge_decision="merge", resolution_time_ms=0.1))
+    emit(DecisionCommittedEvent(turn_number=1, action="action", next_state=next_state, reason_codes=[]))
+    if next_state != state:
+        emit(StateTransitionedEvent(turn_number=1, from_state=state, to_state=next_state,
+                                    trigger_reason=", ".join([])))
+
+
+def _current_turn(orchestrator, blackboard, sources, state, next_state) -> None:
+    bus = orchestrator.event_bus
+    bus.emit_lazy(EventType.TURN_STARTED, lambda: TurnStartedEvent(turn_number=1, intent="intent", state=state))
+    for source in sources:
+        orchestrator._finish_source_run(SourceRun(source=source, view=blackboard, contributed=True), 1)
+    if bus.is_observed(EventType.PROPOSAL_VALIDATED):
+        proposals = blackboard.get_proposals()
+        bus.emit(ProposalValidatedEvent(turn_number=1, valid_count=len(proposals), error_count=0,
+                                        warning_count=0, errors=[]))
+    bus.emit_lazy(EventType.CONFLICT_RESOLVED, lambda: ConflictResolvedEvent(
+        turn_number=1, winning_action="action", winning_transition=next_state,
+        rejected_count=0, merge_decision="merge", resolution_time_ms=0.1,
+    ))
+    bus.emit_lazy(EventType.DECISION_COMMITTED, lambda: DecisionCommittedEvent(
+        turn_number=1, action="action", next_state=next_state, reason_codes=[],
+    ))
+    if next_state != state:
+        bus.emit_lazy(EventType.STATE_TRANSITIONED, lambda: StateTransitionedEvent(
+            turn_number=1, from_state=state, to_state=next_state, trigger_reason=", ".join([]),
+        ))
+
+
+def _time_us(fn: Callable[[], None], rounds: int) -> float:
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1e6)
+    return statistics.median(samples)
+
+
+def run(config: str, rounds: int, orchestrator, turns) -> Dict[str, float]:
+    blackboard = orchestrator.blackboard
+    legacy_bus = _make_bus(config)
+    legacy_history: List = []
+    orchestrator._event_bus = _make_bus(config)
+    orchestrator._last_source_dispatch = {"contributed": 0}
+    orchestrator._last_source_timings_ms = {}
+
+    def legacy():
+        for layer, sources, state, next_state in turns:
+            _restore(blackboard, layer)
+            _legacy_turn(orchestrator, legacy_bus, legacy_history, blackboard, sources, state, next_state)
+
+    def current():
+        for layer, sources, state, next_state in turns:
+            _restore(blackboard, layer)
+            _current_turn(orchestrator, blackboard, sources, state, next_state)
+
+    def restore_only():
+        for layer, *_ in turns:
+            _restore(blackboard, layer)
+
+    baseline = _time_us(restore_only, rounds)
+    legacy_us = max(_time_us(legacy, rounds) - baseline, 0.0) / len(turns)
+    current_us = max(_time_us(current, rounds) - baseline, 0.0) / len(turns)
+    return {"legacy_us": legacy_us, "current_us": current_us}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=500)
+    args = parser.parse_args()
+
+    orchestrator, turns = _capture_turns()
+    contributions = sum(len(sources) for _, sources, _, _ in turns)
+    print(f"turns: {len(turns)}, contributing sources per turn: {contributions / len(turns):.1f}")
+    print(f"{'bus':<10}{'legacy us/turn':>16}{'current us/turn':>17}")
+    for config in ("off", "history", "metrics"):
+        result = run(config, args.rounds, orchestrator, turns)
+        print(f"{config:<10}{result['legacy_us']:>16.2f}{result['current_us']:>17.2f}")
+
+
+if __name__ == "__main__":
+    main()
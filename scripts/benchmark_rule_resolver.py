@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark: flow rule and transition evaluation, interpreted vs compiled.
+
+For every flow in src/yaml_config/flows, each state's rules and transitions
+are evaluated against an EvaluatorContext of that state:
+
+- interpreted: the previous RuleResolver algorithm (type dispatch per rule,
+  evaluate_condition_value() per condition, ConditionExpressionParser.parse()
+  with its repr() cache key for composite conditions)
+- compiled: CompiledRule.evaluate() of rules compiled by
+  RuleResolver.compile_flow() (src/rules/compiler.py)
+
+Rules whose conditions raise for the synthetic context are skipped in both
+modes. The condition cache is not attached, so every condition runs.
+
+Usage:
+    python scripts/benchmark_rule_resolver.py
+    python scripts/benchmark_rule_resolver.py --rounds 200 --flow spin_selling
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import Any, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config_loader import ConfigLoader  # noqa: E402
+from src.conditions.state_machine.context import EvaluatorContext  # noqa: E402
+from src.rules.compiler import CompiledRule  # noqa: E402
+from src.state_machine import StateMachine  # noqa: E402
+
+FLOWS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "yaml_config", "flows"
+)
+
+
+def _flow_names() -> List[str]:
+    return sorted(
+        name for name in os.listdir(FLOWS_DIR)
+        if not name.startswith("_") and name != "examples"
+        and os.path.isfile(os.path.join(FLOWS_DIR, name, "flow.yaml"))
+    )
+
+
+def _interpret(resolver, rule: Any, rule_name: str, ctx: Any) -> Any:
+    """Previous per-call RuleResolver._evaluate_rule algorithm (without tracing)."""
+    if isinstance(rule, str) or rule is None:
+        return rule
+    if isinstance(rule, dict):
+        from src.conditions.expression_parser import evaluate_condition_value
+        if evaluate_condition_value(
+            rule["when"], ctx, resolver.registry, resolver.expression_parser, None, rule_name
+        ):
+            return rule["then"]
+        return None
+    for i, item in enumerate(rule):
+        if (isinstance(item, str) or item is None) and i == len(rule) - 1:
+            return item
+        if isinstance(item, dict):
+            result = _interpret(resolver, item, rule_name, ctx)
+            if result is not None:
+                return result
+        elif isinstance(item, str) or item is None:
+            return item
+    return None
+
+
+def _workload(loader: ConfigLoader, config, flow_name: str) -> Tuple[Any, List[Tuple[str, Any, Any, CompiledRule]], float]:
+    flow = loader.load_flow(flow_name)
+    sm = StateMachine(config=config, flow=flow)
+    resolver = sm._resolver
+
+    started = time.perf_counter()
+    resolver.compile_flow(flow)
+    compile_ms = (time.perf_counter() - started) * 1000
+
+    items = []
+    for state, state_config in flow.states.items():
+        sm.state = state
+        for kind in ("rules", "transitions"):
+            for intent, rule in (state_config.get(kind) or {}).items():
+                ctx = EvaluatorContext.from_state_machine(sm, intent, state_config)
+                program = resolver.compile_rule(rule, intent)
+                try:
+                    expected = _interpret(resolver, rule, intent, ctx)
+                    actual = program.evaluate(ctx, None)
+                except Exception:
+                    continue
+                assert expected == actual, (flow_name, state, intent, expected, actual)
+                items.append((intent, rule, ctx, program))
+    return resolver, items, compile_ms
+
+
+def _time_us(fn, rounds: int, count: int) -> float:
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1e6 / max(count, 1))
+    return statistics.median(samples)
+
+
+def run(flow_name: str, rounds: int, loader: ConfigLoader, config) -> Dict[str, float]:
+    resolver, items, compile_ms = _workload(loader, config, flow_name)
+
+    def interpreted():
+        for intent, rule, ctx, _ in items:
+            _interpret(resolver, rule, intent, ctx)
+
+    def compiled():
+        for _, _, ctx, program in items:
+            program.evaluate(ctx, None)
+
+    interpreted_us = _time_us(interpreted, rounds, len(items))
+    compiled_us = _time_us(compiled, rounds, len(items))
+    return {
+        "rules": len(items),
+        "compile_ms": compile_ms,
+        "interpreted_us": interpreted_us,
+        "compiled_us": compiled_us,
+        "speedup": interpreted_us / compiled_us if compiled_us else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--flow", action="append", help="flow name (repeatable, default: all)")
+    args = parser.parse_args()
+
+    loader = ConfigLoader()
+    config = loader.load()
+    flows = args.flow or _flow_names()
+
+    print(f"{'flow':<20}{'rules':>7}{'compile ms':>12}{'interp us':>11}{'compiled us':>13}{'speedup':>9}")
+    results = []
+    for flow_name in flows:
+        result = run(flow_name, args.rounds, loader, config)
+        results.append(result)
+        print(
+            f"{flow_name:<20}{result['rules']:>7}{result['compile_ms']:>12.2f}"
+            f"{result['interpreted_us']:>11.2f}{result['compiled_us']:>13.2f}{result['speedup']:>8.1f}x"
+        )
+
+    print()
+    print(f"flows: {len(results)}, rules: {sum(r['rules'] for r in results)}")
+    print(f"median speedup: {statistics.median(r['speedup'] for r in results):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
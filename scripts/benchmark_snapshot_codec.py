@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Benchmark: snapshot encode/decode time and stored bytes per snapshot.
+
+Replays the client messages of the real dialogues in `28 client/` through
+SalesBot (LLM is a MagicMock, so no network is needed) and takes
+`bot.to_snapshot()` after every turn. Each snapshot is then encoded with:
+
+- legacy: `json.dumps(snapshot, ensure_ascii=False)` TEXT (previous format)
+- frame/none, frame/zlib, frame/zstd: full codec frames (src/snapshot_codec.py)
+- delta/zlib: SnapshotDeltaEncoder, one key per dialogue, bytes actually
+  written per save (delta frame or a new full frame)
+
+Replaying the dialogues is the slow part; `--dump` stores the snapshots as
+JSON lines and `--load` reuses them.
+
+Usage:
+    python scripts/benchmark_snapshot_codec.py --turns 6 --dump /tmp/snapshots.jsonl
+    python scripts/benchmark_snapshot_codec.py --load /tmp/snapshots.jsonl
+"""
+
+import argparse
+import glob
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.snapshot_codec import (  # noqa: E402
+    SnapshotDeltaEncoder,
+    decode_snapshot,
+    encode_snapshot,
+    zstandard,
+)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DIALOGUES_DIR = os.path.join(ROOT, "28 client")
+
+
+def _client_messages(path: str) -> List[str]:
+    with open(path, encoding="utf-8") as handle:
+        items = json.load(handle)
+    return [
+        str(item["sent_content"])
+        for item in items
+        if item.get("author_type") == "client" and str(item.get("sent_content") or "").strip()
+    ]
+
+
+def collect_snapshots(turns: int, clients: int) -> List[Tuple[str, List[dict]]]:
+    from src.bot import SalesBot
+
+    llm = MagicMock()
+    llm.generate.return_value = "Здравствуйте! Расскажите, пожалуйста, о вашем бизнесе."
+    llm.health_check.return_value = True
+    llm.model = "mock-model"
+
+    dialogues = []
+    for path in sorted(glob.glob(os.path.join(DIALOGUES_DIR, "*.json")))[:clients]:
+        bot = SalesBot(llm=llm, client_id=os.path.basename(path))
+        snapshots = []
+        for message in _client_messages(path)[:turns]:
+            bot.process(message)
+            snapshots.append(bot.to_snapshot())
+        dialogues.append((os.path.basename(path), snapshots))
+        print(f"  {os.path.basename(path)}: {len(snapshots)} turns", file=sys.stderr)
+    return dialogues
+
+
+def _timed(fn: Callable[[], object]) -> Tuple[object, float]:
+    started = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - started) * 1000
+
+
+def bench_full(snapshots: List[dict], encode: Callable, decode: Callable) -> Dict[str, float]:
+    encode_ms, decode_ms, sizes = [], [], []
+    for snapshot in snapshots:
+        payload, elapsed = _timed(lambda: encode(snapshot))
+        encode_ms.append(elapsed)
+        sizes.append(len(payload))
+        _, elapsed = _timed(lambda: decode(payload))
+        decode_ms.append(elapsed)
+    return {
+        "encode_ms": statistics.median(encode_ms),
+        "decode_ms": statistics.median(decode_ms),
+        "bytes": statistics.mean(sizes),
+    }
+
+
+def bench_delta(dialogues: List[Tuple[str, List[dict]]], compression: str) -> Dict[str, float]:
+    encoder = SnapshotDeltaEncoder(compression=compression)
+    encode_ms, decode_ms, sizes = [], [], []
+    for name, snapshots in dialogues:
+        base_frame = None
+        for snapshot in snapshots:
+            encoded, elapsed = _timed(lambda: encoder.encode(name, snapshot))
+            encode_ms.append(elapsed)
+            sizes.append(len(encoded.frame))
+            if not encoded.is_delta:
+                base_frame = encoded.frame
+                _, elapsed = _timed(lambda: decode_snapshot(base_frame))
+            else:
+                _, elapsed = _timed(lambda: decode_snapshot(base_frame, encoded.frame))
+            decode_ms.append(elapsed)
+    stats = encoder.get_stats()
+    return {
+        "encode_ms": statistics.median(encode_ms),
+        "decode_ms": statistics.median(decode_ms),
+        "bytes": statistics.mean(sizes),
+        "delta_share": stats["delta_frames"] / max(1, stats["delta_frames"] + stats["full_frames"]),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Snapshot codec benchmark on the 28 client dialogues")
+    parser.add_argument("--turns", type=int, default=6, help="Client turns replayed per dialogue")
+    parser.add_argument("--clients", type=int, default=28)
+    parser.add_argument("--dump", help="Write collected snapshots to this JSON lines file")
+    parser.add_argument("--load", help="Read snapshots from a --dump file instead of replaying")
+    args = parser.parse_args()
+
+    if args.load:
+        with open(args.load, encoding="utf-8") as handle:
+            dialogues = [tuple(json.loads(line)) for line in handle if line.strip()]
+    else:
+        dialogues = collect_snapshots(args.turns, args.clients)
+    if args.dump:
+        with open(args.dump, "w", encoding="utf-8") as handle:
+            for dialogue in dialogues:
+                handle.write(json.dumps(dialogue, ensure_ascii=False) + "\n")
+
+    snapshots = [snapshot for _, items in dialogues for snapshot in items]
+    variants = {
+        "legacy json": (lambda s: json.dumps(s, ensure_ascii=False).encode("utf-8"), lambda p: json.loads(p)),
+        "frame/none": (lambda s: encode_snapshot(s, compression="none"), decode_snapshot),
+        "frame/zlib": (lambda s: encode_snapshot(s, compression="zlib"), decode_snapshot),
+    }
+    if zstandard is not None:
+        variants["frame/zstd"] = (lambda s: encode_snapshot(s, compression="zstd"), decode_snapshot)
+
+    results = {name: bench_full(snapshots, *codec) for name, codec in variants.items()}
+    results["delta/zlib"] = bench_delta(dialogues, "zlib")
+
+    legacy_bytes = results["legacy json"]["bytes"]
+    print()
+    print(f"{len(dialogues)} dialogues, {len(snapshots)} snapshots")
+    print(f"{'codec':<14}{'encode ms':>11}{'decode ms':>11}{'bytes':>10}{'vs legacy':>11}")
+    for name, row in results.items():
+        print(
+            f"{name:<14}{row['encode_ms']:>11.3f}{row['decode_ms']:>11.3f}"
+            f"{row['bytes']:>10.0f}{row['bytes'] / legacy_bytes:>10.2f}x"
+        )
+    print(f"delta frames: {results['delta/zlib']['delta_share']:.0%} of saves")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,570 @@
+"""
+Record-and-replay stand-in for the LLM + TEI stack (offline perf testing).
+
+Serves, on a single port, every endpoint the bot talks to:
+  - POST /api/chat              (Ollama native, OllamaClient api_format=ollama)
+  - POST /v1/chat/completions   (llama-server / vLLM, api_format=openai)
+  - POST /embed                 (TEI embeddings, src/knowledge/tei_client.py)
+  - POST /rerank                (TEI reranker, src/knowledge/reranker.py)
+  - GET  /health, /api/tags, /v1/models
+  - GET  /stats                 (hit / miss / fallback counters)
+
+Replay mode answers from a cassette (JSONL written by record mode) and from
+LLMTrace dumps, keyed by the SHA-256 of the full prompt and the request's JSON
+schema (LLMTrace.prompt_hash, see llm_request_key). Unknown requests get
+deterministic fallbacks: canned JSON built from the request schema for
+structured calls, a fixed reply for free-form calls, hash-seeded unit vectors
+for embeddings and token-overlap scores for rerank. Response latency is drawn
+from a configurable distribution per endpoint kind.
+
+Record mode proxies to the real servers and appends every exchange (with its
+measured latency) to the cassette.
+
+Usage:
+    # capture real traffic
+    python scripts/llm_replay_server.py --mode record --cassette perf.jsonl \\
+        --upstream-llm http://localhost:11434 \\
+        --upstream-embed http://localhost:8081 --upstream-rerank http://localhost:8082
+
+    # replay on a CPU-only box
+    python scripts/llm_replay_server.py --cassette perf.jsonl --traces traces.jsonl \\
+        --latency chat=lognormal:900:0.4 --latency embed=fixed:15
+
+    # point the bot at it
+    LLM base_url / retriever.embedder_url / reranker.url -> http://localhost:8090
+
+Latency specs: `recorded` (cassette latency, default), `none`, `fixed:MS`,
+`uniform:LO:HI`, `normal:MEAN:STD`, `lognormal:MEDIAN_MS:SIGMA`.
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.decision_trace import llm_request_key  # noqa: E402
+
+CHAT_PATHS = ("/api/chat", "/v1/chat/completions")
+KINDS = ("chat", "embed", "rerank")
+DEFAULT_EMBED_DIM = 2560  # Qwen3-Embedding-4B
+DEFAULT_REPLY = "Спасибо за вопрос! Уточните, пожалуйста, детали, и я помогу."
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+# ---- Keys ----
+
+def prompt_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def chat_prompt(body: Dict[str, Any]) -> str:
+    """Concatenated message contents (OllamaClient sends one user message)."""
+    parts = []
+    for message in body.get("messages") or []:
+        content = message.get("content", "")
+        if isinstance(content, list):
+            # OpenAI multimodal content parts: keep only the text
+            content = "".join(p.get("text", "") for p in content if isinstance(p, dict))
+        parts.append(str(content))
+    return "\n".join(parts)
+
+
+def chat_schema(body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """JSON schema of a structured request (Ollama format / llama-server json_schema)."""
+    fmt = body.get("format")
+    if isinstance(fmt, dict):
+        return fmt
+    if isinstance(body.get("json_schema"), dict):
+        return body["json_schema"]
+    response_format = body.get("response_format") or {}
+    if isinstance(response_format, dict):
+        wrapped = response_format.get("json_schema") or {}
+        if isinstance(wrapped.get("schema"), dict):
+            return wrapped["schema"]
+        if isinstance(response_format.get("schema"), dict):
+            return response_format["schema"]
+    return None
+
+
+def chat_key(body: Dict[str, Any]) -> str:
+    """Same key the client stores in LLMTrace.prompt_hash for this request."""
+    return llm_request_key(chat_prompt(body), chat_schema(body))
+
+
+def rerank_key(query: str, texts: List[str]) -> str:
+    return prompt_hash(query + "\x00" + "\x00".join(texts))
+
+
+# ---- Fallbacks ----
+
+def hash_embedding(text: str, dim: int = DEFAULT_EMBED_DIM) -> List[float]:
+    """Deterministic unit vector seeded by the text hash."""
+    rng = random.Random(int(prompt_hash(text)[:16], 16))
+    vector = [rng.gauss(0.0, 1.0) for _ in range(dim)]
+    norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+    return [v / norm for v in vector]
+
+
+def overlap_score(query: str, text: str) -> float:
+    """Cheap lexical relevance in [0, 1] so rerank order is still meaningful."""
+    q_tokens = set(_TOKEN_RE.findall(query.lower()))
+    t_tokens = set(_TOKEN_RE.findall(text.lower()))
+    if not q_tokens or not t_tokens:
+        return 0.0
+    return len(q_tokens & t_tokens) / len(q_tokens | t_tokens)
+
+
+def canned_instance(schema: Dict[str, Any], root: Optional[Dict[str, Any]] = None) -> Any:
+    """Minimal value that validates against a (Pydantic-generated) JSON schema."""
+    root = root or schema
+    if "$ref" in schema:
+        name = schema["$ref"].rsplit("/", 1)[-1]
+        return canned_instance(root.get("$defs", {}).get(name, {}), root)
+    if "const" in schema:
+        return schema["const"]
+    if schema.get("enum"):
+        return schema["enum"][0]
+    if "default" in schema:
+        return schema["default"]
+    for key in ("anyOf", "oneOf", "allOf"):
+        if schema.get(key):
+            options = [s for s in schema[key] if s.get("type") != "null"] or schema[key]
+            return canned_instance(options[0], root)
+
+    schema_type = schema.get("type")
+    if isinstance(schema_type, list):
+        schema_type = next((t for t in schema_type if t != "null"), "null")
+    if schema_type == "object" or "properties" in schema:
+        properties = schema.get("properties", {})
+        return {
+            name: canned_instance(prop, root)
+            for name, prop in properties.items()
+            if name in schema.get("required", properties)
+        }
+    if schema_type == "array":
+        count = int(schema.get("minItems", 0))
+        return [canned_instance(schema.get("items", {}), root) for _ in range(count)]
+    if schema_type == "string":
+        return "x" * max(1, int(schema.get("minLength", 1)))
+    if schema_type in ("number", "integer"):
+        value = schema.get("minimum", schema.get("exclusiveMinimum", 0))
+        if "exclusiveMinimum" in schema and "minimum" not in schema:
+            value += 1 if schema_type == "integer" else 0.01
+        maximum = schema.get("maximum")
+        if maximum is not None and value > maximum:
+            value = maximum
+        return int(value) if schema_type == "integer" else float(value)
+    if schema_type == "boolean":
+        return False
+    return None
+
+
+# ---- Latency ----
+
+def parse_latency(spec: str) -> Callable[[Optional[float]], float]:
+    """Latency sampler (ms) from a spec; the argument is the recorded latency."""
+    name, _, params = spec.partition(":")
+    args = [float(p) for p in params.split(":") if p]
+    if name == "recorded":
+        return lambda recorded: recorded or 0.0
+    if name == "none":
+        return lambda recorded: 0.0
+    if name == "fixed":
+        return lambda recorded: args[0]
+    if name == "uniform":
+        return lambda recorded: random.uniform(args[0], args[1])
+    if name == "normal":
+        return lambda recorded: max(0.0, random.gauss(args[0], args[1]))
+    if name == "lognormal":
+        return lambda recorded: random.lognormvariate(math.log(args[0]), args[1])
+    raise ValueError(f"Unknown latency spec: {spec}")
+
+
+# ---- Store ----
+
+class ReplayStore:
+    """Recorded exchanges keyed by prompt hash, plus hit/miss counters."""
+
+    def __init__(self, cassette: Optional[Path] = None):
+        self.cassette = cassette
+        self._lock = threading.Lock()
+        self._chat: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._cursor: Dict[str, int] = defaultdict(int)
+        self._embed: Dict[str, Tuple[List[float], float]] = {}
+        self._rerank: Dict[str, Tuple[List[Dict[str, Any]], float]] = {}
+        self.stats: Dict[str, Dict[str, int]] = {
+            kind: {"hits": 0, "misses": 0, "recorded": 0} for kind in KINDS
+        }
+        if cassette is not None and cassette.exists():
+            self.load_cassette(cassette)
+
+    def load_cassette(self, path: Path) -> int:
+        loaded = 0
+        with path.open(encoding="utf-8") as fh:
+            for line in fh:
+                line = line.strip()
+                if line:
+                    self._index(json.loads(line))
+                    loaded += 1
+        return loaded
+
+    def load_traces(self, path: Path) -> int:
+        """
+        Index LLMTrace dumps (one trace or decision trace per line).
+
+        Traces are indexed by their prompt_hash. Older dumps without it are
+        indexed by prompt_user only when it is short enough not to have been
+        truncated by LLMTrace.to_dict() (200 chars); longer ones are skipped,
+        since a prompt prefix cannot tell apart prompts sharing a template.
+        """
+        loaded = 0
+        with path.open(encoding="utf-8") as fh:
+            for line in fh:
+                line = line.strip()
+                if not line:
+                    continue
+                payload = json.loads(line)
+                traces = payload.get("llm_traces") if isinstance(payload, dict) else None
+                for trace in traces if traces is not None else [payload]:
+                    prompt = trace.get("prompt_user") or ""
+                    response = trace.get("raw_response") or ""
+                    if not prompt or not response or trace.get("success") is False:
+                        continue
+                    key = trace.get("prompt_hash")
+                    if not key:
+                        if len(prompt) >= 200:
+                            continue
+                        key = llm_request_key(prompt)
+                    self._chat[key].append({
+                        "content": response,
+                        "latency_ms": trace.get("latency_ms"),
+                        "purpose": trace.get("purpose", ""),
+                    })
+                    loaded += 1
+        return loaded
+
+    def _index(self, record: Dict[str, Any]) -> None:
+        kind = record.get("kind")
+        if kind == "chat":
+            entry = {"content": record["content"], "latency_ms": record.get("latency_ms")}
+            self._chat[record["key"]].append(entry)
+        elif kind == "embed":
+            self._embed[record["key"]] = (record["vector"], record.get("latency_ms") or 0.0)
+        elif kind == "rerank":
+            self._rerank[record["key"]] = (record["scores"], record.get("latency_ms") or 0.0)
+
+    def append(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self._index(record)
+            self.stats[record["kind"]]["recorded"] += 1
+            if self.cassette is not None:
+                with self.cassette.open("a", encoding="utf-8") as fh:
+                    fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def count(self, kind: str, hit: bool) -> None:
+        with self._lock:
+            self.stats[kind]["hits" if hit else "misses"] += 1
+
+    def chat(self, key: str) -> Optional[Dict[str, Any]]:
+        """Recorded reply; repeated requests cycle through their recordings."""
+        entries = self._chat.get(key)
+        if not entries:
+            return None
+        with self._lock:
+            position = self._cursor[key] % len(entries)
+            self._cursor[key] += 1
+        return entries[position]
+
+    def embed(self, text: str) -> Optional[Tuple[List[float], float]]:
+        return self._embed.get(prompt_hash(text))
+
+    def rerank(self, query: str, texts: List[str]) -> Optional[Tuple[List[Dict[str, Any]], float]]:
+        return self._rerank.get(rerank_key(query, texts))
+
+
+# ---- Server ----
+
+class ReplayConfig:
+    def __init__(
+        self,
+        *,
+        store: ReplayStore,
+        mode: str = "replay",
+        model: str = "replay",
+        embed_dim: int = DEFAULT_EMBED_DIM,
+        default_reply: str = DEFAULT_REPLY,
+        latency: Optional[Dict[str, Callable[[Optional[float]], float]]] = None,
+        upstream_llm: Optional[str] = None,
+        upstream_embed: Optional[str] = None,
+        upstream_rerank: Optional[str] = None,
+        upstream_timeout: float = 600.0,
+    ):
+        self.store = store
+        self.mode = mode
+        self.model = model
+        self.embed_dim = embed_dim
+        self.default_reply = default_reply
+        self.latency = {kind: parse_latency("recorded") for kind in KINDS}
+        self.latency.update(latency or {})
+        self.upstream_llm = upstream_llm.rstrip("/") if upstream_llm else None
+        self.upstream_embed = upstream_embed.rstrip("/") if upstream_embed else None
+        self.upstream_rerank = upstream_rerank.rstrip("/") if upstream_rerank else None
+        self.upstream_timeout = upstream_timeout
+
+
+def _chat_response(path: str, model: str, content: str) -> Dict[str, Any]:
+    if path == "/v1/chat/completions":
+        return {
+            "id": "replay",
+            "object": "chat.completion",
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+        }
+    return {
+        "model": model,
+        "message": {"role": "assistant", "content": content},
+        "done": True,
+    }
+
+
+def _chat_content(path: str, data: Dict[str, Any]) -> str:
+    if path == "/v1/chat/completions":
+        return ((data.get("choices") or [{}])[0].get("message") or {}).get("content", "")
+    return (data.get("message") or {}).get("content", "")
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    config: ReplayConfig  # set by make_server()
+
+    # -- plumbing --
+
+    def _send_json(self, payload: Any, status: int = 200) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length", 0))
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def _sleep(self, kind: str, recorded_ms: Optional[float]) -> None:
+        delay_ms = self.config.latency[kind](recorded_ms)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+    def _forward(self, base_url: Optional[str], path: str, body: Any) -> Tuple[Any, float]:
+        if not base_url:
+            raise RuntimeError(f"record mode needs an upstream for {path}")
+        started = time.monotonic()
+        resp = requests.post(f"{base_url}{path}", json=body, timeout=self.config.upstream_timeout)
+        resp.raise_for_status()
+        return resp.json(), (time.monotonic() - started) * 1000
+
+    def log_message(self, fmt, *args):
+        pass  # suppress logs
+
+    # -- routes --
+
+    def do_GET(self):
+        if self.path in ("/health", "/"):
+            self._send_json({"status": "ok", "mode": self.config.mode})
+        elif self.path == "/api/tags":
+            self._send_json({"models": [{"name": self.config.model, "model": self.config.model}]})
+        elif self.path == "/v1/models":
+            self._send_json({"object": "list", "data": [{"id": self.config.model, "object": "model"}]})
+        elif self.path == "/stats":
+            self._send_json(self.config.store.stats)
+        else:
+            self._send_json({"error": "not found"}, status=404)
+
+    def do_POST(self):
+        try:
+            body = self._read_json()
+            if self.path in CHAT_PATHS:
+                self._send_json(self._handle_chat(body))
+            elif self.path == "/embed":
+                self._send_json(self._handle_embed(body))
+            elif self.path == "/rerank":
+                self._send_json(self._handle_rerank(body))
+            else:
+                self._send_json({"error": "not found"}, status=404)
+        except Exception as exc:
+            print(f"[replay] {self.path} failed: {exc}", flush=True)
+            self._send_json({"error": str(exc)}, status=500)
+
+    def _handle_chat(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        store = self.config.store
+        key = chat_key(body)
+        model = body.get("model") or self.config.model
+
+        if self.config.mode == "record":
+            data, latency_ms = self._forward(self.config.upstream_llm, self.path, body)
+            store.append({
+                "kind": "chat",
+                "key": key,
+                "path": self.path,
+                "structured": chat_schema(body) is not None,
+                "content": _chat_content(self.path, data),
+                "latency_ms": round(latency_ms, 1),
+            })
+            return data
+
+        schema = chat_schema(body)
+        recorded = store.chat(key)
+        content = recorded["content"] if recorded else None
+        if content is not None and schema is not None:
+            try:
+                json.loads(content)
+            except ValueError:
+                content = None  # truncated trace dump: fall back to canned JSON
+        store.count("chat", hit=content is not None)
+        if content is None:
+            if schema is not None:
+                content = json.dumps(canned_instance(schema), ensure_ascii=False)
+            else:
+                content = self.config.default_reply
+        self._sleep("chat", recorded.get("latency_ms") if recorded else None)
+        return _chat_response(self.path, model, content)
+
+    def _handle_embed(self, body: Dict[str, Any]) -> List[List[float]]:
+        store = self.config.store
+        inputs = body.get("inputs", [])
+        texts = [inputs] if isinstance(inputs, str) else list(inputs)
+
+        if self.config.mode == "record":
+            vectors, latency_ms = self._forward(self.config.upstream_embed, "/embed", body)
+            per_text_ms = latency_ms / max(1, len(texts))
+            for text, vector in zip(texts, vectors):
+                store.append({
+                    "kind": "embed",
+                    "key": prompt_hash(text),
+                    "vector": vector,
+                    "latency_ms": round(per_text_ms, 2),
+                })
+            return vectors
+
+        vectors = []
+        recorded_ms = 0.0
+        for text in texts:
+            recorded = store.embed(text)
+            store.count("embed", hit=recorded is not None)
+            if recorded is not None:
+                vectors.append(recorded[0])
+                recorded_ms += recorded[1]
+            else:
+                vectors.append(hash_embedding(text, self.config.embed_dim))
+        self._sleep("embed", recorded_ms or None)
+        return vectors
+
+    def _handle_rerank(self, body: Dict[str, Any]) -> List[Dict[str, Any]]:
+        store = self.config.store
+        query = body.get("query", "")
+        texts = list(body.get("texts", []))
+
+        if self.config.mode == "record":
+            scores, latency_ms = self._forward(self.config.upstream_rerank, "/rerank", body)
+            store.append({
+                "kind": "rerank",
+                "key": rerank_key(query, texts),
+                "scores": scores,
+                "latency_ms": round(latency_ms, 1),
+            })
+            return scores
+
+        recorded = store.rerank(query, texts)
+        store.count("rerank", hit=recorded is not None)
+        if recorded is not None:
+            scores = recorded[0]
+        else:
+            scores = [{"index": i, "score": overlap_score(query, t)} for i, t in enumerate(texts)]
+            scores.sort(key=lambda x: x["score"], reverse=True)
+        self._sleep("rerank", recorded[1] if recorded else None)
+        return scores
+
+
+def make_server(config: ReplayConfig, host: str = "0.0.0.0", port: int = 8090) -> ThreadingHTTPServer:
+    handler = type("BoundReplayHandler", (ReplayHandler,), {"config": config})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--mode", choices=("replay", "record"), default="replay")
+    parser.add_argument("--cassette", type=Path, help="JSONL with recorded exchanges (read in replay, appended in record)")
+    parser.add_argument("--traces", type=Path, action="append", default=[], help="LLMTrace / decision trace JSONL dumps")
+    parser.add_argument("--model", default=None, help="model name for /api/tags (default: settings.llm.model)")
+    parser.add_argument("--embed-dim", type=int, default=DEFAULT_EMBED_DIM)
+    parser.add_argument("--default-reply", default=DEFAULT_REPLY)
+    parser.add_argument(
+        "--latency", action="append", default=[],
+        help="KIND=SPEC, e.g. chat=lognormal:900:0.4 (kinds: chat, embed, rerank)",
+    )
+    parser.add_argument("--upstream-llm")
+    parser.add_argument("--upstream-embed")
+    parser.add_argument("--upstream-rerank")
+    args = parser.parse_args()
+
+    model = args.model
+    if model is None:
+        sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+        from src.settings import settings
+        model = settings.llm.model
+
+    latency = {}
+    for item in args.latency:
+        kind, _, spec = item.partition("=")
+        if kind not in KINDS:
+            parser.error(f"unknown latency kind: {kind}")
+        latency[kind] = parse_latency(spec)
+
+    store = ReplayStore(args.cassette)
+    for path in args.traces:
+        print(f"[replay] Loaded {store.load_traces(path)} LLM traces from {path}")
+
+    config = ReplayConfig(
+        store=store,
+        mode=args.mode,
+        model=model,
+        embed_dim=args.embed_dim,
+        default_reply=args.default_reply,
+        latency=latency,
+        upstream_llm=args.upstream_llm,
+        upstream_embed=args.upstream_embed,
+        upstream_rerank=args.upstream_rerank,
+    )
+    server = make_server(config, args.host, args.port)
+    print(f"[replay] {args.mode} mode on http://{args.host}:{args.port} (model {model})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nShutting down.")
+        print(json.dumps(store.stats, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Load test: throughput of the session-affine front router vs worker count.
+
+For every worker count it starts N workers under `WorkerSupervisor`, puts the
+front router (`python -m src.front_router --worker-urls ...`) in front of
+them, and drives `--sessions` concurrent conversations of `--turns` turns
+each through POST /api/v1/process. Prints requests/s, latency percentiles,
+affinity violations (a session served by more than one worker) and the
+speedup over the first worker count.
+
+By default workers run `cpu_stub_app` below: every turn burns `--cpu-ms` of
+pure-Python CPU under the GIL, which is what limits a single `src.api`
+process. Use `--app src.api:app` (with the LLM/TEI pointed at
+scripts/llm_replay_server.py) to load the real bot.
+
+Usage:
+    python scripts/load_test_workers.py --workers 1,2,4 --sessions 32 --turns 10
+    python scripts/load_test_workers.py --workers 1,4 --app src.api:app --api-key $API_KEY
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI, Request  # noqa: E402
+
+from src.front_router import WorkerSupervisor  # noqa: E402
+
+
+# ── CPU-bound stand-in worker ─────────────────────────
+
+cpu_stub_app = FastAPI(title="CPU stub bot worker")
+STUB_CPU_MS = float(os.environ.get("STUB_CPU_MS", "20"))
+
+
+def _burn_cpu(milliseconds: float) -> int:
+    deadline = time.perf_counter() + milliseconds / 1000
+    acc = 0
+    while time.perf_counter() < deadline:
+        acc = (acc * 31 + 7) % 1_000_003
+    return acc
+
+
+@cpu_stub_app.get("/ready")
+@cpu_stub_app.get("/health")
+def stub_ready():
+    return {"status": "ready"}
+
+
+@cpu_stub_app.post("/api/v1/process")
+async def stub_process(request: Request):
+    payload = await request.json()
+    _burn_cpu(STUB_CPU_MS)
+    return {
+        "answer": f"ok {payload.get('session_id')}",
+        "meta": {"worker_port": os.environ.get("ROUTER_WORKER_PORT"), "pid": os.getpid()},
+    }
+
+
+# ── Harness ───────────────────────────────────────────
+
+def _wait_ready(urls: List[str], timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    pending = list(urls)
+    while pending and time.monotonic() < deadline:
+        for url in list(pending):
+            try:
+                if httpx.get(f"{url}/health", timeout=1.0).status_code == 200:
+                    pending.remove(url)
+            except httpx.HTTPError:
+                pass
+        if pending:
+            time.sleep(0.3)
+    if pending:
+        raise RuntimeError(f"Workers not ready after {timeout}s: {pending}")
+
+
+async def _drive(router_url: str, sessions: int, turns: int, api_key: str) -> Dict[str, float]:
+    latencies: List[float] = []
+    served_by: Dict[str, set] = {}
+    errors = 0
+    headers = {"Authorization": f"Bearer {api_key}"}
+
+    async with httpx.AsyncClient(timeout=600, limits=httpx.Limits(max_connections=sessions)) as client:
+
+        async def conversation(index: int) -> None:
+            nonlocal errors
+            session_id = f"load-{index}"
+            for turn in range(turns):
+                payload = {
+                    "session_id": session_id,
+                    "user_id": f"user-{index}",
+                    "message": {"text": f"Сколько стоит тариф? ход {turn}"},
+                }
+                started = time.perf_counter()
+                response = await client.post(f"{router_url}/api/v1/process", json=payload, headers=headers)
+                latencies.append((time.perf_counter() - started) * 1000)
+                if response.status_code != 200:
+                    errors += 1
+                    continue
+                meta = response.json().get("meta", {})
+                served_by.setdefault(session_id, set()).add(meta.get("worker_port") or meta.get("pid"))
+
+        started = time.perf_counter()
+        await asyncio.gather(*(conversation(i) for i in range(sessions)))
+        elapsed = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(ordered),
+        "p95_ms": ordered[int(0.95 * (len(ordered) - 1))],
+        "errors": errors,
+        "affinity_violations": sum(1 for owners in served_by.values() if len(owners - {None}) > 1),
+    }
+
+
+def run_once(worker_count: int, args) -> Dict[str, float]:
+    env_backup = os.environ.get("STUB_CPU_MS")
+    os.environ["STUB_CPU_MS"] = str(args.cpu_ms)
+    supervisor = WorkerSupervisor(
+        worker_count,
+        app=args.app,
+        base_port=args.worker_base_port,
+        extra_args=["--log-level", "warning"],
+    )
+    router = None
+    try:
+        supervisor.start()
+        _wait_ready(supervisor.urls, args.startup_timeout)
+        router = subprocess.Popen(
+            [
+                sys.executable, "-m", "src.front_router",
+                "--worker-urls", ",".join(supervisor.urls),
+                "--host", "127.0.0.1", "--port", str(args.router_port),
+            ],
+        )
+        router_url = f"http://127.0.0.1:{args.router_port}"
+        _wait_ready([router_url], args.startup_timeout)
+        return asyncio.run(_drive(router_url, args.sessions, args.turns, args.api_key))
+    finally:
+        if router is not None:
+            router.terminate()
+            router.wait(timeout=30)
+        supervisor.stop()
+        if env_backup is None:
+            os.environ.pop("STUB_CPU_MS", None)
+        else:
+            os.environ["STUB_CPU_MS"] = env_backup
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Front router throughput vs worker count")
+    parser.add_argument("--workers", default="1,2,4", help="Comma-separated worker counts")
+    parser.add_argument("--sessions", type=int, default=32)
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--cpu-ms", type=float, default=STUB_CPU_MS, help="CPU per turn for cpu_stub_app")
+    parser.add_argument("--app", default="scripts.load_test_workers:cpu_stub_app")
+    parser.add_argument("--api-key", default=os.environ.get("API_KEY", "change-me-in-production"))
+    parser.add_argument("--router-port", type=int, default=8090)
+    parser.add_argument("--worker-base-port", type=int, default=8190)
+    parser.add_argument("--startup-timeout", type=float, default=120.0)
+    args = parser.parse_args()
+
+    counts = [int(value) for value in args.workers.split(",") if value.strip()]
+    results = {count: run_once(count, args) for count in counts}
+
+    baseline = results[counts[0]]["rps"]
+    print()
+    print(f"{'workers':>8}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'errors':>8}{'affinity':>10}{'speedup':>9}")
+    for count in counts:
+        row = results[count]
+        print(
+            f"{count:>8}{row['rps']:>10.1f}{row['p50_ms']:>10.1f}{row['p95_ms']:>10.1f}"
+            f"{row['errors']:>8}{row['affinity_violations']:>10}{row['rps'] / baseline:>8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
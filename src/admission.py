@@ -0,0 +1,220 @@
+"""
+AdmissionController - bounded admission for dialogue turns in the API process.
+
+Every POST /api/v1/process turn runs synchronously in the threadpool and
+mostly waits on the LLM. Without a limit a burst of requests queues up in the
+threadpool, each request holding a worker thread (and often a per-session
+lock) until the upstream caller has long given up. The controller puts two
+event-loop-side stages in front of the threadpool:
+
+1. Per session: at most one turn of a (user_id, session_id) runs at a time.
+   Up to ``session_max_pending`` follow-up requests wait in the event loop
+   (not on a thread blocked on the session lock); anything beyond that is
+   rejected with ``SESSION_BUSY``.
+2. Global: at most ``max_in_flight`` turns run concurrently and at most
+   ``max_queue`` wait for a slot in FIFO order. A full queue is rejected
+   immediately with ``OVERLOADED``; a wait longer than
+   ``queue_timeout_seconds`` is rejected with ``QUEUE_TIMEOUT``.
+
+Rejections carry a ``retry_after`` hint derived from the moving average turn
+duration and the current queue depth.
+
+Usage:
+    admission = AdmissionController(max_in_flight=32, max_queue=64)
+
+    async with admission.admit(f"{user_id}::{session_id}"):
+        response = await run_in_threadpool(process_turn, req)
+
+The controller is not thread-safe: all calls must come from the event loop
+that serves the requests.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict, Optional
+
+
+class AdmissionRejected(Exception):
+    """Turn was not admitted; ``code`` is SESSION_BUSY, OVERLOADED or QUEUE_TIMEOUT."""
+
+    def __init__(self, code: str, message: str, retry_after: int):
+        self.code = code
+        self.message = message
+        self.retry_after = retry_after
+        super().__init__(message)
+
+
+class _FifoSlots:
+    """Counting semaphore with FIFO hand-over and an observable waiter count."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.in_use = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    @property
+    def idle(self) -> bool:
+        return self.in_use == 0 and not self._waiters
+
+    def try_acquire(self) -> bool:
+        if self.in_use < self.capacity and not self._waiters:
+            self.in_use += 1
+            return True
+        return False
+
+    async def acquire(self, timeout: Optional[float]) -> None:
+        if self.try_acquire():
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout)
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed to us just as we gave up: pass it on.
+                self.release()
+            else:
+                waiter.cancel()
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                # Hand the slot over directly; in_use stays the same.
+                waiter.set_result(None)
+                return
+        self.in_use -= 1
+
+
+class AdmissionController:
+    """Two-stage (per-session, then global) bounded admission for dialogue turns."""
+
+    WAIT_SAMPLES = 1000
+    TURN_EWMA_ALPHA = 0.2
+    MIN_RETRY_AFTER_SECONDS = 1
+    MAX_RETRY_AFTER_SECONDS = 60
+
+    def __init__(
+        self,
+        max_in_flight: int = 32,
+        max_queue: int = 64,
+        queue_timeout_seconds: float = 30.0,
+        session_max_pending: int = 1,
+    ):
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be >= 1")
+        self.max_in_flight = max_in_flight
+        self.max_queue = max(0, max_queue)
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self.session_max_pending = max(0, session_max_pending)
+
+        self._slots = _FifoSlots(max_in_flight)
+        self._sessions: Dict[str, _FifoSlots] = {}
+        self._wait_ms: Deque[float] = deque(maxlen=self.WAIT_SAMPLES)
+        self._turn_seconds_ewma: Optional[float] = None
+
+        self.admitted = 0
+        self.rejected: Dict[str, int] = {"SESSION_BUSY": 0, "OVERLOADED": 0, "QUEUE_TIMEOUT": 0}
+
+    # ── Admission ─────────────────────────────────────────
+
+    @asynccontextmanager
+    async def admit(self, session_key: str) -> AsyncIterator[None]:
+        """Hold a session slot and a global slot for the duration of one turn."""
+        started = time.monotonic()
+        session_slots = await self._enter_session(session_key)
+        try:
+            await self._enter_global()
+            self.admitted += 1
+            self._wait_ms.append((time.monotonic() - started) * 1000)
+            turn_started = time.monotonic()
+            try:
+                yield
+            finally:
+                self._observe_turn(time.monotonic() - turn_started)
+                self._slots.release()
+        finally:
+            session_slots.release()
+            if session_slots.idle and self._sessions.get(session_key) is session_slots:
+                del self._sessions[session_key]
+
+    async def _enter_session(self, session_key: str) -> _FifoSlots:
+        slots = self._sessions.get(session_key)
+        if slots is None:
+            slots = self._sessions[session_key] = _FifoSlots(1)
+        if slots.try_acquire():
+            return slots
+        if slots.waiting >= self.session_max_pending:
+            raise self._reject("SESSION_BUSY", "A turn for this session is already in progress")
+        try:
+            await slots.acquire(self.queue_timeout_seconds)
+        except asyncio.TimeoutError as err:
+            raise self._reject("QUEUE_TIMEOUT", "Timed out waiting for the previous turn of this session") from err
+        finally:
+            if slots.idle and self._sessions.get(session_key) is slots:
+                del self._sessions[session_key]
+        return slots
+
+    async def _enter_global(self) -> None:
+        if self._slots.try_acquire():
+            return
+        if self._slots.waiting >= self.max_queue:
+            raise self._reject("OVERLOADED", "Too many requests in flight, retry later")
+        try:
+            await self._slots.acquire(self.queue_timeout_seconds)
+        except asyncio.TimeoutError as err:
+            raise self._reject("QUEUE_TIMEOUT", "Timed out waiting for a free processing slot") from err
+
+    def _reject(self, code: str, message: str) -> AdmissionRejected:
+        self.rejected[code] += 1
+        return AdmissionRejected(code, message, self.retry_after_seconds())
+
+    def _observe_turn(self, seconds: float) -> None:
+        if self._turn_seconds_ewma is None:
+            self._turn_seconds_ewma = seconds
+        else:
+            alpha = self.TURN_EWMA_ALPHA
+            self._turn_seconds_ewma = alpha * seconds + (1 - alpha) * self._turn_seconds_ewma
+
+    def retry_after_seconds(self) -> int:
+        """Rough time until a newly queued turn would start, clamped to [1, 60] s."""
+        turn_seconds = self._turn_seconds_ewma or 0.0
+        estimate = turn_seconds * (self._slots.waiting + 1) / self.max_in_flight
+        return int(min(
+            self.MAX_RETRY_AFTER_SECONDS,
+            max(self.MIN_RETRY_AFTER_SECONDS, math.ceil(estimate)),
+        ))
+
+    # ── Metrics ───────────────────────────────────────────
+
+    def get_stats(self) -> dict:
+        waits = sorted(self._wait_ms)
+        return {
+            "max_in_flight": self.max_in_flight,
+            "max_queue": self.max_queue,
+            "in_flight": self._slots.in_use,
+            "queue_depth": self._slots.waiting,
+            "session_waiters": sum(slots.waiting for slots in self._sessions.values()),
+            "admitted": self.admitted,
+            "rejected": dict(self.rejected),
+            "wait_ms": {
+                "avg": round(sum(waits) / len(waits), 2) if waits else 0.0,
+                "p95": round(waits[int(0.95 * (len(waits) - 1))], 2) if waits else 0.0,
+                "max": round(waits[-1], 2) if waits else 0.0,
+            },
+            "turn_seconds_ewma": round(self._turn_seconds_ewma, 3) if self._turn_seconds_ewma is not None else None,
+        }
@@ -4,13 +4,15 @@ REST API обёртка для CRM Sales Bot.
 
 Запуск: API_KEY=<secret> uvicorn src.api:app --host 127.0.0.1 --port 8000
 
-Two SQLite tables:
+SQLite tables:
   - conversations: full bot snapshots by (session_id, user_id)
   - user_profiles: structured extracted data per (session_id, user_id)
+  - merged_user_profiles: cross-session merged profile per user_id, maintained on every profile save
   - media_knowledge: persistent media-derived knowledge per user
 """
 
 import hmac
+import itertools
 import json
 import logging
 import os
@@ -18,9 +20,11 @@ import sqlite3
 import threading
 import time
 import uuid
+from concurrent.futures import Future
 from contextlib import asynccontextmanager
 from dataclasses import replace
 
+import anyio.to_thread
 import requests
 from fastapi.concurrency import run_in_threadpool
 from fastapi import Depends, FastAPI, Header, Request
@@ -28,9 +32,14 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field, ValidationError
 
+from src.admission import AdmissionController, AdmissionRejected
 from src.bot import SalesBot
 from src.feature_flags import flags
+from src.history_compaction_worker import DEFAULT_MIN_NEW_TURNS, HistoryCompactionWorker
 from src.llm import OllamaLLM
+from src.llm_pool import llm_session_affinity
+from src.persistence import SQLitePersistence
+from src.snapshot_codec import EncodedSnapshot, SnapshotDeltaEncoder, decode_snapshot
 from src.media_preprocessor import prepare_autonomous_incoming_message, prepare_incoming_message
 from src.session_manager import SessionManager
 from src.media_turn_context import (
@@ -48,6 +57,11 @@ API_KEY = os.environ.get("API_KEY", "change-me-in-production")
 DB_PATH = os.environ.get("DB_PATH", "data/conversations.db")
 SQLITE_TIMEOUT_SECONDS = int(os.environ.get("SQLITE_TIMEOUT_SECONDS", "30"))
 SQLITE_BUSY_TIMEOUT_MS = int(os.environ.get("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_WRITE_BATCH_MAX_JOBS = int(os.environ.get("SQLITE_WRITE_BATCH_MAX_JOBS", "64"))
+SQLITE_WRITE_BATCH_WINDOW_MS = float(os.environ.get("SQLITE_WRITE_BATCH_WINDOW_MS", "2"))
+SQLITE_READER_POOL_SIZE = int(os.environ.get("SQLITE_READER_POOL_SIZE", "4"))
+SNAPSHOT_COMPRESSION = os.environ.get("SNAPSHOT_COMPRESSION", "zlib")
+SNAPSHOT_DELTA_ENABLED = os.environ.get("SNAPSHOT_DELTA_ENABLED", "0") == "1"
 DEPENDENCY_HEALTH_TIMEOUT_SECONDS = float(
     os.environ.get("DEPENDENCY_HEALTH_TIMEOUT_SECONDS", "3")
 )
@@ -60,6 +74,19 @@ ACTIVE_SESSION_FINAL_IDLE_SECONDS = int(
 ACTIVE_SESSION_SWEEP_INTERVAL_SECONDS = float(
     os.environ.get("ACTIVE_SESSION_SWEEP_INTERVAL_SECONDS", "60")
 )
+# LRU bound on resident sessions (0 disables the limit)
+SESSION_CACHE_MAX_SESSIONS = int(os.environ.get("SESSION_CACHE_MAX_SESSIONS", "1000"))
+SESSION_CACHE_MAX_MEMORY_MB = int(os.environ.get("SESSION_CACHE_MAX_MEMORY_MB", "4096"))
+ADMISSION_MAX_IN_FLIGHT = int(os.environ.get("ADMISSION_MAX_IN_FLIGHT", "32"))
+ADMISSION_MAX_QUEUE = int(os.environ.get("ADMISSION_MAX_QUEUE", "64"))
+ADMISSION_QUEUE_TIMEOUT_SECONDS = float(os.environ.get("ADMISSION_QUEUE_TIMEOUT_SECONDS", "30"))
+ADMISSION_SESSION_MAX_PENDING = int(os.environ.get("ADMISSION_SESSION_MAX_PENDING", "1"))
+# Фоновая LLM-компакция истории (0 — только детерминированный fallback при сохранении)
+HISTORY_COMPACTION_WORKERS = int(os.environ.get("HISTORY_COMPACTION_WORKERS", "1"))
+# Сколько новых несжатых ходов запускают компакцию: один LLM-вызов на пачку ходов, а не на каждый ход
+HISTORY_COMPACTION_MIN_NEW_TURNS = int(
+    os.environ.get("HISTORY_COMPACTION_MIN_NEW_TURNS", str(DEFAULT_MIN_NEW_TURNS))
+)
 DEFAULT_PROCESS_FLOW_NAME = "autonomous"
 OUTBOUND_START_SUPPORTED_FLOWS = frozenset({"pilot_survey"})
 PILOT_SURVEY_START_COMMANDS = frozenset({"/start_pilot"})
@@ -68,6 +95,13 @@ _llm = None
 _session_manager: SessionManager | None = None
 _session_sweeper_thread: threading.Thread | None = None
 _session_sweeper_stop: threading.Event | None = None
+_admission: AdmissionController | None = None
+_persistence: SQLitePersistence | None = None
+# Latest queued (not yet committed) profile write per user, for read-after-write
+_pending_profile_writes: dict[str, Future] = {}
+_pending_profile_writes_lock = threading.Lock()
+_compaction_worker: HistoryCompactionWorker | None = None
+_snapshot_encoder = SnapshotDeltaEncoder(compression=SNAPSHOT_COMPRESSION, enabled=SNAPSHOT_DELTA_ENABLED)
 _startup_warmup_state = {
     "status": "pending",
     "started_at": None,
@@ -83,10 +117,11 @@ _startup_warmup_lock = threading.Lock()
 class APIError(Exception):
     """Structured API exception with HTTP status code."""
 
-    def __init__(self, status_code: int, code: str, message: str):
+    def __init__(self, status_code: int, code: str, message: str, headers: dict | None = None):
         self.status_code = status_code
         self.code = code
         self.message = message
+        self.headers = headers
         super().__init__(message)
 
 
@@ -115,6 +150,19 @@ def _db_connect() -> sqlite3.Connection:
     return conn
 
 
+def _db_read(query):
+    """Run ``query(conn)`` on a pooled reader, or a one-off connection before startup."""
+    if _persistence is not None:
+        with _persistence.reader() as conn:
+            return query(conn)
+    conn = _db_connect()
+    conn.row_factory = sqlite3.Row
+    try:
+        return query(conn)
+    finally:
+        conn.close()
+
+
 def _init_db():
     os.makedirs(os.path.dirname(DB_PATH) or ".", exist_ok=True)
     conn = _db_connect()
@@ -124,10 +172,13 @@ def _init_db():
             session_id TEXT NOT NULL,
             user_id    TEXT NOT NULL,
             snapshot   TEXT,
+            snapshot_delta   BLOB,
+            snapshot_base_id TEXT,
             updated_at REAL,
             PRIMARY KEY (session_id, user_id)
         )
     """)
+    _migrate_conversations_columns(conn)
     conn.execute("""
         CREATE TABLE IF NOT EXISTS user_profiles (
             session_id        TEXT NOT NULL,
@@ -177,8 +228,57 @@ def _init_db():
     conn.execute(
         "CREATE INDEX IF NOT EXISTS idx_media_knowledge_user_updated ON media_knowledge(user_id, updated_at DESC)"
     )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_user_profiles_user_updated ON user_profiles(user_id, updated_at DESC)"
+    )
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS merged_user_profiles (
+            user_id      TEXT PRIMARY KEY,
+            profile_json TEXT NOT NULL,
+            updated_at   REAL
+        )
+    """)
+    backfilled = _backfill_merged_user_profiles(conn)
     conn.commit()
     conn.close()
+    if backfilled:
+        logger.info("Backfilled merged user profiles: %d", backfilled)
+
+
+def _migrate_conversations_columns(conn: sqlite3.Connection) -> None:
+    """Migration: delta snapshot columns for databases created before the snapshot codec."""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(conversations)").fetchall()}
+    if "snapshot_delta" not in columns:
+        conn.execute("ALTER TABLE conversations ADD COLUMN snapshot_delta BLOB")
+    if "snapshot_base_id" not in columns:
+        conn.execute("ALTER TABLE conversations ADD COLUMN snapshot_base_id TEXT")
+
+
+def _backfill_merged_user_profiles(conn: sqlite3.Connection) -> int:
+    """Migration: build merged_user_profiles for users that only have per-session rows."""
+    conn.row_factory = sqlite3.Row
+    rows = conn.execute(
+        """
+        SELECT *
+        FROM user_profiles
+        WHERE user_id NOT IN (SELECT user_id FROM merged_user_profiles)
+        ORDER BY user_id, updated_at DESC
+        """
+    ).fetchall()
+    conn.row_factory = None
+    count = 0
+    for user_id, group in itertools.groupby((dict(row) for row in rows), key=lambda row: row["user_id"]):
+        user_rows = list(group)
+        conn.execute(
+            "INSERT INTO merged_user_profiles (user_id, profile_json, updated_at) VALUES (?, ?, ?)",
+            (
+                user_id,
+                json.dumps(_merge_profile_rows(user_rows), ensure_ascii=False),
+                max((row["updated_at"] or 0.0) for row in user_rows),
+            ),
+        )
+        count += 1
+    return count
 
 
 def _db_healthcheck() -> bool:
@@ -193,13 +293,14 @@ def _db_healthcheck() -> bool:
 
 
 def _load_snapshot(session_id: str, user_id: str) -> dict | None:
-    conn = _db_connect()
-    row = conn.execute(
-        "SELECT snapshot FROM conversations WHERE session_id=? AND user_id=?",
-        (session_id, user_id),
-    ).fetchone()
-    conn.close()
-    return json.loads(row[0]) if row and row[0] else None
+    row = _db_read(
+        lambda conn: conn.execute(
+            "SELECT snapshot, snapshot_delta FROM conversations WHERE session_id=? AND user_id=?",
+            (session_id, user_id),
+        ).fetchone()
+    )
+    # snapshot: codec frame (BLOB) or legacy JSON TEXT; decode_snapshot handles both.
+    return decode_snapshot(row[0], row[1]) if row and row[0] else None
 
 
 def _split_storage_session_id(storage_session_id: str) -> tuple[str, str]:
@@ -217,6 +318,18 @@ def _load_storage_snapshot(storage_session_id: str) -> dict | None:
 
 
 def _save_snapshot(session_id: str, user_id: str, snapshot: dict):
+    if _persistence is not None:
+        # Кодируем здесь, чтобы не нагружать writer-поток; snapshot durable до возврата.
+        encoded = _snapshot_encoder.encode(f"{user_id}::{session_id}", snapshot)
+        _persistence.write(
+            _save_snapshot_conn,
+            session_id=session_id,
+            user_id=user_id,
+            snapshot=snapshot,
+            updated_at=time.time(),
+            encoded=encoded,
+        )
+        return
     conn = _db_connect()
     _save_snapshot_conn(
         conn,
@@ -241,18 +354,56 @@ def _save_snapshot_conn(
     user_id: str,
     snapshot: dict,
     updated_at: float,
+    encoded: EncodedSnapshot | None = None,
 ) -> None:
+    storage_key = f"{user_id}::{session_id}"
+    if encoded is None:
+        encoded = _snapshot_encoder.encode(storage_key, snapshot)
+    if encoded.is_delta:
+        cursor = conn.execute(
+            """UPDATE conversations SET snapshot_delta=?, updated_at=?
+               WHERE session_id=? AND user_id=? AND snapshot_base_id=?""",
+            (encoded.frame, updated_at, session_id, user_id, encoded.base_id.hex()),
+        )
+        if cursor.rowcount:
+            return
+        # The stored full frame is not our base (another process wrote it): cut a new one.
+        encoded = _snapshot_encoder.encode_full(storage_key, snapshot)
     conn.execute(
-        """INSERT INTO conversations (session_id, user_id, snapshot, updated_at)
-           VALUES (?, ?, ?, ?)
+        """INSERT INTO conversations (session_id, user_id, snapshot, snapshot_delta, snapshot_base_id, updated_at)
+           VALUES (?, ?, ?, NULL, ?, ?)
            ON CONFLICT(session_id, user_id)
-           DO UPDATE SET snapshot=excluded.snapshot, updated_at=excluded.updated_at""",
-        (session_id, user_id, json.dumps(snapshot, ensure_ascii=False), updated_at),
+           DO UPDATE SET snapshot=excluded.snapshot,
+                         snapshot_delta=NULL,
+                         snapshot_base_id=excluded.snapshot_base_id,
+                         updated_at=excluded.updated_at""",
+        (
+            session_id,
+            user_id,
+            encoded.frame,
+            encoded.base_id.hex() if encoded.base_id else None,
+            updated_at,
+        ),
     )
 
 
-def _save_user_profile(session_id: str, user_id: str, bot: SalesBot):
-    """Extract and persist structured user data from bot state."""
+def _save_user_profile(session_id: str, user_id: str, bot: SalesBot) -> Future | None:
+    """
+    Extract and persist structured user data from bot state.
+
+    With the writer service the write is queued and its future returned: the
+    turn does not wait for it, profile reads for the same user do.
+    """
+    if _persistence is not None:
+        # Bot state is read here, under the session lock; the write itself is asynchronous.
+        future = _persistence.submit(
+            _write_user_profile,
+            _user_profile_params(session_id=session_id, user_id=user_id, bot=bot, updated_at=time.time()),
+        )
+        with _pending_profile_writes_lock:
+            _pending_profile_writes[user_id] = future
+        future.add_done_callback(lambda done: _profile_write_done(user_id, done))
+        return future
     conn = _db_connect()
     _save_user_profile_conn(
         conn,
@@ -265,6 +416,28 @@ def _save_user_profile(session_id: str, user_id: str, bot: SalesBot):
     conn.close()
 
 
+def _profile_write_done(user_id: str, future: Future) -> None:
+    with _pending_profile_writes_lock:
+        if _pending_profile_writes.get(user_id) is future:
+            del _pending_profile_writes[user_id]
+    error = future.exception()
+    if error is not None:
+        logger.warning("User profile write failed", extra={"user_id": user_id, "error": str(error)})
+
+
+def _await_profile_write(user_id: str) -> None:
+    """Read-after-write: wait for the user's queued profile write (jobs commit in order)."""
+    with _pending_profile_writes_lock:
+        future = _pending_profile_writes.get(user_id)
+    if future is None:
+        return
+    try:
+        future.result(timeout=SQLITE_TIMEOUT_SECONDS)
+    except Exception:
+        # Failure is logged by _profile_write_done; read what is committed
+        pass
+
+
 def _save_user_profile_conn(
     conn: sqlite3.Connection,
     *,
@@ -274,6 +447,14 @@ def _save_user_profile_conn(
     updated_at: float,
 ) -> None:
     """Extract and persist structured user data from bot state."""
+    _write_user_profile(
+        conn,
+        _user_profile_params(session_id=session_id, user_id=user_id, bot=bot, updated_at=updated_at),
+    )
+
+
+def _user_profile_params(*, session_id: str, user_id: str, bot: SalesBot, updated_at: float) -> tuple:
+    """Build the user_profiles upsert parameters from bot state."""
     # Merge data from collected_data + client_profile
     collected = bot.state_machine.collected_data or {}
 
@@ -312,6 +493,19 @@ def _save_user_profile_conn(
     interested_features = json.dumps(profile_dict.get("interested_features", []), ensure_ascii=False)
     objection_types = json.dumps(profile_dict.get("objection_types", []), ensure_ascii=False)
 
+    return (
+        session_id, user_id,
+        _get("company_name"), _get("company_size"), _get("industry"), _get("contact_name"),
+        _get("contact_phone"), _get("contact_email"),
+        _get("business_type"), _get("current_tools"), _get("budget_range"), _get("timeline"),
+        _get("pain_category"), _get("role"), _get("users_count"), _get("urgency"),
+        _get("preferred_channel"),
+        pain_points, interested_features, objection_types,
+        lead_score, lead_temperature, updated_at,
+    )
+
+
+def _write_user_profile(conn: sqlite3.Connection, params: tuple) -> None:
     conn.execute(
         """INSERT INTO user_profiles (
                session_id, user_id,
@@ -344,45 +538,67 @@ def _save_user_profile_conn(
                lead_score        = COALESCE(excluded.lead_score, user_profiles.lead_score),
                lead_temperature  = COALESCE(excluded.lead_temperature, user_profiles.lead_temperature),
                updated_at        = excluded.updated_at""",
-        (
-            session_id, user_id,
-            _get("company_name"), _get("company_size"), _get("industry"), _get("contact_name"),
-            _get("contact_phone"), _get("contact_email"),
-            _get("business_type"), _get("current_tools"), _get("budget_range"), _get("timeline"),
-            _get("pain_category"), _get("role"), _get("users_count"), _get("urgency"),
-            _get("preferred_channel"),
-            pain_points, interested_features, objection_types,
-            lead_score, lead_temperature, updated_at,
-        ),
+        params,
+    )
+    session_id, user_id, updated_at = params[0], params[1], params[-1]
+    _refresh_merged_user_profile(conn, session_id=session_id, user_id=user_id, updated_at=updated_at)
+
+
+def _refresh_merged_user_profile(
+    conn: sqlite3.Connection,
+    *,
+    session_id: str,
+    user_id: str,
+    updated_at: float,
+) -> None:
+    """Fold the just-saved session row into the user's merged profile (it is the newest row)."""
+    cursor = conn.execute(
+        "SELECT * FROM user_profiles WHERE session_id=? AND user_id=?",
+        (session_id, user_id),
+    )
+    session_row = cursor.fetchone()
+    if session_row is None:
+        return
+    session_profile = dict(zip((column[0] for column in cursor.description), session_row))
+    previous = conn.execute(
+        "SELECT profile_json FROM merged_user_profiles WHERE user_id=?",
+        (user_id,),
+    ).fetchone()
+    merged = _merge_profile_rows([session_profile, _safe_json_dict(previous[0] if previous else None)])
+    conn.execute(
+        """INSERT INTO merged_user_profiles (user_id, profile_json, updated_at)
+           VALUES (?, ?, ?)
+           ON CONFLICT(user_id)
+           DO UPDATE SET profile_json=excluded.profile_json, updated_at=excluded.updated_at""",
+        (user_id, json.dumps(merged, ensure_ascii=False), updated_at),
     )
 
 
 def _load_user_profile(user_id: str) -> list[dict]:
     """Load all profiles for a user across sessions."""
-    conn = _db_connect()
-    conn.row_factory = sqlite3.Row
-    rows = conn.execute(
-        "SELECT * FROM user_profiles WHERE user_id=? ORDER BY updated_at DESC",
-        (user_id,),
-    ).fetchall()
-    conn.close()
+    _await_profile_write(user_id)
+    rows = _db_read(
+        lambda conn: conn.execute(
+            "SELECT * FROM user_profiles WHERE user_id=? ORDER BY updated_at DESC",
+            (user_id,),
+        ).fetchall()
+    )
     return [dict(r) for r in rows]
 
 
 def _load_recent_media_knowledge(user_id: str, limit: int = 20) -> list[dict]:
-    conn = _db_connect()
-    conn.row_factory = sqlite3.Row
-    rows = conn.execute(
-        """
-        SELECT *
-        FROM media_knowledge
-        WHERE user_id=?
-        ORDER BY updated_at DESC
-        LIMIT ?
-        """,
-        (user_id, limit),
-    ).fetchall()
-    conn.close()
+    rows = _db_read(
+        lambda conn: conn.execute(
+            """
+            SELECT *
+            FROM media_knowledge
+            WHERE user_id=?
+            ORDER BY updated_at DESC
+            LIMIT ?
+            """,
+            (user_id, limit),
+        ).fetchall()
+    )
 
     cards: list[dict] = []
     for row in rows:
@@ -416,7 +632,22 @@ def _safe_json_dict(raw: str | None) -> dict:
 
 
 def _merge_user_profiles(user_id: str) -> dict:
-    rows = _load_user_profile(user_id)
+    """Cross-session merged profile: one point lookup in merged_user_profiles."""
+    _await_profile_write(user_id)
+    row = _db_read(
+        lambda conn: conn.execute(
+            "SELECT profile_json FROM merged_user_profiles WHERE user_id=?",
+            (user_id,),
+        ).fetchone()
+    )
+    if row:
+        return _safe_json_dict(row[0])
+    # Rows written around the writer (older processes, manual imports) have no merged row yet.
+    return _merge_profile_rows(_load_user_profile(user_id))
+
+
+def _merge_profile_rows(rows: list[dict]) -> dict:
+    """Merge profile rows, newest first: latest non-empty scalar wins, list fields are unioned."""
     merged: dict = {}
     list_fields = {"pain_points", "interested_features", "objection_types"}
 
@@ -426,7 +657,8 @@ def _merge_user_profiles(user_id: str) -> dict:
                 continue
             if key in list_fields:
                 existing = list(merged.get(key, []) or [])
-                for item in _safe_json_list(value):
+                items = value if isinstance(value, list) else _safe_json_list(value)
+                for item in items:
                     if item not in existing:
                         existing.append(item)
                 if existing:
@@ -456,38 +688,26 @@ def _save_media_knowledge_conn(
     bot: SalesBot,
     updated_at: float,
 ) -> None:
+    rows = _media_knowledge_rows(session_id=session_id, user_id=user_id, bot=bot, updated_at=updated_at)
+    if rows:
+        _write_media_knowledge(conn, user_id, rows)
+
+
+def _media_knowledge_rows(*, session_id: str, user_id: str, bot: SalesBot, updated_at: float) -> list[tuple]:
+    """Build media_knowledge upsert rows from the bot's episodic memory."""
     if not hasattr(bot, "context_window") or not hasattr(bot.context_window, "episodic_memory"):
-        return
+        return []
     memory = bot.context_window.episodic_memory
     if not hasattr(memory, "get_recent_media_knowledge_cards"):
-        return
+        return []
 
+    rows: list[tuple] = []
     cards = memory.get_recent_media_knowledge_cards(limit=100)
     for raw_card in cards:
         card = scrub_media_card_payload(raw_card)
         if not card:
             continue
-        conn.execute(
-            """
-            INSERT INTO media_knowledge (
-                user_id, session_id, knowledge_id, attachment_fingerprint,
-                file_name, media_kind, source_user_text, summary,
-                facts_json, extracted_data_json, answer_context,
-                created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(user_id, attachment_fingerprint) DO UPDATE SET
-                session_id=excluded.session_id,
-                knowledge_id=excluded.knowledge_id,
-                file_name=excluded.file_name,
-                media_kind=excluded.media_kind,
-                source_user_text=excluded.source_user_text,
-                summary=excluded.summary,
-                facts_json=excluded.facts_json,
-                extracted_data_json=excluded.extracted_data_json,
-                answer_context=excluded.answer_context,
-                created_at=COALESCE(media_knowledge.created_at, excluded.created_at),
-                updated_at=excluded.updated_at
-            """,
+        rows.append(
             (
                 user_id,
                 session_id,
@@ -502,8 +722,35 @@ def _save_media_knowledge_conn(
                 redact_media_text(card.get("answer_context")),
                 float(card.get("created_at") or updated_at),
                 float(card.get("updated_at") or updated_at),
-            ),
+            )
         )
+    return rows
+
+
+def _write_media_knowledge(conn: sqlite3.Connection, user_id: str, rows: list[tuple]) -> None:
+    conn.executemany(
+        """
+        INSERT INTO media_knowledge (
+            user_id, session_id, knowledge_id, attachment_fingerprint,
+            file_name, media_kind, source_user_text, summary,
+            facts_json, extracted_data_json, answer_context,
+            created_at, updated_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(user_id, attachment_fingerprint) DO UPDATE SET
+            session_id=excluded.session_id,
+            knowledge_id=excluded.knowledge_id,
+            file_name=excluded.file_name,
+            media_kind=excluded.media_kind,
+            source_user_text=excluded.source_user_text,
+            summary=excluded.summary,
+            facts_json=excluded.facts_json,
+            extracted_data_json=excluded.extracted_data_json,
+            answer_context=excluded.answer_context,
+            created_at=COALESCE(media_knowledge.created_at, excluded.created_at),
+            updated_at=excluded.updated_at
+        """,
+        rows,
+    )
 
     conn.execute(
         """
@@ -523,6 +770,11 @@ def _save_media_knowledge_conn(
 
 def _save_media_knowledge(session_id: str, user_id: str, bot: SalesBot) -> None:
     """Persist media-derived knowledge from bot memory."""
+    if _persistence is not None:
+        rows = _media_knowledge_rows(session_id=session_id, user_id=user_id, bot=bot, updated_at=time.time())
+        if rows:
+            _persistence.submit(_write_media_knowledge, user_id, rows)
+        return
     conn = _db_connect()
     try:
         _save_media_knowledge_conn(
@@ -556,6 +808,34 @@ def _run_session_sweeper(stop_event: threading.Event) -> None:
             logger.exception("Session sweeper failed")
 
 
+def _create_admission_controller() -> AdmissionController | None:
+    """Bounded admission for dialogue turns; ADMISSION_MAX_IN_FLIGHT <= 0 disables it."""
+    if ADMISSION_MAX_IN_FLIGHT <= 0:
+        return None
+    # Каждый допущенный ход занимает поток threadpool: лимит anyio не должен быть ниже in-flight.
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = max(limiter.total_tokens, ADMISSION_MAX_IN_FLIGHT)
+    return AdmissionController(
+        max_in_flight=ADMISSION_MAX_IN_FLIGHT,
+        max_queue=ADMISSION_MAX_QUEUE,
+        queue_timeout_seconds=ADMISSION_QUEUE_TIMEOUT_SECONDS,
+        session_max_pending=ADMISSION_SESSION_MAX_PENDING,
+    )
+
+
+@asynccontextmanager
+async def _admit_turn(req: "ProcessRequest"):
+    """Hold an admission slot for the turn; rejections become 429 with Retry-After."""
+    if _admission is None:
+        yield
+        return
+    try:
+        async with _admission.admit(f"{req.user_id}::{req.session_id}"):
+            yield
+    except AdmissionRejected as err:
+        raise APIError(429, err.code, err.message, headers={"Retry-After": str(err.retry_after)}) from err
+
+
 def _bootstrap_bot_memory(bot: SalesBot, *, user_id: str) -> None:
     try:
         profile_data = _merge_user_profiles(user_id)
@@ -718,16 +998,40 @@ def _start_startup_warmup() -> None:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global _llm, _session_manager, _session_sweeper_thread, _session_sweeper_stop
+    global _llm, _session_manager, _session_sweeper_thread, _session_sweeper_stop, _admission, _persistence
+    global _compaction_worker
     _setup_production_flags()
     if API_KEY == "change-me-in-production":
         logger.warning("API_KEY is set to insecure default value")
     _init_db()
+    _persistence = SQLitePersistence(
+        DB_PATH,
+        timeout_seconds=SQLITE_TIMEOUT_SECONDS,
+        busy_timeout_ms=SQLITE_BUSY_TIMEOUT_MS,
+        batch_max_jobs=SQLITE_WRITE_BATCH_MAX_JOBS,
+        batch_window_ms=SQLITE_WRITE_BATCH_WINDOW_MS,
+        reader_pool_size=SQLITE_READER_POOL_SIZE,
+    )
     _llm = OllamaLLM()
+    if hasattr(_llm, "start_endpoint_health_checks"):
+        _llm.start_endpoint_health_checks()
+    _compaction_worker = (
+        HistoryCompactionWorker(
+            workers=HISTORY_COMPACTION_WORKERS,
+            min_new_turns=HISTORY_COMPACTION_MIN_NEW_TURNS,
+        )
+        if HISTORY_COMPACTION_WORKERS > 0
+        else None
+    )
     _session_manager = SessionManager(
         load_snapshot=_load_storage_snapshot,
         save_snapshot=_save_storage_snapshot,
         require_client_id=True,
+        max_sessions=SESSION_CACHE_MAX_SESSIONS,
+        max_memory_bytes=SESSION_CACHE_MAX_MEMORY_MB * 1024 * 1024,
+        compaction_worker=_compaction_worker,
+        # Вытеснение LRU-сессий в фоне: запрос не сериализует чужие сессии
+        background_eviction=True,
     )
     _session_sweeper_stop = threading.Event()
     _session_sweeper_thread = threading.Thread(
@@ -737,6 +1041,7 @@ async def lifespan(app: FastAPI):
         daemon=True,
     )
     _session_sweeper_thread.start()
+    _admission = _create_admission_controller()
     _start_startup_warmup()
     logger.info("LLM client initialized, DB ready, autonomous flags set")
     yield
@@ -744,7 +1049,13 @@ async def lifespan(app: FastAPI):
         _session_sweeper_stop.set()
     if _session_sweeper_thread is not None:
         _session_sweeper_thread.join(timeout=2)
+    if _compaction_worker is not None:
+        # Снапшоты не ждут LLM: незавершённая компакция заменяется fallback-ом
+        dropped = _compaction_worker.close(timeout=1)
+        if dropped:
+            logger.info("Dropped %d pending history compactions on shutdown", dropped)
     if _session_manager is not None:
+        _session_manager.stop_background_eviction()
         try:
             closed = _session_manager.close_all_sessions()
             if closed:
@@ -754,9 +1065,16 @@ async def lifespan(app: FastAPI):
                 logger.info("Flushed buffered snapshots on shutdown", count=flushed)
         except Exception:
             logger.exception("Failed to serialize sessions on shutdown")
+    if _persistence is not None:
+        _persistence.close()
+    if hasattr(_llm, "stop_endpoint_health_checks"):
+        _llm.stop_endpoint_health_checks()
     _session_sweeper_stop = None
     _session_sweeper_thread = None
     _session_manager = None
+    _admission = None
+    _persistence = None
+    _compaction_worker = None
     _llm = None
 
 
@@ -768,6 +1086,7 @@ async def api_error_handler(_: Request, exc: APIError):
     return JSONResponse(
         status_code=exc.status_code,
         content=_error_payload(exc.code, exc.message),
+        headers=exc.headers,
     )
 
 
@@ -955,16 +1274,6 @@ def _process_message_request(req: ProcessRequest) -> dict:
     if _session_manager is None:
         raise APIError(503, "SERVICE_UNAVAILABLE", "Session manager is not initialized")
 
-    serialized = _session_manager.serialize_inactive_final_sessions(
-        ACTIVE_SESSION_FINAL_IDLE_SECONDS
-    )
-    if serialized:
-        logger.info(
-            "Serialized inactive final sessions on request path",
-            count=serialized,
-            idle_seconds=ACTIVE_SESSION_FINAL_IDLE_SECONDS,
-        )
-
     def _run_turn() -> tuple[dict, int, str]:
         if start_pilot_command:
             acquire = _session_manager.restart_session_with_status(
@@ -1022,10 +1331,11 @@ def _process_message_request(req: ProcessRequest) -> dict:
                 )
             )
 
-        result = bot.process(
-            prepared_message.text,
-            media_turn_context=media_turn_context,
-        )
+        with llm_session_affinity(f"{req.user_id}::{req.session_id}"):
+            result = bot.process(
+                prepared_message.text,
+                media_turn_context=media_turn_context,
+            )
         processing_ms = int((time.time() - start) * 1000)
         _session_manager.touch(
             req.session_id,
@@ -1091,6 +1401,18 @@ def ready():
     return JSONResponse(status_code=200 if is_ready else 503, content=payload)
 
 
+@app.get("/api/v1/metrics", dependencies=[Depends(verify_api_key)])
+def metrics():
+    """Runtime metrics: LLM client stats with per-endpoint latency and queue depth, session cache, admission, SQLite writer."""
+    return {
+        "llm": _llm.get_stats_dict() if hasattr(_llm, "get_stats_dict") else None,
+        "sessions": _session_manager.get_cache_stats() if _session_manager is not None else None,
+        "admission": _admission.get_stats() if _admission is not None else None,
+        "persistence": _persistence.get_stats() if _persistence is not None else None,
+        "snapshots": _snapshot_encoder.get_stats(),
+    }
+
+
 @app.post("/api/v1/process", dependencies=[Depends(verify_api_key)])
 @app.post("/api/v1/process/sula", dependencies=[Depends(verify_api_key)])
 async def process_message(request: Request):
@@ -1111,7 +1433,8 @@ async def process_message(request: Request):
             raise APIError(400, "BAD_REQUEST", "Invalid JSON body") from err
 
         payload_kind, req, normalized_sula = _parse_process_payload(raw_payload)
-        response = await run_in_threadpool(_process_message_request, req)
+        async with _admit_turn(req):
+            response = await run_in_threadpool(_process_message_request, req)
 
         if payload_kind == "default":
             return response
@@ -1130,8 +1453,8 @@ async def process_message(request: Request):
 
 @app.get("/api/v1/users/{user_id}/profile", dependencies=[Depends(verify_api_key)])
 def get_user_profile(user_id: str):
-    """Query collected user data across all sessions."""
+    """Query collected user data across all sessions plus the merged cross-session profile."""
     profiles = _load_user_profile(user_id)
     if not profiles:
         raise APIError(404, "NOT_FOUND", "No profiles found for this user")
-    return {"user_id": user_id, "profiles": profiles}
+    return {"user_id": user_id, "profiles": profiles, "merged": _merge_user_profiles(user_id)}
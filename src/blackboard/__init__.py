@@ -48,7 +48,10 @@ Key Components (Stage 9 - DialogueEventBus):
 - StateTransitionedEvent: Event emitted when state actually changes
 - ErrorOccurredEvent: Event emitted when an error occurs
 - EventHandler: Type alias for event handlers
+- EventFactory: Type alias for lazy event payloads (DialogueEventBus.emit_lazy)
 - DialogueEventBus: Event bus for observability and analytics
+- OverflowPolicy: What the async event queue does when full
+- EventBusStats: Processed/dropped/lagging counters of the event bus
 - MetricsCollector: Subscriber that collects metrics from events
 - DebugLogger: Subscriber that logs detailed debug information
 
@@ -75,7 +78,7 @@ from src.blackboard.models import (
 from src.blackboard.blackboard import DialogueBlackboard
 from src.blackboard.proposal_validator import ValidationError, ProposalValidator
 from src.blackboard.conflict_resolver import ResolutionTrace, ConflictResolver
-from src.blackboard.knowledge_source import KnowledgeSource
+from src.blackboard.knowledge_source import KnowledgeSource, SourceTriggers
 from src.blackboard.source_registry import (
     SourceRegistration,
     SourceRegistry,
@@ -92,7 +95,10 @@ from src.blackboard.event_bus import (
     StateTransitionedEvent,
     ErrorOccurredEvent,
     EventHandler,
+    EventFactory,
     DialogueEventBus,
+    OverflowPolicy,
+    EventBusStats,
     MetricsCollector,
     DebugLogger,
 )
@@ -127,6 +133,7 @@ __all__ = [
     "ConflictResolver",
     # KnowledgeSource and SourceRegistry (Stage 5)
     "KnowledgeSource",
+    "SourceTriggers",
     "SourceRegistration",
     "SourceRegistry",
     "register_source",
@@ -141,7 +148,10 @@ __all__ = [
     "StateTransitionedEvent",
     "ErrorOccurredEvent",
     "EventHandler",
+    "EventFactory",
     "DialogueEventBus",
+    "OverflowPolicy",
+    "EventBusStats",
     "MetricsCollector",
     "DebugLogger",
     # Orchestrator (Stage 10)
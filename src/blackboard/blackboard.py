@@ -1,13 +1,13 @@
 # src/blackboard/blackboard.py
 
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List, TYPE_CHECKING
+from typing import Dict, Any, Optional, List, Tuple, TYPE_CHECKING
 from datetime import datetime
 import logging
 
 from src.blackboard.models import (
     Proposal, ResolvedDecision, ContextSnapshot,
-    deep_freeze_dict, GoBackInfo, IntentTrackerReadOnly,
+    FrozenDict, deep_freeze_dict, freeze_dict_shared, GoBackInfo, IntentTrackerReadOnly,
 )
 from src.blackboard.enums import Priority, ProposalType
 from src.blackboard.protocols import (
@@ -19,7 +19,9 @@ from src.blackboard.protocols import (
 )
 from src.intent_tracker import IntentTracker, should_skip_objection_recording as _shared_skip_objection
 from src.context_envelope import ContextEnvelope
-from src.config_loader import FlowConfig
+from src.config_loader import FlowConfig, FrozenDict as _ConfigFrozenDict
+from src.conditions.cache import ConditionCache, next_data_version
+from src.conditions.trace import ConditionCacheStats
 from src.media_turn_context import MediaTurnContext, freeze_media_turn_context
 # Import objection limits from YAML (single source of truth)
 from src.yaml_config.constants import MAX_CONSECUTIVE_OBJECTIONS, MAX_TOTAL_OBJECTIONS
@@ -27,6 +29,13 @@ from src.yaml_config.constants import MAX_CONSECUTIVE_OBJECTIONS, MAX_TOTAL_OBJE
 logger = logging.getLogger(__name__)
 
 
+def _read_only(value: Dict[str, Any]) -> Dict[str, Any]:
+    """Freeze a config dict for the ContextSnapshot unless it is already read-only."""
+    if isinstance(value, (FrozenDict, _ConfigFrozenDict)):
+        return value
+    return deep_freeze_dict(dict(value))
+
+
 class DataUpdateCollisionError(Exception):
     """Raised when two sources write to the same data/flag field in strict mode."""
     pass
@@ -95,10 +104,14 @@ class DialogueBlackboard:
 
         # === Context Layer (populated on begin_turn) ===
         self._context: Optional[ContextSnapshot] = None
+        # Read-only flow dict of a frozen (shared) FlowConfig, built once
+        self._frozen_flow_dict: Optional[FrozenDict] = None
 
         # === Proposal Layer ===
         self._action_proposals: List[Proposal] = []
         self._transition_proposals: List[Proposal] = []
+        # source_name -> (action proposals, transition proposals)
+        self._proposals_by_source: Dict[str, Tuple[List[Proposal], List[Proposal]]] = {}
         self._data_updates: Dict[str, Any] = {}
         self._flags_to_set: Dict[str, Any] = {}
         self._context_signals: List[Dict[str, Any]] = []
@@ -293,30 +306,25 @@ class DialogueBlackboard:
                 history=history,
             )
 
-        flow_dict_raw = {}
-        flow_to_dict = getattr(self._flow_config, "to_dict", None)
-        if callable(flow_to_dict):
-            try:
-                flow_dict_raw = flow_to_dict() or {}
-            except Exception:
-                flow_dict_raw = {}
-        if not isinstance(flow_dict_raw, dict):
-            flow_dict_raw = {}
-
         raw_states = getattr(self._flow_config, "states", {})
         valid_states = frozenset(raw_states.keys()) if isinstance(raw_states, dict) else frozenset()
 
+        # Copy-on-write: parts unchanged since the previous turn's snapshot
+        # (usually most of collected_data) are shared, not frozen again
+        previous = self._context
         self._context = ContextSnapshot(
             state=self._state_machine.state,
-            collected_data=deep_freeze_dict(dict(current_collected)),
+            collected_data=freeze_dict_shared(
+                current_collected, previous.collected_data if previous else None
+            ),
             current_intent=intent,
             intent_tracker=IntentTrackerReadOnly(tracker) if tracker else tracker,
             context_envelope=context_envelope,
             turn_number=tracker.turn_number if tracker else 0,
             persona=persona,
-            state_config=deep_freeze_dict(dict(state_config)),
-            flow_config=deep_freeze_dict(flow_dict_raw),
-            state_to_phase=deep_freeze_dict(dict(state_to_phase)),
+            state_config=_read_only(state_config),
+            flow_config=self._snapshot_flow_dict(),
+            state_to_phase=_read_only(state_to_phase),
             state_before_objection=self._state_machine.state_before_objection if hasattr(self._state_machine, 'state_before_objection') else getattr(self._state_machine, '_state_before_objection', None),
             valid_states=valid_states,
             go_back_info=go_back_info,
@@ -329,13 +337,20 @@ class DialogueBlackboard:
             # Dialog history for decision LLM
             dialog_history=tuple(dialog_history or []),
             transcript=transcript,
-            history_projections=deep_freeze_dict(dict(history_projections or {})),
+            history_projections=freeze_dict_shared(
+                dict(history_projections or {}),
+                previous.history_projections if previous else None,
+            ),
             media_turn_context=freeze_media_turn_context(media_turn_context),
+            # Every evaluator context built from this snapshot shares one cache
+            data_version=next_data_version(),
+            condition_cache=ConditionCache(),
         )
 
         # Clear proposal layer
         self._action_proposals.clear()
         self._transition_proposals.clear()
+        self._proposals_by_source.clear()
         self._data_updates.clear()
         self._flags_to_set.clear()
         self._context_signals.clear()
@@ -366,6 +381,35 @@ class DialogueBlackboard:
             )
         return result
 
+    def _snapshot_flow_dict(self) -> FrozenDict:
+        """
+        Read-only FlowConfig.to_dict() for the ContextSnapshot.
+
+        A frozen (shared) FlowConfig cannot change, so its dict is built once;
+        a mutable one is rebuilt every turn.
+        """
+        if self._frozen_flow_dict is not None:
+            return self._frozen_flow_dict
+
+        flow_dict_raw = {}
+        flow_to_dict = getattr(self._flow_config, "to_dict", None)
+        if callable(flow_to_dict):
+            try:
+                flow_dict_raw = flow_to_dict() or {}
+            except Exception:
+                flow_dict_raw = {}
+        if not isinstance(flow_dict_raw, dict):
+            flow_dict_raw = {}
+
+        if getattr(self._flow_config, "frozen", False) is True:
+            # Nested values of a frozen flow are already read-only
+            self._frozen_flow_dict = FrozenDict(
+                {key: _read_only(value) if isinstance(value, dict) else value
+                 for key, value in flow_dict_raw.items()}
+            )
+            return self._frozen_flow_dict
+        return deep_freeze_dict(flow_dict_raw)
+
     def get_context(self) -> ContextSnapshot:
         """
         Get the immutable context snapshot.
@@ -455,6 +499,7 @@ class DialogueBlackboard:
         )
 
         self._action_proposals.append(proposal)
+        self._source_proposals(source_name)[0].append(proposal)
 
         logger.debug(
             f"Action proposed: {action} (priority={priority.name}, "
@@ -492,6 +537,7 @@ class DialogueBlackboard:
         )
 
         self._transition_proposals.append(proposal)
+        self._source_proposals(source_name)[1].append(proposal)
 
         logger.debug(
             f"Transition proposed: {next_state} (priority={priority.name}, "
@@ -582,6 +628,24 @@ class DialogueBlackboard:
         """
         return self._action_proposals + self._transition_proposals
 
+    def get_source_proposals(self, source_name: str) -> List[Proposal]:
+        """
+        Get proposals made under source_name this turn.
+
+        Same order as filtering get_proposals() by source_name (actions first),
+        without scanning the proposals of other sources.
+        """
+        entry = self._proposals_by_source.get(source_name)
+        if entry is None:
+            return []
+        return entry[0] + entry[1]
+
+    def _source_proposals(self, source_name: str) -> Tuple[List[Proposal], List[Proposal]]:
+        entry = self._proposals_by_source.get(source_name)
+        if entry is None:
+            entry = self._proposals_by_source[source_name] = ([], [])
+        return entry
+
     def get_action_proposals(self) -> List[Proposal]:
         """Get only action proposals."""
         return list(self._action_proposals)
@@ -652,6 +716,11 @@ class DialogueBlackboard:
     # UTILITY METHODS
     # =========================================================================
 
+    def get_condition_cache_stats(self) -> Optional[ConditionCacheStats]:
+        """Condition memoization stats for the current turn (None before begin_turn)."""
+        cache = getattr(self._context, "condition_cache", None)
+        return cache.get_stats() if cache is not None else None
+
     def get_turn_summary(self) -> Dict[str, Any]:
         """
         Get a summary of the current turn for logging/debugging.
@@ -660,6 +729,7 @@ class DialogueBlackboard:
             Dictionary with turn summary
         """
         tracker = self.intent_tracker
+        cache_stats = self.get_condition_cache_stats()
         return {
             "turn_number": tracker.turn_number if tracker else 0,
             "intent": self._current_intent,
@@ -670,6 +740,7 @@ class DialogueBlackboard:
             "transition_proposals": [str(p) for p in self._transition_proposals],
             "data_updates": self._data_updates,
             "decision": self._decision.to_dict() if self._decision else None,
+            "condition_cache": cache_stats.to_dict() if cache_stats else None,
             "turn_duration_ms": (
                 (datetime.now() - self._turn_start_time).total_seconds() * 1000
                 if self._turn_start_time else None
@@ -16,6 +16,15 @@ from .enums import Priority, ProposalType
 
 logger = logging.getLogger(__name__)
 
+# Rank used for proposals without an explicit priority_rank
+_DEFAULT_PRIORITY_RANK = 10_000
+
+
+def _priority_sort_key(p: Proposal) -> Tuple[int, int]:
+    """Sort key: Priority enum value, then priority_rank (lower wins)."""
+    rank = p.priority_rank if p.priority_rank is not None else _DEFAULT_PRIORITY_RANK
+    return (p.priority.value, rank)
+
 
 @dataclass
 class ResolutionTrace:
@@ -84,14 +93,23 @@ class ConflictResolver:
         LOW (3): Fallback actions (continue, default behavior)
     """
 
-    def __init__(self, default_action: str = "continue"):
+    def __init__(self, default_action: str = "continue", fast_path: bool = True):
         """
         Initialize the conflict resolver.
 
         Args:
             default_action: Action to use when no action proposals exist
+            fast_path: Resolve uncontested turns without ranking (see
+                _resolve_fast). Disable to always run the full algorithm.
         """
         self._default_action = default_action
+        self._fast_path = fast_path
+        self._fast_path_count = 0
+        self._full_path_count = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """Number of resolutions that took the fast and the full path."""
+        return {"fast_path": self._fast_path_count, "full_path": self._full_path_count}
 
     def resolve(
         self,
@@ -112,12 +130,25 @@ class ConflictResolver:
         Returns:
             ResolvedDecision with final action, next_state, and metadata
         """
-        trace = ResolutionTrace()
-
         # Step 1: Separate proposals by type
         action_proposals = [p for p in proposals if p.type == ProposalType.ACTION]
         transition_proposals = [p for p in proposals if p.type == ProposalType.TRANSITION]
 
+        if self._fast_path and len(action_proposals) <= 1 and (
+            len(transition_proposals) <= 1
+            or (action_proposals and not action_proposals[0].combinable)
+        ):
+            self._fast_path_count += 1
+            return self._resolve_fast(
+                action_proposals[0] if action_proposals else None,
+                transition_proposals,
+                current_state,
+                data_updates,
+                flags_to_set,
+            )
+        self._full_path_count += 1
+
+        trace = ResolutionTrace()
         trace.action_proposals = action_proposals
         trace.transition_proposals = transition_proposals
 
@@ -144,13 +175,8 @@ class ConflictResolver:
         # The behavior "different input order → different result" is EXPECTED for
         # stable sort. This is by design, not a bug. If explicit ordering is needed
         # for equal priorities, set distinct priority_rank values in Knowledge Sources.
-        default_rank = 10_000
-        def _sort_key(p: Proposal):
-            rank = p.priority_rank if p.priority_rank is not None else default_rank
-            return (p.priority.value, rank)
-
-        action_proposals.sort(key=_sort_key)
-        transition_proposals.sort(key=_sort_key)
+        action_proposals.sort(key=_priority_sort_key)
+        transition_proposals.sort(key=_priority_sort_key)
 
         # Record rankings for trace
         trace.action_ranking = [
@@ -212,6 +238,92 @@ class ConflictResolver:
             if winning_action:
                 rejected_proposals.extend(action_proposals[1:])  # Non-winning actions
 
+        return self._build_decision(
+            winning_action,
+            winning_transition,
+            rejected_proposals,
+            trace.to_dict(),
+            current_state,
+            data_updates,
+            flags_to_set,
+        )
+
+    def _resolve_fast(
+        self,
+        winning_action: Optional[Proposal],
+        transition_proposals: List[Proposal],
+        current_state: str,
+        data_updates: Optional[Dict[str, Any]],
+        flags_to_set: Optional[Dict[str, Any]],
+    ) -> ResolvedDecision:
+        """
+        Resolve an uncontested turn: at most one action, and either at most
+        one transition or a blocking action that rejects them all.
+
+        No proposal competes with another, so there is no ranking to build
+        beyond ordering the rejected transitions, and the trace dict is
+        written directly instead of through ResolutionTrace. The decision is
+        identical to the full path's.
+        """
+        if len(transition_proposals) > 1:
+            transition_proposals = sorted(transition_proposals, key=_priority_sort_key)
+
+        winning_transition: Optional[Proposal] = None
+        blocking_reason: Optional[str] = None
+        if winning_action and not winning_action.combinable:
+            blocking_reason = (
+                f"Action '{winning_action.value}' has combinable=False, "
+                f"blocking {len(transition_proposals)} transition(s)"
+            )
+            merge_decision = "BLOCKED"
+            rejected_proposals = list(transition_proposals)
+        elif transition_proposals:
+            winning_transition = transition_proposals[0]
+            merge_decision = "MERGED" if winning_action else "TRANSITION_ONLY"
+            rejected_proposals = []
+        else:
+            merge_decision = "ACTION_ONLY" if winning_action else "NO_PROPOSALS"
+            rejected_proposals = []
+
+        # Same layout as ResolutionTrace.to_dict()
+        resolution_trace = {
+            "action_proposals_count": 1 if winning_action else 0,
+            "transition_proposals_count": len(transition_proposals),
+            "action_ranking": (
+                [(winning_action.value, winning_action.priority, winning_action.source_name)]
+                if winning_action else []
+            ),
+            "transition_ranking": [
+                (p.value, p.priority, p.source_name) for p in transition_proposals
+            ],
+            "winning_action": str(winning_action) if winning_action else None,
+            "winning_transition": str(winning_transition) if winning_transition else None,
+            "merge_decision": merge_decision,
+            "blocking_reason": blocking_reason,
+            "winning_action_metadata": winning_action.metadata if winning_action else {},
+        }
+
+        return self._build_decision(
+            winning_action,
+            winning_transition,
+            rejected_proposals,
+            resolution_trace,
+            current_state,
+            data_updates,
+            flags_to_set,
+        )
+
+    def _build_decision(
+        self,
+        winning_action: Optional[Proposal],
+        winning_transition: Optional[Proposal],
+        rejected_proposals: List[Proposal],
+        resolution_trace: Dict[str, Any],
+        current_state: str,
+        data_updates: Optional[Dict[str, Any]],
+        flags_to_set: Optional[Dict[str, Any]],
+    ) -> ResolvedDecision:
+        """Build reason codes and the final ResolvedDecision (steps 5-6)."""
         # Step 5: Build reason codes
         reason_codes: List[str] = []
         if winning_action:
@@ -228,14 +340,14 @@ class ConflictResolver:
             next_state=next_state,
             reason_codes=reason_codes,
             rejected_proposals=rejected_proposals,
-            resolution_trace=trace.to_dict(),
+            resolution_trace=resolution_trace,
             data_updates=data_updates or {},
             flags_to_set=flags_to_set or {},
         )
 
         logger.info(
             f"Conflict resolved: action='{final_action}', next_state='{next_state}', "
-            f"merge={trace.merge_decision}, rejected={len(rejected_proposals)}"
+            f"merge={resolution_trace['merge_decision']}, rejected={len(rejected_proposals)}"
         )
 
         return decision
@@ -1,12 +1,13 @@
 # src/blackboard/event_bus.py
 
-from typing import Dict, Any, List, Callable, Optional
+from typing import Dict, Any, List, Callable, Optional, Tuple
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
 import logging
 import threading
-from queue import Queue
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -219,6 +220,45 @@ class ErrorOccurredEvent(DialogueEvent):
 # Type alias for event handlers
 EventHandler = Callable[[DialogueEvent], None]
 
+# Lazy payload: builds the event only when someone will see it
+EventFactory = Callable[[], DialogueEvent]
+
+
+class OverflowPolicy(Enum):
+    """What emit() does when the async queue is full."""
+    DROP_OLDEST = "drop_oldest"    # evict the oldest queued event
+    DROP_NEWEST = "drop_newest"    # discard the event being emitted
+    BLOCK = "block"                # wait for room (up to block_timeout_ms)
+
+
+@dataclass
+class EventBusStats:
+    """
+    Counters of the event bus.
+
+    Attributes:
+        processed: Events dispatched to handlers
+        dropped: Events discarded by the overflow policy (or by stop(drain=False))
+        lagging: Events dispatched later than lag_threshold_ms after emit()
+        queued: Events currently waiting in the async queue
+        max_lag_ms: Worst queue delay seen so far
+    """
+    processed: int = 0
+    dropped: int = 0
+    lagging: int = 0
+    queued: int = 0
+    max_lag_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert stats to dictionary."""
+        return {
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "lagging": self.lagging,
+            "queued": self.queued,
+            "max_lag_ms": self.max_lag_ms,
+        }
+
 
 class DialogueEventBus:
     """
@@ -235,12 +275,31 @@ class DialogueEventBus:
         - DebugLogger: detailed logging for debugging
         - AnalyticsTracker: business analytics
         - AlertManager: alerts on anomalies
+
+    Emitters with expensive payloads pass a factory to emit_lazy() (or check
+    is_observed() first): with no subscriber for the event type and history
+    disabled (history_size=0), the event is never built.
+
+    Async mode keeps handlers off the dialogue turn: emit() only appends to a
+    bounded queue (queue_size) and a worker thread dispatches events in
+    batches of up to batch_size. When the queue is full, overflow_policy
+    decides what is lost. The worker exits after idling and is restarted by
+    the next emit(), so idle buses hold no thread. stop() drains the queue
+    by default; get_stats() exposes processed/dropped/lagging counters.
     """
 
+    # Seconds an idle async worker waits for events before exiting
+    WORKER_IDLE_TIMEOUT_S = 30.0
+
     def __init__(
         self,
         async_mode: bool = False,
-        history_size: int = 100
+        history_size: int = 100,
+        queue_size: int = 1000,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        batch_size: int = 32,
+        lag_threshold_ms: float = 500.0,
+        block_timeout_ms: float = 100.0,
     ):
         """
         Initialize the event bus.
@@ -248,20 +307,65 @@ class DialogueEventBus:
         Args:
             async_mode: If True, process events asynchronously
             history_size: Number of recent events to keep in history
+            queue_size: Capacity of the async queue
+            overflow_policy: Behaviour of emit() on a full queue
+                (OverflowPolicy or its value, e.g. "drop_newest")
+            batch_size: Max events the worker dispatches per wakeup
+            lag_threshold_ms: Queue delay above which an event counts as lagging
+            block_timeout_ms: Max wait of a BLOCK emit() before the event is dropped
         """
+        if queue_size < 1:
+            raise ValueError(f"queue_size must be >= 1, got {queue_size}")
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+
         self._handlers: Dict[EventType, List[EventHandler]] = {
             event_type: [] for event_type in EventType
         }
         self._global_handlers: List[EventHandler] = []
-        self._history: List[DialogueEvent] = []
+        self._history: deque = deque(maxlen=max(0, history_size))
         self._history_size = history_size
         self._async_mode = async_mode
-        self._event_queue: Optional[Queue] = Queue() if async_mode else None
+        self._queue_size = queue_size
+        self._overflow_policy = OverflowPolicy(overflow_policy)
+        self._batch_size = batch_size
+        self._lag_threshold_s = lag_threshold_ms / 1000.0
+        self._block_timeout_s = block_timeout_ms / 1000.0
+        # (monotonic enqueue time, event) pairs, guarded by _condition
+        self._event_queue: Optional[deque] = deque() if async_mode else None
+        self._condition = threading.Condition()
+        self._in_flight = 0
         self._worker_thread: Optional[threading.Thread] = None
         self._running = False
+        self._stats = EventBusStats()
 
         if async_mode:
-            self._start_worker()
+            self._running = True
+            with self._condition:
+                self._start_worker()
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None) -> "DialogueEventBus":
+        """
+        Create an event bus from the blackboard.event_bus section of constants.yaml.
+
+        Args:
+            config: Mapping of __init__ keyword arguments; unknown keys are ignored
+
+        Returns:
+            Configured DialogueEventBus (synchronous when config is empty)
+        """
+        config = config or {}
+        options = {
+            key: config[key] for key in (
+                "async_mode", "history_size", "queue_size", "overflow_policy",
+                "batch_size", "lag_threshold_ms", "block_timeout_ms",
+            ) if key in config
+        }
+        unknown = sorted(set(config) - set(options))
+        if unknown:
+            logger.warning(f"Ignoring unknown event bus options: {unknown}")
+        return cls(**options)
 
     def subscribe(
         self,
@@ -304,6 +408,35 @@ class DialogueEventBus:
             self._handlers[event_type].remove(handler)
             logger.debug(f"Handler unsubscribed from {event_type.name}")
 
+    def has_subscribers(self, event_type: EventType) -> bool:
+        """
+        Check whether any handler receives events of this type.
+
+        Args:
+            event_type: Type of event
+
+        Returns:
+            True if a type-specific or global handler is subscribed
+        """
+        return bool(self._handlers[event_type] or self._global_handlers)
+
+    def is_observed(self, event_type: EventType) -> bool:
+        """Check whether an event of this type would be handled or kept in history."""
+        if self._history.maxlen or self._global_handlers:
+            return True
+        return bool(self._handlers[event_type])
+
+    def emit_lazy(self, event_type: EventType, factory: EventFactory) -> None:
+        """
+        Emit the event returned by factory(), calling it only if the event is observed.
+
+        Args:
+            event_type: Type of the event the factory builds
+            factory: Zero-argument callable returning the event
+        """
+        if self.is_observed(event_type):
+            self.emit(factory())
+
     def emit(self, event: DialogueEvent) -> None:
         """
         Emit an event to all subscribers.
@@ -311,16 +444,17 @@ class DialogueEventBus:
         Args:
             event: Event to emit
         """
-        # Add to history
-        self._history.append(event)
-        if len(self._history) > self._history_size:
-            self._history.pop(0)
-
-        if self._async_mode and self._event_queue:
-            # Queue for async processing
-            self._event_queue.put(event)
+        # Add to history (deque drops the oldest event when full)
+        if self._history.maxlen:
+            self._history.append(event)
+
+        if not (self._global_handlers or self._handlers[event.event_type]):
+            return
+
+        if self._async_mode and self._running:
+            self._enqueue(event)
         else:
-            # Process synchronously
+            # Process synchronously (also after stop())
             self._process_event(event)
 
     def _process_event(self, event: DialogueEvent) -> None:
@@ -341,31 +475,154 @@ class DialogueEventBus:
             except Exception as e:
                 logger.error(f"Error in global event handler: {e}")
 
+        self._stats.processed += 1
+
+    def _enqueue(self, event: DialogueEvent) -> None:
+        """Put an event on the async queue, applying the overflow policy."""
+        with self._condition:
+            queue = self._event_queue
+            if len(queue) >= self._queue_size:
+                policy = self._overflow_policy
+                if (
+                    policy is OverflowPolicy.BLOCK
+                    and threading.current_thread() is not self._worker_thread
+                ):
+                    # A handler emitting from the worker must not wait on itself
+                    self._condition.wait_for(
+                        lambda: len(queue) < self._queue_size or not self._running,
+                        timeout=self._block_timeout_s,
+                    )
+                if len(queue) >= self._queue_size:
+                    self._stats.dropped += 1
+                    if policy is not OverflowPolicy.DROP_OLDEST:
+                        return
+                    queue.popleft()
+            queue.append((time.monotonic(), event))
+            if self._worker_thread is None:
+                self._start_worker()
+            else:
+                self._condition.notify_all()
+
     def _start_worker(self) -> None:
-        """Start the async worker thread."""
-        self._running = True
+        """Start the async worker thread (caller holds _condition)."""
         self._worker_thread = threading.Thread(
             target=self._worker_loop,
+            name="DialogueEventBus-worker",
             daemon=True
         )
         self._worker_thread.start()
         logger.debug("Event bus async worker started")
 
+    def _next_batch(self) -> List[Tuple[float, DialogueEvent]]:
+        """
+        Wait for queued events and take up to batch_size of them.
+
+        Returns an empty list when the worker should exit: the bus was
+        stopped and the queue is drained, or no event arrived for
+        WORKER_IDLE_TIMEOUT_S.
+        """
+        queue = self._event_queue
+        with self._condition:
+            while not queue:
+                if not self._running:
+                    break
+                if not self._condition.wait(timeout=self.WORKER_IDLE_TIMEOUT_S) and not queue:
+                    break
+            if not queue:
+                self._worker_thread = None
+                self._condition.notify_all()
+                return []
+            count = min(self._batch_size, len(queue))
+            batch = [queue.popleft() for _ in range(count)]
+            self._in_flight = count
+            # Wake producers blocked on a full queue
+            self._condition.notify_all()
+            return batch
+
     def _worker_loop(self) -> None:
         """Worker loop for async event processing."""
-        while self._running:
-            try:
-                event = self._event_queue.get(timeout=1.0)
-                self._process_event(event)
-            except Exception:
-                pass  # Timeout, continue loop
+        while True:
+            batch = self._next_batch()
+            if not batch:
+                return
+            for enqueued_at, event in batch:
+                lag = time.monotonic() - enqueued_at
+                if lag > self._lag_threshold_s:
+                    self._stats.lagging += 1
+                lag_ms = lag * 1000.0
+                if lag_ms > self._stats.max_lag_ms:
+                    self._stats.max_lag_ms = lag_ms
+                try:
+                    self._process_event(event)
+                except Exception:
+                    logger.exception(
+                        f"Event bus worker failed on {event.event_type.name}"
+                    )
+            with self._condition:
+                self._in_flight = 0
+                self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued event has been dispatched.
 
-    def stop(self) -> None:
-        """Stop the async worker."""
-        self._running = False
-        if self._worker_thread:
-            self._worker_thread.join(timeout=2.0)
-            logger.debug("Event bus async worker stopped")
+        Args:
+            timeout: Max seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the queue is empty and no batch is in flight
+        """
+        if self._event_queue is None:
+            return True
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._event_queue and not self._in_flight,
+                timeout=timeout,
+            )
+
+    def stop(self, drain: bool = True, timeout: float = 2.0) -> None:
+        """
+        Stop the async worker.
+
+        Later emit() calls are processed synchronously.
+
+        Args:
+            drain: Dispatch events still in the queue before stopping;
+                if False they are discarded and counted as dropped
+            timeout: Max seconds to wait for the worker to finish
+        """
+        with self._condition:
+            self._running = False
+            if not drain and self._event_queue:
+                self._stats.dropped += len(self._event_queue)
+                self._event_queue.clear()
+            worker = self._worker_thread
+            self._condition.notify_all()
+        if worker is not None:
+            worker.join(timeout=timeout)
+            if worker.is_alive():
+                logger.warning(
+                    f"Event bus async worker did not stop within {timeout}s"
+                )
+            else:
+                logger.debug("Event bus async worker stopped")
+
+    def get_stats(self) -> EventBusStats:
+        """
+        Get a snapshot of the bus counters.
+
+        Returns:
+            EventBusStats with processed, dropped, lagging and queued counts
+        """
+        with self._condition:
+            queued = len(self._event_queue) if self._event_queue is not None else 0
+            return EventBusStats(
+                processed=self._stats.processed,
+                dropped=self._stats.dropped,
+                lagging=self._stats.lagging,
+                queued=queued,
+                max_lag_ms=self._stats.max_lag_ms,
+            )
 
     def get_history(
         self,
@@ -382,10 +639,10 @@ class DialogueEventBus:
         Returns:
             List of recent events (most recent last)
         """
-        events = self._history
-
         if event_type:
-            events = [e for e in events if e.event_type == event_type]
+            events = [e for e in self._history if e.event_type == event_type]
+        else:
+            events = list(self._history)
 
         return events[-limit:]
 
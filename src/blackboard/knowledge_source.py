@@ -9,7 +9,8 @@ should not know about other sources.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, TYPE_CHECKING
+from dataclasses import dataclass
+from typing import FrozenSet, Optional, TYPE_CHECKING
 import logging
 
 if TYPE_CHECKING:
@@ -17,6 +18,43 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Turn-local blackboard channels. Sources declare which of them they read
+# (beyond the frozen ContextSnapshot) and write, so the orchestrator can run
+# independent sources concurrently (see source_scheduler.py).
+CHANNEL_ACTIONS = "actions"
+CHANNEL_TRANSITIONS = "transitions"
+CHANNEL_DATA_UPDATES = "data_updates"
+CHANNEL_FLAGS = "flags"
+CHANNEL_CONTEXT_SIGNALS = "context_signals"
+CHANNEL_PRE_GENERATED_RESPONSE = "pre_generated_response"
+
+
+@dataclass(frozen=True)
+class SourceTriggers:
+    """
+    Static trigger spec of a Knowledge Source.
+
+    Describes when should_contribute() CAN return True; the orchestrator
+    skips the source without calling should_contribute() on turns that do not
+    match (see SourceDispatchIndex in source_scheduler.py).
+
+    A turn matches when:
+        - the current intent is in ``intents``, a secondary intent is in
+          ``secondary_intents`` or the repeated question is in
+          ``repeated_questions`` (not checked if all three are empty), and
+        - the current state is in ``states`` (not checked if empty), and
+        - every feature flag in ``flags`` is enabled.
+    """
+    intents: FrozenSet[str] = frozenset()
+    secondary_intents: FrozenSet[str] = frozenset()
+    repeated_questions: FrozenSet[str] = frozenset()
+    states: FrozenSet[str] = frozenset()
+    flags: FrozenSet[str] = frozenset()
+
+    @property
+    def has_intent_triggers(self) -> bool:
+        return bool(self.intents or self.secondary_intents or self.repeated_questions)
+
 
 class KnowledgeSource(ABC):
     """
@@ -35,8 +73,26 @@ class KnowledgeSource(ABC):
         - No Side Effects: Sources should only propose, never modify state directly
         - Idempotent: Multiple calls with same context should produce same proposals
         - Fast: should_contribute() must be O(1), contribute() should be efficient
+
+    Channel declarations:
+        reads / writes list the CHANNEL_* values the source touches in
+        should_contribute() and contribute(). A source only waits for earlier
+        sources that write a channel it reads. None (the default) means
+        "unknown": such a source runs after all earlier sources are merged and
+        is treated as writing every channel.
+
+    Trigger spec:
+        get_triggers() may return a SourceTriggers describing when the source
+        can contribute; None (the default) means "always ask". The spec must
+        be a necessary condition of should_contribute() and is only used when
+        both are defined by the same class. Call _invalidate_triggers() when
+        the sets it is built from change.
     """
 
+    reads: Optional[FrozenSet[str]] = None
+    writes: Optional[FrozenSet[str]] = None
+    _triggers_version: int = 0
+
     def __init__(self, name: Optional[str] = None):
         """
         Initialize the knowledge source.
@@ -65,6 +121,24 @@ class KnowledgeSource(ABC):
         """Disable the source."""
         self._enabled = False
 
+    @property
+    def triggers_version(self) -> int:
+        """Incremented whenever get_triggers() would return a different spec."""
+        return self._triggers_version
+
+    def get_triggers(self) -> Optional[SourceTriggers]:
+        """
+        Static trigger spec of this source, or None to be asked every turn.
+
+        Returns:
+            SourceTriggers or None
+        """
+        return None
+
+    def _invalidate_triggers(self) -> None:
+        """Mark the trigger spec as changed (rebuilds the dispatch index)."""
+        self._triggers_version += 1
+
     def should_contribute(self, blackboard: 'DialogueBlackboard') -> bool:
         """
         Quick check whether this source should contribute.
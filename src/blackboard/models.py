@@ -14,7 +14,7 @@ from typing import Any, Optional, List, Dict, TYPE_CHECKING
 from datetime import datetime
 
 from .enums import Priority, ProposalType
-from src.immutable_types import FrozenDict, deep_freeze_dict
+from src.immutable_types import FrozenDict, deep_freeze_dict, freeze_dict_shared
 from src.media_turn_context import MediaTurnContext
 
 if TYPE_CHECKING:
@@ -342,6 +342,8 @@ class ContextSnapshot:
         flow_config: Configuration for current flow
         tenant_id: Tenant identifier for multi-tenancy support
         tenant_config: Tenant-specific configuration (feature flags, limits)
+        data_version: Unique version of collected_data for condition memoization
+        condition_cache: Turn-scoped ConditionCache shared by all evaluators
     """
     state: str
     collected_data: Dict[str, Any]
@@ -371,6 +373,9 @@ class ContextSnapshot:
     transcript: Any = None
     history_projections: Dict[str, Any] = field(default_factory=dict)
     media_turn_context: Optional[MediaTurnContext] = None
+    # Per-turn condition memoization (src/conditions/cache.py)
+    data_version: Optional[int] = None
+    condition_cache: Any = field(default=None, compare=False, repr=False)
 
     # Computed properties for convenience
     @property
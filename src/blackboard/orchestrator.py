@@ -12,6 +12,7 @@ from src.blackboard.priority_assigner import PriorityAssigner
 from src.blackboard.proposal_validator import ProposalValidator, ValidationError
 from src.blackboard.event_bus import (
     DialogueEventBus,
+    EventType,
     TurnStartedEvent,
     SourceContributedEvent,
     ProposalValidatedEvent,
@@ -38,16 +39,21 @@ from src.blackboard.protocols import (
 
 # Import SourceRegistry (Plugin System)
 from src.blackboard.source_registry import BUILTIN_SOURCE_NAMES, SourceRegistry
+from src.blackboard.source_scheduler import (
+    SourceDispatchIndex,
+    SourceRun,
+    execute_sources,
+    run_source,
+)
+from src.feature_flags import flags
 
 # Import intent categories for objection tracking
-from src.yaml_config.constants import INTENT_CATEGORIES, OBJECTION_INTENTS, POSITIVE_INTENTS
+from src.yaml_config.constants import ANSWERABLE_QUESTION_INTENTS, OBJECTION_INTENTS, POSITIVE_INTENTS
 
 logger = logging.getLogger(__name__)
 trace_logger = logging.getLogger("blackboard.trace")
 
-ANSWERABLE_INTENTS = frozenset(INTENT_CATEGORIES.get("question", ())) | frozenset(
-    INTENT_CATEGORIES.get("price_related", ())
-)
+ANSWERABLE_INTENTS = ANSWERABLE_QUESTION_INTENTS
 TERMINAL_HARD_STOP_INTENTS = frozenset({"rejection", "farewell"})
 
 class DialogueOrchestrator:
@@ -100,6 +106,7 @@ class DialogueOrchestrator:
         blackboard_config: Optional[Dict[str, Any]] = None,
         valid_actions: Optional[Set[str]] = None,
         strict_data_updates: bool = False,
+        parallel_sources: Optional[bool] = None,
     ):
         """
         Initialize the orchestrator.
@@ -115,6 +122,8 @@ class DialogueOrchestrator:
             llm: LLM instance for AutonomousDecisionSource (None for non-autonomous flows)
             blackboard_config: Blackboard config from constants.yaml (source enablement, etc.)
             strict_data_updates: If True, raise DataUpdateCollisionError on data/flag collisions
+            parallel_sources: Run independent sources concurrently (None = follow the
+                parallel_knowledge_sources feature flag on every turn)
         """
         self._state_machine = state_machine
         self._flow_config = flow_config
@@ -122,6 +131,10 @@ class DialogueOrchestrator:
         self._guard = guard
         self._fallback_handler = fallback_handler
         self._blackboard_config = blackboard_config or {}
+        self._parallel_sources = parallel_sources
+        self._last_source_timings_ms: Dict[str, float] = {}
+        self._dispatch_index = SourceDispatchIndex()
+        self._last_source_dispatch: Dict[str, int] = {}
 
         # Initialize blackboard with tenant config
         self._blackboard = DialogueBlackboard(
@@ -205,6 +218,24 @@ class DialogueOrchestrator:
         """Get list of Knowledge Sources."""
         return list(self._sources)
 
+    @property
+    def last_source_timings_ms(self) -> Dict[str, float]:
+        """Wall-clock time of each source that ran in the last turn, in ms."""
+        return dict(self._last_source_timings_ms)
+
+    @property
+    def last_source_dispatch(self) -> Dict[str, int]:
+        """Sources skipped by the dispatch index, invoked and contributed in the last turn."""
+        return dict(self._last_source_dispatch)
+
+    @property
+    def resolution_path_stats(self) -> Dict[str, Dict[str, int]]:
+        """Fast-path vs full-path counts of the validator and the conflict resolver."""
+        return {
+            "validator": self._validator.get_stats(),
+            "resolver": self._resolver.get_stats(),
+        }
+
     def add_source(self, source: KnowledgeSource) -> None:
         """
         Add a new Knowledge Source.
@@ -348,6 +379,86 @@ class DialogueOrchestrator:
             except Exception as e:
                 logger.warning("Failed to reset source %s: %s", source.name, e)
 
+    def _parallel_sources_enabled(self) -> bool:
+        if self._parallel_sources is not None:
+            return self._parallel_sources
+        return flags.is_enabled("parallel_knowledge_sources")
+
+    def _run_knowledge_sources(self, turn_number: int) -> None:
+        """
+        Let every source contribute to the blackboard.
+
+        Sources whose trigger spec does not match the turn are skipped without
+        calling should_contribute() (SourceDispatchIndex, behind the
+        source_dispatch_index flag).
+
+        In parallel mode independent sources run concurrently (see
+        source_scheduler.py); their proposals are merged in source order, so
+        the result is the same as in sequential mode, which is kept for
+        debugging behind the parallel_knowledge_sources flag.
+        """
+        self._last_source_timings_ms = {}
+        sources = self._sources
+        if flags.is_enabled("source_dispatch_index"):
+            sources = self._dispatch_index.select(self._sources, self._blackboard)
+        self._last_source_dispatch = {
+            "skipped": len(self._sources) - len(sources),
+            "invoked": len(sources),
+            "contributed": 0,
+        }
+        if self._parallel_sources_enabled() and len(sources) > 1:
+            execute_sources(
+                sources,
+                self._blackboard,
+                lambda run: self._finish_source_run(run, turn_number),
+            )
+            return
+        for source in sources:
+            run = run_source(SourceRun(source=source, view=self._blackboard))
+            self._finish_source_run(run, turn_number)
+
+    def _finish_source_run(self, run: SourceRun, turn_number: int) -> None:
+        """Merge one source's proposals into the blackboard and emit its event."""
+        source = run.source
+        self._last_source_timings_ms[source.name] = run.elapsed_ms
+        if run.gate_error is not None:
+            raise run.gate_error
+
+        if not run.contributed:
+            logger.debug(f"Source {source.name} skipped (should_contribute=False)")
+            return
+        self._last_source_dispatch["contributed"] += 1
+
+        # Proposals made before a contribute() error are kept, as in sequential mode
+        error = run.error
+        try:
+            run.merge()
+        except Exception as e:
+            error = error or e
+        if error is not None:
+            logger.error(f"Error in source {source.name}: {error}")
+            self._event_bus.emit(ErrorOccurredEvent(
+                turn_number=turn_number,
+                error_type=type(error).__name__,
+                error_message=str(error),
+                component=source.name,
+            ))
+            return
+
+        if not self._event_bus.is_observed(EventType.SOURCE_CONTRIBUTED):
+            return
+
+        # Get proposals from this source
+        proposals_summary = [str(p) for p in self._blackboard.get_source_proposals(source.name)]
+
+        self._event_bus.emit(SourceContributedEvent(
+            turn_number=turn_number,
+            source_name=source.name,
+            proposals_count=len(proposals_summary),
+            proposals_summary=proposals_summary,
+            execution_time_ms=run.elapsed_ms,
+        ))
+
     def process_turn(
         self,
         intent: str,
@@ -395,7 +506,7 @@ class DialogueOrchestrator:
                 media_turn_context=media_turn_context,
             )
 
-            self._event_bus.emit(TurnStartedEvent(
+            self._event_bus.emit_lazy(EventType.TURN_STARTED, lambda: TurnStartedEvent(
                 turn_number=turn_number,
                 intent=intent,
                 state=current_state,
@@ -406,42 +517,7 @@ class DialogueOrchestrator:
             )
 
             # === STEP 2: Knowledge Sources Contribute ===
-            for source in self._sources:
-                source_start_time = time.time()
-
-                # Check if source should contribute
-                if not source.should_contribute(self._blackboard):
-                    logger.debug(f"Source {source.name} skipped (should_contribute=False)")
-                    continue
-
-                # Let source contribute
-                try:
-                    source.contribute(self._blackboard)
-                except Exception as e:
-                    logger.error(f"Error in source {source.name}: {e}")
-                    self._event_bus.emit(ErrorOccurredEvent(
-                        turn_number=turn_number,
-                        error_type=type(e).__name__,
-                        error_message=str(e),
-                        component=source.name,
-                    ))
-                    continue
-
-                source_time_ms = (time.time() - source_start_time) * 1000
-
-                # Get proposals from this source
-                proposals_summary = [
-                    str(p) for p in self._blackboard.get_proposals()
-                    if p.source_name == source.name
-                ]
-
-                self._event_bus.emit(SourceContributedEvent(
-                    turn_number=turn_number,
-                    source_name=source.name,
-                    proposals_count=len(proposals_summary),
-                    proposals_summary=proposals_summary,
-                    execution_time_ms=source_time_ms,
-                ))
+            self._run_knowledge_sources(turn_number)
 
             # === STEP 3: Apply Priority Ordering (config-driven) ===
             proposals = self._blackboard.get_proposals()
@@ -453,16 +529,17 @@ class DialogueOrchestrator:
             if self._enable_validation:
                 validation_errors = self._validator.validate(proposals)
 
-                error_count = len(self._validator.get_errors_only(validation_errors))
-                warning_count = len(self._validator.get_warnings_only(validation_errors))
+                if self._event_bus.is_observed(EventType.PROPOSAL_VALIDATED):
+                    error_count = len(self._validator.get_errors_only(validation_errors))
+                    warning_count = len(self._validator.get_warnings_only(validation_errors))
 
-                self._event_bus.emit(ProposalValidatedEvent(
-                    turn_number=turn_number,
-                    valid_count=len(proposals) - error_count,
-                    error_count=error_count,
-                    warning_count=warning_count,
-                    errors=[str(e) for e in validation_errors],
-                ))
+                    self._event_bus.emit(ProposalValidatedEvent(
+                        turn_number=turn_number,
+                        valid_count=len(proposals) - error_count,
+                        error_count=error_count,
+                        warning_count=warning_count,
+                        errors=[str(e) for e in validation_errors],
+                    ))
 
                 # Handle blocking validation errors
                 if self._validator.has_blocking_errors(validation_errors):
@@ -540,7 +617,7 @@ class DialogueOrchestrator:
 
             resolve_time_ms = (time.time() - resolve_start_time) * 1000
 
-            self._event_bus.emit(ConflictResolvedEvent(
+            self._event_bus.emit_lazy(EventType.CONFLICT_RESOLVED, lambda: ConflictResolvedEvent(
                 turn_number=turn_number,
                 winning_action=decision.action,
                 winning_transition=decision.next_state if decision.next_state != current_state else None,
@@ -559,10 +636,16 @@ class DialogueOrchestrator:
                 decision=decision,
             )
 
+            # Per-turn condition memoization stats (StateMachine tracing mode)
+            trace_collector = getattr(self._state_machine, "_trace_collector", None)
+            cache_stats = self._blackboard.get_condition_cache_stats()
+            if trace_collector is not None and cache_stats is not None:
+                trace_collector.add_cache_stats(cache_stats)
+
             # === STEP 5: Commit Decision ===
             self._blackboard.commit_decision(decision)
 
-            self._event_bus.emit(DecisionCommittedEvent(
+            self._event_bus.emit_lazy(EventType.DECISION_COMMITTED, lambda: DecisionCommittedEvent(
                 turn_number=turn_number,
                 action=decision.action,
                 next_state=decision.next_state,
@@ -572,7 +655,7 @@ class DialogueOrchestrator:
             # Emit state transition event if state changed
             state_changed = decision.next_state != current_state
             if state_changed:
-                self._event_bus.emit(StateTransitionedEvent(
+                self._event_bus.emit_lazy(EventType.STATE_TRANSITIONED, lambda: StateTransitionedEvent(
                     turn_number=turn_number,
                     from_state=current_state,
                     to_state=decision.next_state,
@@ -635,6 +718,8 @@ class DialogueOrchestrator:
         - Secondary intents and repeated_question from context_envelope
         - Winning action, transition, reason_codes, merge_decision
         - Rejected proposals
+        - Condition evaluations and memoization hit rate
+        - Knowledge Sources skipped by the dispatch index, invoked, contributed
         """
         if not trace_logger.isEnabledFor(logging.DEBUG):
             return
@@ -665,6 +750,13 @@ class DialogueOrchestrator:
             )
 
         proposals_block = "\n".join(f"│{line}" for line in proposal_lines) or "│  (none)"
+        cache_stats = self._blackboard.get_condition_cache_stats()
+        conditions_line = f"│  {cache_stats.to_compact_string()}\n" if cache_stats else ""
+        dispatch = self._last_source_dispatch
+        sources_line = (
+            f"│  sources: invoked={dispatch['invoked']} skipped={dispatch['skipped']} "
+            f"contributed={dispatch['contributed']}\n"
+        ) if dispatch else ""
         rejected_block = ("\n".join(f"│{line}" for line in rejected_lines) + "\n") if rejected_lines else ""
 
         trace_logger.debug(
@@ -673,6 +765,7 @@ class DialogueOrchestrator:
             f"│  intent={intent!r:30s}  state={current_state!r}\n"
             f"│  secondary_intents={secondary_intents}\n"
             f"│  repeated_question={repeated_question!r}\n"
+            f"{sources_line}"
             f"│  proposals ({len(proposals)}):\n"
             f"{proposals_block}\n"
             f"│  resolution:\n"
@@ -681,6 +774,7 @@ class DialogueOrchestrator:
             f"│    reason_codes  = {decision.reason_codes}\n"
             f"│    merge_decision= {decision.resolution_trace.get('merge_decision', 'N/A')!r}\n"
             f"{rejected_block}"
+            f"{conditions_line}"
             f"└─────────────────────────────────────────────────────────────────"
         )
 
@@ -1322,8 +1416,8 @@ def create_orchestrator(
                 )
                 logger.info(f"Registered custom source: {source_class.__name__}")
 
-    # Create event bus
-    event_bus = DialogueEventBus()
+    # Create event bus (async queue settings: blackboard.event_bus in constants.yaml)
+    event_bus = DialogueEventBus.from_config((blackboard_config or {}).get("event_bus"))
 
     # Add metrics collector
     if enable_metrics:
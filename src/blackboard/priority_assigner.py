@@ -265,7 +265,7 @@ class PriorityAssigner:
         current_phase = ctx.current_phase
 
         return EvaluatorContext(
-            collected_data=dict(ctx.collected_data),
+            collected_data=ctx.collected_data,
             state=ctx.state,
             turn_number=ctx.turn_number,
             current_phase=current_phase,
@@ -290,4 +290,6 @@ class PriorityAssigner:
             guard_intervention=getattr(envelope, "guard_intervention", None),
             tone=getattr(envelope, "tone", None),
             unclear_count=getattr(envelope, "unclear_count", 0),
+            condition_cache=getattr(ctx, "condition_cache", None),
+            data_version=getattr(ctx, "data_version", None),
         )
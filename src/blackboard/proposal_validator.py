@@ -59,7 +59,8 @@ class ProposalValidator:
         valid_actions: Optional[Set[str]] = None,
         valid_states: Optional[Set[str]] = None,
         valid_reason_codes: Optional[Set[str]] = None,
-        strict_mode: bool = False
+        strict_mode: bool = False,
+        fast_path: bool = True
     ):
         """
         Initialize the validator.
@@ -69,11 +70,20 @@ class ProposalValidator:
             valid_states: Set of valid state names. If None, state validation is skipped.
             valid_reason_codes: Set of documented reason codes. If None, logs warning only.
             strict_mode: If True, treat warnings as errors.
+            fast_path: Accept clean proposal lists with a single check per
+                proposal (see _is_clean). Disable to always run the full pass.
         """
         self._valid_actions = valid_actions
         self._valid_states = valid_states
         self._valid_reason_codes = valid_reason_codes
         self._strict_mode = strict_mode
+        self._fast_path = fast_path
+        self._fast_path_count = 0
+        self._full_path_count = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """Number of validate() calls that took the fast and the full path."""
+        return {"fast_path": self._fast_path_count, "full_path": self._full_path_count}
 
     def validate(self, proposals: List[Proposal]) -> List[ValidationError]:
         """
@@ -85,6 +95,12 @@ class ProposalValidator:
         Returns:
             List of ValidationError objects (empty if all valid)
         """
+        if self._fast_path and all(self._is_clean(p) for p in proposals):
+            self._fast_path_count += 1
+            logger.debug(f"Proposal validation passed: {len(proposals)} proposals valid")
+            return []
+        self._full_path_count += 1
+
         errors: List[ValidationError] = []
 
         for proposal in proposals:
@@ -103,6 +119,36 @@ class ProposalValidator:
 
         return errors
 
+    def _is_clean(self, proposal: Proposal) -> bool:
+        """
+        True if _validate_proposal() would report neither errors nor warnings.
+
+        Mirrors its checks as plain boolean tests, without building messages.
+        Anything unusual (including values the full pass would choke on)
+        returns False and is left to the full pass.
+        """
+        value = proposal.value
+        reason_code = proposal.reason_code
+        source_name = proposal.source_name
+        if not (
+            isinstance(proposal.priority, Priority)
+            and isinstance(value, str)
+            and isinstance(reason_code, str) and reason_code.strip()
+            and isinstance(source_name, str) and source_name.strip()
+        ):
+            return False
+        if self._valid_reason_codes is not None and reason_code not in self._valid_reason_codes:
+            return False
+        if proposal.type == ProposalType.ACTION:
+            if self._valid_actions is not None and value not in self._valid_actions:
+                return False
+            return proposal.combinable or proposal.priority != Priority.LOW
+        if proposal.type == ProposalType.TRANSITION:
+            if self._valid_states is not None and value not in self._valid_states:
+                return False
+            return bool(proposal.combinable)
+        return False
+
     def _validate_proposal(self, proposal: Proposal) -> List[ValidationError]:
         """Validate a single proposal."""
         errors: List[ValidationError] = []
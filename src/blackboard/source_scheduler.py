@@ -0,0 +1,374 @@
+# src/blackboard/source_scheduler.py
+
+"""
+Concurrent Knowledge Source execution for DialogueOrchestrator.
+
+Sources run against the frozen ContextSnapshot of the turn, so most of them
+are independent of each other: only a few read what earlier sources wrote
+(context signals, action proposals). Using the reads/writes declarations on
+KnowledgeSource, the scheduler:
+
+- starts every source whose dependencies are already merged on a shared
+  thread pool (the calling thread runs one of them itself and takes back any
+  task the pool has not started yet, so a saturated pool never stalls a turn);
+- buffers each source's writes in a BufferedBlackboard;
+- merges finished sources into the real blackboard strictly in source order,
+  so proposals, collision warnings and conflict resolution are identical to
+  sequential execution.
+
+A source depends on an earlier source when that source writes a channel it
+reads. Sources with unknown reads run inline on the real blackboard once every
+earlier source is merged, exactly as in sequential mode.
+
+Before scheduling, SourceDispatchIndex narrows the source list to the sources
+whose trigger spec (KnowledgeSource.get_triggers) matches the turn, so sources
+that cannot contribute are not asked at all.
+"""
+
+import contextvars
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+from src.blackboard.knowledge_source import (
+    CHANNEL_ACTIONS,
+    CHANNEL_CONTEXT_SIGNALS,
+    CHANNEL_DATA_UPDATES,
+    CHANNEL_FLAGS,
+    CHANNEL_PRE_GENERATED_RESPONSE,
+    CHANNEL_TRANSITIONS,
+    KnowledgeSource,
+    SourceTriggers,
+)
+from src.feature_flags import flags
+
+if TYPE_CHECKING:
+    from .blackboard import DialogueBlackboard
+
+logger = logging.getLogger(__name__)
+
+ALL_CHANNELS: FrozenSet[str] = frozenset({
+    CHANNEL_ACTIONS,
+    CHANNEL_TRANSITIONS,
+    CHANNEL_DATA_UPDATES,
+    CHANNEL_FLAGS,
+    CHANNEL_CONTEXT_SIGNALS,
+    CHANNEL_PRE_GENERATED_RESPONSE,
+})
+
+# Blackboard write methods and the channel each one writes
+WRITE_METHODS: Dict[str, str] = {
+    "propose_action": CHANNEL_ACTIONS,
+    "propose_transition": CHANNEL_TRANSITIONS,
+    "propose_data_update": CHANNEL_DATA_UPDATES,
+    "propose_flag_set": CHANNEL_FLAGS,
+    "add_context_signal": CHANNEL_CONTEXT_SIGNALS,
+    "set_pre_generated_response": CHANNEL_PRE_GENERATED_RESPONSE,
+}
+
+# Blackboard read methods over turn-local channels
+READ_METHODS: Dict[str, FrozenSet[str]] = {
+    "get_proposals": frozenset({CHANNEL_ACTIONS, CHANNEL_TRANSITIONS}),
+    "get_source_proposals": frozenset({CHANNEL_ACTIONS, CHANNEL_TRANSITIONS}),
+    "get_action_proposals": frozenset({CHANNEL_ACTIONS}),
+    "get_transition_proposals": frozenset({CHANNEL_TRANSITIONS}),
+    "get_data_updates": frozenset({CHANNEL_DATA_UPDATES}),
+    "get_flags_to_set": frozenset({CHANNEL_FLAGS}),
+    "get_context_signals": frozenset({CHANNEL_CONTEXT_SIGNALS}),
+    "get_pre_generated_response": frozenset({CHANNEL_PRE_GENERATED_RESPONSE}),
+}
+
+DEFAULT_MAX_WORKERS = int(os.environ.get("BLACKBOARD_SOURCE_WORKERS", "8"))
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_source_executor() -> ThreadPoolExecutor:
+    """Process-wide pool shared by all orchestrators (created lazily)."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max(1, DEFAULT_MAX_WORKERS),
+                thread_name_prefix="blackboard-source",
+            )
+        return _executor
+
+
+def declared_channels(source: KnowledgeSource, attr: str) -> Optional[FrozenSet[str]]:
+    """Declared reads/writes of a source, None when undeclared."""
+    value = getattr(source, attr, None)
+    if isinstance(value, (set, frozenset, list, tuple)):
+        return frozenset(value)
+    return None
+
+
+class BufferedBlackboard:
+    """
+    Per-source view of the blackboard used during concurrent execution.
+
+    Reads go to the real blackboard; writes are recorded and applied later by
+    replay(), in source order, on the orchestrator thread.
+    """
+
+    def __init__(self, blackboard: 'DialogueBlackboard', source: KnowledgeSource):
+        self._blackboard = blackboard
+        self._source = source
+        self._reads = declared_channels(source, "reads")
+        self._writes = declared_channels(source, "writes")
+        self.ops: List[Tuple[str, Tuple[Any, ...], Dict[str, Any]]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        if name in WRITE_METHODS:
+            def _record(*args: Any, **kwargs: Any) -> None:
+                self.ops.append((name, args, kwargs))
+            return _record
+        channels = READ_METHODS.get(name)
+        if channels is not None and self._reads is not None and not channels <= self._reads:
+            logger.warning(
+                "Source %s reads undeclared channel(s) %s via %s; "
+                "result may differ from sequential mode",
+                self._source.name, sorted(channels - self._reads), name,
+            )
+        return getattr(self._blackboard, name)
+
+    def replay(self) -> None:
+        """Apply recorded writes to the real blackboard in call order."""
+        for name, args, kwargs in self.ops:
+            channel = WRITE_METHODS[name]
+            if self._writes is not None and channel not in self._writes:
+                logger.warning(
+                    "Source %s writes undeclared channel %s", self._source.name, channel
+                )
+            getattr(self._blackboard, name)(*args, **kwargs)
+
+
+@dataclass
+class SourceRun:
+    """Outcome of one source for one turn."""
+    source: KnowledgeSource
+    view: Any
+    contributed: bool = False
+    error: Optional[Exception] = None
+    gate_error: Optional[Exception] = None
+    elapsed_ms: float = 0.0
+
+    def merge(self) -> None:
+        """Apply buffered writes (no-op when the source wrote directly)."""
+        if isinstance(self.view, BufferedBlackboard):
+            self.view.replay()
+
+
+def run_source(run: SourceRun) -> SourceRun:
+    """Run should_contribute() and contribute() of one source, never raising."""
+    started = time.perf_counter()
+    try:
+        run.contributed = bool(run.source.should_contribute(run.view))
+    except Exception as exc:
+        run.gate_error = exc
+    if run.contributed:
+        try:
+            run.source.contribute(run.view)
+        except Exception as exc:
+            run.error = exc
+    run.elapsed_ms = (time.perf_counter() - started) * 1000
+    return run
+
+
+def plan_dependencies(sources: Sequence[KnowledgeSource]) -> List[int]:
+    """
+    For each source, the index of its last earlier dependency (-1 if none).
+
+    A source may start once every source up to that index is merged.
+    """
+    last_dependency: List[int] = []
+    writes = [declared_channels(source, "writes") for source in sources]
+    for index, source in enumerate(sources):
+        reads = declared_channels(source, "reads")
+        if reads is None:
+            last_dependency.append(index - 1)
+            continue
+        last = -1
+        if reads:
+            for earlier in range(index - 1, -1, -1):
+                written = writes[earlier]
+                if written is None or written & reads:
+                    last = earlier
+                    break
+        last_dependency.append(last)
+    return last_dependency
+
+
+def execute_sources(
+    sources: Sequence[KnowledgeSource],
+    blackboard: 'DialogueBlackboard',
+    on_merge: Callable[[SourceRun], None],
+    executor: Optional[ThreadPoolExecutor] = None,
+) -> None:
+    """
+    Run sources concurrently and call on_merge(run) for each, in source order.
+
+    on_merge runs on the calling thread and is expected to call run.merge();
+    a source starts only after on_merge has returned for its dependencies.
+    Exceptions raised by on_merge propagate after in-flight sources finish.
+    """
+    count = len(sources)
+    last_dependency = plan_dependencies(sources)
+    runs = [
+        SourceRun(
+            source=source,
+            view=(
+                BufferedBlackboard(blackboard, source)
+                if declared_channels(source, "reads") is not None
+                else blackboard
+            ),
+        )
+        for source in sources
+    ]
+    pool = executor or get_source_executor()
+    started = [False] * count
+    futures: Dict[int, Future] = {}
+    merged = 0
+
+    try:
+        while merged < count:
+            ready = [
+                index for index in range(merged, count)
+                if not started[index] and last_dependency[index] < merged
+                and (isinstance(runs[index].view, BufferedBlackboard) or index == merged)
+            ]
+            for index in ready:
+                started[index] = True
+            # The calling thread takes the first ready source, the pool the rest
+            for index in ready[1:]:
+                futures[index] = pool.submit(contextvars.copy_context().run, run_source, runs[index])
+            if ready:
+                run_source(runs[ready[0]])
+            for index in sorted(futures):
+                if futures[index].cancel():
+                    del futures[index]
+                    run_source(runs[index])
+
+            if not started[merged]:
+                continue
+            future = futures.pop(merged, None)
+            if future is not None:
+                future.result()
+            while merged < count and started[merged]:
+                future = futures.get(merged)
+                if future is not None:
+                    if not future.done():
+                        break
+                    futures.pop(merged)
+                on_merge(runs[merged])
+                merged += 1
+    finally:
+        for future in futures.values():
+            if not future.cancel():
+                future.exception()
+
+
+def source_triggers(source: KnowledgeSource) -> Optional[SourceTriggers]:
+    """
+    Trigger spec the dispatcher may rely on, None when the source must be asked.
+
+    The spec is only trusted when get_triggers() and should_contribute() are
+    defined by the same class: a subclass (or instance) that overrides only
+    should_contribute() may contribute on turns the inherited spec excludes.
+    """
+    if "should_contribute" in vars(source) or "get_triggers" in vars(source):
+        return None
+    mro = type(source).__mro__
+    gate_owner = next((cls for cls in mro if "should_contribute" in vars(cls)), None)
+    spec_owner = next((cls for cls in mro if "get_triggers" in vars(cls)), None)
+    if gate_owner is not spec_owner:
+        return None
+    try:
+        triggers = source.get_triggers()
+    except Exception as exc:
+        logger.warning("Source %s: get_triggers() failed: %s", source.name, exc)
+        return None
+    return triggers if isinstance(triggers, SourceTriggers) else None
+
+
+class SourceDispatchIndex:
+    """
+    Intent -> candidate sources, built from the sources' trigger specs.
+
+    select() returns, in source order, the sources whose spec matches the turn
+    plus every source without a spec. The index is rebuilt when the source
+    list or any source's triggers_version changes.
+    """
+
+    def __init__(self):
+        self._key: Tuple[Tuple[Any, Any], ...] = ()
+        self._sources: List[KnowledgeSource] = []
+        self._triggers: List[Optional[SourceTriggers]] = []
+        self._always: FrozenSet[int] = frozenset()
+        self._by_intent: Dict[str, List[int]] = {}
+        self._by_secondary_intent: Dict[str, List[int]] = {}
+        self._by_repeated_question: Dict[str, List[int]] = {}
+
+    def _build(self, sources: Sequence[KnowledgeSource], key: Tuple[Tuple[Any, Any], ...]) -> None:
+        self._key = key
+        self._sources = list(sources)
+        self._triggers = [source_triggers(source) for source in sources]
+        always = []
+        self._by_intent = {}
+        self._by_secondary_intent = {}
+        self._by_repeated_question = {}
+        for index, triggers in enumerate(self._triggers):
+            if triggers is None or not triggers.has_intent_triggers:
+                always.append(index)
+                continue
+            for intent in triggers.intents:
+                self._by_intent.setdefault(intent, []).append(index)
+            for intent in triggers.secondary_intents:
+                self._by_secondary_intent.setdefault(intent, []).append(index)
+            for intent in triggers.repeated_questions:
+                self._by_repeated_question.setdefault(intent, []).append(index)
+        self._always = frozenset(always)
+
+    def select(
+        self,
+        sources: Sequence[KnowledgeSource],
+        blackboard: 'DialogueBlackboard',
+    ) -> List[KnowledgeSource]:
+        """Sources to run this turn, in source order."""
+        key = tuple((source, getattr(source, "triggers_version", 0)) for source in sources)
+        if key != self._key:
+            self._build(sources, key)
+
+        candidates = set(self._always)
+        candidates.update(self._by_intent.get(blackboard.current_intent, ()))
+        if self._by_secondary_intent or self._by_repeated_question:
+            envelope = blackboard.get_context().context_envelope
+            if envelope is not None:
+                secondary = getattr(envelope, "secondary_intents", None)
+                if secondary and self._by_secondary_intent:
+                    for intent in secondary:
+                        if isinstance(intent, str):
+                            candidates.update(self._by_secondary_intent.get(intent, ()))
+                repeated = getattr(envelope, "repeated_question", None)
+                if isinstance(repeated, str):
+                    candidates.update(self._by_repeated_question.get(repeated, ()))
+
+        state = None
+        selected = []
+        for index in sorted(candidates):
+            triggers = self._triggers[index]
+            if triggers is not None:
+                if triggers.states:
+                    if state is None:
+                        state = blackboard.current_state
+                    if state not in triggers.states:
+                        continue
+                if not all(flags.is_enabled(flag) for flag in triggers.flags):
+                    continue
+            selected.append(self._sources[index])
+        return selected
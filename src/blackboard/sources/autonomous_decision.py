@@ -26,7 +26,14 @@ import time
 
 from pydantic import AliasChoices, BaseModel, ConfigDict, Field
 
-from ..knowledge_source import KnowledgeSource
+from ..knowledge_source import (
+    CHANNEL_ACTIONS,
+    CHANNEL_CONTEXT_SIGNALS,
+    CHANNEL_PRE_GENERATED_RESPONSE,
+    CHANNEL_TRANSITIONS,
+    KnowledgeSource,
+    SourceTriggers,
+)
 from ..enums import Priority
 from src.settings import settings as _global_settings
 from src.terminal_requirements import (
@@ -208,6 +215,9 @@ class AutonomousDecisionSource(KnowledgeSource):
     still provide hard safety limits around that decision.
     """
 
+    reads = frozenset({CHANNEL_CONTEXT_SIGNALS})
+    writes = frozenset({CHANNEL_ACTIONS, CHANNEL_TRANSITIONS, CHANNEL_PRE_GENERATED_RESPONSE})
+
     def __init__(self, llm: Any = None, name: str = "AutonomousDecisionSource"):
         super().__init__(name)
         self._llm = llm
@@ -448,6 +458,10 @@ class AutonomousDecisionSource(KnowledgeSource):
 
         return AutonomousDecisionSource._looks_like_ready_to_buy_message(user_message)
 
+    def get_triggers(self) -> Optional[SourceTriggers]:
+        """Runs every turn while autonomous_flow is enabled."""
+        return SourceTriggers(flags=frozenset({"autonomous_flow"}))
+
     def should_contribute(self, blackboard: 'DialogueBlackboard') -> bool:
         """Only contribute for autonomous flow with LLM available."""
         if self._llm is None:
@@ -593,6 +607,14 @@ class AutonomousDecisionSource(KnowledgeSource):
 
         if not hasattr(self._llm, "generate"):
             return None
+        if (
+            getattr(self._llm, "constrained_decoding", False) is True
+            and getattr(self._llm, "last_structured_truncated", False) is not True
+        ):
+            # Schema was enforced as a decoding grammar: a free-form retry
+            # cannot produce a better payload, it only costs another generation.
+            # Output cut off at num_predict is the exception the grammar can't prevent.
+            return None
 
         try:
             try:
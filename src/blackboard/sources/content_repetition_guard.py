@@ -21,7 +21,11 @@ Escalation ladder:
 
 import logging
 
-from ..knowledge_source import KnowledgeSource
+from ..knowledge_source import (
+    CHANNEL_ACTIONS,
+    CHANNEL_TRANSITIONS,
+    KnowledgeSource,
+)
 from ..enums import Priority
 from src.terminal_requirements import (
     is_terminal_field_present,
@@ -46,6 +50,9 @@ class ContentRepetitionGuardSource(KnowledgeSource):
     и передаётся через ContextEnvelope.content_repeat_count.
     """
 
+    reads = frozenset()
+    writes = frozenset({CHANNEL_ACTIONS, CHANNEL_TRANSITIONS})
+
     SOFT_THRESHOLD = 2   # count >= 2 → redirect
     HARD_THRESHOLD = 3   # count >= 3 → escalate
     AUTONOMOUS_SOFT_THRESHOLD = 3  # give autonomous LLM one extra turn to adapt
@@ -26,7 +26,12 @@ state_machine shared between bot.py and Orchestrator.
 from typing import Optional, Dict, Any, TYPE_CHECKING
 import logging
 
-from ..knowledge_source import KnowledgeSource
+from ..knowledge_source import (
+    CHANNEL_ACTIONS,
+    CHANNEL_TRANSITIONS,
+    KnowledgeSource,
+    SourceTriggers,
+)
 from ..enums import Priority
 from src.feature_flags import flags
 
@@ -83,6 +88,9 @@ class ConversationGuardSource(KnowledgeSource):
         Thread-safe — reads context from blackboard, delegates detection to Guard.
     """
 
+    reads = frozenset()
+    writes = frozenset({CHANNEL_ACTIONS, CHANNEL_TRANSITIONS})
+
     def __init__(
         self,
         name: str = "ConversationGuardSource",
@@ -101,6 +109,10 @@ class ConversationGuardSource(KnowledgeSource):
                 "will be inactive until guard is set"
             )
 
+    def get_triggers(self) -> Optional[SourceTriggers]:
+        """Runs every turn while conversation_guard_in_pipeline is enabled."""
+        return SourceTriggers(flags=frozenset({"conversation_guard_in_pipeline"}))
+
     def should_contribute(self, blackboard: 'DialogueBlackboard') -> bool:
         """
         Quick O(1) gate check.
@@ -134,7 +146,7 @@ class ConversationGuardSource(KnowledgeSource):
         state = ctx.state
         user_message = ctx.user_message
         frustration_level = ctx.frustration_level
-        collected_data = dict(ctx.collected_data)
+        collected_data = ctx.collected_data
         current_intent = ctx.current_intent
         flow_config = ctx.flow_config
         if isinstance(flow_config, dict):
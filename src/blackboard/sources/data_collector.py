@@ -10,7 +10,10 @@ when all required data for the current state has been collected.
 from typing import List, Optional, TYPE_CHECKING
 import logging
 
-from ..knowledge_source import KnowledgeSource
+from ..knowledge_source import (
+    CHANNEL_TRANSITIONS,
+    KnowledgeSource,
+)
 from ..enums import Priority
 
 if TYPE_CHECKING:
@@ -36,6 +39,9 @@ class DataCollectorSource(KnowledgeSource):
         - TransitionResolverSource: intent-based transitions ONLY
     """
 
+    reads = frozenset()
+    writes = frozenset({CHANNEL_TRANSITIONS})
+
     def __init__(self, name: str = "DataCollectorSource"):
         """
         Initialize the data collector source.
@@ -10,10 +10,15 @@ combinable=False ensures that no transitions are applied while the bot
 is asking the user to clarify their intent.
 """
 
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 import logging
 
-from ..knowledge_source import KnowledgeSource
+from ..knowledge_source import (
+    CHANNEL_ACTIONS,
+    CHANNEL_CONTEXT_SIGNALS,
+    KnowledgeSource,
+    SourceTriggers,
+)
 from ..enums import Priority
 from src.blackboard.sources.pilot_survey_answer_gate import (
     latest_pilot_survey_signal,
@@ -40,9 +45,16 @@ class DisambiguationSource(KnowledgeSource):
     CRITICAL-priority actions (escalation, rejection) still win over HIGH.
     """
 
+    reads = frozenset({CHANNEL_CONTEXT_SIGNALS})
+    writes = frozenset({CHANNEL_ACTIONS})
+
     def __init__(self, name: str = "DisambiguationSource"):
         super().__init__(name)
 
+    def get_triggers(self) -> Optional[SourceTriggers]:
+        """Triggered by disambiguation_needed only."""
+        return SourceTriggers(intents=frozenset({"disambiguation_needed"}))
+
     def should_contribute(self, blackboard: 'DialogueBlackboard') -> bool:
         if not self._enabled:
             return False
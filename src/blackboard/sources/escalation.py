@@ -10,7 +10,11 @@ escalation actions that BLOCK other processing (combinable=False).
 from typing import Optional, Set, TYPE_CHECKING
 import logging
 
-from ..knowledge_source import KnowledgeSource
+from ..knowledge_source import (
+    CHANNEL_ACTIONS,
+    CHANNEL_TRANSITIONS,
+    KnowledgeSource,
+)
 from ..enums import Priority
 
 # FIX: Import categories from centralized constants (Single Source of Truth)
@@ -58,6 +62,9 @@ class EscalationSource(KnowledgeSource):
     Categories used: escalation, frustration, sensitive (defined in constants.yaml)
     """
 
+    reads = frozenset()
+    writes = frozenset({CHANNEL_ACTIONS, CHANNEL_TRANSITIONS})
+
     # FIX: Load from constants.yaml instead of hardcoding
     # This ensures synchronization with IntentTracker category_streak
     EXPLICIT_ESCALATION_INTENTS: Set[str] = _get_category_intents("escalation")
@@ -46,7 +46,12 @@ from typing import Set, Optional, Union, Dict, List, Any, TYPE_CHECKING, FrozenS
 import logging
 import re
 
-from ..knowledge_source import KnowledgeSource
+from ..knowledge_source import (
+    CHANNEL_ACTIONS,
+    CHANNEL_CONTEXT_SIGNALS,
+    KnowledgeSource,
+    SourceTriggers,
+)
 from ..enums import Priority
 
 if TYPE_CHECKING:
@@ -92,6 +97,9 @@ class FactQuestionSource(KnowledgeSource):
         and proposes "answer_with_facts" to respond to the question.
     """
 
+    reads = frozenset()
+    writes = frozenset({CHANNEL_ACTIONS, CHANNEL_CONTEXT_SIGNALS})
+
     # Default fact-requiring intents (can be overridden from config)
     DEFAULT_FACT_INTENTS: FrozenSet[str] = frozenset({
         # Features and capabilities
@@ -247,18 +255,20 @@ class FactQuestionSource(KnowledgeSource):
         )
 
     @property
-    def fact_intents(self) -> Set[str]:
-        """Get the set of fact-requiring intents."""
-        return self._fact_intents
+    def fact_intents(self) -> FrozenSet[str]:
+        """Get the set of fact-requiring intents (change it via add/remove_fact_intent)."""
+        return frozenset(self._fact_intents)
 
     def add_fact_intent(self, intent: str) -> None:
         """Add an intent to the fact intents set."""
         if intent not in self.EXCLUDED_INTENTS:
             self._fact_intents.add(intent)
+            self._invalidate_triggers()
 
     def remove_fact_intent(self, intent: str) -> None:
         """Remove an intent from the fact intents set."""
         self._fact_intents.discard(intent)
+        self._invalidate_triggers()
 
     @staticmethod
     def _load_config() -> Dict[str, Any]:
@@ -282,6 +292,11 @@ class FactQuestionSource(KnowledgeSource):
             logger.warning(f"Error loading fact_question_source config: {e}")
             return {}
 
+    def get_triggers(self) -> Optional[SourceTriggers]:
+        """Triggered by a fact intent as primary, secondary or repeated question."""
+        intents = frozenset(self._fact_intents)
+        return SourceTriggers(intents=intents, secondary_intents=intents, repeated_questions=intents)
+
     def should_contribute(self, blackboard: 'DialogueBlackboard') -> bool:
         """
         Check if current situation requires fact-based answer.
@@ -671,7 +686,7 @@ class FactQuestionSource(KnowledgeSource):
         current_phase = ctx.current_phase
 
         return EvaluatorContext(
-            collected_data=dict(ctx.collected_data),
+            collected_data=ctx.collected_data,
             state=ctx.state,
             turn_number=ctx.turn_number,
             current_phase=current_phase,
@@ -688,6 +703,8 @@ class FactQuestionSource(KnowledgeSource):
             engagement_level=getattr(envelope, "engagement_level", "medium"),
             repeated_question=getattr(envelope, "repeated_question", None),
             tone=getattr(envelope, "tone", None),
+            condition_cache=getattr(ctx, "condition_cache", None),
+            data_version=getattr(ctx, "data_version", None),
         )
 
     def get_stats(self) -> Dict[str, Any]:
@@ -13,10 +13,14 @@ was never invoked in the blackboard pipeline. This source ensures:
 3. If limit reached, alternative action is proposed instead of transition
 """
 
-from typing import Set, Optional, TYPE_CHECKING
+from typing import FrozenSet, Set, Optional, TYPE_CHECKING
 import logging
 
-from ..knowledge_source import KnowledgeSource
+from ..knowledge_source import (
+    CHANNEL_ACTIONS,
+    KnowledgeSource,
+    SourceTriggers,
+)
 from ..enums import Priority
 
 if TYPE_CHECKING:
@@ -66,6 +70,9 @@ class GoBackGuardSource(KnowledgeSource):
         - goback_count to always remain 0
     """
 
+    reads = frozenset()
+    writes = frozenset({CHANNEL_ACTIONS})
+
     # Intents that trigger go_back behavior
     GO_BACK_INTENTS: Set[str] = {
         "go_back",
@@ -86,12 +93,16 @@ class GoBackGuardSource(KnowledgeSource):
             name: Source name for logging
         """
         super().__init__(name)
-        self._go_back_intents = go_back_intents or self.GO_BACK_INTENTS.copy()
+        self._go_back_intents = set(go_back_intents or self.GO_BACK_INTENTS)
 
     @property
-    def go_back_intents(self) -> Set[str]:
-        """Get the set of go_back intents."""
-        return self._go_back_intents
+    def go_back_intents(self) -> FrozenSet[str]:
+        """Get the set of go_back intents (read-only: it drives dispatch triggers)."""
+        return frozenset(self._go_back_intents)
+
+    def get_triggers(self) -> Optional[SourceTriggers]:
+        """Triggered by go_back intents only."""
+        return SourceTriggers(intents=frozenset(self._go_back_intents))
 
     def should_contribute(self, blackboard: 'DialogueBlackboard') -> bool:
         """
@@ -19,7 +19,11 @@ Principle 3.4: Defense-in-Depth - additional layer for close state
 from typing import Dict, Any, Optional, Set
 import logging
 
-from ..knowledge_source import KnowledgeSource
+from ..knowledge_source import (
+    CHANNEL_ACTIONS,
+    KnowledgeSource,
+    SourceTriggers,
+)
 from ..enums import Priority
 from src.feature_flags import flags
 
@@ -45,6 +49,9 @@ class IntentPatternGuardSource(KnowledgeSource):
     contribute(): proposes action based on state and streak severity
     """
 
+    reads = frozenset()
+    writes = frozenset({CHANNEL_ACTIONS})
+
     def __init__(self, name: str = "IntentPatternGuardSource", enabled: bool = True):
         super().__init__(name)
         self._enabled = enabled
@@ -78,6 +85,13 @@ class IntentPatternGuardSource(KnowledgeSource):
             f"{len(self._all_pattern_intents)} intents"
         )
 
+    def get_triggers(self) -> Optional[SourceTriggers]:
+        """Triggered by pattern intents while intent_pattern_guard is enabled."""
+        return SourceTriggers(
+            intents=frozenset(self._all_pattern_intents),
+            flags=frozenset({"intent_pattern_guard"}),
+        )
+
     def should_contribute(self, blackboard) -> bool:
         """
         O(1) check: is current intent in any configured pattern AND
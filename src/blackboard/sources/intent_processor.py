@@ -3,10 +3,17 @@
 from typing import Optional, Dict, Any, List, Union, TYPE_CHECKING
 import logging
 
-from ..knowledge_source import KnowledgeSource
+from ..knowledge_source import (
+    CHANNEL_ACTIONS,
+    CHANNEL_CONTEXT_SIGNALS,
+    CHANNEL_TRANSITIONS,
+    KnowledgeSource,
+)
 from ..blackboard import DialogueBlackboard
 from ..enums import Priority
+from src.conditions.expression_parser import compile_condition_value
 from src.conditions.state_machine.context import EvaluatorContext
+from src.rules.compiler import RuleProgramCache, compile_source_rule
 from src.blackboard.sources.pilot_survey_answer_gate import (
     latest_pilot_survey_signal,
     should_defer_to_pilot_router,
@@ -39,6 +46,9 @@ class IntentProcessorSource(KnowledgeSource):
         3. Conditional chain: [{"when": "cond1", "then": "act1"}, "default"]
     """
 
+    reads = frozenset({CHANNEL_CONTEXT_SIGNALS})
+    writes = frozenset({CHANNEL_ACTIONS, CHANNEL_TRANSITIONS})
+
     # Intents handled by dedicated sources (skip here)
     DEDICATED_SOURCE_INTENTS = {
         # Price questions handled by PriceQuestionSource
@@ -82,6 +92,9 @@ class IntentProcessorSource(KnowledgeSource):
             from src.conditions.state_machine.registry import sm_registry
             self._condition_registry = sm_registry
 
+        # Compiled rules per (state, intent)
+        self._programs = RuleProgramCache()
+
     @property
     def rule_resolver(self) -> 'RuleResolver':
         """Get the rule resolver instance."""
@@ -229,16 +242,24 @@ class IntentProcessorSource(KnowledgeSource):
 
     def _evaluate_condition_value(self, condition, eval_ctx):
         """Evaluate condition using shared utility (supports composite dict)."""
-        from src.conditions.expression_parser import evaluate_condition_value
-        ep = getattr(self._rule_resolver, 'expression_parser', None)
-        try:
-            return evaluate_condition_value(
-                condition, eval_ctx, self._condition_registry, ep,
-                source_name="IntentProcessorSource"
-            )
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Condition evaluation failed: {e}")
-            return False
+        return self._compile_condition(condition)(eval_ctx)
+
+    def _compile_condition(self, condition):
+        """Compile a rule condition; evaluation errors count as False."""
+        evaluate = compile_condition_value(
+            condition, self._condition_registry,
+            getattr(self._rule_resolver, 'expression_parser', None),
+            source_name="IntentProcessorSource"
+        )
+
+        def check(eval_ctx) -> bool:
+            try:
+                return evaluate(eval_ctx, None)
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Condition evaluation failed: {e}")
+                return False
+
+        return check
 
     def _resolve_rule(
         self,
@@ -248,6 +269,10 @@ class IntentProcessorSource(KnowledgeSource):
         """
         Resolve a rule to an action.
 
+        Supports simple string, conditional dict {"when": ..., "then": ...}
+        and conditional chain [{...}, ..., "default"] rules. Rules are
+        compiled once per (state, intent) and reused while unchanged.
+
         Args:
             rule: Rule definition (string, dict, or list)
             ctx: Context snapshot
@@ -255,45 +280,20 @@ class IntentProcessorSource(KnowledgeSource):
         Returns:
             Resolved action name or None
         """
-        # Simple string rule
-        if isinstance(rule, str):
-            return rule
-
-        # Conditional dict rule: {"when": "condition", "then": "action"}
-        if isinstance(rule, dict):
-            condition = rule.get("when")
-            action = rule.get("then")
-
-            if condition and action:
-                # Build evaluation context for condition registry
-                eval_ctx = self._build_eval_context(ctx)
-
-                if self._evaluate_condition_value(condition, eval_ctx):
-                    return action
-
-            return None
-
-        # Conditional chain: [{"when": "c1", "then": "a1"}, ..., "default"]
-        if isinstance(rule, list):
-            for item in rule:
-                if isinstance(item, str):
-                    # Default fallback
-                    return item
-
-                if isinstance(item, dict):
-                    condition = item.get("when")
-                    action = item.get("then")
-
-                    if condition and action:
-                        eval_ctx = self._build_eval_context(ctx)
-
-                        if self._evaluate_condition_value(condition, eval_ctx):
-                            return action
-
+        if not isinstance(rule, (str, dict, list)):
+            logger.warning(f"Unknown rule type: {type(rule)}")
             return None
 
-        logger.warning(f"Unknown rule type: {type(rule)}")
-        return None
+        self._programs.bind(
+            self._condition_registry,
+            getattr(self._rule_resolver, 'expression_parser', None),
+        )
+        program = self._programs.get(
+            (ctx.state, ctx.current_intent), rule,
+            lambda value: compile_source_rule(value, self._compile_condition),
+        )
+        eval_ctx = self._build_eval_context(ctx) if program.needs_context else None
+        return program.evaluate(eval_ctx, None)
 
     def _build_eval_context(self, ctx) -> EvaluatorContext:
         """Build evaluation context for condition registry."""
@@ -301,7 +301,7 @@ class IntentProcessorSource(KnowledgeSource):
         current_phase = ctx.current_phase
 
         return EvaluatorContext(
-            collected_data=dict(ctx.collected_data),
+            collected_data=ctx.collected_data,
             state=ctx.state,
             turn_number=ctx.turn_number,
             current_phase=current_phase,
@@ -327,4 +327,6 @@ class IntentProcessorSource(KnowledgeSource):
             tone=getattr(envelope, "tone", None),
             unclear_count=getattr(envelope, "unclear_count", 0),
             persona=getattr(ctx, 'persona', 'default'),
+            condition_cache=getattr(ctx, "condition_cache", None),
+            data_version=getattr(ctx, "data_version", None),
         )
@@ -1,9 +1,15 @@
 # src/blackboard/sources/objection_guard.py
 
-from typing import Dict, Optional, Set
+from typing import Dict, FrozenSet, Optional, Set
 import logging
 
-from ..knowledge_source import KnowledgeSource
+from ..knowledge_source import (
+    CHANNEL_ACTIONS,
+    CHANNEL_DATA_UPDATES,
+    CHANNEL_TRANSITIONS,
+    KnowledgeSource,
+    SourceTriggers,
+)
 from ..blackboard import DialogueBlackboard
 from ..enums import Priority
 from src.yaml_config.constants import OBJECTION_INTENTS, PERSONA_OBJECTION_LIMITS
@@ -33,6 +39,9 @@ class ObjectionGuardSource(KnowledgeSource):
     redirect to soft close.
     """
 
+    reads = frozenset()
+    writes = frozenset({CHANNEL_ACTIONS, CHANNEL_TRANSITIONS, CHANNEL_DATA_UPDATES})
+
     # Default persona limits — loaded from constants.yaml (single source of truth).
     # Hardcoded dict is kept only as a safety net fallback if YAML fails to load.
     DEFAULT_PERSONA_LIMITS: Dict[str, Dict[str, int]] = PERSONA_OBJECTION_LIMITS if PERSONA_OBJECTION_LIMITS else {
@@ -82,9 +91,13 @@ class ObjectionGuardSource(KnowledgeSource):
         return self._persona_limits
 
     @property
-    def objection_intents(self) -> Set[str]:
-        """Get the set of objection intents."""
-        return self._objection_intents
+    def objection_intents(self) -> FrozenSet[str]:
+        """Get the set of objection intents (read-only: it drives dispatch triggers)."""
+        return frozenset(self._objection_intents)
+
+    def get_triggers(self) -> Optional[SourceTriggers]:
+        """Triggered by objection intents only."""
+        return SourceTriggers(intents=frozenset(self._objection_intents))
 
     def should_contribute(self, blackboard: DialogueBlackboard) -> bool:
         """
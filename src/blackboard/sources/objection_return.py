@@ -25,10 +25,14 @@ Architecture:
 Part of the fundamental fix for the Objection Stuck bug.
 """
 
-from typing import Optional, Set, TYPE_CHECKING
+from typing import FrozenSet, Optional, Set, TYPE_CHECKING
 import logging
 
-from ..knowledge_source import KnowledgeSource
+from ..knowledge_source import (
+    CHANNEL_TRANSITIONS,
+    KnowledgeSource,
+    SourceTriggers,
+)
 from ..enums import Priority
 from src.yaml_config.constants import (
     OBJECTION_INTENTS,
@@ -144,6 +148,9 @@ class ObjectionReturnSource(KnowledgeSource):
                          → objection_limit_reached → soft_close → 0% coverage)
     """
 
+    reads = frozenset()
+    writes = frozenset({CHANNEL_TRANSITIONS})
+
     # Return intents loaded from constants.yaml (SSOT)
     # Composed category: positive + price_related + all_questions
     # Defined in constants.yaml → composed_categories → objection_return_triggers
@@ -185,9 +192,16 @@ class ObjectionReturnSource(KnowledgeSource):
         )
 
     @property
-    def return_intents(self) -> Set[str]:
-        """Get the set of intents that trigger return."""
-        return self._return_intents
+    def return_intents(self) -> FrozenSet[str]:
+        """Get the set of intents that trigger return (read-only: it drives dispatch triggers)."""
+        return frozenset(self._return_intents)
+
+    def get_triggers(self) -> Optional[SourceTriggers]:
+        """Triggered in handle_objection by return or objection intents."""
+        return SourceTriggers(
+            intents=frozenset(self._return_intents) | frozenset(OBJECTION_INTENTS),
+            states=frozenset({self.OBJECTION_STATE}),
+        )
 
     def should_contribute(self, blackboard: 'DialogueBlackboard') -> bool:
         """
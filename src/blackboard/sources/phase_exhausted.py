@@ -18,10 +18,14 @@ Priority interactions:
     - StallGuardSource fires at higher threshold; PhaseExhausted doesn't fire
 """
 
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 import logging
 
-from ..knowledge_source import KnowledgeSource
+from ..knowledge_source import (
+    CHANNEL_ACTIONS,
+    KnowledgeSource,
+    SourceTriggers,
+)
 from ..enums import Priority
 from src.feature_flags import flags
 
@@ -47,10 +51,17 @@ class PhaseExhaustedSource(KnowledgeSource):
         proposes changes through the blackboard.
     """
 
+    reads = frozenset()
+    writes = frozenset({CHANNEL_ACTIONS})
+
     def __init__(self, name: str = "PhaseExhaustedSource", enabled: bool = True):
         super().__init__(name)
         self._enabled = enabled
 
+    def get_triggers(self) -> Optional[SourceTriggers]:
+        """Runs every turn while phase_exhausted_source is enabled."""
+        return SourceTriggers(flags=frozenset({"phase_exhausted_source"}))
+
     def should_contribute(self, blackboard: 'DialogueBlackboard') -> bool:
         """
         Quick check: should we offer options menu?
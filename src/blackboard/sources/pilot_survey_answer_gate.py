@@ -9,8 +9,13 @@ from typing import Any, Dict, Iterable, Literal, Optional, Set, TYPE_CHECKING
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator
 
 from ..enums import Priority
-from ..knowledge_source import KnowledgeSource
-from src.yaml_config.constants import INTENT_CATEGORIES, get_fact_question_source_config
+from ..knowledge_source import (
+    CHANNEL_ACTIONS,
+    CHANNEL_CONTEXT_SIGNALS,
+    CHANNEL_TRANSITIONS,
+    KnowledgeSource,
+)
+from src.yaml_config.constants import get_fact_question_source_config, get_intent_category_set
 
 if TYPE_CHECKING:
     from ..blackboard import DialogueBlackboard
@@ -121,6 +126,9 @@ class PilotSurveyAnswerGateSource(KnowledgeSource):
     deterministic `transitions.answer_accepted` state transition.
     """
 
+    reads = frozenset({CHANNEL_ACTIONS, CHANNEL_CONTEXT_SIGNALS})
+    writes = frozenset({CHANNEL_TRANSITIONS, CHANNEL_CONTEXT_SIGNALS})
+
     def __init__(self, llm: Any = None, name: str = "PilotSurveyAnswerGateSource"):
         super().__init__(name)
         self._llm = llm
@@ -128,7 +136,7 @@ class PilotSurveyAnswerGateSource(KnowledgeSource):
 
     @staticmethod
     def _load_company_question_intents() -> Set[str]:
-        price_intents = set(INTENT_CATEGORIES.get("price_related", []) or [])
+        price_intents = set(get_intent_category_set("price_related"))
         fact_cfg = get_fact_question_source_config()
         fact_intents = set(fact_cfg.get("fact_intents", []) or [])
         if not fact_intents:
@@ -137,7 +145,7 @@ class PilotSurveyAnswerGateSource(KnowledgeSource):
 
                 fact_intents = set(FactQuestionSource.DEFAULT_FACT_INTENTS)
             except Exception:
-                fact_intents = set(INTENT_CATEGORIES.get("all_questions", []) or [])
+                fact_intents = set(get_intent_category_set("all_questions"))
         return price_intents | fact_intents
 
     @staticmethod
@@ -11,10 +11,15 @@ If a rule is defined for the price intent (e.g., in value_rules mixin),
 that rule's action is used instead of the default answer_with_pricing.
 """
 
-from typing import Set, Optional, Union, Dict, List, Any, TYPE_CHECKING
+from typing import FrozenSet, Set, Optional, Union, Dict, List, Any, TYPE_CHECKING
 import logging
 
-from ..knowledge_source import KnowledgeSource
+from ..knowledge_source import (
+    CHANNEL_ACTIONS,
+    CHANNEL_CONTEXT_SIGNALS,
+    KnowledgeSource,
+    SourceTriggers,
+)
 from ..enums import Priority
 from src.conditions.state_machine.context import EvaluatorContext
 
@@ -84,6 +89,9 @@ class PriceQuestionSource(KnowledgeSource):
     and conditions.py price_repeated_3x/2x.
     """
 
+    reads = frozenset()
+    writes = frozenset({CHANNEL_ACTIONS, CHANNEL_CONTEXT_SIGNALS})
+
     # FIX: Load from constants.yaml instead of hardcoding
     # This ensures synchronization across the system
     DEFAULT_PRICE_INTENTS: Set[str] = _get_price_intents_from_config()
@@ -117,7 +125,7 @@ class PriceQuestionSource(KnowledgeSource):
             name: Source name for logging
         """
         super().__init__(name)
-        self._price_intents = price_intents or self.DEFAULT_PRICE_INTENTS.copy()
+        self._price_intents = set(price_intents or self.DEFAULT_PRICE_INTENTS)
 
         # Lazy initialization of condition registry
         if condition_registry is not None:
@@ -127,17 +135,24 @@ class PriceQuestionSource(KnowledgeSource):
             self._condition_registry = sm_registry
 
     @property
-    def price_intents(self) -> Set[str]:
-        """Get the set of price-related intents."""
-        return self._price_intents
+    def price_intents(self) -> FrozenSet[str]:
+        """Get the set of price-related intents (change it via add/remove_price_intent)."""
+        return frozenset(self._price_intents)
 
     def add_price_intent(self, intent: str) -> None:
         """Add an intent to the price intents set."""
         self._price_intents.add(intent)
+        self._invalidate_triggers()
 
     def remove_price_intent(self, intent: str) -> None:
         """Remove an intent from the price intents set."""
         self._price_intents.discard(intent)
+        self._invalidate_triggers()
+
+    def get_triggers(self) -> Optional[SourceTriggers]:
+        """Triggered by a price intent as primary, secondary or repeated question."""
+        intents = frozenset(self._price_intents)
+        return SourceTriggers(intents=intents, secondary_intents=intents, repeated_questions=intents)
 
     def should_contribute(self, blackboard: 'DialogueBlackboard') -> bool:
         """
@@ -483,7 +498,7 @@ class PriceQuestionSource(KnowledgeSource):
         current_phase = ctx.current_phase
 
         return EvaluatorContext(
-            collected_data=dict(ctx.collected_data),
+            collected_data=ctx.collected_data,
             state=ctx.state,
             turn_number=ctx.turn_number,
             current_phase=current_phase,
@@ -508,4 +523,6 @@ class PriceQuestionSource(KnowledgeSource):
             guard_intervention=getattr(envelope, "guard_intervention", None),
             tone=getattr(envelope, "tone", None),
             unclear_count=getattr(envelope, "unclear_count", 0),
+            condition_cache=getattr(ctx, "condition_cache", None),
+            data_version=getattr(ctx, "data_version", None),
         )
@@ -29,7 +29,12 @@ Root Causes Fixed:
 from typing import Optional, TYPE_CHECKING
 import logging
 
-from ..knowledge_source import KnowledgeSource
+from ..knowledge_source import (
+    CHANNEL_ACTIONS,
+    CHANNEL_TRANSITIONS,
+    KnowledgeSource,
+    SourceTriggers,
+)
 from ..enums import Priority
 from src.feature_flags import flags
 
@@ -55,6 +60,9 @@ class StallGuardSource(KnowledgeSource):
         proposes changes through the blackboard.
     """
 
+    reads = frozenset()
+    writes = frozenset({CHANNEL_ACTIONS, CHANNEL_TRANSITIONS})
+
     # Follow ObjectionReturnSource pattern — class constant for state name
     OBJECTION_STATE = "handle_objection"
 
@@ -62,6 +70,10 @@ class StallGuardSource(KnowledgeSource):
         super().__init__(name)
         self._enabled = enabled
 
+    def get_triggers(self) -> Optional[SourceTriggers]:
+        """Runs every turn while universal_stall_guard is enabled."""
+        return SourceTriggers(flags=frozenset({"universal_stall_guard"}))
+
     def should_contribute(self, blackboard: 'DialogueBlackboard') -> bool:
         """
         Quick check: should we force a state transition?
@@ -10,10 +10,16 @@ Clear separation of concerns with DataCollectorSource which handles data-based t
 from typing import Optional, Dict, Any, List, Union, Set, TYPE_CHECKING
 import logging
 
-from ..knowledge_source import KnowledgeSource
+from ..knowledge_source import (
+    CHANNEL_CONTEXT_SIGNALS,
+    CHANNEL_TRANSITIONS,
+    KnowledgeSource,
+)
 from ..enums import Priority
 from src.conditions.state_machine.registry import get_sm_registry
+from src.conditions.expression_parser import compile_condition_value
 from src.conditions.state_machine.context import EvaluatorContext
+from src.rules.compiler import RuleProgramCache, compile_source_rule
 from src.blackboard.sources.pilot_survey_answer_gate import (
     latest_pilot_survey_signal,
     should_defer_to_pilot_router,
@@ -43,6 +49,9 @@ class TransitionResolverSource(KnowledgeSource):
         - DataCollectorSource: data-based transitions (data_complete only)
     """
 
+    reads = frozenset({CHANNEL_CONTEXT_SIGNALS})
+    writes = frozenset({CHANNEL_TRANSITIONS})
+
     # Transition triggers handled by other sources
     EXCLUDED_TRIGGERS: Set[str] = {
         "data_complete",  # Handled by DataCollectorSource
@@ -67,6 +76,8 @@ class TransitionResolverSource(KnowledgeSource):
         super().__init__(name)
         self._condition_registry = condition_registry or get_sm_registry()
         self._expression_parser = expression_parser
+        # Compiled transitions per (state, intent)
+        self._programs = RuleProgramCache()
 
     def should_contribute(self, blackboard: 'DialogueBlackboard') -> bool:
         """
@@ -195,6 +206,10 @@ class TransitionResolverSource(KnowledgeSource):
         """
         Resolve a transition definition to a target state.
 
+        Supports simple string, conditional dict {"when": ..., "then": ...}
+        and conditional chain [{...}, ..., "default"] transitions. They are
+        compiled once per (state, intent) and reused while unchanged.
+
         Args:
             transition_def: Transition definition (string, dict, or list)
             ctx: Context snapshot
@@ -202,44 +217,17 @@ class TransitionResolverSource(KnowledgeSource):
         Returns:
             Target state name or None
         """
-        # Simple string transition
-        if isinstance(transition_def, str):
-            return transition_def
-
-        # Conditional dict: {"when": "condition", "then": "state"}
-        if isinstance(transition_def, dict):
-            condition = transition_def.get("when")
-            target = transition_def.get("then")
-
-            if condition and target:
-                eval_ctx = self._build_eval_context(ctx)
-
-                if self._evaluate_condition(condition, eval_ctx):
-                    return target
-
+        if not isinstance(transition_def, (str, dict, list)):
+            logger.warning(f"Unknown transition type: {type(transition_def)}")
             return None
 
-        # Conditional chain: [{"when": "c1", "then": "s1"}, ..., "default"]
-        if isinstance(transition_def, list):
-            for item in transition_def:
-                if isinstance(item, str):
-                    # Default fallback
-                    return item
-
-                if isinstance(item, dict):
-                    condition = item.get("when")
-                    target = item.get("then")
-
-                    if condition and target:
-                        eval_ctx = self._build_eval_context(ctx)
-
-                        if self._evaluate_condition(condition, eval_ctx):
-                            return target
-
-            return None
-
-        logger.warning(f"Unknown transition type: {type(transition_def)}")
-        return None
+        self._programs.bind(self._condition_registry, self._expression_parser)
+        program = self._programs.get(
+            (ctx.state, ctx.current_intent), transition_def,
+            lambda value: compile_source_rule(value, self._compile_condition),
+        )
+        eval_ctx = self._build_eval_context(ctx) if program.needs_context else None
+        return program.evaluate(eval_ctx, None)
 
     def _evaluate_condition(self, condition, eval_ctx: EvaluatorContext) -> bool:
         """
@@ -252,18 +240,26 @@ class TransitionResolverSource(KnowledgeSource):
         Returns:
             True if condition is met, False otherwise
         """
-        from src.conditions.expression_parser import evaluate_condition_value
-        try:
-            return evaluate_condition_value(
-                condition, eval_ctx, self._condition_registry,
-                self._expression_parser, source_name="TransitionResolverSource"
-            )
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Condition evaluation failed: {e}")
-            return False
-        except Exception as e:
-            logger.error(f"Error evaluating condition '{condition}': {e}")
-            return False
+        return self._compile_condition(condition)(eval_ctx)
+
+    def _compile_condition(self, condition):
+        """Compile a transition condition; evaluation errors count as False."""
+        evaluate = compile_condition_value(
+            condition, self._condition_registry,
+            self._expression_parser, source_name="TransitionResolverSource"
+        )
+
+        def check(eval_ctx: EvaluatorContext) -> bool:
+            try:
+                return evaluate(eval_ctx, None)
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Condition evaluation failed: {e}")
+                return False
+            except Exception as e:
+                logger.error(f"Error evaluating condition '{condition}': {e}")
+                return False
+
+        return check
 
     def _build_eval_context(self, ctx) -> EvaluatorContext:
         """
@@ -279,7 +275,7 @@ class TransitionResolverSource(KnowledgeSource):
         current_phase = ctx.current_phase
 
         return EvaluatorContext(
-            collected_data=dict(ctx.collected_data),
+            collected_data=ctx.collected_data,
             state=ctx.state,
             turn_number=ctx.turn_number,
             current_phase=current_phase,
@@ -305,4 +301,6 @@ class TransitionResolverSource(KnowledgeSource):
             tone=getattr(envelope, "tone", None),
             unclear_count=getattr(envelope, "unclear_count", 0),
             persona=getattr(ctx, 'persona', 'default'),
+            condition_cache=getattr(ctx, "condition_cache", None),
+            data_version=getattr(ctx, "data_version", None),
         )
@@ -17,6 +17,7 @@
 
 import time
 import re
+import threading
 import json
 import uuid
 from collections.abc import MutableSequence
@@ -60,6 +61,7 @@ from src.response_directives import build_response_directives
 # Phase DAG: Modular Flow System & YAML Parameterization
 from src.config_loader import ConfigLoader, LoadedConfig, FlowConfig
 from src.settings import settings
+from src.turn_deadline import TurnDeadline, turn_deadline
 
 # Blackboard Architecture: DialogueOrchestrator (Stage 14)
 from src.blackboard import create_orchestrator
@@ -226,6 +228,8 @@ class SalesBot:
 
         # Phase DAG: Load modular flow configuration (REQUIRED since v2.0)
         # Legacy Python-based config is deprecated and no longer used
+        # shared=True: замороженный бандл из процессного кэша, общий для всех
+        # сессий; YAML перечитывается только при изменении файлов/overrides.
         self._config_loader = ConfigLoader()
         self._config: LoadedConfig
         self._flow: FlowConfig
@@ -233,6 +237,7 @@ class SalesBot:
             config_name=config_name or "default",
             flow_name=flow_name,
             validate=True,
+            shared=True,
         )
         resolved_flow = self._config.flow_name or settings.flow.active
 
@@ -267,6 +272,8 @@ class SalesBot:
         self.transcript = DialogTranscript(policy=self.history_projection_policy)
         self.history_compact: Optional[Dict[str, Any]] = None
         self.history_compact_meta: Optional[Dict[str, Any]] = None
+        # Background compaction (HistoryCompactionWorker) swaps the pair above
+        self._history_compact_lock = threading.Lock()
 
         # FIX: Store persona in collected_data for ObjectionGuard persona-specific limits
         # This fixes the bug where 99% of simulated dialogues ended in soft_close
@@ -2438,12 +2445,29 @@ class SalesBot:
         9. Apply CTA (Phase 3)
         10. Record metrics (Phase 0)
 
+        Весь ход выполняется внутри TurnDeadline (settings.turn_deadline):
+        LLM таймауты/retry и опциональные LLM-этапы ограничены бюджетом хода.
+
         Args:
             user_message: Сообщение от клиента
 
         Returns:
             Dict с response, intent, action, state, is_final и др.
         """
+        deadline = TurnDeadline.from_settings()
+        with turn_deadline(deadline):
+            result = self._process_turn(user_message, media_turn_context=media_turn_context)
+        if deadline is not None and isinstance(result, dict):
+            result["turn_deadline"] = deadline.to_dict()
+        return result
+
+    def _process_turn(
+        self,
+        user_message: str,
+        *,
+        media_turn_context: Optional[MediaTurnContext] = None,
+    ) -> Dict:
+        """Pipeline одного хода; вызывается из process() внутри дедлайна хода."""
         pending_media_meta = self._consume_pending_media_meta()
         current_turn_number = (
             self.context_window.get_total_turn_count() + 1
@@ -4017,31 +4041,86 @@ class SalesBot:
     # Snapshot API
     # =========================================================================
 
+    def _history_compaction_context(self) -> Dict[str, Any]:
+        return {
+            "collected_data": dict(self.state_machine.collected_data),
+            "metrics": self.metrics.to_dict() if hasattr(self.metrics, "to_dict") else {},
+            "context_window": self.context_window.to_dict() if hasattr(self.context_window, "to_dict") else {},
+        }
+
+    def get_history_compact(self) -> tuple:
+        """Latest applied (history_compact, history_compact_meta) pair."""
+        with self._history_compact_lock:
+            return self.history_compact, self.history_compact_meta
+
+    def apply_history_compact(self, compact: Dict[str, Any], meta: Dict[str, Any]) -> bool:
+        """
+        Install a compact produced in the background.
+
+        Ignored when it covers fewer turns than the current one, so a slow
+        compaction never rolls the summary back.
+        """
+        with self._history_compact_lock:
+            current = (self.history_compact_meta or {}).get("compacted_turns")
+            if current is not None and int(meta.get("compacted_turns", 0)) < int(current):
+                return False
+            self.history_compact = compact
+            self.history_compact_meta = meta
+            return True
+
+    def capture_history_compaction(
+        self,
+        *,
+        history_tail_size: int = 4,
+        min_new_turns: int = 1,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Capture inputs for background compaction, or None if nothing to do.
+
+        Called under the session lock; the worker only touches the capture.
+        """
+        history = list(self.history)
+        old_turns = len(history) - max(0, min(int(history_tail_size), len(history)))
+        _, meta = self.get_history_compact()
+        compacted = int((meta or {}).get("compacted_turns") or 0)
+        if old_turns - compacted < max(1, int(min_new_turns)):
+            return None
+        return {
+            "history": history,
+            "history_tail_size": history_tail_size,
+            "llm": getattr(self.generator, "llm", None),
+            "fallback_context": self._history_compaction_context(),
+        }
+
     def to_snapshot(
         self,
         compact_history: bool = False,
         history_tail_size: int = 4
     ) -> Dict[str, Any]:
-        """Serialize full bot state into snapshot."""
+        """
+        Serialize full bot state into snapshot.
+
+        compact_history never calls the LLM: it uses the latest compact from
+        the background worker and folds turns it has not reached yet in with
+        the deterministic fallback (not stored, the worker still upgrades it).
+        """
         history_compact = None
         history_compact_meta = None
 
         if compact_history:
-            history_compact, history_compact_meta = HistoryCompactor.compact(
-                history_full=self.history,
-                history_tail_size=history_tail_size,
-                previous_compact=getattr(self, "history_compact", None),
-                previous_meta=getattr(self, "history_compact_meta", None),
-                llm=getattr(self.generator, "llm", None),
-                fallback_context={
-                    "collected_data": self.state_machine.collected_data,
-                    "metrics": self.metrics.to_dict() if hasattr(self.metrics, "to_dict") else {},
-                    "context_window": self.context_window.to_dict() if hasattr(self.context_window, "to_dict") else {},
-                },
-            )
-            # Keep for incremental compaction
-            self.history_compact = history_compact
-            self.history_compact_meta = history_compact_meta
+            history_compact, history_compact_meta = self.get_history_compact()
+            history_full = self.history
+            tail_size = max(0, min(int(history_tail_size), len(history_full)))
+            compacted = (history_compact_meta or {}).get("compacted_turns")
+            if history_compact is None or compacted is None or int(compacted) < len(history_full) - tail_size:
+                history_compact, history_compact_meta = HistoryCompactor.compact(
+                    history_full=history_full,
+                    history_tail_size=history_tail_size,
+                    previous_compact=history_compact,
+                    previous_meta=history_compact_meta,
+                    llm=None,
+                    fallback_context=self._history_compaction_context(),
+                )
 
         context_payload = (
             self.context_window.to_dict()
@@ -89,6 +89,8 @@ class LLMClassifier:
                     fallback_classifier=self.fallback,
                 )
                 if salvaged_result is not None:
+                    if hasattr(self.vllm, "record_structured_event"):
+                        self.vllm.record_structured_event(trace.purpose, "salvage_calls")
                     logger.info(
                         "LLM classifier salvaged structured payload via fallback top intent",
                         extra={"request_id": trace.request_id},
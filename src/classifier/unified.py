@@ -70,10 +70,12 @@ class UnifiedClassifier:
 
     @property
     def hybrid(self):
-        """Lazy init HybridClassifier."""
+        """Lazy init HybridClassifier (shared between sessions: it is stateless,
+        but holds the pymorphy dictionaries and compiled patterns)."""
         if self._hybrid is None:
             from src.classifier.hybrid import HybridClassifier
-            self._hybrid = HybridClassifier()
+            from src.component_registry import shared_component
+            self._hybrid = shared_component("hybrid_classifier", HybridClassifier)
         return self._hybrid
 
     @property
@@ -0,0 +1,126 @@
+"""
+ComponentRegistry - process-wide shared engines for SalesBot sessions.
+
+Several SalesBot components are split into a heavy, read-only engine that is
+identical for every conversation (compiled regexes, morphology dictionaries,
+parsed YAML, KB-derived labels) and a small per-session state object that
+holds the dialogue-specific counters and history. The engines live here and
+are built once per process; each session only allocates its own state.
+
+Engines are keyed by (name, factory, *key) and built as ``factory(*key)``.
+Including the factory in the key means a patched or substituted factory
+(tests, tenant-specific builds) gets its own entry instead of silently
+receiving an engine built by another one.
+
+Usage:
+    from src.component_registry import shared_component
+
+    self.hybrid = shared_component("hybrid_classifier", HybridClassifier)
+
+Engines returned from the registry must be treated as read-only by callers.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, TypeVar
+
+from src.logger import logger
+
+
+T = TypeVar("T")
+
+
+class ComponentRegistry:
+    """Thread-safe get-or-create cache of shared, read-only components."""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._components: Dict[Tuple[Hashable, ...], Any] = {}
+        self._build_ms: Dict[str, float] = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.builds = 0
+
+    def get(self, name: str, factory: Callable[..., T], *key: Hashable) -> T:
+        """
+        Return the shared ``factory(*key)`` for (name, factory, *key), building it once.
+
+        When the registry is disabled every call builds a fresh instance, which
+        is how the benchmark measures the unshared baseline.
+        """
+        if not self.enabled:
+            return factory(*key)
+
+        cache_key = (name, factory) + key
+        component = self._components.get(cache_key)
+        if component is not None:
+            self.hits += 1
+            return component
+
+        with self._lock:
+            component = self._components.get(cache_key)
+            if component is not None:
+                self.hits += 1
+                return component
+            started = time.perf_counter()
+            component = factory(*key)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self._components[cache_key] = component
+            self._build_ms[name] = self._build_ms.get(name, 0.0) + elapsed_ms
+            self.builds += 1
+            logger.debug(
+                "Shared component built",
+                component=name,
+                build_ms=round(elapsed_ms, 2),
+            )
+            return component
+
+    def names(self) -> List[str]:
+        with self._lock:
+            return sorted({key[0] for key in self._components})
+
+    def clear(self, name: Optional[str] = None) -> int:
+        """Drop shared components (all, or only those registered under `name`)."""
+        with self._lock:
+            if name is None:
+                count = len(self._components)
+                self._components.clear()
+                self._build_ms.clear()
+                return count
+            stale = [key for key in self._components if key[0] == name]
+            for key in stale:
+                del self._components[key]
+            self._build_ms.pop(name, None)
+            return len(stale)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "components": len(self._components),
+                "hits": self.hits,
+                "builds": self.builds,
+                "build_ms": {name: round(ms, 2) for name, ms in self._build_ms.items()},
+            }
+
+
+_registry = ComponentRegistry()
+
+
+def get_component_registry() -> ComponentRegistry:
+    """Process-wide registry used by SalesBot components."""
+    return _registry
+
+
+def shared_component(name: str, factory: Callable[..., T], *key: Hashable) -> T:
+    """Shortcut for get_component_registry().get(name, factory, *key)."""
+    return _registry.get(name, factory, *key)
+
+
+__all__ = [
+    "ComponentRegistry",
+    "get_component_registry",
+    "shared_component",
+]
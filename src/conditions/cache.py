@@ -0,0 +1,157 @@
+"""
+Turn-scoped memoization of condition evaluations.
+
+Within one dialogue turn the same conditions (has_pricing_data, contact
+checks, ...) are evaluated many times: by PriorityAssigner, several
+Knowledge Sources, RuleResolver and the DAG executor, each with its own
+EvaluatorContext. A ConditionCache is created per turn and attached to
+every context built for that turn; ConditionRegistry.evaluate() then
+returns a memoized result for (registry, condition, context version).
+
+The context version identifies what a condition can observe: the
+collected_data version (see VersionedDict) plus every other context field.
+Two contexts built from the same turn snapshot therefore share results,
+while a context built after collected_data was mutated does not.
+"""
+
+import itertools
+import threading
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from src.conditions.trace import ConditionCacheStats
+
+_data_versions = itertools.count(1)
+
+
+def next_data_version() -> int:
+    """Return a process-wide unique collected_data version."""
+    return next(_data_versions)
+
+
+class VersionedDict(dict):
+    """
+    dict that takes a new unique ``version`` on every mutation.
+
+    Used for StateMachine.collected_data so that condition results cached
+    for one version of the data are never reused for another.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = next_data_version()
+
+    def _touch(self) -> None:
+        self.version = next_data_version()
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._touch()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._touch()
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._touch()
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._touch()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._touch()
+        return item
+
+    def clear(self):
+        super().clear()
+        self._touch()
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self._touch()
+        return super().setdefault(key, default)
+
+    def __ior__(self, other):
+        result = super().__ior__(other)
+        self._touch()
+        return result
+
+
+class ConditionCache:
+    """
+    Memoized condition results for one dialogue turn.
+
+    Thread-safe: Knowledge Sources may evaluate conditions concurrently.
+    Results of evaluations that raise are never cached.
+    """
+
+    def __init__(self):
+        self._results: Dict[Tuple[Any, str, Hashable], bool] = {}
+        self._versions: Dict[int, Hashable] = {}
+        # Contexts are kept alive so that identity-based parts of their
+        # versions (id of config, tracker) cannot be reused by new objects.
+        self._contexts: List[Any] = []
+        self._lock = threading.Lock()
+        self._evaluations: Dict[str, int] = {}
+        self._hits: Dict[str, int] = {}
+        self._uncached = 0
+
+    def version_of(self, ctx: Any) -> Optional[Hashable]:
+        """Version of ``ctx``, or None when it cannot be cached."""
+        with self._lock:
+            version = self._versions.get(id(ctx))
+        if version is not None:
+            return version
+        cache_version = getattr(ctx, "cache_version", None)
+        version = cache_version() if callable(cache_version) else None
+        if version is not None:
+            with self._lock:
+                self._versions[id(ctx)] = version
+                self._contexts.append(ctx)
+        return version
+
+    def lookup(self, registry: Any, condition: str, ctx: Any) -> Tuple[Optional[Hashable], Optional[bool]]:
+        """
+        Return (key, result). result is None on a miss; key is None when
+        the context has no version and the result must not be stored.
+        """
+        version = self.version_of(ctx)
+        with self._lock:
+            self._evaluations[condition] = self._evaluations.get(condition, 0) + 1
+            if version is None:
+                self._uncached += 1
+                return None, None
+            key = (registry, condition, version)
+            result = self._results.get(key)
+            if result is not None:
+                self._hits[condition] = self._hits.get(condition, 0) + 1
+            return key, result
+
+    def store(self, key: Hashable, result: bool) -> None:
+        with self._lock:
+            self._results[key] = result
+
+    def get_stats(self) -> ConditionCacheStats:
+        with self._lock:
+            return ConditionCacheStats(
+                evaluations=sum(self._evaluations.values()),
+                hits=sum(self._hits.values()),
+                uncached=self._uncached,
+                by_condition={
+                    name: (count, self._hits.get(name, 0))
+                    for name, count in self._evaluations.items()
+                },
+            )
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __repr__(self) -> str:
+        stats = self.get_stats()
+        return (
+            f"ConditionCache(results={len(self)}, evaluations={stats.evaluations}, "
+            f"hits={stats.hits})"
+        )
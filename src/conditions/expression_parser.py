@@ -506,6 +506,49 @@ def evaluate_condition_value(
     )
 
 
+def compile_condition_value(
+    condition: Union[str, Dict],
+    registry: 'ConditionRegistry',
+    expression_parser: Optional['ConditionExpressionParser'] = None,
+    source_name: str = ""
+) -> Callable[[Any, Optional['EvaluationTrace']], bool]:
+    """
+    Compiled counterpart of evaluate_condition_value().
+
+    Returns evaluator(ctx, trace) -> bool. Composite conditions are parsed
+    once here; invalid conditions raise the same errors as
+    evaluate_condition_value(), but only when the evaluator is called.
+    """
+    if isinstance(condition, str):
+        def evaluate_simple(ctx: Any, trace: Optional['EvaluationTrace'] = None) -> bool:
+            return registry.evaluate(condition, ctx, trace)
+        return evaluate_simple
+
+    if isinstance(condition, dict):
+        if expression_parser is None:
+            message = (
+                f"Composite condition in '{source_name}' requires expression_parser. "
+                f"Condition: {condition}"
+            )
+
+            def missing_parser(ctx: Any, trace: Optional['EvaluationTrace'] = None) -> bool:
+                raise ValueError(message)
+            return missing_parser
+        try:
+            return expression_parser.parse(condition, source_name).evaluator
+        except Exception:
+            # Re-parse (and raise) on every evaluation, like the interpreter
+            def invalid_expression(ctx: Any, trace: Optional['EvaluationTrace'] = None) -> bool:
+                return expression_parser.parse(condition, source_name).evaluate(ctx, trace)
+            return invalid_expression
+
+    message = f"Condition must be str or dict, got {type(condition).__name__}"
+
+    def invalid_type(ctx: Any, trace: Optional['EvaluationTrace'] = None) -> bool:
+        raise TypeError(message)
+    return invalid_type
+
+
 # Export all public components
 __all__ = [
     "ConditionExpressionParser",
@@ -515,4 +558,5 @@ __all__ = [
     "UnknownConditionError",
     "UnknownCustomConditionError",
     "evaluate_condition_value",
+    "compile_condition_value",
 ]
@@ -673,12 +673,12 @@ def is_price_question(ctx: PolicyContext) -> bool:
 
     Uses INTENT_CATEGORIES from constants.yaml as Single Source of Truth.
     """
-    from src.yaml_config.constants import INTENT_CATEGORIES
-    price_intents = set(INTENT_CATEGORIES.get("price_related", []))
+    from src.yaml_config.constants import get_intent_category_set
+    price_intents = get_intent_category_set("price_related")
     if ctx.current_intent and ctx.current_intent in price_intents:
         return True
     if ctx.secondary_intents:
-        if price_intents & set(ctx.secondary_intents):
+        if not price_intents.isdisjoint(ctx.secondary_intents):
             return True
     # repeated_question fallback — require current-turn price signal
     if ctx.repeated_question and ctx.repeated_question in price_intents:
@@ -701,15 +701,11 @@ def is_price_question(ctx: PolicyContext) -> bool:
 )
 def is_answerable_question(ctx: PolicyContext) -> bool:
     """Universal version of is_price_question for ALL question types."""
-    from src.yaml_config.constants import INTENT_CATEGORIES
-    answerable = (
-        set(INTENT_CATEGORIES.get("question", []))
-        | set(INTENT_CATEGORIES.get("price_related", []))
-    )
+    from src.yaml_config.constants import ANSWERABLE_QUESTION_INTENTS as answerable
     if ctx.current_intent and ctx.current_intent in answerable:
         return True
     if ctx.secondary_intents:
-        if answerable & set(ctx.secondary_intents):
+        if not answerable.isdisjoint(ctx.secondary_intents):
             return True
     if ctx.repeated_question and ctx.repeated_question in answerable:
         return True
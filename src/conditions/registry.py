@@ -18,6 +18,7 @@ import inspect
 import time
 
 from src.conditions.base import BaseContext
+from src.conditions.cache import ConditionCache
 
 if TYPE_CHECKING:
     from src.conditions.trace import EvaluationTrace
@@ -352,6 +353,11 @@ class ConditionRegistry(Generic[TContext]):
         """
         Evaluate a condition.
 
+        When the context carries a turn-scoped ConditionCache
+        (``ctx.condition_cache``), a result memoized for the same
+        condition and context version is returned without calling the
+        condition function.
+
         Args:
             name: Name of the condition
             ctx: Context to evaluate against
@@ -368,11 +374,29 @@ class ConditionRegistry(Generic[TContext]):
         if metadata is None:
             raise ConditionNotFoundError(name, self.name)
 
+        cache = getattr(ctx, "condition_cache", None)
+        cache_key = None
+        if isinstance(cache, ConditionCache):
+            cache_key, cached = cache.lookup(self, name, ctx)
+            if cached is not None:
+                if trace is not None:
+                    trace.record(
+                        condition_name=name,
+                        result=cached,
+                        ctx=ctx,
+                        relevant_fields=metadata.requires_fields,
+                        cached=True
+                    )
+                return cached
+
         try:
             start_time = time.perf_counter()
             result = metadata.func(ctx)
             elapsed_ms = (time.perf_counter() - start_time) * 1000
 
+            if cache_key is not None:
+                cache.store(cache_key, result)
+
             if trace is not None:
                 trace.record(
                     condition_name=name,
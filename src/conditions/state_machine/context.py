@@ -7,8 +7,8 @@ conditions in the StateMachine (rules/transitions).
 Part of Phase 2: StateMachine Domain (ARCHITECTURE_UNIFIED_PLAN.md)
 """
 
-from typing import Dict, Any, Optional, List, Protocol, runtime_checkable, TYPE_CHECKING
-from dataclasses import dataclass, field
+from typing import Dict, Any, Hashable, Optional, List, Protocol, runtime_checkable, TYPE_CHECKING
+from dataclasses import dataclass, field, fields
 
 # Import INTENT_CATEGORIES from the single source of truth
 from src.intent_tracker import INTENT_CATEGORIES
@@ -24,6 +24,7 @@ from src.yaml_config.constants import (
 
 if TYPE_CHECKING:
     from src.config_loader import FlowConfig
+    from src.conditions.cache import ConditionCache
 
 # Create reverse mapping: state -> phase
 _STATE_TO_PHASE = {v: k for k, v in SPIN_STATES.items()}
@@ -176,6 +177,11 @@ class EvaluatorContext:
         has_breakthrough: Whether breakthrough was detected
         turns_since_breakthrough: Turns since breakthrough
         guard_intervention: Guard intervention type (or None)
+
+        # === Condition memoization ===
+        condition_cache: Turn-scoped ConditionCache (None disables memoization)
+        data_version: Version of the collected_data this context was built
+            from (VersionedDict.version / ContextSnapshot.data_version)
     """
     # Base context fields (from BaseContext protocol)
     collected_data: Dict[str, Any] = field(default_factory=dict)
@@ -228,6 +234,10 @@ class EvaluatorContext:
     max_consecutive_objections: int = field(default_factory=lambda: MAX_CONSECUTIVE_OBJECTIONS)
     max_total_objections: int = field(default_factory=lambda: MAX_TOTAL_OBJECTIONS)
 
+    # === Condition memoization (see src/conditions/cache.py) ===
+    condition_cache: Optional["ConditionCache"] = field(default=None, repr=False, compare=False)
+    data_version: Optional[int] = field(default=None, compare=False)
+
     def __post_init__(self):
         """Validate and compute derived fields."""
         if self.turn_number < 0:
@@ -258,6 +268,24 @@ class EvaluatorContext:
             self.max_consecutive_objections = limits["consecutive"]
             self.max_total_objections = limits["total"]
 
+    def cache_version(self) -> Optional[Hashable]:
+        """
+        Version of everything a condition can observe in this context.
+
+        collected_data is represented by data_version; objects such as the
+        intent tracker and configs by identity. Returns None when the data
+        version is unknown, which disables memoization for this context.
+        Contexts are treated as immutable once conditions are evaluated.
+        """
+        if not isinstance(self.data_version, int):
+            return None
+        parts: List[Any] = [type(self), self.data_version]
+        for f in fields(self):
+            if f.name in _UNVERSIONED_FIELDS:
+                continue
+            parts.append(_version_part(getattr(self, f.name)))
+        return tuple(parts)
+
     # Legacy aliases for backward compatibility
     @property
     def spin_phase(self) -> Optional[str]:
@@ -275,7 +303,8 @@ class EvaluatorContext:
         state_machine: Any,
         current_intent: str,
         config: Optional[Dict[str, Any]] = None,
-        context_envelope: Any = None
+        context_envelope: Any = None,
+        condition_cache: Optional["ConditionCache"] = None
     ) -> "EvaluatorContext":
         """
         Create context from StateMachine instance.
@@ -288,6 +317,7 @@ class EvaluatorContext:
             current_intent: Intent being processed
             config: Optional state configuration (from SALES_STATES)
             context_envelope: Optional ContextEnvelope with rich context
+            condition_cache: Optional turn-scoped ConditionCache
 
         Returns:
             Initialized EvaluatorContext
@@ -415,6 +445,8 @@ class EvaluatorContext:
             # Objection limits from state_machine (explicit overrides prevent auto-resolution)
             max_consecutive_objections=max_consecutive,
             max_total_objections=max_total,
+            condition_cache=condition_cache,
+            data_version=getattr(collected_data, "version", None),
         )
 
     @classmethod
@@ -612,6 +644,20 @@ class EvaluatorContext:
         )
 
 
+# Fields not covered by EvaluatorContext.cache_version() field walk
+_UNVERSIONED_FIELDS = frozenset({"collected_data", "condition_cache", "data_version"})
+
+
+def _version_part(value: Any) -> Hashable:
+    """Hashable stand-in for a context field value."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple(_version_part(item) for item in value)
+    # Configs, trackers, flow configs: compared by identity
+    return ("id", id(value))
+
+
 # Export all public components
 __all__ = [
     "EvaluatorContext",
@@ -8,7 +8,7 @@ during development.
 Part of Phase 1: Foundation (ARCHITECTURE_UNIFIED_PLAN.md)
 """
 
-from typing import Dict, List, Any, Optional, Set
+from typing import Dict, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -43,6 +43,7 @@ class ConditionEntry:
         field_values: Actual values of relevant fields at evaluation time
         elapsed_ms: Time taken to evaluate the condition in milliseconds
         timestamp: When the evaluation occurred
+        cached: Whether the result came from the turn's ConditionCache
     """
     condition_name: str
     result: bool
@@ -50,6 +51,7 @@ class ConditionEntry:
     field_values: Dict[str, Any] = field(default_factory=dict)
     elapsed_ms: float = 0.0
     timestamp: datetime = field(default_factory=datetime.now)
+    cached: bool = False
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
@@ -59,7 +61,8 @@ class ConditionEntry:
             "relevant_fields": list(self.relevant_fields),
             "field_values": self.field_values,
             "elapsed_ms": round(self.elapsed_ms, 3),
-            "timestamp": self.timestamp.isoformat()
+            "timestamp": self.timestamp.isoformat(),
+            "cached": self.cached
         }
 
     def to_compact_string(self) -> str:
@@ -68,7 +71,8 @@ class ConditionEntry:
         values_str = ""
         if self.field_values:
             values_str = f" ({', '.join(f'{k}={v}' for k, v in self.field_values.items())})"
-        return f"  {self.condition_name}: {result_str}{values_str}"
+        cached_str = " [cached]" if self.cached else ""
+        return f"  {self.condition_name}: {result_str}{values_str}{cached_str}"
 
 
 @dataclass
@@ -108,7 +112,8 @@ class EvaluationTrace:
         result: bool,
         ctx: Any,
         relevant_fields: Set[str] = None,
-        elapsed_ms: float = 0.0
+        elapsed_ms: float = 0.0,
+        cached: bool = False
     ) -> None:
         """
         Record a condition evaluation.
@@ -119,6 +124,7 @@ class EvaluationTrace:
             ctx: Context used for evaluation (to extract field values)
             relevant_fields: Fields checked by this condition
             elapsed_ms: Time taken for evaluation
+            cached: Whether the result was served by the ConditionCache
         """
         # Extract relevant field values from context
         field_values = {}
@@ -133,7 +139,8 @@ class EvaluationTrace:
             result=result,
             relevant_fields=fields,
             field_values=field_values,
-            elapsed_ms=elapsed_ms
+            elapsed_ms=elapsed_ms,
+            cached=cached
         )
         self.entries.append(entry)
 
@@ -234,6 +241,65 @@ class EvaluationTrace:
         )
 
 
+@dataclass
+class ConditionCacheStats:
+    """
+    Per-turn condition evaluation statistics of a ConditionCache.
+
+    Attributes:
+        evaluations: Total ConditionRegistry.evaluate() calls in the turn
+        hits: Calls answered from the cache
+        uncached: Calls whose context had no version (always evaluated)
+        by_condition: condition name -> (evaluations, hits)
+    """
+    evaluations: int = 0
+    hits: int = 0
+    uncached: int = 0
+    by_condition: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+
+    @property
+    def misses(self) -> int:
+        """Calls that ran the condition function."""
+        return self.evaluations - self.hits
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of calls answered from the cache."""
+        return self.hits / self.evaluations if self.evaluations else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary representation."""
+        return {
+            "evaluations": self.evaluations,
+            "hits": self.hits,
+            "misses": self.misses,
+            "uncached": self.uncached,
+            "hit_rate": round(self.hit_rate, 3),
+            "by_condition": {
+                name: {"evaluations": count, "hits": hits}
+                for name, (count, hits) in sorted(self.by_condition.items())
+            },
+        }
+
+    def to_compact_string(self) -> str:
+        """
+        Convert to compact string for simulation reports.
+
+        Example:
+        [CONDITIONS] 14 evaluations, 9 cached (64%)
+          has_pricing_data: 6 (5 cached)
+        """
+        lines = [
+            f"[CONDITIONS] {self.evaluations} evaluations, "
+            f"{self.hits} cached ({self.hit_rate:.0%})"
+        ]
+        for name, (count, hits) in sorted(
+            self.by_condition.items(), key=lambda item: (-item[1][0], item[0])
+        ):
+            lines.append(f"  {name}: {count} ({hits} cached)")
+        return "\n".join(lines)
+
+
 @dataclass
 class TraceSummary:
     """
@@ -246,6 +312,9 @@ class TraceSummary:
         total_conditions_checked: Total conditions evaluated
         total_elapsed_ms: Total time spent on evaluations
         matched_conditions: Count by matched condition name
+        cache_turns: Number of turns with recorded ConditionCacheStats
+        cache_evaluations: Condition evaluations over those turns
+        cache_hits: Evaluations answered from the per-turn cache
     """
     total_traces: int = 0
     by_resolution: Dict[str, int] = field(default_factory=dict)
@@ -253,6 +322,9 @@ class TraceSummary:
     total_conditions_checked: int = 0
     total_elapsed_ms: float = 0.0
     matched_conditions: Dict[str, int] = field(default_factory=dict)
+    cache_turns: int = 0
+    cache_evaluations: int = 0
+    cache_hits: int = 0
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
@@ -266,7 +338,16 @@ class TraceSummary:
                 round(self.total_conditions_checked / self.total_traces, 2)
                 if self.total_traces > 0 else 0
             ),
-            "matched_conditions": self.matched_conditions
+            "matched_conditions": self.matched_conditions,
+            "condition_cache": {
+                "turns": self.cache_turns,
+                "evaluations": self.cache_evaluations,
+                "hits": self.cache_hits,
+                "hit_rate": (
+                    round(self.cache_hits / self.cache_evaluations, 3)
+                    if self.cache_evaluations > 0 else 0
+                ),
+            },
         }
 
 
@@ -291,6 +372,7 @@ class TraceCollector:
     def __init__(self):
         """Initialize a new trace collector."""
         self._traces: List[EvaluationTrace] = []
+        self._cache_stats: List[ConditionCacheStats] = []
         self._created_at = datetime.now()
 
     def create_trace(
@@ -330,6 +412,19 @@ class TraceCollector:
         """
         self._traces.append(trace)
 
+    def add_cache_stats(self, stats: ConditionCacheStats) -> None:
+        """
+        Add the ConditionCache statistics of one turn.
+
+        Args:
+            stats: Stats returned by ConditionCache.get_stats()
+        """
+        self._cache_stats.append(stats)
+
+    def get_cache_stats(self) -> List[ConditionCacheStats]:
+        """Get per-turn condition cache statistics."""
+        return list(self._cache_stats)
+
     def get_traces(self) -> List[EvaluationTrace]:
         """Get all collected traces."""
         return list(self._traces)
@@ -377,11 +472,17 @@ class TraceCollector:
                     summary.matched_conditions.get(trace.matched_condition, 0) + 1
                 )
 
+        for stats in self._cache_stats:
+            summary.cache_turns += 1
+            summary.cache_evaluations += stats.evaluations
+            summary.cache_hits += stats.hits
+
         return summary
 
     def clear(self) -> None:
         """Clear all collected traces."""
         self._traces.clear()
+        self._cache_stats.clear()
 
     def __len__(self) -> int:
         """Return number of collected traces."""
@@ -8,7 +8,7 @@ Part of Phase 1: State Machine Parameterization
 """
 
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Set, Union, TYPE_CHECKING
+from typing import Dict, Any, Callable, FrozenSet, Optional, List, Set, Union, TYPE_CHECKING
 from dataclasses import dataclass, field
 import copy
 import threading
@@ -18,6 +18,7 @@ import re
 
 if TYPE_CHECKING:
     from src.conditions.registry import ConditionRegistry
+    from src.dag.graph import CompiledDAG, DAGValidationReport
     from src.dag.models import DAGNodeConfig
 
 logger = logging.getLogger(__name__)
@@ -43,8 +44,149 @@ class ConfigLoadError(Exception):
         super().__init__(message)
 
 
+class FrozenConfigError(TypeError):
+    """Raised on an attempt to mutate a shared (cached) configuration object."""
+
+
+def _frozen_mutation(self, *args, **kwargs):
+    raise FrozenConfigError(
+        f"{type(self).__name__} is shared between sessions and read-only; "
+        f"copy.deepcopy() it before modifying"
+    )
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict used inside cached LoadedConfig/FlowConfig objects.
+
+    Subclasses dict so isinstance checks, json.dumps and .get() keep working.
+    copy.copy()/copy.deepcopy()/pickle produce plain mutable dicts.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = _frozen_mutation
+    __delitem__ = _frozen_mutation
+    __ior__ = _frozen_mutation
+    clear = _frozen_mutation
+    pop = _frozen_mutation
+    popitem = _frozen_mutation
+    setdefault = _frozen_mutation
+    update = _frozen_mutation
+
+    def __copy__(self) -> Dict[Any, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[Any, Any]:
+        return {copy.deepcopy(k, memo): copy.deepcopy(v, memo) for k, v in self.items()}
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+class FrozenList(list):
+    """Read-only list counterpart of FrozenDict."""
+
+    __slots__ = ()
+
+    __setitem__ = _frozen_mutation
+    __delitem__ = _frozen_mutation
+    __iadd__ = _frozen_mutation
+    __imul__ = _frozen_mutation
+    append = _frozen_mutation
+    clear = _frozen_mutation
+    extend = _frozen_mutation
+    insert = _frozen_mutation
+    pop = _frozen_mutation
+    remove = _frozen_mutation
+    reverse = _frozen_mutation
+    sort = _frozen_mutation
+
+    def __copy__(self) -> List[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> List[Any]:
+        return [copy.deepcopy(v, memo) for v in self]
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+def _freeze_value(value: Any) -> Any:
+    """Recursively convert dicts/lists into FrozenDict/FrozenList."""
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((k, _freeze_value(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return FrozenList(_freeze_value(v) for v in value)
+    return value
+
+
+class _FreezableConfig:
+    """
+    Mixin for config dataclasses that can be frozen for sharing.
+
+    After freeze() public attributes cannot be reassigned and all nested
+    dicts/lists are read-only. Underscore attributes stay writable so
+    derived lazily-computed caches can still be attached.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if not name.startswith("_") and self.__dict__.get("_frozen", False):
+            raise FrozenConfigError(
+                f"{type(self).__name__}.{name} is read-only: the object is a shared "
+                f"cached bundle; use ConfigLoader().load_bundle() for a private copy"
+            )
+        object.__setattr__(self, name, value)
+
+    @property
+    def frozen(self) -> bool:
+        return self.__dict__.get("_frozen", False)
+
+    def freeze(self):
+        """Make the object read-only in place. Returns self."""
+        if self.frozen:
+            return self
+        for name, value in list(self.__dict__.items()):
+            if not name.startswith("_"):
+                object.__setattr__(self, name, _freeze_value(value))
+        object.__setattr__(self, "_frozen", True)
+        return self
+
+    def _derived(self, key: str, build: Callable[[], Any]) -> Any:
+        """
+        Return a view derived from public attributes (reverse maps, sets).
+
+        A frozen object builds each view once and serves the same read-only
+        value afterwards; a mutable object rebuilds it on every access so
+        edits to states/phases are always reflected.
+        """
+        if not self.frozen:
+            return build()
+        views = self.__dict__.get("_derived_views")
+        if views is None:
+            views = {}
+            object.__setattr__(self, "_derived_views", views)
+        try:
+            return views[key]
+        except KeyError:
+            value = views[key] = _freeze_value(build())
+            return value
+
+    def __deepcopy__(self, memo: Dict[int, Any]):
+        """Deep copies are always mutable, even of a frozen object."""
+        clone = object.__new__(type(self))
+        memo[id(self)] = clone
+        for name, value in self.__dict__.items():
+            if name in ("_frozen", "_derived_views"):
+                continue
+            object.__setattr__(clone, name, copy.deepcopy(value, memo))
+        return clone
+
+
 @dataclass
-class LoadedConfig:
+class LoadedConfig(_FreezableConfig):
     """
     Result of loading configuration.
 
@@ -136,6 +278,28 @@ class LoadedConfig:
         """Get disambiguation configuration (confidence thresholds, etc.)."""
         return self.constants.get("disambiguation", {})
 
+    @property
+    def intent_category_sets(self) -> Dict[str, FrozenSet[str]]:
+        """
+        Intent categories (intents.categories plus resolved
+        intents.composed_categories) as frozensets for membership checks.
+        """
+        def build() -> Dict[str, FrozenSet[str]]:
+            from src.yaml_config.constants import _resolve_composed_categories
+
+            base = {
+                name: list(intents) if isinstance(intents, list) else []
+                for name, intents in self.intents.get("categories", {}).items()
+            }
+            resolved = _resolve_composed_categories(base, self.intents.get("composed_categories", {}))
+            return {name: frozenset(intents) for name, intents in resolved.items()}
+
+        return self._derived("intent_category_sets", build)
+
+    def get_intent_category_set(self, category: str) -> FrozenSet[str]:
+        """Intents of a category as a frozenset (empty if the category is unknown)."""
+        return self.intent_category_sets.get(category, frozenset())
+
     @property
     def taxonomy_bypass_intents(self) -> List[str]:
         """Compute bypass intents from taxonomy (SSoT).
@@ -206,10 +370,16 @@ class LoadedConfig:
         state = self.states.get(state_name, {})
         return state.get("rules", {})
 
+    @property
+    def final_states(self) -> FrozenSet[str]:
+        """Names of states marked is_final."""
+        return self._derived("final_states", lambda: frozenset(
+            name for name, state in self.states.items() if state.get("is_final", False)
+        ))
+
     def is_final_state(self, state_name: str) -> bool:
         """Check if a state is final."""
-        state = self.states.get(state_name, {})
-        return state.get("is_final", False)
+        return state_name in self.final_states
 
     def get_state_on_enter(self, state_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -258,7 +428,7 @@ class LoadedConfig:
 
 
 @dataclass
-class FlowConfig:
+class FlowConfig(_FreezableConfig):
     """
     Configuration for a modular flow (SPIN, BANT, Support, etc.).
 
@@ -322,7 +492,8 @@ class FlowConfig:
         raise AttributeError(f"'{type(self).__name__}' has no attribute '{name}'")
 
     def _parse_dag_nodes(self):
-        """Extract DAG nodes from states configuration."""
+        """Extract DAG nodes from states configuration and compile the DAG graph."""
+        from src.dag.graph import CompiledDAG
         from src.dag.models import DAGNodeConfig, NodeType
 
         for state_id, state_config in self.states.items():
@@ -336,6 +507,11 @@ class FlowConfig:
                     # If parsing fails, skip this node
                     pass
 
+        # Flows without DAG nodes compile the graph only on demand (validation)
+        self._dag_graph = (
+            CompiledDAG.compile(self.states, self._dag_nodes) if self._dag_nodes else None
+        )
+
     # Computed properties
     @property
     def post_phases_state(self) -> Optional[str]:
@@ -347,9 +523,7 @@ class FlowConfig:
     @property
     def phase_order(self) -> List[str]:
         """Ordered list of phase names."""
-        if self.phases:
-            return self.phases.get("order", [])
-        return []
+        return self._derived("phase_order", lambda: self.phases.get("order", []) if self.phases else [])
 
     @property
     def phase_mapping(self) -> Dict[str, str]:
@@ -361,9 +535,9 @@ class FlowConfig:
     @property
     def progress_intents(self) -> Dict[str, str]:
         """Intents that indicate progress through phases."""
-        if self.phases:
-            return self.phases.get("progress_intents", {})
-        return {}
+        return self._derived(
+            "progress_intents", lambda: self.phases.get("progress_intents", {}) if self.phases else {}
+        )
 
     @property
     def skip_conditions(self) -> Dict[str, List[str]]:
@@ -400,7 +574,12 @@ class FlowConfig:
             # phases.mapping: {phase_a: my_state}
             # states.my_state.phase: "explicit_phase"
             flow.state_to_phase  # {"my_state": "explicit_phase"}
+
+        Computed once on a frozen (cached) flow and returned read-only.
         """
+        return self._derived("state_to_phase", self._build_state_to_phase)
+
+    def _build_state_to_phase(self) -> Dict[str, str]:
         # 1. Start with reverse mapping from phase_mapping
         result = {v: k for k, v in self.phase_mapping.items()}
 
@@ -412,6 +591,29 @@ class FlowConfig:
 
         return result
 
+    @property
+    def phase_to_state(self) -> Dict[str, str]:
+        """
+        Complete mapping from phase name to state name.
+
+        phases.mapping entries win; phases declared only through an explicit
+        state.phase / state.spin_phase map to the first such state.
+        """
+        def build() -> Dict[str, str]:
+            result = dict(self.phase_mapping)
+            for state_name, phase in self.state_to_phase.items():
+                result.setdefault(phase, state_name)
+            return result
+
+        return self._derived("phase_to_state", build)
+
+    @property
+    def final_states(self) -> FrozenSet[str]:
+        """Names of states marked is_final."""
+        return self._derived("final_states", lambda: frozenset(
+            name for name, state in self.states.items() if state.get("is_final", False)
+        ))
+
     def get_phase_for_state(self, state_name: str) -> Optional[str]:
         """
         Get phase name for a state.
@@ -573,6 +775,9 @@ class FlowConfig:
         Returns:
             Dict mapping state_name -> skip_target_state
         """
+        return self._derived("skip_map", self._build_skip_map)
+
+    def _build_skip_map(self) -> Dict[str, str]:
         result = {}
         for state_name, state_config in self.states.items():
             if state_name.startswith("_"):  # Skip abstract states
@@ -594,6 +799,9 @@ class FlowConfig:
         Returns:
             Dict mapping state_name -> goback_target_state
         """
+        return self._derived("goback_map", self._build_goback_map)
+
+    def _build_goback_map(self) -> Dict[str, str]:
         result = {}
         for state_name, state_config in self.states.items():
             if state_name.startswith("_"):
@@ -618,6 +826,34 @@ class FlowConfig:
         """Get all DAG nodes in this flow."""
         return self._dag_nodes
 
+    @property
+    def dag_graph(self) -> "CompiledDAG":
+        """Compiled DAG graph: integer node IDs, adjacency, normalized DAG nodes."""
+        if self._dag_graph is None:
+            from src.dag.graph import CompiledDAG
+            self._dag_graph = CompiledDAG.compile(self.states, self._dag_nodes)
+        return self._dag_graph
+
+    def validate_dag(
+        self, registry: Optional["ConditionRegistry"] = None
+    ) -> "DAGValidationReport":
+        """
+        Validate DAG nodes ahead of time.
+
+        Checks references to undefined states, DAG nodes unreachable from
+        the entry points, cycles made only of DAG nodes, FORK/JOIN mismatches
+        and (with a registry) unknown CHOICE/FORK conditions.
+
+        Args:
+            registry: ConditionRegistry to check conditions against (optional)
+
+        Returns:
+            DAGValidationReport
+        """
+        entry_states = set(self.entry_points.values())
+        entry_states.add(self.get_entry_point("default"))
+        return self.dag_graph.validate(entry_states=sorted(entry_states), registry=registry)
+
     def is_dag_state(self, state_id: str) -> bool:
         """
         Check if a state is a DAG node (choice, fork, join, parallel).
@@ -960,14 +1196,35 @@ class ConfigLoader:
         config_name: str = "default",
         flow_name: Optional[str] = None,
         validate: bool = True,
+        shared: bool = False,
     ) -> tuple[LoadedConfig, FlowConfig]:
         """
         Atomically load runtime config + flow with strict binding validation.
 
+        Args:
+            config_name: Named config (tenant) to load
+            flow_name: Flow to bind (defaults to settings.flow.active)
+            validate: Whether to validate configuration
+            shared: Return frozen objects from the process-wide bundle cache
+                instead of parsing YAML again. The cache is keyed by
+                (config_dir, config_name, flow_name, overrides hash, YAML
+                mtimes), so edited files and runtime overrides are picked up.
+
         Returns:
             tuple[LoadedConfig, FlowConfig]
         """
         resolved_flow = self._resolve_flow_name(flow_name)
+        if shared:
+            return _bundle_cache.get(self, config_name or "default", resolved_flow, validate)
+        return self._build_bundle(config_name, resolved_flow, validate)
+
+    def _build_bundle(
+        self,
+        config_name: str,
+        resolved_flow: str,
+        validate: bool,
+    ) -> tuple[LoadedConfig, FlowConfig]:
+        """Parse and validate a config/flow bundle from YAML."""
         config = self.load_named(
             config_name or "default",
             validate=validate,
@@ -1910,6 +2167,124 @@ def clear_all_config_overrides() -> int:
         return count
 
 
+# === Shared Bundle Cache ===
+
+class _ConfigBundleCache:
+    """
+    Process-wide cache of frozen (LoadedConfig, FlowConfig) bundles.
+
+    SalesBot builds one bundle per conversation; parsing YAML, resolving
+    mixins/templates and validating takes tens of milliseconds, while the
+    result is identical for every session with the same config and flow.
+    Cached bundles are frozen and returned by reference.
+
+    Staleness is detected by a fingerprint of (path, mtime_ns, size) of every
+    YAML file under config_dir. The fingerprint is re-read at most once per
+    ``check_interval`` seconds per directory so cache hits stay cheap.
+    """
+
+    def __init__(self, check_interval: float = 1.0):
+        self.check_interval = check_interval
+        self._bundles: Dict[tuple, tuple[LoadedConfig, FlowConfig]] = {}
+        self._fingerprints: Dict[str, tuple[float, tuple]] = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def _fingerprint(self, config_dir: Path) -> tuple:
+        import time
+
+        key = str(config_dir)
+        now = time.monotonic()
+        cached = self._fingerprints.get(key)
+        if cached is not None and now - cached[0] < self.check_interval:
+            return cached[1]
+        entries = []
+        for path in sorted(config_dir.rglob("*.y*ml")):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((str(path), stat.st_mtime_ns, stat.st_size))
+        fingerprint = tuple(entries)
+        self._fingerprints[key] = (now, fingerprint)
+        return fingerprint
+
+    @staticmethod
+    def _overrides_hash(config_name: str) -> str:
+        import hashlib
+        import json
+
+        with _overrides_lock:
+            overrides = _config_overrides.get(config_name)
+            if not overrides:
+                return ""
+            payload = json.dumps(overrides, sort_keys=True, default=str)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def get(
+        self,
+        loader: "ConfigLoader",
+        config_name: str,
+        flow_name: str,
+        validate: bool,
+    ) -> tuple[LoadedConfig, FlowConfig]:
+        config_dir = loader.config_dir.resolve()
+        with self._lock:
+            base_key = (str(config_dir), config_name, flow_name, validate)
+            key = base_key + (
+                self._overrides_hash(config_name),
+                self._fingerprint(config_dir),
+            )
+            bundle = self._bundles.get(key)
+            if bundle is not None:
+                self.hits += 1
+                return bundle
+
+            self.misses += 1
+            config, flow = loader._build_bundle(config_name, flow_name, validate)
+            bundle = (config.freeze(), flow.freeze())
+            # Keep only the latest version of each (dir, config, flow) bundle.
+            for stale in [k for k in self._bundles if k[:4] == base_key]:
+                del self._bundles[stale]
+            self._bundles[key] = bundle
+            logger.debug(
+                "Config bundle cached: config=%s flow=%s dir=%s",
+                config_name, flow_name, config_dir,
+            )
+            return bundle
+
+    def clear(self) -> int:
+        with self._lock:
+            count = len(self._bundles)
+            self._bundles.clear()
+            self._fingerprints.clear()
+            self.hits = 0
+            self.misses = 0
+            return count
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "bundles": len(self._bundles),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_bundle_cache = _ConfigBundleCache()
+
+
+def clear_config_bundle_cache() -> int:
+    """Drop all cached shared bundles and reset counters. Returns count of dropped bundles."""
+    return _bundle_cache.clear()
+
+
+def get_config_bundle_cache_stats() -> Dict[str, Any]:
+    """Get shared bundle cache counters (bundles, hits, misses)."""
+    return _bundle_cache.stats()
+
+
 def validate_config_conditions(
     config: LoadedConfig,
     registry: "ConditionRegistry",
@@ -2069,4 +2444,7 @@ __all__ = [
     "get_config_overrides",
     "clear_config_overrides",
     "clear_all_config_overrides",
+    "FrozenConfigError",
+    "clear_config_bundle_cache",
+    "get_config_bundle_cache_stats",
 ]
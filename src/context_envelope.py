@@ -34,7 +34,7 @@ from src.yaml_config.constants import (
     MAX_CONSECUTIVE_OBJECTIONS,
     MAX_TOTAL_OBJECTIONS,
     get_persona_objection_limits,
-    INTENT_CATEGORIES,
+    get_intent_category_set,
     get_persona_question_thresholds,
 )
 
@@ -842,7 +842,7 @@ class ContextEnvelopeBuilder:
         current_intent when it matched the tail, causing consecutive
         same-type questions to not increase density.
         """
-        all_q = set(INTENT_CATEGORIES.get("all_questions", []))
+        all_q = get_intent_category_set("all_questions")
         recent = list(intent_history[-(window - 1):]) if current_intent else list(intent_history[-window:])
         if current_intent:
             recent.append(current_intent)
@@ -44,6 +44,7 @@ from src.dag.models import (
     DAGExecutionContext,
     DAGNodeConfig,
 )
+from src.dag.graph import CompiledDAG, CompiledDAGNode, DAGValidationReport
 from src.dag.executor import DAGExecutor, DAGExecutionResult
 from src.dag.branch_router import BranchRouter, BranchRouteResult, IntentBranchMapping
 from src.dag.sync_points import SyncPointManager, SyncStrategy, SyncPoint, SyncResult
@@ -60,6 +61,10 @@ __all__ = [
     "DAGEvent",
     "DAGExecutionContext",
     "DAGNodeConfig",
+    # Compiled graph
+    "CompiledDAG",
+    "CompiledDAGNode",
+    "DAGValidationReport",
     # Executor
     "DAGExecutor",
     "DAGExecutionResult",
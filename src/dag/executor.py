@@ -6,12 +6,17 @@ DAG Executor - выполнение DAG узлов.
 - Управление FORK/JOIN (параллельные ветки)
 - Координацию PARALLEL regions
 - Event sourcing для отладки и replay
+
+Узлы берутся из скомпилированного графа flow (FlowConfig.dag_graph,
+src/dag/graph.py): поиск узла - индексация массива, варианты CHOICE,
+ветки FORK и счётчик JOIN нормализованы при загрузке.
 """
 
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, TYPE_CHECKING
 import logging
 
+from src.dag.graph import CompiledDAG, CompiledDAGNode
 from src.dag.models import (
     NodeType,
     BranchStatus,
@@ -19,7 +24,6 @@ from src.dag.models import (
     DAGBranch,
     DAGEvent,
     DAGExecutionContext,
-    DAGNodeConfig,
 )
 
 if TYPE_CHECKING:
@@ -101,6 +105,13 @@ class DAGExecutor:
         """
         self.flow = flow_config
         self._registry = condition_registry
+        self._graph: Optional[CompiledDAG] = None
+        self._handlers = {
+            NodeType.CHOICE: self._execute_choice,
+            NodeType.FORK: self._execute_fork,
+            NodeType.JOIN: self._execute_join,
+            NodeType.PARALLEL: self._execute_parallel,
+        }
 
     @property
     def registry(self) -> "ConditionRegistry":
@@ -129,29 +140,15 @@ class DAGExecutor:
         Returns:
             DAGExecutionResult with action and state info
         """
-        # Check if this is a DAG node
-        if not self.flow.is_dag_state(node_id):
-            return DAGExecutionResult(
-                is_dag=False,
-                primary_state=node_id,
-            )
-
-        node = self.flow.get_dag_node(node_id)
-        if not node:
+        node = self._get_node(node_id)
+        if node is None:
             return DAGExecutionResult(
                 is_dag=False,
                 primary_state=node_id,
             )
 
         # Dispatch by node type
-        handlers = {
-            NodeType.CHOICE: self._execute_choice,
-            NodeType.FORK: self._execute_fork,
-            NodeType.JOIN: self._execute_join,
-            NodeType.PARALLEL: self._execute_parallel,
-        }
-
-        handler = handlers.get(node.node_type)
+        handler = self._handlers.get(node.node_type)
         if handler:
             try:
                 return handler(node, intent, ctx, dag_ctx)
@@ -174,9 +171,41 @@ class DAGExecutor:
             primary_state=node_id,
         )
 
+    def _get_node(self, node_id: str) -> Optional[CompiledDAGNode]:
+        """
+        Find the compiled DAG node for a state.
+
+        Uses the flow's compiled graph when it has one; other IFlowConfig
+        implementations are asked via is_dag_state()/get_dag_node() and the
+        node is compiled on the fly.
+
+        Args:
+            node_id: State/node identifier
+
+        Returns:
+            CompiledDAGNode or None for simple/unknown states
+        """
+        graph = self._graph
+        if graph is None:
+            graph = getattr(self.flow, "dag_graph", None)
+            if isinstance(graph, CompiledDAG):
+                self._graph = graph
+            else:
+                graph = None
+        if graph is not None:
+            index = graph.index.get(node_id)
+            return graph.nodes[index] if index is not None else None
+
+        if not self.flow.is_dag_state(node_id):
+            return None
+        config = self.flow.get_dag_node(node_id)
+        if not config or not config.is_dag_node:
+            return None
+        return CompiledDAGNode.from_config(config)
+
     def _execute_choice(
         self,
-        node: DAGNodeConfig,
+        node: CompiledDAGNode,
         intent: str,
         ctx: "EvaluatorContext",
         dag_ctx: DAGExecutionContext,
@@ -198,14 +227,8 @@ class DAGExecutor:
         """
         logger.debug(f"Executing CHOICE node: {node.node_id}")
 
-        # Evaluate each choice in order
-        for choice in node.choices:
-            condition = choice.get("condition")
-            next_state = choice.get("next")
-
-            if not condition or not next_state:
-                continue
-
+        # Evaluate each choice in order (entries without condition/next dropped at compile)
+        for condition, next_state in node.choices:
             try:
                 if self.registry.evaluate(condition, ctx):
                     logger.debug(
@@ -272,7 +295,7 @@ class DAGExecutor:
 
     def _execute_fork(
         self,
-        node: DAGNodeConfig,
+        node: CompiledDAGNode,
         intent: str,
         ctx: "EvaluatorContext",
         dag_ctx: DAGExecutionContext,
@@ -297,16 +320,14 @@ class DAGExecutor:
         activated = []
         skipped = []
 
-        for branch_config in node.branches:
-            branch_id = branch_config.get("id")
-            start_at = branch_config.get("start_at")
-
-            if not branch_id or not start_at:
-                logger.warning(f"Invalid branch config in FORK {node.node_id}")
-                continue
+        if node.invalid_branches:
+            logger.warning(
+                f"Invalid branch config in FORK {node.node_id} "
+                f"({node.invalid_branches} branches without id/start_at)"
+            )
 
+        for branch_id, start_at, condition in node.branches:
             # Check branch condition (if any)
-            condition = branch_config.get("condition")
             if condition:
                 try:
                     if not self.registry.evaluate(condition, ctx):
@@ -386,7 +407,7 @@ class DAGExecutor:
 
     def _execute_join(
         self,
-        node: DAGNodeConfig,
+        node: CompiledDAGNode,
         intent: str,
         ctx: "EvaluatorContext",
         dag_ctx: DAGExecutionContext,
@@ -408,8 +429,10 @@ class DAGExecutor:
         """
         logger.debug(f"Executing JOIN node: {node.node_id}")
 
-        expected = set(node.expects_branches)
+        expected = node.expects_branches
         join_condition = node.join_condition
+        if join_condition is None:
+            raise ValueError(f"Invalid join_condition in JOIN node '{node.node_id}'")
 
         # Count completed branches
         completed = set()
@@ -418,10 +441,8 @@ class DAGExecutor:
             if branch and branch.status in (BranchStatus.COMPLETED, BranchStatus.SKIPPED):
                 completed.add(b_id)
 
-        # Check join condition
-        ready_to_join = self._check_join_condition(
-            join_condition, completed, expected
-        )
+        # Check join condition (precompiled into a counter, completed ⊆ expected)
+        ready_to_join = len(completed) >= node.join_required
 
         if not ready_to_join:
             logger.debug(
@@ -523,7 +544,7 @@ class DAGExecutor:
 
     def _execute_parallel(
         self,
-        node: DAGNodeConfig,
+        node: CompiledDAGNode,
         intent: str,
         ctx: "EvaluatorContext",
         dag_ctx: DAGExecutionContext,
@@ -549,8 +570,7 @@ class DAGExecutor:
         logger.debug(f"Executing PARALLEL node: {node.node_id}")
 
         # For now, treat as a fork with automatic regions
-        regions = node.regions
-        if not regions:
+        if not node.region_ids:
             logger.warning(f"PARALLEL {node.node_id}: no regions defined")
             return DAGExecutionResult(
                 is_dag=True,
@@ -560,25 +580,18 @@ class DAGExecutor:
 
         # Create branches for each region
         branches = {}
-        for region_id, region_config in regions.items():
-            initial_state = region_config.get("initial")
-            if initial_state:
-                branch = DAGBranch(
-                    branch_id=region_id,
-                    start_state=initial_state,
-                )
-                branch.activate()
-                branches[region_id] = branch
+        for region_id, initial_state in node.regions:
+            branch = DAGBranch(
+                branch_id=region_id,
+                start_state=initial_state,
+            )
+            branch.activate()
+            branches[region_id] = branch
 
         dag_ctx.start_fork(f"{node.node_id}_parallel", branches)
 
         # Primary state is from the main region (first one)
-        first_region = next(iter(regions.keys()), None)
-        primary_state = (
-            regions[first_region].get("initial", node.node_id)
-            if first_region
-            else node.node_id
-        )
+        primary_state = node.parallel_primary
 
         return DAGExecutionResult(
             is_dag=True,
@@ -588,7 +601,7 @@ class DAGExecutor:
             dag_event={
                 "type": "PARALLEL_STARTED",
                 "node": node.node_id,
-                "regions": list(regions.keys()),
+                "regions": list(node.region_ids),
             },
         )
 
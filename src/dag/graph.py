@@ -0,0 +1,461 @@
+"""
+Compiled DAG graph - неизменяемое представление DAG узлов flow.
+
+FlowConfig компилирует свои состояния один раз при загрузке:
+- каждому состоянию (и каждой ссылке на неописанное состояние)
+  присваивается целочисленный ID
+- рёбра хранятся массивами смежности (successors[node_id])
+- CHOICE/FORK/JOIN/PARALLEL узлы нормализуются в CompiledDAGNode:
+  некорректные варианты отброшены, условия слияния JOIN сведены
+  к счётчику join_required
+
+DAGExecutor берёт узел индексом (graph.nodes[graph.index[state]]) вместо
+разбора config-словарей на каждом ходу. validate() проверяет граф заранее:
+ссылки на неописанные состояния, недостижимые DAG узлы, циклы из DAG узлов,
+несогласованные FORK/JOIN и неизвестные условия.
+"""
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+import math
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+import logging
+
+from src.dag.models import DAGNodeConfig, JoinCondition, NodeType
+
+logger = logging.getLogger(__name__)
+
+
+def join_required_count(condition: JoinCondition, expected: int) -> int:
+    """
+    Количество завершённых веток, после которого JOIN срабатывает.
+
+    Эквивалентно DAGExecutor._check_join_condition() для completed ⊆ expected.
+
+    Args:
+        condition: Условие слияния
+        expected: Количество ожидаемых веток
+
+    Returns:
+        Порог завершённых веток
+    """
+    if condition == JoinCondition.ALL_COMPLETE:
+        return expected
+    if condition == JoinCondition.ANY_COMPLETE:
+        return 1
+    # MAJORITY и N_OF_M (без доп. конфигурации): простое большинство, 50%+
+    return math.ceil(expected / 2)
+
+
+@dataclass(frozen=True)
+class CompiledDAGNode:
+    """
+    DAG узел, нормализованный для выполнения.
+
+    Attributes:
+        node_id: ID узла (имя состояния)
+        node_type: Тип узла
+        choices: CHOICE - пары (condition, next) в порядке проверки
+        default_choice: CHOICE - путь по умолчанию
+        branches: FORK - тройки (branch_id, start_at, condition)
+        join_at: FORK - узел слияния
+        expects_branches: JOIN - ожидаемые ветки
+        join_condition: JOIN - условие слияния (None если значение некорректно)
+        join_required: JOIN - сколько веток должно завершиться
+        on_join_action: JOIN - действие при слиянии
+        regions: PARALLEL - пары (region_id, initial) с начальным состоянием
+        region_ids: PARALLEL - все регионы
+        parallel_primary: PARALLEL - основное состояние после старта
+        invalid_branches: FORK - количество отброшенных веток без id/start_at
+    """
+    node_id: str
+    node_type: NodeType
+    choices: Tuple[Tuple[str, str], ...] = ()
+    default_choice: Optional[str] = None
+    branches: Tuple[Tuple[str, str, Optional[str]], ...] = ()
+    join_at: Optional[str] = None
+    expects_branches: FrozenSet[str] = frozenset()
+    join_condition: Optional[JoinCondition] = JoinCondition.ALL_COMPLETE
+    join_required: int = 0
+    on_join_action: Optional[str] = None
+    regions: Tuple[Tuple[str, str], ...] = ()
+    region_ids: Tuple[str, ...] = ()
+    parallel_primary: Optional[str] = None
+    invalid_branches: int = 0
+
+    @property
+    def targets(self) -> Tuple[str, ...]:
+        """Состояния, в которые узел ведёт сам (без transitions)."""
+        targets = [next_state for _, next_state in self.choices]
+        if self.default_choice:
+            targets.append(self.default_choice)
+        targets.extend(start_at for _, start_at, _ in self.branches)
+        if self.join_at:
+            targets.append(self.join_at)
+        targets.extend(initial for _, initial in self.regions)
+        return tuple(targets)
+
+    @classmethod
+    def from_config(cls, node: DAGNodeConfig) -> "CompiledDAGNode":
+        """Скомпилировать узел из DAGNodeConfig."""
+        choices = tuple(
+            (choice.get("condition"), choice.get("next"))
+            for choice in node.choices
+            if choice.get("condition") and choice.get("next")
+        )
+
+        branches = []
+        invalid_branches = 0
+        for branch in node.branches:
+            branch_id = branch.get("id")
+            start_at = branch.get("start_at")
+            if not branch_id or not start_at:
+                invalid_branches += 1
+                continue
+            branches.append((branch_id, start_at, branch.get("condition")))
+
+        expects_branches = frozenset(node.expects_branches)
+        try:
+            join_condition = node.join_condition
+        except ValueError:
+            join_condition = None
+        join_required = (
+            join_required_count(join_condition, len(expects_branches))
+            if join_condition is not None else 0
+        )
+
+        region_config = node.regions
+        regions = tuple(
+            (region_id, config.get("initial"))
+            for region_id, config in region_config.items()
+            if config.get("initial")
+        )
+        first_region = next(iter(region_config), None)
+        parallel_primary = (
+            region_config[first_region].get("initial", node.node_id)
+            if first_region
+            else node.node_id
+        )
+
+        return cls(
+            node_id=node.node_id,
+            node_type=node.node_type,
+            choices=choices,
+            default_choice=node.default_choice,
+            branches=tuple(branches),
+            join_at=node.join_at,
+            expects_branches=expects_branches,
+            join_condition=join_condition,
+            join_required=join_required,
+            on_join_action=node.on_join_action,
+            regions=regions,
+            region_ids=tuple(region_config),
+            parallel_primary=parallel_primary,
+            invalid_branches=invalid_branches,
+        )
+
+
+@dataclass
+class DAGValidationReport:
+    """
+    Результат CompiledDAG.validate().
+
+    Attributes:
+        undefined_targets: (node, target) - DAG узел ссылается на неописанное состояние
+        unreachable: DAG узлы, недостижимые из точек входа
+        cycles: Циклы, целиком состоящие из DAG узлов
+        join_mismatches: Несогласованные FORK/JOIN пары
+        unknown_conditions: (node, condition) - условия, которых нет в реестре
+        invalid_branches: FORK узлы с ветками без id/start_at
+    """
+    undefined_targets: List[Tuple[str, str]] = field(default_factory=list)
+    unreachable: List[str] = field(default_factory=list)
+    cycles: List[List[str]] = field(default_factory=list)
+    join_mismatches: List[str] = field(default_factory=list)
+    unknown_conditions: List[Tuple[str, str]] = field(default_factory=list)
+    invalid_branches: List[str] = field(default_factory=list)
+
+    @property
+    def is_valid(self) -> bool:
+        """Нет ошибок (недостижимые узлы - только предупреждение)."""
+        return not (
+            self.undefined_targets
+            or self.cycles
+            or self.join_mismatches
+            or self.unknown_conditions
+            or self.invalid_branches
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Сериализация в словарь."""
+        return {
+            "is_valid": self.is_valid,
+            "undefined_targets": [list(item) for item in self.undefined_targets],
+            "unreachable": list(self.unreachable),
+            "cycles": [list(cycle) for cycle in self.cycles],
+            "join_mismatches": list(self.join_mismatches),
+            "unknown_conditions": [list(item) for item in self.unknown_conditions],
+            "invalid_branches": list(self.invalid_branches),
+        }
+
+
+def _transition_targets(rule: Any) -> List[str]:
+    """Целевые состояния значения transitions (строка, {when, then}, цепочка)."""
+    if isinstance(rule, str):
+        return [rule]
+    if isinstance(rule, Mapping):
+        then = rule.get("then")
+        return [then] if isinstance(then, str) else []
+    if isinstance(rule, (list, tuple)):
+        targets = []
+        for item in rule:
+            targets.extend(_transition_targets(item))
+        return targets
+    return []
+
+
+@dataclass(frozen=True)
+class CompiledDAG:
+    """
+    Неизменяемый граф состояний flow с целочисленными ID.
+
+    ID 0..defined-1 - состояния flow в порядке описания, дальше - состояния,
+    на которые есть ссылки, но которых нет в flow.
+
+    Attributes:
+        names: ID -> имя состояния
+        index: имя состояния -> ID (read-only)
+        nodes: ID -> CompiledDAGNode (None для simple состояний)
+        successors: ID -> ID состояний, в которые ведут рёбра
+        defined: Количество состояний, описанных в flow
+    """
+    names: Tuple[str, ...]
+    index: Mapping[str, int]
+    nodes: Tuple[Optional[CompiledDAGNode], ...]
+    successors: Tuple[Tuple[int, ...], ...]
+    defined: int
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "CompiledDAG":
+        # Неизменяемый граф разделяется между копиями FlowConfig
+        return self
+
+    def __reduce__(self):
+        return (
+            type(self),
+            (self.names, dict(self.index), self.nodes, self.successors, self.defined),
+        )
+
+    def __post_init__(self):
+        if not isinstance(self.index, MappingProxyType):
+            object.__setattr__(self, "index", MappingProxyType(dict(self.index)))
+
+    @classmethod
+    def compile(
+        cls,
+        states: Mapping[str, Mapping[str, Any]],
+        dag_nodes: Optional[Mapping[str, DAGNodeConfig]] = None,
+    ) -> "CompiledDAG":
+        """
+        Скомпилировать граф.
+
+        Args:
+            states: Состояния flow
+            dag_nodes: Уже разобранные DAG узлы (по умолчанию разбираются из states)
+
+        Returns:
+            CompiledDAG
+        """
+        if dag_nodes is None:
+            dag_nodes = {
+                state_id: DAGNodeConfig.from_state_config(state_id, config)
+                for state_id, config in states.items()
+                if config.get("type", "simple") != "simple"
+            }
+
+        names: List[str] = list(states)
+        index: Dict[str, int] = {name: i for i, name in enumerate(names)}
+
+        def node_id(name: str) -> int:
+            if name not in index:
+                index[name] = len(names)
+                names.append(name)
+            return index[name]
+
+        compiled: Dict[int, CompiledDAGNode] = {}
+        edges: List[Tuple[int, ...]] = []
+        for name in list(names[:len(states)]):
+            config = states[name]
+            targets: List[str] = []
+            node_config = dag_nodes.get(name)
+            if node_config is not None and node_config.is_dag_node:
+                node = CompiledDAGNode.from_config(node_config)
+                compiled[index[name]] = node
+                targets.extend(node.targets)
+            transitions = config.get("transitions") or {}
+            if isinstance(transitions, Mapping):
+                for rule in transitions.values():
+                    targets.extend(_transition_targets(rule))
+            edges.append(tuple(dict.fromkeys(node_id(target) for target in targets)))
+
+        edges.extend(() for _ in range(len(names) - len(edges)))
+        return cls(
+            names=tuple(names),
+            index=MappingProxyType(index),
+            nodes=tuple(compiled.get(i) for i in range(len(names))),
+            successors=tuple(edges),
+            defined=len(states),
+        )
+
+    def node(self, state_id: str) -> Optional[CompiledDAGNode]:
+        """DAG узел состояния (None для simple и неизвестных состояний)."""
+        node_id = self.index.get(state_id)
+        return self.nodes[node_id] if node_id is not None else None
+
+    @property
+    def dag_node_ids(self) -> Tuple[int, ...]:
+        """ID всех DAG узлов."""
+        return tuple(i for i, node in enumerate(self.nodes) if node is not None)
+
+    def reachable_from(self, entry_states: Iterable[str]) -> FrozenSet[str]:
+        """
+        Состояния, достижимые из точек входа по transitions и DAG рёбрам.
+
+        Args:
+            entry_states: Начальные состояния
+
+        Returns:
+            Имена достижимых состояний (включая точки входа)
+        """
+        seen = [False] * len(self.names)
+        stack = [self.index[state] for state in entry_states if state in self.index]
+        for node_id in stack:
+            seen[node_id] = True
+        while stack:
+            for successor in self.successors[stack.pop()]:
+                if not seen[successor]:
+                    seen[successor] = True
+                    stack.append(successor)
+        return frozenset(name for name, hit in zip(self.names, seen) if hit)
+
+    def find_cycles(self) -> List[List[str]]:
+        """
+        Циклы из DAG узлов (сильно связные компоненты подграфа DAG узлов).
+
+        Обычные состояния могут образовывать циклы (возвраты в диалоге), но
+        цикл, в котором каждое состояние - CHOICE/FORK/JOIN/PARALLEL, никогда
+        не выходит к состоянию, где бот отвечает клиенту.
+
+        Returns:
+            Список циклов (имена состояний)
+        """
+        nodes = self.nodes
+        order: Dict[int, int] = {}
+        low: Dict[int, int] = {}
+        on_stack = set()
+        stack: List[int] = []
+        cycles: List[List[str]] = []
+
+        for root in self.dag_node_ids:
+            if root in order:
+                continue
+            # Итеративный алгоритм Тарьяна: (узел, итератор по соседям)
+            work = [(root, iter(self.successors[root]))]
+            order[root] = low[root] = len(order)
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                current, successors = work[-1]
+                advanced = False
+                for successor in successors:
+                    if nodes[successor] is None:
+                        continue
+                    if successor not in order:
+                        order[successor] = low[successor] = len(order)
+                        stack.append(successor)
+                        on_stack.add(successor)
+                        work.append((successor, iter(self.successors[successor])))
+                        advanced = True
+                        break
+                    if successor in on_stack:
+                        low[current] = min(low[current], order[successor])
+                if advanced:
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[current])
+                if low[current] == order[current]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == current:
+                            break
+                    if len(component) > 1 or current in self.successors[current]:
+                        cycles.append([self.names[i] for i in reversed(component)])
+        return cycles
+
+    def validate(
+        self,
+        entry_states: Iterable[str] = (),
+        registry: Optional[Any] = None,
+    ) -> DAGValidationReport:
+        """
+        Проверить DAG заранее (при загрузке или в CI).
+
+        Args:
+            entry_states: Точки входа для проверки достижимости
+                (пусто - достижимость не проверяется)
+            registry: ConditionRegistry для проверки условий CHOICE/FORK
+                (None - условия не проверяются)
+
+        Returns:
+            DAGValidationReport
+        """
+        report = DAGValidationReport()
+        dag_ids = self.dag_node_ids
+
+        for node_id in dag_ids:
+            node = self.nodes[node_id]
+            for target in node.targets:
+                if self.index[target] >= self.defined:
+                    report.undefined_targets.append((node.node_id, target))
+            if node.invalid_branches:
+                report.invalid_branches.append(node.node_id)
+
+            if node.node_type == NodeType.FORK and node.join_at:
+                join = self.node(node.join_at)
+                branch_ids = {branch_id for branch_id, _, _ in node.branches}
+                if join is None or join.node_type != NodeType.JOIN:
+                    report.join_mismatches.append(
+                        f"FORK '{node.node_id}' joins at '{node.join_at}', which is not a JOIN node"
+                    )
+                elif not join.expects_branches <= branch_ids:
+                    missing = sorted(join.expects_branches - branch_ids)
+                    report.join_mismatches.append(
+                        f"JOIN '{node.join_at}' expects branches {missing} "
+                        f"not started by FORK '{node.node_id}'"
+                    )
+            if node.node_type == NodeType.JOIN and node.join_condition is None:
+                report.join_mismatches.append(
+                    f"JOIN '{node.node_id}' has an invalid join_condition"
+                )
+
+            if registry is not None:
+                conditions = [condition for condition, _ in node.choices]
+                conditions.extend(condition for _, _, condition in node.branches if condition)
+                for condition in conditions:
+                    if not registry.has(condition):
+                        report.unknown_conditions.append((node.node_id, condition))
+
+        entry_states = list(entry_states)
+        if entry_states:
+            reachable = self.reachable_from(entry_states)
+            report.unreachable = [
+                self.names[node_id] for node_id in dag_ids
+                if self.names[node_id] not in reachable
+            ]
+
+        report.cycles = self.find_cycles()
+        return report
@@ -24,6 +24,8 @@ Decision Trace — полное логирование всех этапов п
 - DecisionStatistics: агрегированная статистика
 """
 
+import hashlib
+import json
 import time
 import uuid
 from dataclasses import dataclass, field
@@ -533,6 +535,21 @@ class ResponseTrace:
 # LLM Trace (НОВОЕ)
 # =============================================================================
 
+def llm_request_key(prompt: str, schema: Optional[Dict[str, Any]] = None) -> str:
+    """
+    SHA-256 полного промпта и JSON schema LLM запроса.
+
+    to_dict() обрезает prompt_user до 200 символов, поэтому replay
+    (scripts/llm_replay_server.py) ищет трейсы по этому ключу, а не по префиксу.
+    """
+    material = prompt
+    if schema is not None:
+        material += "\x00" + json.dumps(
+            schema, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+        )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
 @dataclass
 class LLMTrace:
     """
@@ -544,6 +561,7 @@ class LLMTrace:
     purpose: str = ""  # classification, response_generation, etc.
     prompt_system: Optional[str] = None
     prompt_user: str = ""
+    prompt_hash: str = ""  # llm_request_key(): полный промпт + schema
     raw_response: str = ""
     last_cleaned_structured_response: str = ""
     tokens_input: int = 0
@@ -552,6 +570,8 @@ class LLMTrace:
     model_used: str = ""
     num_ctx_requested: int = 0
     circuit_breaker_state: str = "closed"
+    priority: str = ""  # interactive / turn_critical / background (src/llm_scheduler.py)
+    queue_wait_ms: float = 0.0  # время ожидания слота в LLM scheduler
     retry_count: int = 0
     success: bool = True
     error: Optional[str] = None
@@ -562,6 +582,7 @@ class LLMTrace:
             "purpose": self.purpose,
             "prompt_system": self.prompt_system[:200] if self.prompt_system else None,
             "prompt_user": self.prompt_user[:200] if self.prompt_user else "",
+            "prompt_hash": self.prompt_hash,
             "raw_response": self.raw_response[:500] if self.raw_response else "",
             "last_cleaned_structured_response": (
                 self.last_cleaned_structured_response[:500]
@@ -573,6 +594,8 @@ class LLMTrace:
             "model_used": self.model_used,
             "num_ctx_requested": self.num_ctx_requested,
             "circuit_breaker_state": self.circuit_breaker_state,
+            "priority": self.priority,
+            "queue_wait_ms": round(self.queue_wait_ms, 2),
             "retry_count": self.retry_count,
             "success": self.success,
             "error": self.error,
@@ -589,6 +612,7 @@ class LLMTrace:
                 if self.last_cleaned_structured_response else ""
             ),
             "latency_ms": round(self.latency_ms, 2),
+            "queue_wait_ms": round(self.queue_wait_ms, 2),
             "num_ctx_requested": self.num_ctx_requested,
             "success": self.success,
         }
@@ -1522,6 +1546,7 @@ def aggregate_decision_statistics(
     total_tokens_in = 0
     total_tokens_out = 0
     all_latencies = []
+    all_queue_waits = []
     retries = 0
 
     for traces in traces_by_simulation.values():
@@ -1531,6 +1556,7 @@ def aggregate_decision_statistics(
                 total_tokens_in += llm_trace.tokens_input
                 total_tokens_out += llm_trace.tokens_output
                 all_latencies.append(llm_trace.latency_ms)
+                all_queue_waits.append(llm_trace.queue_wait_ms)
                 retries += llm_trace.retry_count
 
     if all_latencies:
@@ -1543,6 +1569,8 @@ def aggregate_decision_statistics(
             "avg_latency_ms": sum(all_latencies) / len(all_latencies),
             "p95_latency_ms": sorted_latencies[p95_idx] if p95_idx < len(sorted_latencies) else 0,
             "max_latency_ms": max(all_latencies),
+            "avg_queue_wait_ms": sum(all_queue_waits) / len(all_queue_waits),
+            "max_queue_wait_ms": max(all_queue_waits),
             "total_retries": retries,
         }
 
@@ -29,7 +29,7 @@ DialoguePolicy добавляет гибкость в поведение бот
 """
 
 from dataclasses import dataclass, field
-from typing import Callable, Dict, List, Optional, Any, Set
+from typing import Callable, Dict, FrozenSet, List, Optional, Any, Set
 from enum import Enum
 
 from src.context_envelope import ContextEnvelope, ReasonCode
@@ -45,8 +45,8 @@ from src.yaml_config.constants import (
     PRICING_CORRECT_ACTIONS,
     REPAIR_ACTION_REPEAT_THRESHOLD,
     REPEATABLE_INTENT_GROUPS as _REPEATABLE_INTENT_GROUPS,
-    INTENT_CATEGORIES as _INTENT_CATEGORIES,
     get_escalated_action as _get_escalated_action,
+    get_intent_category_set as _get_intent_category_set,
     should_notify_operator as _should_notify_operator,
     notify_operator_stub as _notify_operator_stub,
 )
@@ -162,23 +162,33 @@ class DialoguePolicy:
 
     @staticmethod
     def _load_addressing_templates() -> Set[str]:
-        """Auto-derive repair-protected actions from templates tagged addresses_question: true."""
+        """Auto-derive repair-protected actions from templates tagged addresses_question: true.
+
+        Parsed once per process (shared between sessions).
+        """
+        from src.component_registry import shared_component
+        return shared_component(
+            "addressing_templates", DialoguePolicy._read_addressing_templates
+        )
+
+    @staticmethod
+    def _read_addressing_templates() -> FrozenSet[str]:
         from pathlib import Path
         try:
             import yaml
         except ImportError:
-            return set()
+            return frozenset()
         base = Path(__file__).parent / "yaml_config" / "templates" / "_base" / "prompts.yaml"
         try:
             with open(base) as f:
                 data = yaml.safe_load(f) or {}
             templates = data.get("templates", {})
-            return {
+            return frozenset(
                 name for name, config in templates.items()
                 if isinstance(config, dict) and config.get("addresses_question", False)
-            }
+            )
         except Exception:
-            return set()
+            return frozenset()
 
     def __init__(self, shadow_mode: bool = False, trace_enabled: bool = False, flow=None):
         """
@@ -693,7 +703,7 @@ class DialoguePolicy:
             None
         )
         if category is None:
-            _price = set(_INTENT_CATEGORIES.get("price_related", []))
+            _price = _get_intent_category_set("price_related")
             if intent_for_lookup in _price:
                 # Легитимный ценовой интент (pricing_details, discount_request и т.д.)
                 category = "price_core"
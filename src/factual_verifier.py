@@ -18,6 +18,7 @@ from pydantic import AliasChoices, BaseModel, Field
 from src.feature_flags import flags
 from src.logger import logger
 from src.settings import settings
+from src.turn_deadline import stage_allowed
 from src.unknown_kb_fallbacks import (
     LEGACY_KB_FALLBACK_RE,
     pick_unknown_kb_fallback,
@@ -132,6 +133,14 @@ class FactualVerifier:
                 verifier_verdict="not_run",
                 reason_codes=["disabled"],
             )
+        if not stage_allowed("factual_verifier"):
+            return VerificationResult(
+                final_response=original,
+                changed=False,
+                verifier_used=False,
+                verifier_verdict="not_run",
+                reason_codes=["turn_budget_exhausted"],
+            )
         if not facts_text:
             return VerificationResult(
                 final_response=original,
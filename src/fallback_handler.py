@@ -34,6 +34,7 @@ import yaml
 if TYPE_CHECKING:
     from src.config_loader import FlowConfig, LoadedConfig
 
+from src.component_registry import shared_component
 from src.logger import logger
 from src.conditions.fallback import (
     FallbackContext,
@@ -49,6 +50,18 @@ from src.yaml_config.constants import (
 )
 
 
+def _read_fallback_options(path: str) -> Dict[str, Any]:
+    """Parse fallback_options.yaml (shared between sessions, treat as read-only)."""
+    try:
+        yaml_path = Path(path)
+        if yaml_path.exists():
+            with open(yaml_path, "r", encoding="utf-8") as f:
+                return yaml.safe_load(f) or {}
+    except Exception as e:
+        logger.warning("Failed to load fallback_options.yaml", error=str(e))
+    return {}
+
+
 @dataclass
 class FallbackResponse:
     """Структура ответа fallback"""
@@ -202,17 +215,13 @@ class FallbackHandler:
         """
         Build DYNAMIC_CTA_OPTIONS from YAML config + KB product overviews.
 
-        Questions and generic CTA actions come from fallback_options.yaml.
-        Product feature options (3 per pain) are random.sample from KB overviews.
+        Questions and generic CTA actions come from fallback_options.yaml
+        (parsed once per process). Product feature options (3 per pain) are
+        random.sample from KB overviews, per session.
         """
-        # Load YAML config
-        yaml_config: Dict[str, Any] = {}
-        try:
-            if self._FALLBACK_OPTIONS_YAML.exists():
-                with open(self._FALLBACK_OPTIONS_YAML, "r", encoding="utf-8") as f:
-                    yaml_config = yaml.safe_load(f) or {}
-        except Exception as e:
-            logger.warning("Failed to load fallback_options.yaml", error=str(e))
+        yaml_config = shared_component(
+            "fallback_options_yaml", _read_fallback_options, str(self._FALLBACK_OPTIONS_YAML)
+        )
 
         result: Dict[str, Dict[str, Any]] = {}
         for pain_key, pain_cfg in yaml_config.items():
@@ -190,6 +190,10 @@ class FeatureFlags:
         # === ConversationGuard in Pipeline ===
         "conversation_guard_in_pipeline": True,    # Guard runs inside Blackboard pipeline by default
 
+        # === Parallel Knowledge Sources ===
+        "parallel_knowledge_sources": True,        # Независимые sources выполняются параллельно
+        "source_dispatch_index": True,             # Sources вызываются только для своих интентов (get_triggers)
+
         # === Simulation Diagnostic Mode ===
         "simulation_diagnostic_mode": False,       # Higher sim limits for bug detection
 
@@ -761,6 +765,20 @@ class FeatureFlags:
         """Включён ли ConversationGuard внутри Blackboard pipeline"""
         return self.is_enabled("conversation_guard_in_pipeline")
 
+    # =========================================================================
+    # Parallel Knowledge Sources flags
+    # =========================================================================
+
+    @property
+    def parallel_knowledge_sources(self) -> bool:
+        """Выполняются ли независимые Knowledge Sources параллельно (иначе по очереди)"""
+        return self.is_enabled("parallel_knowledge_sources")
+
+    @property
+    def source_dispatch_index(self) -> bool:
+        """Пропускаются ли sources, чей trigger spec не совпадает с ходом"""
+        return self.is_enabled("source_dispatch_index")
+
     # =========================================================================
     # Simulation Diagnostic Mode flags
     # =========================================================================
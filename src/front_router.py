@@ -0,0 +1,422 @@
+"""
+Front router for session-affine multi-worker deployments.
+
+Live sessions sit in the memory of the `src.api` process that served them, so
+scaling past one interpreter needs every turn of a conversation to reach the
+same worker. This module provides:
+
+- `HashRing`: consistent hashing of `(user_id, session_id)` onto N workers.
+  Adding or removing a worker only remaps ~1/N of the sessions.
+- `FrontRouter` + `create_router_app()`: a small ASGI app that extracts the
+  routing key from the request body (default and Sula payloads), forwards the
+  request to its worker and streams the reply back.
+- `WorkerSupervisor`: spawns `uvicorn src.api:app` workers on local ports and
+  restarts them when they exit.
+
+Failover: when a worker does not accept the connection, the router marks it
+down for `down_cooldown_seconds` and sends the turn to the next worker on the
+ring. The session is cold-restored there from the shared snapshot store, and
+`SessionLockManager`'s file locks keep two workers from running turns of the
+same session at once. The router remembers which worker last served each
+session (bounded LRU), so a session does not bounce back to its old worker
+when that one recovers; only new sessions follow the ring again.
+
+Requests are retried on another worker only when the connection could not be
+established - a turn that reached a worker is never replayed.
+
+Run:
+    python -m src.front_router --workers 4 --port 8000
+
+All workers share DB_PATH, SNAPSHOT_BUFFER_PATH and SESSION_LOCK_DIR, so they
+must run on one host (or on a shared volume with working fcntl locks).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import bisect
+import hashlib
+import itertools
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional, Sequence
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+from src.logger import logger
+
+
+ROUTER_WORKER_URLS = os.environ.get("ROUTER_WORKER_URLS", "")
+ROUTER_VNODES = int(os.environ.get("ROUTER_VNODES", "128"))
+ROUTER_DOWN_COOLDOWN_SECONDS = float(os.environ.get("ROUTER_DOWN_COOLDOWN_SECONDS", "5"))
+ROUTER_STICKY_SESSIONS = int(os.environ.get("ROUTER_STICKY_SESSIONS", "100000"))
+ROUTER_UPSTREAM_TIMEOUT_SECONDS = float(os.environ.get("ROUTER_UPSTREAM_TIMEOUT_SECONDS", "600"))
+
+ROUTED_PATHS = frozenset({"/api/v1/process", "/api/v1/process/sula"})
+HOP_BY_HOP_HEADERS = frozenset({
+    "connection",
+    "keep-alive",
+    "proxy-authenticate",
+    "proxy-authorization",
+    "te",
+    "trailers",
+    "transfer-encoding",
+    "upgrade",
+    "host",
+    "content-length",
+})
+
+
+def _error_payload(code: str, message: str) -> dict:
+    return {"error": {"code": code, "message": message}}
+
+
+# ── Consistent hashing ────────────────────────────────
+
+class HashRing:
+    """Consistent hash ring with virtual nodes."""
+
+    def __init__(self, nodes: Sequence[str], vnodes: int = ROUTER_VNODES):
+        if not nodes:
+            raise ValueError("HashRing needs at least one node")
+        self.nodes = list(dict.fromkeys(nodes))
+        self.vnodes = vnodes
+        ring = sorted(
+            (self._hash(f"{node}#{index}"), node)
+            for node in self.nodes
+            for index in range(vnodes)
+        )
+        self._hashes = [point for point, _ in ring]
+        self._owners = [node for _, node in ring]
+
+    @staticmethod
+    def _hash(value: str) -> int:
+        return int.from_bytes(hashlib.md5(value.encode("utf-8")).digest()[:8], "big")
+
+    def node_for(self, key: str) -> str:
+        return self.nodes_for(key, limit=1)[0]
+
+    def nodes_for(self, key: str, limit: Optional[int] = None) -> List[str]:
+        """Distinct nodes in ring order starting at `key` (primary first)."""
+        limit = len(self.nodes) if limit is None else min(limit, len(self.nodes))
+        start = bisect.bisect(self._hashes, self._hash(key)) % len(self._hashes)
+        result: List[str] = []
+        for offset in range(len(self._owners)):
+            node = self._owners[(start + offset) % len(self._owners)]
+            if node not in result:
+                result.append(node)
+                if len(result) == limit:
+                    break
+        return result
+
+
+def routing_key(path: str, body: bytes) -> Optional[str]:
+    """
+    `user_id::session_id` for /api/v1/process requests, None for everything else.
+
+    Mirrors the payload shapes accepted by src.api: the default JSON object,
+    a Sula object and a Sula list (the last item is processed).
+    """
+    if path.rstrip("/") not in ROUTED_PATHS or not body:
+        return None
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return None
+    if isinstance(payload, list):
+        payload = payload[-1] if payload else None
+    if not isinstance(payload, dict):
+        return None
+    if "session_id" in payload and "user_id" in payload:
+        return f"{payload.get('user_id')}::{payload.get('session_id')}"
+    phone = payload.get("cleint_phone", payload.get("client_phone"))
+    if phone is not None and "session" in payload:
+        return f"{phone}::{payload.get('session') or ''}"
+    return None
+
+
+# ── Router ────────────────────────────────────────────
+
+class FrontRouter:
+    """Forwards requests to session-affine workers with connect-failure failover."""
+
+    def __init__(
+        self,
+        workers: Sequence[str],
+        *,
+        client: Optional[httpx.AsyncClient] = None,
+        vnodes: int = ROUTER_VNODES,
+        down_cooldown_seconds: float = ROUTER_DOWN_COOLDOWN_SECONDS,
+        sticky_sessions: int = ROUTER_STICKY_SESSIONS,
+        upstream_timeout_seconds: float = ROUTER_UPSTREAM_TIMEOUT_SECONDS,
+    ):
+        self.workers = [worker.rstrip("/") for worker in workers]
+        self.ring = HashRing(self.workers, vnodes=vnodes)
+        self.client = client or httpx.AsyncClient(
+            timeout=httpx.Timeout(upstream_timeout_seconds, connect=5.0),
+            limits=httpx.Limits(max_connections=None, max_keepalive_connections=256),
+        )
+        self.down_cooldown_seconds = down_cooldown_seconds
+        self.sticky_sessions = sticky_sessions
+        self._down_until: Dict[str, float] = {}
+        self._sticky: "OrderedDict[str, str]" = OrderedDict()
+        self._round_robin = itertools.cycle(self.workers)
+        self._lock = threading.Lock()
+        self.stats: Dict[str, Any] = {
+            "requests": 0,
+            "failovers": 0,
+            "unavailable": 0,
+            "per_worker": {worker: 0 for worker in self.workers},
+        }
+
+    def is_up(self, worker: str) -> bool:
+        return self._down_until.get(worker, 0.0) <= time.monotonic()
+
+    def mark_down(self, worker: str) -> None:
+        self._down_until[worker] = time.monotonic() + self.down_cooldown_seconds
+        logger.warning("Router worker marked down", worker=worker)
+
+    def candidates(self, key: Optional[str]) -> List[str]:
+        """Workers to try, in order: sticky owner, ring order, then workers in cooldown."""
+        if key is None:
+            first = next(self._round_robin)
+            ordered = [first] + [w for w in self.workers if w != first]
+        else:
+            ordered = self.ring.nodes_for(key)
+            with self._lock:
+                owner = self._sticky.get(key)
+            if owner in ordered:
+                ordered.remove(owner)
+                ordered.insert(0, owner)
+        up = [worker for worker in ordered if self.is_up(worker)]
+        return up + [worker for worker in ordered if worker not in up]
+
+    def _remember(self, key: Optional[str], worker: str) -> None:
+        if key is None:
+            return
+        with self._lock:
+            self._sticky[key] = worker
+            self._sticky.move_to_end(key)
+            while len(self._sticky) > self.sticky_sessions:
+                self._sticky.popitem(last=False)
+
+    async def forward(self, request: Request) -> Response:
+        body = await request.body()
+        path = request.url.path
+        key = routing_key(path, body)
+        headers = {
+            name: value
+            for name, value in request.headers.items()
+            if name.lower() not in HOP_BY_HOP_HEADERS
+        }
+        self.stats["requests"] += 1
+
+        for attempt, worker in enumerate(self.candidates(key)):
+            try:
+                upstream = await self.client.request(
+                    request.method,
+                    f"{worker}{path}",
+                    params=request.query_params,
+                    content=body,
+                    headers=headers,
+                )
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                self.mark_down(worker)
+                continue
+            if attempt:
+                self.stats["failovers"] += 1
+                logger.info("Router failover", worker=worker, attempt=attempt)
+            self.stats["per_worker"][worker] += 1
+            self._remember(key, worker)
+            return Response(
+                content=upstream.content,
+                status_code=upstream.status_code,
+                headers={
+                    name: value
+                    for name, value in upstream.headers.items()
+                    if name.lower() not in HOP_BY_HOP_HEADERS
+                    and name.lower() != "content-encoding"
+                },
+            )
+
+        self.stats["unavailable"] += 1
+        return JSONResponse(
+            status_code=503,
+            content=_error_payload("SERVICE_UNAVAILABLE", "No bot worker is reachable"),
+            headers={"Retry-After": str(max(1, int(self.down_cooldown_seconds)))},
+        )
+
+    async def fan_out(self, path: str, headers: Dict[str, str]) -> Dict[str, Any]:
+        """GET `path` from every worker (for /ready and metrics aggregation)."""
+
+        async def _get(worker: str) -> Any:
+            try:
+                response = await self.client.get(f"{worker}{path}", headers=headers, timeout=5.0)
+                return {"status_code": response.status_code, "body": response.json()}
+            except (httpx.HTTPError, ValueError) as err:
+                return {"status_code": None, "error": str(err)}
+
+        results = await asyncio.gather(*(_get(worker) for worker in self.workers))
+        return dict(zip(self.workers, results))
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            sticky = len(self._sticky)
+        return {
+            **self.stats,
+            "per_worker": dict(self.stats["per_worker"]),
+            "workers_up": [worker for worker in self.workers if self.is_up(worker)],
+            "sticky_sessions": sticky,
+        }
+
+
+def create_router_app(router: FrontRouter) -> FastAPI:
+    """ASGI app: router health/metrics endpoints plus a catch-all forwarder."""
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI):
+        yield
+        await router.client.aclose()
+
+    app = FastAPI(title="CRM Sales Bot Router", lifespan=lifespan)
+    app.state.router = router
+
+    @app.get("/health")
+    async def health():
+        up = [worker for worker in router.workers if router.is_up(worker)]
+        return {"status": "ok" if up else "degraded", "workers": len(router.workers), "workers_up": len(up)}
+
+    @app.get("/ready")
+    async def ready():
+        workers = await router.fan_out("/ready", {})
+        is_ready = any(result.get("status_code") == 200 for result in workers.values())
+        return JSONResponse(
+            status_code=200 if is_ready else 503,
+            content={"status": "ready" if is_ready else "not_ready", "workers": workers},
+        )
+
+    @app.get("/api/v1/metrics")
+    async def metrics(request: Request):
+        auth = request.headers.get("authorization")
+        workers = await router.fan_out("/api/v1/metrics", {"authorization": auth} if auth else {})
+        if workers and all(result.get("status_code") == 401 for result in workers.values()):
+            return JSONResponse(status_code=401, content=next(iter(workers.values()))["body"])
+        return {"router": router.get_stats(), "workers": workers}
+
+    @app.api_route("/{path:path}", methods=["GET", "POST", "PUT", "PATCH", "DELETE"])
+    async def proxy(request: Request):
+        return await router.forward(request)
+
+    return app
+
+
+# ── Worker processes ──────────────────────────────────
+
+class WorkerSupervisor:
+    """Runs N uvicorn workers on consecutive local ports and restarts dead ones."""
+
+    def __init__(
+        self,
+        count: int,
+        *,
+        app: str = "src.api:app",
+        host: str = "127.0.0.1",
+        base_port: int = 8100,
+        restart_backoff_seconds: float = 2.0,
+        extra_args: Sequence[str] = (),
+    ):
+        self.app = app
+        self.host = host
+        self.ports = [base_port + index for index in range(count)]
+        self.restart_backoff_seconds = restart_backoff_seconds
+        self.extra_args = list(extra_args)
+        self.restarts = 0
+        self._processes: Dict[int, subprocess.Popen] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def urls(self) -> List[str]:
+        return [f"http://{self.host}:{port}" for port in self.ports]
+
+    def _spawn(self, port: int) -> subprocess.Popen:
+        command = [
+            sys.executable, "-m", "uvicorn", self.app,
+            "--host", self.host, "--port", str(port),
+            *self.extra_args,
+        ]
+        env = {**os.environ, "ROUTER_WORKER_PORT": str(port)}
+        logger.info("Starting bot worker", port=port, app=self.app)
+        return subprocess.Popen(command, env=env)
+
+    def start(self) -> None:
+        for port in self.ports:
+            self._processes[port] = self._spawn(port)
+        self._thread = threading.Thread(target=self._watch, name="router-worker-supervisor", daemon=True)
+        self._thread.start()
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.restart_backoff_seconds):
+            for port, process in list(self._processes.items()):
+                if process.poll() is None or self._stop.is_set():
+                    continue
+                logger.warning("Bot worker exited, restarting", port=port, returncode=process.returncode)
+                self.restarts += 1
+                self._processes[port] = self._spawn(port)
+
+    def stop(self, timeout: float = 30.0) -> None:
+        """SIGTERM all workers so they serialize live sessions, then wait."""
+        self._stop.set()
+        for process in self._processes.values():
+            if process.poll() is None:
+                process.terminate()
+        deadline = time.monotonic() + timeout
+        for process in self._processes.values():
+            try:
+                process.wait(timeout=max(0.1, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Session-affine front router for src.api workers")
+    parser.add_argument("--workers", type=int, default=int(os.environ.get("API_WORKERS", os.cpu_count() or 1)))
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--worker-base-port", type=int, default=8100)
+    parser.add_argument("--app", default="src.api:app", help="ASGI app each worker runs")
+    parser.add_argument(
+        "--worker-urls",
+        default=ROUTER_WORKER_URLS,
+        help="Comma-separated externally managed workers (no processes are spawned)",
+    )
+    args = parser.parse_args(argv)
+
+    import uvicorn
+
+    supervisor: Optional[WorkerSupervisor] = None
+    if args.worker_urls:
+        workers = [url.strip() for url in args.worker_urls.split(",") if url.strip()]
+    else:
+        supervisor = WorkerSupervisor(args.workers, app=args.app, base_port=args.worker_base_port)
+        supervisor.start()
+        workers = supervisor.urls
+
+    try:
+        uvicorn.run(create_router_app(FrontRouter(workers)), host=args.host, port=args.port)
+    finally:
+        if supervisor is not None:
+            supervisor.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -794,11 +794,16 @@ class ResponseGenerator:
 
         These are overview sections (not detailed FAQ entries with priority 10).
         Each section's .facts first line serves as a short summary label.
-        Runs ONCE at startup — O(n) scan of sections, cached forever.
+        O(n) scan of sections runs once per KB object; the resulting list is
+        shared by every session (read-only) and rebuilt when the KB is reloaded.
         """
         try:
             retriever = get_retriever()
             kb = retriever.kb
+            cached = getattr(kb, "_product_overview_labels", None)
+            if isinstance(cached, list):
+                self._product_overview = cached
+                return
             overviews = []
             seen = set()
             for section in kb.sections:
@@ -812,6 +817,10 @@ class ResponseGenerator:
                         overviews.append(label)
                         seen.add(label)
             self._product_overview = overviews
+            try:
+                kb._product_overview_labels = overviews
+            except AttributeError:
+                pass
             logger.info(
                 "Product overview initialized from KB",
                 overview_count=len(overviews),
@@ -2952,14 +2961,14 @@ class ResponseGenerator:
         # Skip for autonomous_respond: autonomous flow decides in LLM.
         _ctx_envelope = context.get("context_envelope")
         if action != "autonomous_respond" and _ctx_envelope and getattr(_ctx_envelope, 'repeated_question', None):
-            from src.yaml_config.constants import INTENT_CATEGORIES, REPAIR_PROTECTED_ACTIONS
-            _rq = _ctx_envelope.repeated_question
-            _answerable = (
-                set(INTENT_CATEGORIES.get("question", []))
-                | set(INTENT_CATEGORIES.get("price_related", []))
+            from src.yaml_config.constants import (
+                ANSWERABLE_QUESTION_INTENTS,
+                REPAIR_PROTECTED_ACTIONS,
+                get_intent_category_set,
             )
-            if _rq in _answerable and template_key not in REPAIR_PROTECTED_ACTIONS:
-                _price = set(INTENT_CATEGORIES.get("price_related", []))
+            _rq = _ctx_envelope.repeated_question
+            if _rq in ANSWERABLE_QUESTION_INTENTS and template_key not in REPAIR_PROTECTED_ACTIONS:
+                _price = get_intent_category_set("price_related")
                 if _rq in _price:
                     template_key = self._get_price_template_key(_rq, action)
                 else:
@@ -4086,8 +4095,8 @@ class ResponseGenerator:
         # another clarifying loop. This improves dialogue coherence under stress.
         envelope = context.get("context_envelope")
         repeated_question = getattr(envelope, "repeated_question", None) if envelope else None
-        from src.yaml_config.constants import INTENT_CATEGORIES
-        price_related = set(INTENT_CATEGORIES.get("price_related", []))
+        from src.yaml_config.constants import get_intent_category_set
+        price_related = get_intent_category_set("price_related")
         has_price_signal = self._has_price_signal(user_message)
         if _is_autonomous and (
             intent in price_related
@@ -6633,8 +6642,8 @@ class ResponseGenerator:
             repeated_question = getattr(envelope, "repeated_question", None) if envelope else None
             has_price_signal = self._has_price_signal(str(context.get("user_message", "") or ""))
 
-            from src.yaml_config.constants import INTENT_CATEGORIES
-            price_related = set(INTENT_CATEGORIES.get("price_related", []))
+            from src.yaml_config.constants import get_intent_category_set
+            price_related = get_intent_category_set("price_related")
             if (
                 intent not in price_related
                 and not (repeated_question in price_related and has_price_signal)
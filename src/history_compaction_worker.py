@@ -0,0 +1,226 @@
+"""
+HistoryCompactionWorker - LLM history compaction off the snapshot save path.
+
+`SalesBot.to_snapshot(compact_history=True)` used to call
+`HistoryCompactor.compact` inline, so every save, eviction and shutdown paid
+for an LLM round-trip per session. Compaction now runs here, in background
+threads, as turns complete:
+
+- `schedule()` is called by SessionManager right after a turn, under the
+  session lock, and captures the bot's history and fallback context;
+- requests are coalesced per session: while a session is queued only its
+  newest capture is kept, and one session is never compacted concurrently;
+- the result is handed back through `SalesBot.apply_history_compact`, which
+  only ever moves the compacted prefix forward;
+- a session is compacted only once `min_new_turns` (default 4) turns have
+  left the uncompacted tail since its last compact, so the LLM is called
+  about once per batch of turns, not after every turn.
+
+`to_snapshot` reads the latest applied compact and covers turns that are not
+compacted yet with the deterministic fallback, so saving never waits for
+the LLM.
+
+Usage:
+    worker = HistoryCompactionWorker()
+    manager = SessionManager(..., compaction_worker=worker)
+    ...
+    worker.close()   # drops the backlog, snapshots stay consistent
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Optional
+
+from src.history_compactor import HistoryCompactor
+from src.logger import logger
+
+
+# New uncompacted turns that trigger a compaction (one LLM call per batch)
+DEFAULT_MIN_NEW_TURNS = 4
+
+
+@dataclass
+class _CompactionJob:
+    bot: Any
+    capture: Dict[str, Any]
+    scheduled_at: float
+
+
+class HistoryCompactionWorker:
+    """Coalescing background queue of per-session history compactions."""
+
+    def __init__(
+        self,
+        *,
+        workers: int = 1,
+        history_tail_size: int = 4,
+        min_new_turns: int = DEFAULT_MIN_NEW_TURNS,
+        max_pending: int = 10000,
+    ):
+        self.workers = max(1, int(workers))
+        self.history_tail_size = max(0, int(history_tail_size))
+        self.min_new_turns = max(1, int(min_new_turns))
+        self.max_pending = max(1, int(max_pending))
+
+        self._pending: "OrderedDict[Hashable, _CompactionJob]" = OrderedDict()
+        self._running: set = set()
+        self._cond = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._closed = False
+
+        self.scheduled = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.completed = 0
+        self.applied = 0
+        self.failed = 0
+        self._lag_ms: deque = deque(maxlen=512)
+
+    # ── Producer side ─────────────────────────────────────
+
+    def schedule(self, key: Hashable, bot: Any) -> bool:
+        """
+        Queue compaction of ``bot`` if enough turns are not compacted yet.
+
+        Call with the session lock held: the history is captured here.
+        """
+        capture = bot.capture_history_compaction(
+            history_tail_size=self.history_tail_size,
+            min_new_turns=self.min_new_turns,
+        )
+        if capture is None:
+            return False
+        with self._cond:
+            if self._closed:
+                return False
+            job = self._pending.get(key)
+            if job is not None:
+                # Keep the original enqueue time: lag is measured from the
+                # oldest turn still waiting for compaction.
+                job.bot = bot
+                job.capture = capture
+                self.coalesced += 1
+                return True
+            if len(self._pending) >= self.max_pending:
+                self.dropped += 1
+                return False
+            self._pending[key] = _CompactionJob(bot, capture, time.monotonic())
+            self.scheduled += 1
+            self._ensure_threads()
+            self._cond.notify()
+        return True
+
+    def discard(self, key: Hashable) -> None:
+        """Forget a queued compaction (session closed or evicted)."""
+        with self._cond:
+            self._pending.pop(key, None)
+
+    def _ensure_threads(self) -> None:
+        """Caller holds _cond. Threads start lazily on the first job."""
+        self._threads = [thread for thread in self._threads if thread.is_alive()]
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(
+                target=self._run,
+                name=f"history-compaction-{len(self._threads)}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    # ── Worker side ───────────────────────────────────────
+
+    def _next_job(self) -> Optional[tuple]:
+        """Caller holds _cond. Oldest queued key that is not being compacted."""
+        for key in self._pending:
+            if key not in self._running:
+                return key, self._pending.pop(key)
+        return None
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                item = self._next_job()
+                while item is None and not self._closed:
+                    self._cond.wait()
+                    item = self._next_job()
+                if item is None:
+                    return
+                key, job = item
+                self._running.add(key)
+            try:
+                self._compact(job)
+            finally:
+                with self._cond:
+                    self._running.discard(key)
+                    self._cond.notify_all()
+
+    def _compact(self, job: _CompactionJob) -> None:
+        previous_compact, previous_meta = job.bot.get_history_compact()
+        try:
+            compact, meta = HistoryCompactor.compact(
+                history_full=job.capture["history"],
+                history_tail_size=job.capture["history_tail_size"],
+                previous_compact=previous_compact,
+                previous_meta=previous_meta,
+                llm=job.capture["llm"],
+                fallback_context=job.capture["fallback_context"],
+            )
+        except Exception:
+            with self._cond:
+                self.failed += 1
+            logger.exception("Background history compaction failed")
+            return
+        applied = job.bot.apply_history_compact(compact, meta)
+        with self._cond:
+            self.completed += 1
+            if applied:
+                self.applied += 1
+            self._lag_ms.append((time.monotonic() - job.scheduled_at) * 1000)
+
+    # ── Lifecycle and metrics ─────────────────────────────
+
+    def close(self, timeout: float = 1.0) -> int:
+        """
+        Stop accepting work and drop the backlog.
+
+        Returns the number of dropped jobs. A compaction that is already
+        calling the LLM is not interrupted; it is waited for at most
+        ``timeout`` seconds in total, since snapshots never depend on it.
+        """
+        with self._cond:
+            self._closed = True
+            dropped = len(self._pending)
+            self._pending.clear()
+            self.dropped += dropped
+            self._cond.notify_all()
+            threads = list(self._threads)
+        deadline = time.monotonic() + max(0.0, timeout)
+        for thread in threads:
+            thread.join(timeout=max(0.0, deadline - time.monotonic()))
+        return dropped
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cond:
+            now = time.monotonic()
+            oldest = min((job.scheduled_at for job in self._pending.values()), default=None)
+            lags = sorted(self._lag_ms)
+            return {
+                "backlog": len(self._pending),
+                "running": len(self._running),
+                "oldest_pending_seconds": round(now - oldest, 3) if oldest is not None else 0.0,
+                "scheduled": self.scheduled,
+                "coalesced": self.coalesced,
+                "dropped": self.dropped,
+                "completed": self.completed,
+                "applied": self.applied,
+                "failed": self.failed,
+                "lag_ms": {
+                    "avg": round(sum(lags) / len(lags), 2) if lags else 0.0,
+                    "p95": round(lags[int(0.95 * (len(lags) - 1))], 2) if lags else 0.0,
+                    "max": round(lags[-1], 2) if lags else 0.0,
+                },
+            }
@@ -13,6 +13,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
+from src.llm_scheduler import LLMPriority, llm_priority
 from src.logger import logger
 
 
@@ -61,7 +62,9 @@ class HistoryCompactor:
         if new_old and llm is not None and hasattr(llm, "generate_structured"):
             try:
                 prompt = cls._build_prompt(previous_compact, new_old)
-                result = llm.generate_structured(prompt, HistoryCompactSchema)
+                # Compaction is never on the user-facing path: yield to live turns.
+                with llm_priority(LLMPriority.BACKGROUND):
+                    result = llm.generate_structured(prompt, HistoryCompactSchema)
                 if isinstance(result, dict):
                     history_compact = result
                 elif result is not None and hasattr(result, "model_dump"):
@@ -49,3 +49,49 @@ def deep_freeze_dict(d: dict) -> FrozenDict:
             for key, value in d.items()
         }
     )
+
+
+def _unchanged(frozen, value) -> bool:
+    """True if `frozen` (an entry of an earlier freeze) still represents `value`."""
+    if frozen is value:
+        return True
+    if isinstance(value, dict):
+        return (
+            isinstance(frozen, FrozenDict)
+            and len(frozen) == len(value)
+            and all(key in frozen and _unchanged(frozen[key], item) for key, item in value.items())
+        )
+    if isinstance(value, (list, tuple)):
+        return (
+            type(frozen) is type(value)
+            and len(frozen) == len(value)
+            and all(_unchanged(a, b) for a, b in zip(frozen, value))
+        )
+    return type(frozen) is type(value) and frozen == value
+
+
+def freeze_dict_shared(d: dict, previous: FrozenDict | None = None) -> FrozenDict:
+    """
+    deep_freeze_dict() that shares structure with an earlier result (copy-on-write).
+
+    Entries unchanged since `previous` was frozen reuse its frozen values;
+    if nothing changed (same keys, same order) `previous` itself is returned
+    and no new containers are allocated.
+    """
+    if previous is None:
+        return deep_freeze_dict(d)
+    if len(previous) == len(d) and all(
+        old_key == key and _unchanged(old_value, value)
+        for (old_key, old_value), (key, value) in zip(previous.items(), d.items())
+    ):
+        return previous
+    return FrozenDict(
+        {
+            key: previous[key]
+            if key in previous and _unchanged(previous[key], value)
+            else deep_freeze_dict(value)
+            if isinstance(value, dict) and not isinstance(value, FrozenDict)
+            else value
+            for key, value in d.items()
+        }
+    )
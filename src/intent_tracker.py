@@ -21,7 +21,7 @@ from datetime import datetime
 # which loads them from constants.yaml (single source of truth)
 # This ensures IntentTracker uses the complete, up-to-date list of intents
 # including all 19 objection types, 24 positive signals, 18 questions, etc.
-from src.yaml_config.constants import INTENT_CATEGORIES
+from src.yaml_config.constants import INTENT_CATEGORIES, get_intent_category_set
 
 
 @dataclass
@@ -294,7 +294,7 @@ class IntentTracker:
         Returns:
             List of IntentRecord for intents in this category
         """
-        category_intents = set(INTENT_CATEGORIES.get(category, []))
+        category_intents = get_intent_category_set(category)
         return [r for r in self._history if r.intent in category_intents]
 
     def get_state_history(self) -> List[str]:
@@ -418,19 +418,19 @@ class IntentTracker:
 
     def is_objection(self, intent: str) -> bool:
         """Check if intent is an objection."""
-        return intent in INTENT_CATEGORIES.get("objection", [])
+        return intent in get_intent_category_set("objection")
 
     def is_positive(self, intent: str) -> bool:
         """Check if intent is positive."""
-        return intent in INTENT_CATEGORIES.get("positive", [])
+        return intent in get_intent_category_set("positive")
 
     def is_question(self, intent: str) -> bool:
         """Check if intent is a question."""
-        return intent in INTENT_CATEGORIES.get("question", [])
+        return intent in get_intent_category_set("question")
 
     def is_spin_progress(self, intent: str) -> bool:
         """Check if intent indicates SPIN progress."""
-        return intent in INTENT_CATEGORIES.get("spin_progress", [])
+        return intent in get_intent_category_set("spin_progress")
 
     # ==========================================================================
     # НОВЫЕ HELPER-МЕТОДЫ для 150+ интентов (26 категорий из constants.yaml)
@@ -447,7 +447,7 @@ class IntentTracker:
         Returns:
             True if intent belongs to category
         """
-        return intent in INTENT_CATEGORIES.get(category, [])
+        return intent in get_intent_category_set(category)
 
     # --- Вопросы об оборудовании (12 интентов) ---
     def is_equipment_question(self, intent: str) -> bool:
@@ -19,6 +19,7 @@ from pydantic import BaseModel, Field
 
 from src.logger import logger
 from src.settings import settings
+from src.turn_deadline import stage_allowed
 
 from .autonomous_kb import MAX_KB_CHARS, load_facts_for_state
 from .category_router import CategoryRouter
@@ -375,6 +376,8 @@ class QueryDecomposer:
             return None
         if not hasattr(self.llm, "generate_structured"):
             return None
+        if not stage_allowed("query_decomposition"):
+            return None
 
         categories = ", ".join(CategoryRouter.CATEGORIES)
         prompt = (
@@ -10,6 +10,15 @@ Ollama Client для CRM Sales Bot.
 - Retry: exponential backoff при ошибках
 - Fallback: graceful degradation при сбоях
 - LLMTrace: детальный трейсинг каждого вызова
+- Endpoint pool: least-outstanding-requests routing по нескольким серверам
+  (settings.llm.endpoints, см. src/llm_pool.py)
+- Scheduler: priority admission control (interactive / turn_critical /
+  background), см. src/llm_scheduler.py
+- Turn deadline: таймауты и число retry ограничены бюджетом хода
+  (src/turn_deadline.py)
+- Constrained decoding: JSON schema уходит грамматикой в каждый backend
+  (Ollama `format`, llama-server `json_schema` / response_format), поэтому
+  generate_structured повторяет только транспортные ошибки
 
 Запуск Ollama сервера:
     ollama serve
@@ -21,10 +30,12 @@ Ollama Client для CRM Sales Bot.
 
 import json
 import re
+import threading
 import time
 import uuid
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional, Type, TypeVar, Tuple, Union
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, Optional, Type, TypeVar, Tuple, Union
 
 import requests
 from pydantic import BaseModel, ValidationError
@@ -32,7 +43,16 @@ from pydantic import BaseModel, ValidationError
 from src.logger import logger
 from src.settings import settings
 from src.yaml_config.constants import LLM_FALLBACK_RESPONSES, LLM_DEFAULT_FALLBACK
-from src.decision_trace import LLMTrace
+from src.decision_trace import LLMTrace, llm_request_key
+from src.turn_deadline import current_turn_deadline
+from src.llm_pool import LLMEndpointPool, NoHealthyEndpointError
+from src.llm_scheduler import (
+    LLMScheduler,
+    SchedulerTicket,
+    SchedulerTimeoutError,
+    get_llm_scheduler,
+    resolve_priority,
+)
 
 T = TypeVar('T', bound=BaseModel)
 
@@ -59,6 +79,17 @@ class CircuitBreakerState:
         return self.status == CircuitBreakerStatus.OPEN
 
 
+# События structured output, которые считаются по purpose
+STRUCTURED_EVENTS = (
+    "calls",
+    "transport_retries",
+    "schema_violations",
+    "repairs",
+    "truncated",
+    "salvage_calls",
+)
+
+
 @dataclass
 class LLMStats:
     """Статистика LLM клиента"""
@@ -69,6 +100,8 @@ class LLMStats:
     total_retries: int = 0
     circuit_breaker_trips: int = 0
     total_response_time_ms: float = 0.0
+    # purpose -> {calls, transport_retries, schema_violations, repairs, truncated, salvage_calls}
+    structured_by_purpose: Dict[str, Dict[str, int]] = field(default_factory=dict)
 
     @property
     def success_rate(self) -> float:
@@ -84,6 +117,14 @@ class LLMStats:
             return 0.0
         return self.total_response_time_ms / self.successful_requests
 
+    def record_structured(self, purpose: str, event: str, count: int = 1) -> None:
+        """Учесть событие structured output для purpose."""
+        counters = self.structured_by_purpose.setdefault(
+            purpose or "unknown",
+            {event_name: 0 for event_name in STRUCTURED_EVENTS},
+        )
+        counters[event] = counters.get(event, 0) + count
+
 
 class OllamaClient:
     """
@@ -130,6 +171,8 @@ class OllamaClient:
         enable_circuit_breaker: bool = True,
         enable_retry: bool = True,
         api_format: Optional[str] = None,
+        endpoint_pool: Optional[LLMEndpointPool] = None,
+        scheduler: Optional[LLMScheduler] = None,
     ):
         """
         Инициализация LLM клиента.
@@ -141,8 +184,17 @@ class OllamaClient:
             enable_circuit_breaker: Включить circuit breaker
             enable_retry: Включить retry с exponential backoff
             api_format: "ollama" или "openai" (llama-server, vLLM)
+            endpoint_pool: Пул LLM серверов (process-wide пул из settings.llm.endpoints
+                если не указан и base_url не задан явно)
+            scheduler: Priority scheduler (process-wide для backend'а из
+                settings.llm.scheduler если не указан)
         """
         self.model = model or settings.llm.model
+        if endpoint_pool is None and base_url is None:
+            endpoint_pool = LLMEndpointPool.from_settings(settings.llm, shared=True)
+        self._endpoint_pool = endpoint_pool
+        if endpoint_pool is not None and base_url is None:
+            base_url = endpoint_pool.endpoints[0].base_url
         self.base_url = base_url or settings.llm.base_url
         self.timeout = timeout or settings.llm.timeout
         self.api_format = api_format or getattr(settings.llm, 'api_format', 'ollama')
@@ -153,6 +205,45 @@ class OllamaClient:
         self._circuit_breaker = CircuitBreakerState()
         self._stats = LLMStats()
 
+        self._scheduler = scheduler if scheduler is not None else self._resolve_scheduler()
+        self._admission_timeout = settings.get_nested("llm.scheduler.admission_timeout_seconds")
+
+        # Constrained decoding: невалидный по схеме ответ не повторяем
+        # (retry не меняет грамматику), только транспортные ошибки
+        self.retry_on_schema_violation = bool(
+            settings.get_nested("llm.structured_output.retry_on_schema_violation", False)
+        )
+        self._native_json_schema = bool(
+            settings.get_nested("llm.structured_output.native_json_schema", True)
+        )
+        self._constrained_decoding = bool(
+            settings.get_nested("llm.structured_output.constrained_decoding", True)
+        )
+        # Был ли последний structured ответ обрезан по num_predict (per-thread:
+        # клиент общий для параллельных sources)
+        self._structured_outcome = threading.local()
+
+    def _resolve_scheduler(self) -> Optional[LLMScheduler]:
+        """Process-wide scheduler for this backend (один на base_url или пул)."""
+        if not settings.get_nested("llm.scheduler.enabled", False):
+            return None
+        per_endpoint = int(settings.get_nested("llm.scheduler.max_concurrency_per_backend", 4))
+        if self._endpoint_pool is not None:
+            endpoints = self._endpoint_pool.endpoints
+            backend_key = "pool:" + ",".join(ep.base_url for ep in endpoints)
+            max_concurrency = per_endpoint * len(endpoints)
+        else:
+            backend_key = self.base_url.rstrip("/")
+            max_concurrency = per_endpoint
+        return get_llm_scheduler(
+            backend_key,
+            max_concurrency=max_concurrency,
+            background_max_concurrency=int(
+                settings.get_nested("llm.scheduler.background_max_concurrency", 1)
+            ),
+            aging_seconds=float(settings.get_nested("llm.scheduler.aging_seconds", 10)),
+        )
+
     @property
     def _is_openai_api(self) -> bool:
         return self.api_format == "openai"
@@ -176,6 +267,68 @@ class OllamaClient:
         """Проверка открыт ли circuit breaker"""
         return self._is_circuit_open()
 
+    @property
+    def constrained_decoding(self) -> bool:
+        """Backend декодирует по грамматике схемы (llm.structured_output.constrained_decoding)"""
+        return self._constrained_decoding
+
+    @property
+    def last_structured_truncated(self) -> bool:
+        """
+        Последний generate_structured() этого потока обрезан по длине.
+
+        Грамматика не спасает от обрыва на num_predict: для такого ответа
+        free-form salvage вызывающего кода по-прежнему имеет смысл.
+        """
+        return getattr(self._structured_outcome, "truncated", False)
+
+    def record_structured_event(self, purpose: str, event: str) -> None:
+        """Учесть salvage/repair, выполненный вызывающим кодом (per-purpose stats)."""
+        self._stats.record_structured(purpose, event)
+
+    @property
+    def scheduler(self) -> Optional[LLMScheduler]:
+        """Priority scheduler (None если отключён)"""
+        return self._scheduler
+
+    @contextmanager
+    def _admission(self, trace: LLMTrace) -> Iterator[Optional[SchedulerTicket]]:
+        """Занять слот scheduler'а на одну попытку; время ожидания пишется в trace."""
+        if self._scheduler is None:
+            yield None
+            return
+        started = time.monotonic()
+        try:
+            ticket = self._scheduler.acquire(trace.priority, timeout=self._admission_wait())
+        except SchedulerTimeoutError:
+            trace.queue_wait_ms += (time.monotonic() - started) * 1000
+            raise
+        trace.queue_wait_ms += ticket.wait_ms
+        try:
+            yield ticket
+        finally:
+            self._scheduler.release(ticket)
+
+    def _admission_wait(self) -> float:
+        """
+        Максимальное ожидание слота: admission_timeout, но не дальше дедлайна хода.
+
+        Raises:
+            SchedulerTimeoutError: бюджет хода уже исчерпан — в очередь не встаём.
+        """
+        deadline = current_turn_deadline()
+        if deadline is None:
+            return self._admission_timeout
+        remaining = deadline.remaining()
+        if remaining <= 0:
+            raise SchedulerTimeoutError("LLM admission skipped: turn budget exhausted")
+        return min(self._admission_timeout, remaining)
+
+    @property
+    def endpoint_pool(self) -> Optional[LLMEndpointPool]:
+        """Пул LLM серверов (None в single-endpoint режиме)"""
+        return self._endpoint_pool
+
     # =========================================================================
     # STRUCTURED OUTPUT (НОВОЕ)
     # =========================================================================
@@ -219,6 +372,7 @@ class OllamaClient:
             model_used=self.model,
             num_ctx_requested=0 if self._is_openai_api else self._resolve_num_ctx(),
             circuit_breaker_state=self._circuit_breaker.status,
+            priority=resolve_priority(purpose),
         )
 
         # Circuit breaker check
@@ -234,57 +388,33 @@ class OllamaClient:
         last_cleaned_structured_response = ""
         delay = self.INITIAL_DELAY
         max_attempts = self.MAX_RETRIES if self._enable_retry else 1
+        self._stats.record_structured(purpose, "calls")
+        self._structured_outcome.truncated = False
 
-        # Получаем JSON schema из Pydantic модели
-        json_schema = schema.model_json_schema()
+        # JSON schema из Pydantic модели -> грамматика backend'а
+        json_schema = self._grammar_schema(schema)
+        trace.prompt_hash = llm_request_key(prompt, json_schema)
 
         # Temperature escalation: on retries, bump temperature to get different output
+        # (только в режиме retry_on_schema_violation — транспортный retry
+        # повторяет тот же запрос)
         _TEMP_ESCALATION = (0.0, 0.15, 0.35)  # additive bumps per attempt
 
+        attempts_made = 0
         for attempt in range(max_attempts):
-            attempt_temp = min(temperature + _TEMP_ESCALATION[min(attempt, len(_TEMP_ESCALATION) - 1)], 1.0)
+            attempts_made = attempt + 1
+            attempt_temp = temperature
+            if self.retry_on_schema_violation:
+                attempt_temp = min(temperature + _TEMP_ESCALATION[min(attempt, len(_TEMP_ESCALATION) - 1)], 1.0)
             try:
-                base_url_normalized = self.base_url.rstrip("/")
-
-                if self._is_openai_api:
-                    # OpenAI-compatible API (llama-server, vLLM)
-                    request_body = {
-                        "model": self.model,
-                        "messages": [{"role": "user", "content": prompt}],
-                        "temperature": attempt_temp,
-                        "max_tokens": num_predict,
-                        "response_format": {
-                            "type": "json_schema",
-                            "json_schema": {"name": "response", "strict": True, "schema": json_schema},
-                        },
-                    }
-                    response = requests.post(
-                        f"{base_url_normalized}/v1/chat/completions",
-                        json=request_body,
-                        timeout=self.timeout,
-                    )
-                else:
-                    # Ollama native structured output через format
-                    num_ctx = self._resolve_num_ctx()
-                    response = requests.post(
-                        f"{base_url_normalized}/api/chat",
-                        json={
-                            "model": self.model,
-                            "messages": [{"role": "user", "content": prompt}],
-                            "stream": False,
-                            "think": False,
-                            "format": json_schema,  # Ollama: schema напрямую в format
-                            "options": {
-                                "temperature": attempt_temp,
-                                "num_predict": num_predict,
-                                "num_ctx": num_ctx,
-                            }
-                        },
-                        timeout=self.timeout
-                    )
-                response.raise_for_status()
+                with self._admission(trace):
+                    response = self._post_structured(prompt, json_schema, attempt_temp, num_predict)
 
                 data = response.json()
+                truncated = self._is_length_truncated(data)
+                self._structured_outcome.truncated = truncated
+                if truncated:
+                    self._stats.record_structured(purpose, "truncated")
                 content = self._extract_content(data)
 
                 # Clean LLM artefacts before validation
@@ -309,6 +439,7 @@ class OllamaClient:
 
                         if repaired_payload is not None:
                             result = schema.model_validate(repaired_payload)
+                            self._stats.record_structured(purpose, "repairs")
                         else:
                             raise
                     else:
@@ -328,6 +459,16 @@ class OllamaClient:
 
                 return (result, trace) if return_trace else result
 
+            except ValidationError as e:
+                last_error = e
+                self._stats.record_structured(purpose, "schema_violations")
+                logger.warning(
+                    f"Ollama structured schema violation (attempt {attempt + 1}/{max_attempts}): {str(e)[:100]}",
+                    purpose=purpose,
+                )
+                if not self.retry_on_schema_violation:
+                    # Ответ пришёл под грамматикой: повтор даст тот же результат
+                    break
             except requests.exceptions.Timeout as e:
                 last_error = e
                 logger.warning(f"Ollama structured timeout (attempt {attempt + 1}/{max_attempts})")
@@ -343,7 +484,10 @@ class OllamaClient:
 
             # Retry с backoff
             if attempt < max_attempts - 1:
+                if not self._retry_fits_deadline(delay):
+                    break
                 self._stats.total_retries += 1
+                self._stats.record_structured(purpose, "transport_retries")
                 time.sleep(delay)
                 delay = min(delay * self.BACKOFF_MULTIPLIER, self.MAX_DELAY)
 
@@ -354,7 +498,7 @@ class OllamaClient:
 
         # Обновляем trace для неудачи
         trace.latency_ms = (time.time() - start_time) * 1000
-        trace.retry_count = max_attempts
+        trace.retry_count = attempts_made
         trace.success = False
         trace.error = str(last_error)[:100] if last_error else "unknown"
         trace.last_cleaned_structured_response = last_cleaned_structured_response
@@ -408,15 +552,20 @@ class OllamaClient:
         """
         self._stats.total_requests += 1
         start_time = time.time()
+        if purpose.endswith("_salvage"):
+            # Free-form повтор после неудачного structured вызова
+            self._stats.record_structured(purpose[: -len("_salvage")], "salvage_calls")
 
         # Создаем trace
         trace = LLMTrace(
             request_id=str(uuid.uuid4())[:8],
             purpose=purpose,
             prompt_user=prompt,
+            prompt_hash=llm_request_key(prompt),
             model_used=self.model,
             num_ctx_requested=0 if self._is_openai_api else self._resolve_num_ctx(),
             circuit_breaker_state=self._circuit_breaker.status,
+            priority=resolve_priority(purpose),
         )
 
         # Circuit breaker check
@@ -441,11 +590,12 @@ class OllamaClient:
         for attempt in range(max_attempts):
             try:
                 # Используем _call_llm для совместимости с тестами
-                response_text = self._call_llm(
-                    prompt,
-                    temperature=temperature,
-                    num_predict=num_predict,
-                )
+                with self._admission(trace):
+                    response_text = self._call_llm(
+                        prompt,
+                        temperature=temperature,
+                        num_predict=num_predict,
+                    )
 
                 # Успех
                 elapsed_ms = (time.time() - start_time) * 1000
@@ -484,6 +634,8 @@ class OllamaClient:
 
             # Retry с backoff
             if attempt < max_attempts - 1:
+                if not self._retry_fits_deadline(delay):
+                    break
                 self._stats.total_retries += 1
                 logger.debug(f"Retrying in {delay:.1f}s...")
                 time.sleep(delay)
@@ -541,9 +693,11 @@ class OllamaClient:
             request_id=str(uuid.uuid4())[:8],
             purpose=purpose,
             prompt_user=prompt,
+            prompt_hash=llm_request_key(prompt),
             model_used=self.model,
             num_ctx_requested=0 if self._is_openai_api else self._resolve_num_ctx(),
             circuit_breaker_state=self._circuit_breaker.status,
+            priority=resolve_priority(purpose),
         )
 
         if self._enable_circuit_breaker and self._is_circuit_open():
@@ -562,13 +716,14 @@ class OllamaClient:
 
         for attempt in range(max_attempts):
             try:
-                response_text = self._call_multimodal_llm(
-                    prompt,
-                    images=images,
-                    mime_type=mime_type,
-                    temperature=temperature,
-                    num_predict=num_predict,
-                )
+                with self._admission(trace):
+                    response_text = self._call_multimodal_llm(
+                        prompt,
+                        images=images,
+                        mime_type=mime_type,
+                        temperature=temperature,
+                        num_predict=num_predict,
+                    )
 
                 elapsed_ms = (time.time() - start_time) * 1000
                 self._stats.successful_requests += 1
@@ -598,6 +753,8 @@ class OllamaClient:
                 logger.error(f"Ollama multimodal unexpected error (attempt {attempt + 1}/{max_attempts})")
 
             if attempt < max_attempts - 1:
+                if not self._retry_fits_deadline(delay):
+                    break
                 self._stats.total_retries += 1
                 time.sleep(delay)
                 delay = min(delay * self.BACKOFF_MULTIPLIER, self.MAX_DELAY)
@@ -662,26 +819,23 @@ class OllamaClient:
         Внутренний метод без retry/circuit breaker.
         Тесты могут мокать этот метод.
         """
-        base_url_normalized = self.base_url.rstrip("/")
-
         if self._is_openai_api:
             # OpenAI-compatible API (llama-server, vLLM)
-            response = requests.post(
-                f"{base_url_normalized}/v1/chat/completions",
-                json={
+            response = self._post(
+                "/v1/chat/completions",
+                {
                     "model": self.model,
                     "messages": [{"role": "user", "content": prompt}],
                     "temperature": temperature,
                     "max_tokens": num_predict,
                 },
-                timeout=self.timeout,
             )
         else:
             # Ollama native API
             num_ctx = self._resolve_num_ctx()
-            response = requests.post(
-                f"{base_url_normalized}/api/chat",
-                json={
+            response = self._post(
+                "/api/chat",
+                {
                     "model": self.model,
                     "messages": [{"role": "user", "content": prompt}],
                     "stream": False,
@@ -692,13 +846,84 @@ class OllamaClient:
                         "num_ctx": num_ctx,
                     }
                 },
-                timeout=self.timeout
             )
-        response.raise_for_status()
 
         data = response.json()
         return self._extract_content(data)
 
+    # JSON schema на класс схемы: model_json_schema() не пересчитывается на каждый вызов
+    _GRAMMAR_SCHEMA_CACHE: Dict[type, Dict[str, Any]] = {}
+
+    @classmethod
+    def _grammar_schema(cls, schema: Type[BaseModel]) -> Dict[str, Any]:
+        """
+        JSON schema для грамматики backend'а.
+
+        Объектам со списком properties добавляется additionalProperties: false,
+        чтобы грамматика не разрешала лишние ключи (pydantic их всё равно
+        отбросит, а токены на них тратятся).
+        """
+        cached = cls._GRAMMAR_SCHEMA_CACHE.get(schema)
+        if cached is not None:
+            return cached
+
+        def _close_objects(node: Any) -> None:
+            if isinstance(node, dict):
+                if "properties" in node and "additionalProperties" not in node:
+                    node["additionalProperties"] = False
+                for value in node.values():
+                    _close_objects(value)
+            elif isinstance(node, list):
+                for value in node:
+                    _close_objects(value)
+
+        json_schema = schema.model_json_schema()
+        _close_objects(json_schema)
+        cls._GRAMMAR_SCHEMA_CACHE[schema] = json_schema
+        return json_schema
+
+    def _post_structured(
+        self,
+        prompt: str,
+        json_schema: Dict[str, Any],
+        temperature: float,
+        num_predict: int,
+    ) -> requests.Response:
+        """Structured-output запрос: JSON schema как грамматика декодирования."""
+        if self._is_openai_api:
+            # OpenAI-compatible API (llama-server, vLLM)
+            payload: Dict[str, Any] = {
+                "model": self.model,
+                "messages": [{"role": "user", "content": prompt}],
+                "temperature": temperature,
+                "max_tokens": num_predict,
+                "response_format": {
+                    "type": "json_schema",
+                    "json_schema": {"name": "response", "strict": True, "schema": json_schema},
+                },
+            }
+            if self._native_json_schema:
+                # llama-server: json_schema -> GBNF даже на сборках, которые
+                # игнорируют response_format.json_schema
+                payload["json_schema"] = json_schema
+            return self._post("/v1/chat/completions", payload)
+        # Ollama native structured output через format
+        return self._post(
+            "/api/chat",
+            {
+                "model": self.model,
+                "messages": [{"role": "user", "content": prompt}],
+                "stream": False,
+                "think": False,
+                "format": json_schema,  # Ollama: schema напрямую в format
+                "options": {
+                    "temperature": temperature,
+                    "num_predict": num_predict,
+                    "num_ctx": self._resolve_num_ctx(),
+                },
+            },
+        )
+
     def _call_multimodal_llm(
         self,
         prompt: str,
@@ -712,8 +937,6 @@ class OllamaClient:
         if not images:
             raise ValueError("generate_multimodal requires at least one image")
 
-        base_url_normalized = self.base_url.rstrip("/")
-
         if self._is_openai_api:
             image_mime = mime_type or "image/jpeg"
             content: list[dict[str, Any]] = [{"type": "text", "text": prompt}]
@@ -724,21 +947,20 @@ class OllamaClient:
                         "image_url": {"url": f"data:{image_mime};base64,{image}"},
                     }
                 )
-            response = requests.post(
-                f"{base_url_normalized}/v1/chat/completions",
-                json={
+            response = self._post(
+                "/v1/chat/completions",
+                {
                     "model": self.model,
                     "messages": [{"role": "user", "content": content}],
                     "temperature": temperature,
                     "max_tokens": num_predict,
                 },
-                timeout=self.timeout,
             )
         else:
             num_ctx = self._resolve_num_ctx()
-            response = requests.post(
-                f"{base_url_normalized}/api/chat",
-                json={
+            response = self._post(
+                "/api/chat",
+                {
                     "model": self.model,
                     "messages": [
                         {
@@ -755,13 +977,57 @@ class OllamaClient:
                         "num_ctx": num_ctx,
                     },
                 },
-                timeout=self.timeout,
             )
 
-        response.raise_for_status()
         data = response.json()
         return self._extract_content(data)
 
+    def _request_timeout(self) -> float:
+        """HTTP таймаут: settings.llm.timeout, но не дальше дедлайна хода."""
+        deadline = current_turn_deadline()
+        if deadline is None:
+            return self.timeout
+        return deadline.call_timeout(self.timeout)
+
+    def _retry_fits_deadline(self, delay: float) -> bool:
+        """Retry имеет смысл только если backoff + попытка укладываются в бюджет хода."""
+        deadline = current_turn_deadline()
+        if deadline is None or deadline.allows_retry(delay):
+            return True
+        logger.warning(
+            "LLM retry skipped: turn budget exhausted",
+            remaining_s=round(deadline.remaining(), 2),
+        )
+        return False
+
+    def _post(self, path: str, payload: Dict[str, Any]) -> requests.Response:
+        """
+        POST на LLM сервер с raise_for_status.
+
+        С пулом endpoint'ов запрос уходит на сервер с наименьшим числом
+        in-flight запросов; ошибка HTTP засчитывается этому серверу.
+        """
+        if self._endpoint_pool is None:
+            response = requests.post(
+                f"{self.base_url.rstrip('/')}{path}",
+                json=payload,
+                timeout=self._request_timeout(),
+            )
+            response.raise_for_status()
+            return response
+
+        try:
+            with self._endpoint_pool.lease() as endpoint:
+                response = requests.post(
+                    f"{endpoint.base_url}{path}",
+                    json=payload,
+                    timeout=self._request_timeout(),
+                )
+                response.raise_for_status()
+                return response
+        except NoHealthyEndpointError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+
     @staticmethod
     def _strip_markdown_json(text: str) -> str:
         """Strip ```json...``` markdown wrapper if present."""
@@ -805,6 +1071,17 @@ class OllamaClient:
 
         return cleaned
 
+    def _is_length_truncated(self, data: Any) -> bool:
+        """Генерация остановлена лимитом токенов (done_reason / finish_reason == "length")."""
+        if not isinstance(data, dict):
+            return False
+        if self._is_openai_api:
+            choices = data.get("choices") or []
+            reason = choices[0].get("finish_reason") if choices and isinstance(choices[0], dict) else None
+        else:
+            reason = data.get("done_reason")
+        return reason == "length"
+
     def _extract_content(self, data: dict) -> str:
         """Извлечь content из ответа (Ollama или OpenAI формат)."""
         if self._is_openai_api:
@@ -963,17 +1240,52 @@ class OllamaClient:
             "average_response_time_ms": round(self._stats.average_response_time_ms, 1),
             "circuit_breaker_status": self._circuit_breaker.status,
             "circuit_breaker_open": self._circuit_breaker.is_open,  # backward compatibility
+            "endpoints": self.get_endpoint_stats(),
+            "scheduler": self._scheduler.get_stats() if self._scheduler is not None else None,
+            "structured_output": {
+                purpose: dict(counters)
+                for purpose, counters in self._stats.structured_by_purpose.items()
+            },
         }
 
+    def get_endpoint_stats(self) -> list[Dict[str, Any]]:
+        """Per-endpoint latency/queue depth (пустой список без пула)"""
+        if self._endpoint_pool is None:
+            return []
+        return self._endpoint_pool.get_stats()
+
     def health_check(self) -> bool:
         """
         Проверка доступности LLM сервера.
 
+        С пулом endpoint'ов проверяет все серверы, помечает упавшие как
+        unhealthy (трафик уходит с них) и возвращает True если жив хотя бы один.
+
         Returns:
             True если сервер доступен и модель загружена
         """
+        if self._endpoint_pool is not None:
+            results = self._endpoint_pool.run_health_checks(self._probe_endpoint)
+            return any(results.values())
+        return self._probe_endpoint(self.base_url)
+
+    def start_endpoint_health_checks(self, interval_seconds: Optional[float] = None) -> None:
+        """Запустить периодические health checks пула (no-op без пула)"""
+        if self._endpoint_pool is None:
+            return
+        if interval_seconds is None:
+            interval_seconds = float(
+                settings.get_nested("llm.pool.health_check_interval_seconds", 15)
+            )
+        self._endpoint_pool.start_health_checks(self._probe_endpoint, interval_seconds)
+
+    def stop_endpoint_health_checks(self) -> None:
+        if self._endpoint_pool is not None:
+            self._endpoint_pool.stop_health_checks()
+
+    def _probe_endpoint(self, base_url: str) -> bool:
         try:
-            base_url_normalized = self.base_url.rstrip("/")
+            base_url_normalized = base_url.rstrip("/")
 
             if self._is_openai_api:
                 # OpenAI-compatible: /health or /v1/models
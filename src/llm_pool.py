@@ -0,0 +1,405 @@
+"""
+LLM endpoint pool - least-outstanding-requests routing across several LLM servers.
+
+`OllamaClient` talks to a single `settings.llm.base_url` by default. When
+`settings.llm.endpoints` lists several servers, the client routes every HTTP
+call through an `LLMEndpointPool`:
+
+- each call goes to the healthy endpoint with the fewest in-flight requests,
+  preferring endpoints whose last request did not fail (so a retry moves off
+  the node that just failed);
+- a session can optionally stick to one endpoint (KV-cache locality) until a
+  request from that session fails there;
+- clients built from the same settings share one pool per endpoint set
+  (`from_settings(..., shared=True)`), so in-flight counts are per process;
+- every endpoint has its own circuit breaker and an optional periodic health
+  probe, so traffic drains from a failed node and returns after recovery;
+- per-endpoint latency and queue depth are exposed via `get_stats()`.
+
+Usage:
+    pool = LLMEndpointPool(["http://gpu-1:8080", "http://gpu-2:8080"])
+    with llm_session_affinity("user-1::session-1"):
+        with pool.lease() as endpoint:
+            requests.post(f"{endpoint.base_url}/api/chat", ...)
+"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Sequence, Union
+
+from src.logger import logger
+
+
+_session_affinity_key: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "llm_session_affinity_key",
+    default=None,
+)
+
+
+@contextmanager
+def llm_session_affinity(session_key: Optional[str]) -> Iterator[None]:
+    """Bind LLM calls made inside the block to a session for sticky routing."""
+    token = _session_affinity_key.set(session_key or None)
+    try:
+        yield
+    finally:
+        _session_affinity_key.reset(token)
+
+
+def current_session_affinity() -> Optional[str]:
+    """Session key bound by the innermost `llm_session_affinity` block."""
+    return _session_affinity_key.get()
+
+
+_shared_pools: Dict[tuple, "LLMEndpointPool"] = {}
+_shared_pools_lock = threading.Lock()
+
+
+class NoHealthyEndpointError(RuntimeError):
+    """Raised when every endpoint in the pool is unavailable."""
+
+
+class EndpointStatus:
+    """Circuit breaker statuses for a single endpoint."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class LLMEndpoint:
+    """Runtime state of one LLM server."""
+    base_url: str
+    name: str = ""
+    in_flight: int = 0
+    total_requests: int = 0
+    failed_requests: int = 0
+    consecutive_failures: int = 0
+    status: str = EndpointStatus.CLOSED
+    open_until: float = 0.0
+    half_open_probe_in_flight: bool = False
+    healthy: bool = True
+    last_health_check: float = 0.0
+    ewma_latency_ms: float = 0.0
+    recent_latencies_ms: Deque[float] = field(default_factory=lambda: deque(maxlen=256))
+
+    def __post_init__(self) -> None:
+        self.base_url = self.base_url.rstrip("/")
+        if not self.name:
+            self.name = self.base_url
+
+    def latency_percentile(self, percentile: float) -> float:
+        if not self.recent_latencies_ms:
+            return 0.0
+        ordered = sorted(self.recent_latencies_ms)
+        index = min(len(ordered) - 1, int(round((percentile / 100.0) * (len(ordered) - 1))))
+        return ordered[index]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "base_url": self.base_url,
+            "in_flight": self.in_flight,
+            "total_requests": self.total_requests,
+            "failed_requests": self.failed_requests,
+            "circuit_breaker_status": self.status,
+            "healthy": self.healthy,
+            "ewma_latency_ms": round(self.ewma_latency_ms, 1),
+            "p50_latency_ms": round(self.latency_percentile(50), 1),
+            "p95_latency_ms": round(self.latency_percentile(95), 1),
+        }
+
+
+class LLMEndpointPool:
+    """Thread-safe pool of LLM endpoints with least-outstanding-requests routing."""
+
+    EWMA_ALPHA: float = 0.2
+
+    def __init__(
+        self,
+        endpoints: Sequence[Union[str, Dict[str, Any]]],
+        *,
+        sticky_sessions: bool = True,
+        circuit_breaker_threshold: int = 3,
+        circuit_breaker_timeout: float = 30.0,
+        max_sticky_sessions: int = 10000,
+        now_provider: Optional[Callable[[], float]] = None,
+    ):
+        parsed: List[LLMEndpoint] = []
+        for item in endpoints:
+            if isinstance(item, dict):
+                base_url = str(item.get("base_url") or item.get("url") or "").strip()
+                name = str(item.get("name") or "")
+            else:
+                base_url = str(item or "").strip()
+                name = ""
+            if base_url:
+                parsed.append(LLMEndpoint(base_url=base_url, name=name))
+        if not parsed:
+            raise ValueError("LLMEndpointPool requires at least one endpoint")
+
+        self._endpoints = parsed
+        self._sticky_sessions = sticky_sessions
+        self._threshold = max(1, int(circuit_breaker_threshold))
+        self._open_timeout = float(circuit_breaker_timeout)
+        self._max_sticky_sessions = max(1, int(max_sticky_sessions))
+        self._now = now_provider or time.time
+        self._lock = threading.Lock()
+        self._affinity: Dict[str, str] = {}
+        self._rr_cursor = 0
+        self._health_thread: Optional[threading.Thread] = None
+        self._health_stop: Optional[threading.Event] = None
+
+    @classmethod
+    def from_settings(cls, llm_settings: Any, *, shared: bool = False) -> Optional["LLMEndpointPool"]:
+        """
+        Build a pool from `settings.llm`; None when fewer than two endpoints are set.
+
+        With shared=True every caller with the same endpoints and pool settings
+        gets the same process-wide pool, so least-outstanding routing sees all
+        in-flight requests of the process, not just one client's.
+        """
+        endpoints = list(llm_settings.get("endpoints") or [])
+        if len(endpoints) < 2:
+            return None
+        pool_cfg = llm_settings.get("pool") or {}
+        kwargs = {
+            "sticky_sessions": bool(pool_cfg.get("sticky_sessions", True)),
+            "circuit_breaker_threshold": int(pool_cfg.get("circuit_breaker_threshold", 3)),
+            "circuit_breaker_timeout": float(pool_cfg.get("circuit_breaker_timeout", 30)),
+        }
+        if not shared:
+            return cls(endpoints, **kwargs)
+
+        key = (
+            tuple(
+                (str(item.get("base_url") or item.get("url") or ""), str(item.get("name") or ""))
+                if isinstance(item, dict) else (str(item), "")
+                for item in endpoints
+            ),
+            tuple(sorted(kwargs.items())),
+        )
+        with _shared_pools_lock:
+            pool = _shared_pools.get(key)
+            if pool is None:
+                pool = cls(endpoints, **kwargs)
+                _shared_pools[key] = pool
+            return pool
+
+    @property
+    def endpoints(self) -> List[LLMEndpoint]:
+        return list(self._endpoints)
+
+    # =========================================================================
+    # ROUTING
+    # =========================================================================
+
+    def _is_available(self, endpoint: LLMEndpoint, now: float) -> bool:
+        """Circuit breaker check for one endpoint (caller holds the lock)."""
+        if not endpoint.healthy:
+            return False
+        if endpoint.status == EndpointStatus.CLOSED:
+            return True
+        if endpoint.status == EndpointStatus.OPEN:
+            if now < endpoint.open_until:
+                return False
+            endpoint.status = EndpointStatus.HALF_OPEN
+            endpoint.half_open_probe_in_flight = False
+            logger.info("LLM endpoint half-open", endpoint=endpoint.name)
+        return not endpoint.half_open_probe_in_flight
+
+    def acquire(self, session_key: Optional[str] = None) -> LLMEndpoint:
+        """
+        Pick an endpoint and mark one request in flight on it.
+
+        Raises:
+            NoHealthyEndpointError: when every endpoint is open or unhealthy.
+        """
+        if session_key is None:
+            session_key = current_session_affinity()
+        with self._lock:
+            now = self._now()
+            candidates = [ep for ep in self._endpoints if self._is_available(ep, now)]
+            if not candidates:
+                raise NoHealthyEndpointError("No healthy LLM endpoints available")
+
+            chosen: Optional[LLMEndpoint] = None
+            if self._sticky_sessions and session_key:
+                pinned = self._affinity.get(session_key)
+                chosen = next((ep for ep in candidates if ep.base_url == pinned), None)
+
+            if chosen is None:
+                # Skip endpoints whose last request failed while others are
+                # fine, so a retry does not go back to the node that just failed.
+                fresh = [ep for ep in candidates if ep.consecutive_failures == 0] or candidates
+                # Least outstanding requests; round-robin among ties so idle
+                # endpoints share load evenly.
+                least = min(ep.in_flight for ep in fresh)
+                tied = [ep for ep in fresh if ep.in_flight == least]
+                chosen = tied[self._rr_cursor % len(tied)]
+                self._rr_cursor += 1
+                if self._sticky_sessions and session_key:
+                    if (
+                        session_key not in self._affinity
+                        and len(self._affinity) >= self._max_sticky_sessions
+                    ):
+                        self._affinity.pop(next(iter(self._affinity)))
+                    self._affinity[session_key] = chosen.base_url
+
+            if chosen.status == EndpointStatus.HALF_OPEN:
+                chosen.half_open_probe_in_flight = True
+            chosen.in_flight += 1
+            chosen.total_requests += 1
+            return chosen
+
+    def release(
+        self,
+        endpoint: LLMEndpoint,
+        *,
+        success: bool,
+        latency_ms: float = 0.0,
+        session_key: Optional[str] = None,
+    ) -> None:
+        """
+        Finish a request started by `acquire` and update endpoint health.
+
+        A failed request unpins its session from the endpoint right away, so the
+        retry is routed afresh instead of waiting for the circuit to open.
+        """
+        if session_key is None:
+            session_key = current_session_affinity()
+        with self._lock:
+            endpoint.in_flight = max(0, endpoint.in_flight - 1)
+            if success:
+                endpoint.recent_latencies_ms.append(latency_ms)
+                if endpoint.ewma_latency_ms == 0.0:
+                    endpoint.ewma_latency_ms = latency_ms
+                else:
+                    endpoint.ewma_latency_ms += self.EWMA_ALPHA * (
+                        latency_ms - endpoint.ewma_latency_ms
+                    )
+                if endpoint.status != EndpointStatus.CLOSED:
+                    logger.info("LLM endpoint closed after successful request", endpoint=endpoint.name)
+                endpoint.status = EndpointStatus.CLOSED
+                endpoint.consecutive_failures = 0
+                endpoint.half_open_probe_in_flight = False
+                return
+
+            endpoint.failed_requests += 1
+            endpoint.consecutive_failures += 1
+            if session_key and self._affinity.get(session_key) == endpoint.base_url:
+                del self._affinity[session_key]
+            if (
+                endpoint.status == EndpointStatus.HALF_OPEN
+                or endpoint.consecutive_failures >= self._threshold
+            ):
+                endpoint.status = EndpointStatus.OPEN
+                endpoint.open_until = self._now() + self._open_timeout
+                endpoint.half_open_probe_in_flight = False
+                self._drop_affinity(endpoint)
+                logger.warning(
+                    "LLM endpoint circuit opened",
+                    endpoint=endpoint.name,
+                    failures=endpoint.consecutive_failures,
+                    timeout=self._open_timeout,
+                )
+
+    def _drop_affinity(self, endpoint: LLMEndpoint) -> None:
+        """Unpin sessions from a failed endpoint (caller holds the lock)."""
+        stale = [key for key, url in self._affinity.items() if url == endpoint.base_url]
+        for key in stale:
+            del self._affinity[key]
+
+    @contextmanager
+    def lease(self, session_key: Optional[str] = None) -> Iterator[LLMEndpoint]:
+        """Acquire an endpoint for the duration of one HTTP call."""
+        if session_key is None:
+            session_key = current_session_affinity()
+        endpoint = self.acquire(session_key)
+        started = time.perf_counter()
+        success = False
+        try:
+            yield endpoint
+            success = True
+        finally:
+            self.release(
+                endpoint,
+                success=success,
+                latency_ms=(time.perf_counter() - started) * 1000,
+                session_key=session_key,
+            )
+
+    # =========================================================================
+    # HEALTH CHECKS
+    # =========================================================================
+
+    def run_health_checks(self, probe: Callable[[str], bool]) -> Dict[str, bool]:
+        """Probe every endpoint once and mark it healthy/unhealthy."""
+        results: Dict[str, bool] = {}
+        for endpoint in self._endpoints:
+            try:
+                ok = bool(probe(endpoint.base_url))
+            except Exception:
+                ok = False
+            with self._lock:
+                if endpoint.healthy and not ok:
+                    self._drop_affinity(endpoint)
+                    logger.warning("LLM endpoint failed health check", endpoint=endpoint.name)
+                elif not endpoint.healthy and ok:
+                    logger.info("LLM endpoint recovered", endpoint=endpoint.name)
+                endpoint.healthy = ok
+                endpoint.last_health_check = self._now()
+            results[endpoint.name] = ok
+        return results
+
+    def start_health_checks(self, probe: Callable[[str], bool], interval_seconds: float) -> None:
+        """Start a daemon thread that probes endpoints every `interval_seconds`."""
+        if self._health_thread is not None or interval_seconds <= 0:
+            return
+        stop_event = threading.Event()
+
+        def _loop() -> None:
+            while not stop_event.wait(interval_seconds):
+                try:
+                    self.run_health_checks(probe)
+                except Exception:
+                    logger.exception("LLM endpoint health check loop failed")
+
+        self._health_stop = stop_event
+        self._health_thread = threading.Thread(
+            target=_loop,
+            name="crm-sales-bot-llm-health",
+            daemon=True,
+        )
+        self._health_thread.start()
+
+    def stop_health_checks(self) -> None:
+        if self._health_stop is not None:
+            self._health_stop.set()
+        if self._health_thread is not None:
+            self._health_thread.join(timeout=2)
+        self._health_stop = None
+        self._health_thread = None
+
+    # =========================================================================
+    # STATS
+    # =========================================================================
+
+    def has_available_endpoint(self) -> bool:
+        with self._lock:
+            now = self._now()
+            return any(
+                ep.healthy and (ep.status != EndpointStatus.OPEN or now >= ep.open_until)
+                for ep in self._endpoints
+            )
+
+    def get_stats(self) -> List[Dict[str, Any]]:
+        """Per-endpoint latency, queue depth (in-flight requests) and breaker status."""
+        with self._lock:
+            return [endpoint.to_dict() for endpoint in self._endpoints]
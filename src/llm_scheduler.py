@@ -0,0 +1,308 @@
+"""
+LLM Scheduler - process-wide priority admission control in front of OllamaClient.
+
+User-facing generation, turn-critical classification and background work
+(history compaction, media card analysis, profile snapshot extraction) share
+the same LLM server. The scheduler gives every backend a concurrency budget
+and admits waiting calls by priority class:
+
+- INTERACTIVE: response generation the user is waiting for
+- TURN_CRITICAL: classification / decisions on the current turn path
+- BACKGROUND: work that can be delayed without hurting the turn
+
+Within a class calls are FIFO. Classes are strict-priority with aging, so a
+waiting call gains one priority level per `aging_seconds` and nothing starves.
+Background calls are additionally capped by `background_max_concurrency` and
+are held back while foreground load is high. In-flight HTTP requests are never
+cancelled: "preemption" means delaying background admission.
+
+Priority is resolved from an explicit `llm_priority()` block first, then from
+the call purpose (see `PURPOSE_PRIORITIES`).
+
+Usage:
+    scheduler = get_llm_scheduler("http://gpu-1:8080")
+    with llm_priority(LLMPriority.BACKGROUND):
+        with scheduler.slot(resolve_priority("history_compaction")) as ticket:
+            ...
+    ticket.wait_ms
+"""
+
+from __future__ import annotations
+
+import contextvars
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+from src.logger import logger
+
+
+class LLMPriority:
+    """Priority classes (lower rank = admitted first)."""
+    INTERACTIVE = "interactive"
+    TURN_CRITICAL = "turn_critical"
+    BACKGROUND = "background"
+
+    ALL = (INTERACTIVE, TURN_CRITICAL, BACKGROUND)
+    RANKS = {INTERACTIVE: 0, TURN_CRITICAL: 1, BACKGROUND: 2}
+
+
+# Purpose -> priority. Matching is by substring, first hit wins; purposes not
+# listed here default to TURN_CRITICAL.
+PURPOSE_PRIORITIES = (
+    ("history_compaction", LLMPriority.BACKGROUND),
+    ("autonomous_profile_snapshot", LLMPriority.BACKGROUND),
+    ("media_knowledge_card", LLMPriority.BACKGROUND),
+    ("media_sparse_extraction", LLMPriority.BACKGROUND),
+    ("document_summary", LLMPriority.BACKGROUND),
+    ("structured_generation", LLMPriority.TURN_CRITICAL),
+    ("generation", LLMPriority.INTERACTIVE),
+    ("merged_decision_response", LLMPriority.INTERACTIVE),
+    ("rewrite", LLMPriority.INTERACTIVE),
+    ("followup", LLMPriority.INTERACTIVE),
+)
+
+
+_priority_override: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "llm_priority_override",
+    default=None,
+)
+
+
+@contextmanager
+def llm_priority(priority: str) -> Iterator[None]:
+    """Run LLM calls inside the block with an explicit priority class."""
+    if priority not in LLMPriority.RANKS:
+        raise ValueError(f"Unknown LLM priority: {priority}")
+    token = _priority_override.set(priority)
+    try:
+        yield
+    finally:
+        _priority_override.reset(token)
+
+
+def resolve_priority(purpose: str = "") -> str:
+    """Priority for a call: explicit `llm_priority()` block, then purpose mapping."""
+    override = _priority_override.get()
+    if override:
+        return override
+    purpose_low = str(purpose or "").lower()
+    for marker, priority in PURPOSE_PRIORITIES:
+        if marker in purpose_low:
+            return priority
+    return LLMPriority.TURN_CRITICAL
+
+
+class SchedulerTimeoutError(TimeoutError):
+    """Raised when a call waited longer than its admission timeout."""
+
+
+@dataclass
+class SchedulerTicket:
+    """One admission request."""
+    priority: str
+    seq: int
+    enqueued_at: float
+    granted: bool = False
+    admitted_at: float = 0.0
+
+    @property
+    def wait_ms(self) -> float:
+        end = self.admitted_at if self.granted else time.monotonic()
+        return (end - self.enqueued_at) * 1000
+
+
+@dataclass
+class _ClassStats:
+    admitted: int = 0
+    timeouts: int = 0
+    total_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "admitted": self.admitted,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": round(self.total_wait_ms / self.admitted, 1) if self.admitted else 0.0,
+            "max_wait_ms": round(self.max_wait_ms, 1),
+        }
+
+
+@dataclass
+class LLMScheduler:
+    """Priority admission control for one LLM backend."""
+    max_concurrency: int = 4
+    background_max_concurrency: int = 1
+    high_load_threshold: Optional[int] = None
+    aging_seconds: float = 10.0
+    name: str = ""
+    _lock: threading.Condition = field(default_factory=threading.Condition, repr=False)
+    _waiting: List[SchedulerTicket] = field(default_factory=list, repr=False)
+    _in_flight: Dict[str, int] = field(
+        default_factory=lambda: {p: 0 for p in LLMPriority.ALL}, repr=False
+    )
+    _stats: Dict[str, _ClassStats] = field(
+        default_factory=lambda: {p: _ClassStats() for p in LLMPriority.ALL}, repr=False
+    )
+    _seq: Any = field(default_factory=itertools.count, repr=False)
+
+    def __post_init__(self) -> None:
+        self.max_concurrency = max(1, int(self.max_concurrency))
+        self.background_max_concurrency = max(
+            0, min(int(self.background_max_concurrency), self.max_concurrency)
+        )
+        if self.high_load_threshold is None:
+            # Foreground load at which background admission is delayed
+            self.high_load_threshold = max(1, self.max_concurrency - 1)
+
+    # =========================================================================
+    # ADMISSION
+    # =========================================================================
+
+    def _effective_rank(self, ticket: SchedulerTicket, now: float) -> int:
+        rank = LLMPriority.RANKS[ticket.priority]
+        if self.aging_seconds > 0:
+            rank -= int((now - ticket.enqueued_at) / self.aging_seconds)
+        return rank
+
+    def _foreground_in_flight(self) -> int:
+        return self._in_flight[LLMPriority.INTERACTIVE] + self._in_flight[LLMPriority.TURN_CRITICAL]
+
+    def _can_admit(self, ticket: SchedulerTicket, now: float, foreground_waiting: bool) -> bool:
+        if sum(self._in_flight.values()) >= self.max_concurrency:
+            return False
+        if ticket.priority != LLMPriority.BACKGROUND:
+            return True
+        if self._in_flight[LLMPriority.BACKGROUND] >= self.background_max_concurrency:
+            return False
+        aged = self.aging_seconds > 0 and (now - ticket.enqueued_at) >= 2 * self.aging_seconds
+        if aged:
+            return True
+        return not foreground_waiting and self._foreground_in_flight() < self.high_load_threshold
+
+    def _dispatch(self) -> None:
+        """Grant slots to waiting tickets in priority order (caller holds the lock)."""
+        if not self._waiting:
+            return
+        now = time.monotonic()
+        self._waiting.sort(key=lambda t: (self._effective_rank(t, now), t.seq))
+        foreground_waiting = any(t.priority != LLMPriority.BACKGROUND for t in self._waiting)
+        granted_any = False
+        for ticket in list(self._waiting):
+            if not self._can_admit(ticket, now, foreground_waiting):
+                if ticket.priority != LLMPriority.BACKGROUND:
+                    # Capacity exhausted: lower-ranked tickets must not jump ahead.
+                    break
+                continue
+            self._waiting.remove(ticket)
+            ticket.granted = True
+            ticket.admitted_at = now
+            self._in_flight[ticket.priority] += 1
+            stats = self._stats[ticket.priority]
+            stats.admitted += 1
+            stats.total_wait_ms += ticket.wait_ms
+            stats.max_wait_ms = max(stats.max_wait_ms, ticket.wait_ms)
+            granted_any = True
+        if granted_any:
+            self._lock.notify_all()
+
+    def acquire(self, priority: str, timeout: Optional[float] = None) -> SchedulerTicket:
+        """
+        Wait for a slot.
+
+        Raises:
+            SchedulerTimeoutError: if no slot was granted within `timeout` seconds.
+        """
+        if priority not in LLMPriority.RANKS:
+            priority = LLMPriority.TURN_CRITICAL
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            ticket = SchedulerTicket(
+                priority=priority,
+                seq=next(self._seq),
+                enqueued_at=time.monotonic(),
+            )
+            self._waiting.append(ticket)
+            self._dispatch()
+            while not ticket.granted:
+                wait_for = self.aging_seconds if self.aging_seconds > 0 else None
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._waiting.remove(ticket)
+                        self._stats[priority].timeouts += 1
+                        raise SchedulerTimeoutError(
+                            f"LLM admission timed out after {ticket.wait_ms:.0f} ms ({priority})"
+                        )
+                    wait_for = remaining if wait_for is None else min(wait_for, remaining)
+                self._lock.wait(timeout=wait_for)
+                if not ticket.granted:
+                    # Re-evaluate aging / high-load conditions after a timed wake-up
+                    self._dispatch()
+            return ticket
+
+    def release(self, ticket: SchedulerTicket) -> None:
+        with self._lock:
+            if not ticket.granted:
+                return
+            ticket.granted = False
+            self._in_flight[ticket.priority] = max(0, self._in_flight[ticket.priority] - 1)
+            self._dispatch()
+
+    @contextmanager
+    def slot(self, priority: str, timeout: Optional[float] = None) -> Iterator[SchedulerTicket]:
+        ticket = self.acquire(priority, timeout=timeout)
+        try:
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    # =========================================================================
+    # STATS
+    # =========================================================================
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            waiting = {p: 0 for p in LLMPriority.ALL}
+            for ticket in self._waiting:
+                waiting[ticket.priority] += 1
+            return {
+                "name": self.name,
+                "max_concurrency": self.max_concurrency,
+                "background_max_concurrency": self.background_max_concurrency,
+                "in_flight": dict(self._in_flight),
+                "waiting": waiting,
+                "classes": {p: s.to_dict() for p, s in self._stats.items()},
+            }
+
+
+_schedulers: Dict[str, LLMScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_llm_scheduler(backend_key: str, **kwargs: Any) -> LLMScheduler:
+    """
+    Process-wide scheduler for a backend (base_url or endpoint pool).
+
+    Keyword arguments are used only when the scheduler is created.
+    """
+    with _schedulers_lock:
+        scheduler = _schedulers.get(backend_key)
+        if scheduler is None:
+            scheduler = LLMScheduler(name=backend_key, **kwargs)
+            _schedulers[backend_key] = scheduler
+            logger.info(
+                "LLM scheduler created",
+                backend=backend_key,
+                max_concurrency=scheduler.max_concurrency,
+            )
+        return scheduler
+
+
+def reset_llm_schedulers() -> None:
+    """Drop all process-wide schedulers (tests)."""
+    with _schedulers_lock:
+        _schedulers.clear()
@@ -0,0 +1,323 @@
+"""
+SQLitePersistence - single-writer, batched SQLite access for the API process.
+
+Opening a fresh connection and committing once per statement costs an fsync
+per write and makes concurrent turns contend on the SQLite write lock. This
+service funnels all writes through one long-lived writer thread instead:
+
+- the writer owns a WAL connection and takes jobs from a bounded queue;
+- jobs that arrive within ``batch_window_ms`` of each other (up to
+  ``batch_max_jobs``) share one ``BEGIN IMMEDIATE ... COMMIT`` transaction,
+  each wrapped in its own SAVEPOINT so a failing job does not roll back the
+  rest of the batch;
+- ``submit()`` returns a ``concurrent.futures.Future`` resolved after the
+  batch commits, so callers that need durability wait on it and the rest
+  fire and forget;
+- if the writer thread dies (the connection cannot be opened, an unexpected
+  error escapes a batch) every pending and later write fails with that error
+  instead of waiting forever, and ``write()`` never waits longer than
+  ``write_timeout_seconds``.
+
+Reads use a small pool of long-lived WAL connections; in WAL mode they never
+block the writer.
+
+Usage:
+    persistence = SQLitePersistence("data/conversations.db")
+
+    persistence.write(_save_snapshot_conn, session_id=..., snapshot=...)   # durable
+    persistence.submit(_write_user_profile, params)                       # async
+
+    with persistence.reader() as conn:
+        rows = conn.execute("SELECT ...").fetchall()
+
+    persistence.close()   # drains the queue
+
+Jobs are called as ``job(conn, *args, **kwargs)`` on the writer thread and
+must not commit or roll back themselves.
+"""
+
+from __future__ import annotations
+
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from src.logger import logger
+
+
+_STOP = object()
+
+
+@dataclass
+class _WriteJob:
+    fn: Callable[..., Any]
+    args: Tuple[Any, ...]
+    kwargs: Dict[str, Any]
+    future: Future = field(default_factory=Future)
+
+
+def _noop(_conn: sqlite3.Connection) -> None:
+    return None
+
+
+class SQLitePersistence:
+    """One writer thread with batched transactions plus a pooled set of readers."""
+
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        timeout_seconds: float = 30.0,
+        busy_timeout_ms: int = 5000,
+        batch_max_jobs: int = 64,
+        batch_window_ms: float = 2.0,
+        reader_pool_size: int = 4,
+        max_pending: int = 10000,
+        write_timeout_seconds: float = 60.0,
+    ):
+        self.db_path = db_path
+        self.timeout_seconds = timeout_seconds
+        self.busy_timeout_ms = busy_timeout_ms
+        self.batch_max_jobs = max(1, batch_max_jobs)
+        self.batch_window_seconds = max(0.0, batch_window_ms) / 1000
+        self.reader_pool_size = max(1, reader_pool_size)
+        self.write_timeout_seconds = write_timeout_seconds
+
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max(0, max_pending))
+        self._writer: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+        # Set when the writer thread exits with an error; fails all writes from then on
+        self._writer_error: Optional[BaseException] = None
+
+        self._readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._readers_created = 0
+
+        self.jobs = 0
+        self.failed_jobs = 0
+        self.batches = 0
+        self.failed_batches = 0
+        self.max_batch = 0
+        self._commit_seconds_total = 0.0
+
+    # ── Connections ───────────────────────────────────────
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.timeout_seconds,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled read connection (rows come back as ``sqlite3.Row``)."""
+        conn = self._acquire_reader()
+        try:
+            yield conn
+        finally:
+            if self._closed:
+                conn.close()
+            else:
+                self._readers.put(conn)
+
+    def _acquire_reader(self) -> sqlite3.Connection:
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            create = self._readers_created < self.reader_pool_size
+            if create:
+                self._readers_created += 1
+        if not create:
+            return self._readers.get(timeout=self.timeout_seconds)
+        try:
+            conn = self._connect()
+        except Exception:
+            with self._lock:
+                self._readers_created -= 1
+            raise
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    # ── Writes ────────────────────────────────────────────
+
+    def submit(self, job: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """Queue ``job(conn, *args, **kwargs)``; the future resolves after its batch commits."""
+        write = _WriteJob(job, args, kwargs)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("SQLitePersistence is closed")
+            if self._writer_error is not None:
+                raise RuntimeError("SQLite writer thread is dead") from self._writer_error
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._run_writer,
+                    name="crm-sales-bot-sqlite-writer",
+                    daemon=True,
+                )
+                self._writer.start()
+        self._queue.put(write, timeout=self.timeout_seconds)
+        if self._writer_error is not None:
+            # The writer died while this job was being queued: nobody will take it
+            self._fail_pending(self._writer_error)
+        return write.future
+
+    def write(self, job: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Queue a job and wait for the durable commit; re-raises the job's error.
+
+        Raises:
+            concurrent.futures.TimeoutError: not committed within ``write_timeout_seconds``.
+        """
+        return self.submit(job, *args, **kwargs).result(timeout=self.write_timeout_seconds)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until everything queued so far is committed."""
+        if self._writer is None:
+            return True
+        try:
+            self.submit(_noop).result(timeout)
+            return True
+        except Exception:
+            return False
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Drain queued writes, stop the writer and close all connections."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            writer = self._writer
+        if writer is not None and writer.is_alive():
+            try:
+                self._queue.put(_STOP, timeout=timeout)
+            except queue.Full:
+                logger.warning("SQLite writer queue full on close", pending=self._queue.qsize())
+            else:
+                writer.join(timeout=timeout)
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def _run_writer(self) -> None:
+        try:
+            self._write_loop()
+        except BaseException as exc:
+            self._writer_error = exc
+            logger.exception("SQLite writer thread died", pending=self._queue.qsize())
+            self._fail_pending(exc)
+
+    def _fail_pending(self, exc: BaseException) -> None:
+        """Fail every queued job with the writer's error (the writer is gone)."""
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if isinstance(item, _WriteJob) and not item.future.done():
+                self.failed_jobs += 1
+                item.future.set_exception(exc)
+
+    def _write_loop(self) -> None:
+        conn = self._connect()
+        try:
+            stop = False
+            while not stop:
+                item = self._queue.get()
+                if item is _STOP:
+                    break
+                batch: List[_WriteJob] = [item]
+                deadline = time.monotonic() + self.batch_window_seconds
+                while len(batch) < self.batch_max_jobs:
+                    remaining = deadline - time.monotonic()
+                    try:
+                        item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is _STOP:
+                        stop = True
+                        break
+                    batch.append(item)
+                try:
+                    self._commit_batch(conn, batch)
+                except BaseException as exc:
+                    for job in batch:
+                        if not job.future.done():
+                            job.future.set_exception(exc)
+                    raise
+        finally:
+            conn.close()
+
+    def _commit_batch(self, conn: sqlite3.Connection, batch: List[_WriteJob]) -> None:
+        started = time.perf_counter()
+        outcomes: List[Tuple[_WriteJob, Any, Optional[BaseException]]] = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for job in batch:
+                conn.execute("SAVEPOINT write_job")
+                try:
+                    value = job.fn(conn, *job.args, **job.kwargs)
+                except Exception as exc:
+                    conn.execute("ROLLBACK TO write_job")
+                    conn.execute("RELEASE write_job")
+                    outcomes.append((job, None, exc))
+                else:
+                    conn.execute("RELEASE write_job")
+                    outcomes.append((job, value, None))
+            conn.execute("COMMIT")
+        except Exception as exc:
+            try:
+                conn.execute("ROLLBACK")
+            except sqlite3.Error:
+                pass
+            self.failed_batches += 1
+            self.failed_jobs += len(batch)
+            logger.exception("SQLite write batch failed", jobs=len(batch))
+            for job in batch:
+                if not job.future.done():
+                    job.future.set_exception(exc)
+            return
+
+        self._commit_seconds_total += time.perf_counter() - started
+        self.batches += 1
+        self.jobs += len(batch)
+        self.max_batch = max(self.max_batch, len(batch))
+        for job, value, error in outcomes:
+            if error is None:
+                job.future.set_result(value)
+                continue
+            self.failed_jobs += 1
+            logger.warning(
+                "SQLite write job failed",
+                job=getattr(job.fn, "__name__", repr(job.fn)),
+                error=str(error),
+            )
+            job.future.set_exception(error)
+
+    # ── Metrics ───────────────────────────────────────────
+
+    def get_stats(self) -> dict:
+        return {
+            "queue_depth": self._queue.qsize(),
+            "jobs": self.jobs,
+            "failed_jobs": self.failed_jobs,
+            "batches": self.batches,
+            "failed_batches": self.failed_batches,
+            "avg_batch": round(self.jobs / self.batches, 2) if self.batches else 0.0,
+            "max_batch": self.max_batch,
+            "avg_commit_ms": round(self._commit_seconds_total / self.batches * 1000, 2) if self.batches else 0.0,
+            "readers": self._readers_created,
+        }
@@ -19,6 +19,7 @@ from pydantic import BaseModel, Field
 
 from src.feature_flags import flags
 from src.logger import logger
+from src.turn_deadline import stage_allowed
 from src.response_routing_contract import (
     build_response_routing_context,
     is_autonomous_response_context,
@@ -144,6 +145,7 @@ class ResponseBoundaryValidator:
             result = llm.generate_structured(
                 prompt,
                 schema=SemanticRelevanceResult,
+                purpose="semantic_relevance",
                 temperature=0.1,
                 num_predict=150,
             )
@@ -154,6 +156,13 @@ class ResponseBoundaryValidator:
 
         if not hasattr(llm, "generate"):
             return None
+        if (
+            getattr(llm, "constrained_decoding", False) is True
+            and getattr(llm, "last_structured_truncated", False) is not True
+        ):
+            # Schema enforced by the decoding grammar: no free-form salvage call
+            # unless the output was cut off at num_predict
+            return None
         try:
             try:
                 raw = llm.generate(
@@ -2353,6 +2362,10 @@ class ResponseBoundaryValidator:
         if not user_message:
             return False
 
+        # Skip condition 6: optional judge does not fit the turn budget (fail-open)
+        if not stage_allowed("semantic_relevance"):
+            return False
+
         prompt = (
             f'Клиент спросил: "{user_message}"\n'
             f'Бот ответил: "{response}"\n\n'
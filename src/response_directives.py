@@ -484,10 +484,10 @@ class ResponseDirectivesBuilder:
         thresholds = get_persona_question_thresholds(persona)
         # Repeated answerable questions (especially pricing) should be answered
         # directly without another clarifying loop.
-        from src.yaml_config.constants import INTENT_CATEGORIES
+        from src.yaml_config.constants import ANSWERABLE_QUESTION_INTENTS, get_intent_category_set
         repeated = getattr(self.envelope, "repeated_question", None)
-        price_related = set(INTENT_CATEGORIES.get("price_related", []))
-        answerable = price_related | set(INTENT_CATEGORIES.get("question", []))
+        price_related = get_intent_category_set("price_related")
+        answerable = ANSWERABLE_QUESTION_INTENTS
         if repeated in price_related:
             directives.suppress_question = True
             directives.question_mode = "suppress"
@@ -533,15 +533,11 @@ class ResponseDirectivesBuilder:
                 # known answerable type (price, technical, features, etc.)
                 # For these, the policy overlay + generator will select the correct
                 # answer template. Adding "ask clarifying" conflicts with answer-first.
-                from src.yaml_config.constants import INTENT_CATEGORIES
-                _answerable = (
-                    set(INTENT_CATEGORIES.get("price_related", []))
-                    | set(INTENT_CATEGORIES.get("question", []))
-                )
-                if envelope.repeated_question not in _answerable:
+                from src.yaml_config.constants import ANSWERABLE_QUESTION_INTENTS, get_intent_category_set
+                if envelope.repeated_question not in ANSWERABLE_QUESTION_INTENTS:
                     directives.ask_clarifying = True
                 # Category-aware repair context
-                _price = set(INTENT_CATEGORIES.get("price_related", []))
+                _price = get_intent_category_set("price_related")
                 if envelope.repeated_question in _price:
                     directives.repair_context = (
                         "Клиент ПОВТОРНО спрашивает о цене! "
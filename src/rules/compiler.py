@@ -0,0 +1,197 @@
+"""
+Rule compilation - flow rules and transitions as prebuilt closures.
+
+A rule value from flow YAML (simple string, conditional dict, rule chain,
+composite AND/OR/NOT condition) is compiled once into a CompiledRule whose
+``evaluate(ctx, trace)`` runs with no type dispatch, expression parsing,
+imports or repr() calls. Compiled rules are cached per (kind, state, intent)
+and re-compiled only when the rule value at that key changes. Values of a
+frozen (shared) FlowConfig cannot change, so for them a lookup is a single
+identity check; mutable values are compared by content.
+
+Two compilers share this module:
+- RuleResolver.compile_rule (src/rules/resolver.py): strict semantics,
+  malformed rules raise, traces are recorded when a trace is passed.
+- compile_source_rule: lenient semantics of the Knowledge Sources that
+  resolve rules themselves (IntentProcessorSource, TransitionResolverSource):
+  malformed entries are skipped.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, TYPE_CHECKING
+
+from src.config_loader import FrozenDict, FrozenList
+
+if TYPE_CHECKING:
+    from src.conditions.trace import EvaluationTrace
+
+# Compiled rule body: (ctx, trace) -> action/state or None
+RuleProgram = Callable[[Any, Optional["EvaluationTrace"]], Optional[str]]
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    """
+    A rule value compiled into a closure.
+
+    Attributes:
+        source: Plain copy of the rule value (dicts/lists), used to detect
+            that the rule at a cache key has changed
+        evaluate: Compiled body, called as evaluate(ctx, trace)
+        needs_context: Whether evaluation can reach a condition (callers may
+            skip building an EvaluatorContext when it cannot)
+    """
+    source: Any
+    evaluate: RuleProgram
+    needs_context: bool = True
+
+
+def plain_rule(rule: Any) -> Any:
+    """Copy a rule value into plain dicts/lists (FrozenDict -> dict)."""
+    if isinstance(rule, dict):
+        return {key: plain_rule(value) for key, value in rule.items()}
+    if isinstance(rule, list):
+        return [plain_rule(item) for item in rule]
+    return rule
+
+
+_NO_ORIGIN = object()
+
+
+def _is_immutable_rule(rule: Any) -> bool:
+    """Whether a rule value can never change (strings, frozen FlowConfig values)."""
+    return isinstance(rule, (str, FrozenDict, FrozenList))
+
+
+class RuleProgramCache:
+    """
+    Compiled rules keyed by (kind, state, intent).
+
+    An entry is reused while the rule value at its key is the immutable
+    object it was compiled from (identity check) or, for mutable values,
+    equal to it. ``bind()`` drops all entries when the registry or
+    expression parser they were compiled against is replaced.
+    """
+
+    def __init__(self):
+        self._programs: Dict[Hashable, CompiledRule] = {}
+        # key -> immutable rule object the program was compiled from
+        self._origins: Dict[Hashable, Any] = {}
+        self._bound: Tuple[Any, ...] = ()
+
+    def bind(self, *dependencies: Any) -> None:
+        """Clear compiled rules if any dependency (by identity) changed."""
+        bound = self._bound
+        if len(bound) != len(dependencies) or any(
+            old is not new for old, new in zip(bound, dependencies)
+        ):
+            self._programs.clear()
+            self._origins.clear()
+            self._bound = dependencies
+
+    def get(
+        self,
+        key: Hashable,
+        rule: Any,
+        compile_fn: Callable[[Any], CompiledRule],
+    ) -> CompiledRule:
+        """Return the compiled rule for key, compiling it on first use or change."""
+        if self._origins.get(key, _NO_ORIGIN) is rule:
+            return self._programs[key]
+        program = self._programs.get(key)
+        if program is None or program.source != rule:
+            program = compile_fn(rule)
+        self.put(key, program, origin=rule)
+        return program
+
+    def put(self, key: Hashable, program: CompiledRule, origin: Any = _NO_ORIGIN) -> None:
+        """Store a compiled rule; ``origin`` is the rule value it was compiled from."""
+        self._programs[key] = program
+        if origin is not _NO_ORIGIN and _is_immutable_rule(origin):
+            self._origins[key] = origin
+        else:
+            self._origins.pop(key, None)
+
+    def clear(self) -> None:
+        self._programs.clear()
+        self._origins.clear()
+
+    def __len__(self) -> int:
+        return len(self._programs)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._programs
+
+
+def compile_source_rule(
+    rule: Any,
+    compile_condition: Callable[[Any], Callable[[Any], bool]],
+) -> CompiledRule:
+    """
+    Compile a rule with Knowledge Source semantics.
+
+    - "action" -> action
+    - {"when": cond, "then": action} -> action if cond else None
+      (entries with an empty "when" or "then" never match)
+    - [{...}, {...}, "default"] -> first matching action; a string entry
+      ends the chain; other entries are skipped
+
+    Args:
+        rule: Rule value (str, dict or list; callers handle other types)
+        compile_condition: condition -> callable(eval_ctx) -> bool, with the
+            source's own error handling
+
+    Returns:
+        CompiledRule; evaluate(eval_ctx, trace) ignores trace
+    """
+    source = plain_rule(rule)
+
+    if isinstance(rule, str):
+        def evaluate_simple(ctx: Any, trace: Any = None) -> Optional[str]:
+            return rule
+        return CompiledRule(source, evaluate_simple, needs_context=False)
+
+    if isinstance(rule, dict):
+        condition = rule.get("when")
+        action = rule.get("then")
+        if not (condition and action):
+            return CompiledRule(source, _no_match, needs_context=False)
+        check = compile_condition(condition)
+
+        def evaluate_conditional(ctx: Any, trace: Any = None) -> Optional[str]:
+            return action if check(ctx) else None
+        return CompiledRule(source, evaluate_conditional)
+
+    # Rule chain: flatten into (check, action) steps; check None = default
+    steps: List[Tuple[Optional[Callable[[Any], bool]], str]] = []
+    for item in rule:
+        if isinstance(item, str):
+            steps.append((None, item))
+            break
+        if isinstance(item, dict):
+            condition = item.get("when")
+            action = item.get("then")
+            if condition and action:
+                steps.append((compile_condition(condition), action))
+
+    def evaluate_chain(ctx: Any, trace: Any = None) -> Optional[str]:
+        for check, action in steps:
+            if check is None or check(ctx):
+                return action
+        return None
+
+    needs_context = any(check is not None for check, _ in steps)
+    return CompiledRule(source, evaluate_chain, needs_context=needs_context)
+
+
+def _no_match(ctx: Any, trace: Any = None) -> Optional[str]:
+    return None
+
+
+__all__ = [
+    "CompiledRule",
+    "RuleProgram",
+    "RuleProgramCache",
+    "compile_source_rule",
+    "plain_rule",
+]
@@ -15,8 +15,10 @@ from typing import Dict, List, Optional, Any, Union, Set, Iterator, TYPE_CHECKIN
 from dataclasses import dataclass, field
 import logging
 
+from src.conditions.expression_parser import compile_condition_value
 from src.conditions.registry import ConditionRegistry, ConditionNotFoundError
 from src.conditions.trace import EvaluationTrace, Resolution
+from src.rules.compiler import CompiledRule, RuleProgram, RuleProgramCache, plain_rule
 
 if TYPE_CHECKING:
     from src.conditions.expression_parser import ConditionExpressionParser
@@ -216,6 +218,10 @@ class RuleResolver:
     - Rule chains (list with conditions and default)
     - Optional tracing for debugging
 
+    Rules are compiled into closures (see src/rules/compiler.py) on first use
+    and cached per (state, intent); compile_flow() compiles a whole flow at
+    config load.
+
     Example:
         resolver = RuleResolver(registry)
 
@@ -264,6 +270,46 @@ class RuleResolver:
         self.default_action = default_action or self.DEFAULT_ACTION
         self.expression_parser = expression_parser
         self.taxonomy_registry = taxonomy_registry
+        self._programs = RuleProgramCache()
+
+    def compile_flow(self, flow_config: Any) -> int:
+        """
+        Compile rules and transitions of every state of a flow.
+
+        Args:
+            flow_config: FlowConfig (or any object with a ``states`` dict)
+
+        Returns:
+            Number of compiled rules
+        """
+        self._programs.bind(self.registry, self.expression_parser)
+        compiled = 0
+        for state, state_config in (getattr(flow_config, "states", None) or {}).items():
+            if not isinstance(state_config, dict):
+                continue
+            for kind in ("rules", "transitions"):
+                for intent, rule in (state_config.get(kind) or {}).items():
+                    self._programs.put(
+                        (kind, state, intent), self.compile_rule(rule, intent), origin=rule
+                    )
+                    compiled += 1
+        return compiled
+
+    def compile_rule(self, rule: RuleValue, rule_name: str) -> CompiledRule:
+        """
+        Compile a rule value into a CompiledRule.
+
+        Invalid rules compile fine and raise the same errors as before when
+        evaluated, so unreachable chain entries stay harmless.
+        """
+        return CompiledRule(plain_rule(rule), self._compile_rule(rule, rule_name))
+
+    def _program(self, kind: str, state: str, intent: str, rule: RuleValue) -> RuleProgram:
+        """Cached compiled program of rule at (kind, state, intent)."""
+        self._programs.bind(self.registry, self.expression_parser)
+        return self._programs.get(
+            (kind, state, intent), rule, lambda value: self.compile_rule(value, intent)
+        ).evaluate
 
     def resolve_action(
         self,
@@ -298,12 +344,7 @@ class RuleResolver:
         """
         # 1. Try state rules first (exact match)
         if intent in state_rules:
-            result = self._evaluate_rule(
-                rule=state_rules[intent],
-                rule_name=intent,
-                ctx=ctx,
-                trace=trace
-            )
+            result = self._program("rules", state, intent, state_rules[intent])(ctx, trace)
             if result is not None:
                 return RuleResult(
                     action=result,
@@ -316,12 +357,7 @@ class RuleResolver:
 
         # 2. Try global rules (exact match)
         if intent in global_rules:
-            result = self._evaluate_rule(
-                rule=global_rules[intent],
-                rule_name=intent,
-                ctx=ctx,
-                trace=trace
-            )
+            result = self._program("global_rules", "", intent, global_rules[intent])(ctx, trace)
             if result is not None:
                 return RuleResult(
                     action=result,
@@ -419,14 +455,7 @@ class RuleResolver:
                 trace.set_result("(stay)", Resolution.NONE)
             return None
 
-        result = self._evaluate_rule(
-            rule=transitions[intent],
-            rule_name=intent,
-            ctx=ctx,
-            trace=trace
-        )
-
-        return result
+        return self._program("transitions", state, intent, transitions[intent])(ctx, trace)
 
     def _evaluate_rule(
         self,
@@ -436,12 +465,7 @@ class RuleResolver:
         trace: Optional[EvaluationTrace] = None
     ) -> Optional[str]:
         """
-        Evaluate a single rule.
-
-        Handles all rule formats:
-        - Simple string: return as-is
-        - Conditional dict: evaluate condition, return "then" if True
-        - Rule chain (list): evaluate each condition in order
+        Evaluate a single rule (uncached; resolve_* use compiled programs).
 
         Args:
             rule: The rule to evaluate
@@ -452,41 +476,71 @@ class RuleResolver:
         Returns:
             Resolved action/state, or None if no match
         """
+        return self._compile_rule(rule, rule_name)(ctx, trace)
+
+    def _evaluate_conditional_rule(
+        self,
+        rule: ConditionalRule,
+        rule_name: str,
+        ctx: Any,
+        trace: Optional[EvaluationTrace] = None
+    ) -> Optional[str]:
+        """Evaluate a conditional rule dict (see _compile_conditional_rule)."""
+        return self._compile_conditional_rule(rule, rule_name)(ctx, trace)
+
+    def _evaluate_rule_chain(
+        self,
+        chain: RuleChain,
+        rule_name: str,
+        ctx: Any,
+        trace: Optional[EvaluationTrace] = None
+    ) -> Optional[str]:
+        """Evaluate a rule chain (see _compile_rule_chain)."""
+        return self._compile_rule_chain(chain, rule_name)(ctx, trace)
+
+    def _compile_rule(self, rule: RuleValue, rule_name: str) -> RuleProgram:
+        """
+        Compile a single rule.
+
+        Handles all rule formats:
+        - Simple string: return as-is
+        - None: explicit "stay in current state"
+        - Conditional dict: evaluate condition, return "then" if True
+        - Rule chain (list): evaluate each condition in order
+
+        Args:
+            rule: The rule to compile
+            rule_name: Name of the rule (for tracing and errors)
+
+        Returns:
+            program(ctx, trace) -> resolved action/state, or None if no match
+        """
         # Simple string rule
         if isinstance(rule, str):
-            if trace:
-                trace.set_result(rule, Resolution.SIMPLE)
-            return rule
+            return _simple_program(rule)
 
         # None - explicit "stay in current state"
         if rule is None:
-            if trace:
-                trace.set_result("(stay)", Resolution.NONE)
-            return None
+            return _stay_program
 
         # Conditional dict: {"when": "condition", "then": "action"}
         if isinstance(rule, dict):
-            return self._evaluate_conditional_rule(rule, rule_name, ctx, trace)
+            return self._compile_conditional_rule(rule, rule_name)
 
         # Rule chain (list)
         if isinstance(rule, list):
-            return self._evaluate_rule_chain(rule, rule_name, ctx, trace)
+            return self._compile_rule_chain(rule, rule_name)
 
         # Unknown format
-        raise InvalidRuleFormatError(
+        return _raising_program(
+            InvalidRuleFormatError,
             rule_name,
             f"unexpected type {type(rule).__name__}"
         )
 
-    def _evaluate_conditional_rule(
-        self,
-        rule: ConditionalRule,
-        rule_name: str,
-        ctx: Any,
-        trace: Optional[EvaluationTrace] = None
-    ) -> Optional[str]:
+    def _compile_conditional_rule(self, rule: ConditionalRule, rule_name: str) -> RuleProgram:
         """
-        Evaluate a conditional rule dict.
+        Compile a conditional rule dict.
 
         Formats:
         - Simple: {"when": "condition_name", "then": "action"}
@@ -497,51 +551,46 @@ class RuleResolver:
         Args:
             rule: The conditional rule dict
             rule_name: Name of the rule
-            ctx: Context for evaluation
-            trace: Optional trace
 
         Returns:
-            Action if condition is True, None otherwise
+            program returning the action if the condition is True, None otherwise
         """
         if "when" not in rule or "then" not in rule:
-            raise InvalidRuleFormatError(
+            return _raising_program(
+                InvalidRuleFormatError,
                 rule_name,
                 "conditional rule must have 'when' and 'then' keys"
             )
 
-        condition = rule["when"]
+        condition = plain_rule(rule["when"])
         action = rule["then"]
+        condition_desc = str(condition) if isinstance(condition, dict) else condition
+        evaluate_condition = compile_condition_value(
+            condition, self.registry, self.expression_parser, rule_name
+        )
 
-        # Evaluate condition using shared utility (handles str + dict)
-        from src.conditions.expression_parser import evaluate_condition_value
-        try:
-            result = evaluate_condition_value(
-                condition, ctx, self.registry, self.expression_parser, trace, rule_name
-            )
-            condition_desc = str(condition) if isinstance(condition, dict) else condition
-        except ConditionNotFoundError:
-            raise UnknownConditionError(condition, rule_name)
-        except ValueError as e:
-            raise InvalidRuleFormatError(rule_name, str(e))
-        except TypeError as e:
-            raise InvalidRuleFormatError(rule_name, str(e))
-
-        if result:
-            if trace:
-                trace.set_result(action, Resolution.CONDITION_MATCHED, condition_desc)
-            return action
+        def program(ctx: Any, trace: Optional[EvaluationTrace] = None) -> Optional[str]:
+            try:
+                result = evaluate_condition(ctx, trace)
+            except ConditionNotFoundError:
+                raise UnknownConditionError(condition, rule_name)
+            except ValueError as e:
+                raise InvalidRuleFormatError(rule_name, str(e))
+            except TypeError as e:
+                raise InvalidRuleFormatError(rule_name, str(e))
+
+            if result:
+                if trace is not None:
+                    trace.set_result(action, Resolution.CONDITION_MATCHED, condition_desc)
+                return action
 
-        return None
+            return None
 
-    def _evaluate_rule_chain(
-        self,
-        chain: RuleChain,
-        rule_name: str,
-        ctx: Any,
-        trace: Optional[EvaluationTrace] = None
-    ) -> Optional[str]:
+        return program
+
+    def _compile_rule_chain(self, chain: RuleChain, rule_name: str) -> RuleProgram:
         """
-        Evaluate a rule chain (list of conditions with default).
+        Compile a rule chain (list of conditions with default).
 
         Format: [{"when": "cond1", "then": "act1"}, {"when": "cond2", "then": "act2"}, "default"]
 
@@ -550,59 +599,58 @@ class RuleResolver:
         - None: stay in current state
         - Dict: another conditional rule
 
+        A string or None before the last element ends the chain. The chain is
+        flattened into (program, is_terminal) steps.
+
         Args:
             chain: List of conditional rules with optional default
             rule_name: Name of the rule
-            ctx: Context for evaluation
-            trace: Optional trace
 
         Returns:
-            First matching action, default, or None
+            program returning the first matching action, the default, or None
         """
         if not chain:
-            raise InvalidRuleFormatError(rule_name, "empty rule chain")
+            return _raising_program(InvalidRuleFormatError, rule_name, "empty rule chain")
 
+        steps: List[Any] = []
         default_value: Optional[str] = None
         has_default = False
+        last = len(chain) - 1
 
         for i, item in enumerate(chain):
-            # Check if this is the default (last string or None)
-            if isinstance(item, str) and i == len(chain) - 1:
+            # Default (last string or None)
+            if (isinstance(item, str) or item is None) and i == last:
                 default_value = item
                 has_default = True
                 continue
-            if item is None and i == len(chain) - 1:
-                default_value = None
-                has_default = True
-                continue
 
-            # Evaluate conditional rule
             if isinstance(item, dict):
-                result = self._evaluate_conditional_rule(item, rule_name, ctx, trace)
-                if result is not None:
-                    return result
+                steps.append((self._compile_conditional_rule(item, rule_name), False))
             elif isinstance(item, str):
                 # String in middle of chain - treat as simple rule
-                if trace:
-                    trace.set_result(item, Resolution.SIMPLE)
-                return item
+                steps.append((_simple_program(item), True))
+                break
             elif item is None:
                 # None in middle - stay
-                if trace:
-                    trace.set_result("(stay)", Resolution.NONE)
-                return None
+                steps.append((_stay_program, True))
+                break
 
-        # Return default if we have one
-        if has_default:
-            if trace:
-                trace.set_result(
-                    default_value or "(stay)",
-                    Resolution.DEFAULT
-                )
-            return default_value
+        def program(ctx: Any, trace: Optional[EvaluationTrace] = None) -> Optional[str]:
+            for step, is_terminal in steps:
+                result = step(ctx, trace)
+                if is_terminal or result is not None:
+                    return result
+
+            # Return default if we have one
+            if has_default:
+                if trace is not None:
+                    trace.set_result(default_value or "(stay)", Resolution.DEFAULT)
+                return default_value
 
-        # No match and no default
-        return None
+            # No match and no default
+            return None
+
+        return program
 
     def validate_config(
         self,
@@ -956,6 +1004,27 @@ class RuleResolver:
                 )
 
 
+def _simple_program(rule: str) -> RuleProgram:
+    def program(ctx: Any, trace: Optional[EvaluationTrace] = None) -> Optional[str]:
+        if trace is not None:
+            trace.set_result(rule, Resolution.SIMPLE)
+        return rule
+    return program
+
+
+def _stay_program(ctx: Any, trace: Optional[EvaluationTrace] = None) -> Optional[str]:
+    if trace is not None:
+        trace.set_result("(stay)", Resolution.NONE)
+    return None
+
+
+def _raising_program(error_cls: type, *args: Any) -> RuleProgram:
+    """Program for an invalid rule: raises only when actually evaluated."""
+    def program(ctx: Any, trace: Optional[EvaluationTrace] = None) -> Optional[str]:
+        raise error_cls(*args)
+    return program
+
+
 def create_resolver(registry: ConditionRegistry = None, taxonomy_registry=None) -> RuleResolver:
     """
     Factory function to create RuleResolver.
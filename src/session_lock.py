@@ -51,3 +51,24 @@ class SessionLockManager:
                     yield
                 finally:
                     fcntl.flock(handle, fcntl.LOCK_UN)
+
+    @contextmanager
+    def try_lock(self, session_id: str) -> Iterator[bool]:
+        """Non-blocking variant of lock(): yields False if the session is busy."""
+        local_lock = self._get_local_lock(session_id)
+        if not local_lock.acquire(blocking=False):
+            yield False
+            return
+        try:
+            with open(self._lock_path(session_id), "a", encoding="utf-8") as handle:
+                try:
+                    fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    yield False
+                    return
+                try:
+                    yield True
+                finally:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+        finally:
+            local_lock.release()
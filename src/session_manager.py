@@ -3,16 +3,37 @@ Session Manager - caches active sessions and loads snapshots only on cache miss.
 
 Snapshot loading happens only when session is not in memory.
 Sessions are closed explicitly via close_session() call from the server.
+
+The cache is an LRU bounded by `max_sessions` and an approximate memory
+budget (`max_memory_bytes`). The resident size is kept as a running total
+updated on insert, removal and size refresh, so the capacity check is O(1).
+Least-recently-used sessions are evicted through `_persist_snapshot` (local
+buffer) and restored through `_restore_from_snapshot` on their next message.
+With `background_eviction=True` the request path only wakes an evictor
+thread, so a request never pays for serialising another session.
+
+With a `compaction_worker`, LLM history compaction is scheduled from `touch()`
+after every turn and runs in the background; snapshot saves only read the
+latest compact (see src/history_compaction_worker.py).
+
+Sessions in a final state are also kept in a min-heap ordered by
+`final_since`, so `serialize_inactive_final_sessions` pops only the expired
+ones instead of scanning the whole cache. Heap items are invalidated lazily:
+an item is live only while its session is cached with the same
+`final_since`.
 """
 
 from __future__ import annotations
 
+import heapq
 import time
 import threading
+from collections import OrderedDict, deque
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from src.bot import SalesBot
+from src.history_compaction_worker import HistoryCompactionWorker
 from src.logger import logger
 from src.snapshot_buffer import LocalSnapshotBuffer
 from src.session_lock import SessionLockManager
@@ -24,6 +45,33 @@ class SessionEntry:
     last_activity: float
     created_at: float
     final_since: Optional[float] = None
+    approx_bytes: int = 0
+
+
+# Approximate resident size of one SalesBot without history: classifier,
+# generator, orchestrator, context window and response embeddings.
+DEFAULT_SESSION_BASE_BYTES = 4 * 1024 * 1024
+# Python str + projections kept per character of dialogue history
+HISTORY_BYTES_PER_CHAR = 8
+# How many evicted session keys are remembered to tag their restores
+EVICTED_KEYS_LIMIT = 10000
+# Stale heap items tolerated before the final-session heap is rebuilt
+FINAL_HEAP_SLACK = 64
+
+
+def estimate_session_bytes(bot: Any, base_bytes: int = DEFAULT_SESSION_BASE_BYTES) -> int:
+    """Cheap resident-size estimate: fixed per-bot cost plus dialogue history."""
+    try:
+        history = bot.history or []
+        chars = sum(
+            len(value)
+            for turn in history
+            for value in turn.values()
+            if isinstance(value, str)
+        )
+    except Exception:
+        chars = 0
+    return int(base_bytes + chars * HISTORY_BYTES_PER_CHAR)
 
 
 @dataclass(frozen=True)
@@ -46,8 +94,14 @@ class SessionManager:
         lock_manager: Optional[SessionLockManager] = None,
         require_client_id: bool = True,
         now_provider: Optional[Callable[[], float]] = None,
+        max_sessions: Optional[int] = None,
+        max_memory_bytes: Optional[int] = None,
+        size_estimator: Optional[Callable[[SalesBot], int]] = None,
+        compaction_worker: Optional[HistoryCompactionWorker] = None,
+        background_eviction: bool = False,
     ):
-        self._sessions: Dict[Tuple[str, str], SessionEntry] = {}
+        # LRU order: least recently used first
+        self._sessions: "OrderedDict[Tuple[str, str], SessionEntry]" = OrderedDict()
         self._load_snapshot = load_snapshot
         self._save_snapshot = save_snapshot
         self._load_history_tail = load_history_tail
@@ -59,6 +113,30 @@ class SessionManager:
         self._require_client_id = require_client_id
         self._cache_lock = threading.RLock()
 
+        self._max_sessions = max_sessions if max_sessions and max_sessions > 0 else None
+        self._max_memory_bytes = (
+            max_memory_bytes if max_memory_bytes and max_memory_bytes > 0 else None
+        )
+        self._size_estimator = size_estimator or estimate_session_bytes
+        # Sum of approx_bytes of cached entries, guarded by _cache_lock
+        self._resident_bytes = 0
+        self._evictions = 0
+        self._eviction_failures = 0
+        self._restores = 0
+        self._restores_after_eviction = 0
+        self._restore_latencies_ms: deque = deque(maxlen=512)
+        self._evicted_keys: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        self._compaction_worker = compaction_worker
+        # (final_since, cache_key), guarded by _cache_lock
+        self._final_heap: List[Tuple[float, Tuple[str, str]]] = []
+        self._eviction_wakeup: Optional[threading.Event] = None
+        self._eviction_stop: Optional[threading.Event] = None
+        self._eviction_thread: Optional[threading.Thread] = None
+        if background_eviction and (
+            self._max_sessions is not None or self._max_memory_bytes is not None
+        ):
+            self._start_evictor()
+
     def _normalize_client_id(self, client_id: Optional[str]) -> str:
         if client_id is None:
             return ""
@@ -240,6 +318,8 @@ class SessionManager:
 
         with self._cache_lock:
             entry = self._sessions.get(cache_key)
+            if entry is not None:
+                self._sessions.move_to_end(cache_key)
         if entry is not None:
             if flow_name or config_name:
                 current_flow = getattr(entry.bot, "_flow", None)
@@ -274,6 +354,7 @@ class SessionManager:
 
         bot = None
         source = "new"
+        restore_started = time.perf_counter()
         local_snapshot = self._buffer.get(session_id, client_id=normalized_client_id)
         if local_snapshot:
             if self._snapshot_matches_client(local_snapshot, client_id):
@@ -353,6 +434,8 @@ class SessionManager:
                 session_id=session_id,
                 client_id=normalized_client_id,
             )
+        else:
+            self._record_restore(cache_key, (time.perf_counter() - restore_started) * 1000)
 
         entry = SessionEntry(
             bot=bot,
@@ -360,8 +443,7 @@ class SessionManager:
             created_at=now,
             final_since=now if bot.state_machine.is_final() else None,
         )
-        with self._cache_lock:
-            self._sessions[cache_key] = entry
+        self._store_entry(cache_key, entry)
         return SessionAcquireResult(bot=bot, source=source)
 
     def _restart_session_with_status_locked(
@@ -397,8 +479,7 @@ class SessionManager:
             created_at=now,
             final_since=now if bot.state_machine.is_final() else None,
         )
-        with self._cache_lock:
-            self._sessions[cache_key] = entry
+        self._store_entry(cache_key, entry)
 
         logger.info(
             "Session restarted with fresh flow",
@@ -532,14 +613,25 @@ class SessionManager:
             entry = self._sessions.get(cache_key)
             if entry is None:
                 return False
+            self._sessions.move_to_end(cache_key)
             entry.last_activity = now
-            if is_final is None:
-                return True
-            if is_final:
-                entry.final_since = entry.final_since or now
-            else:
-                entry.final_since = None
-            return True
+            if is_final is not None:
+                if is_final:
+                    if entry.final_since is None:
+                        entry.final_since = now
+                        self._track_final(cache_key, entry)
+                else:
+                    entry.final_since = None
+        # History grew during the turn: refresh the size estimate
+        approx_bytes = self._size_estimator(entry.bot)
+        with self._cache_lock:
+            if self._sessions.get(cache_key) is entry:
+                self._resident_bytes += approx_bytes - entry.approx_bytes
+            entry.approx_bytes = approx_bytes
+        if self._compaction_worker is not None:
+            self._compaction_worker.schedule(cache_key, entry.bot)
+        self._request_capacity(protect=cache_key)
+        return True
 
     def serialize_inactive_final_sessions(self, max_idle_seconds: float) -> int:
         """
@@ -547,24 +639,46 @@ class SessionManager:
         than max_idle_seconds.
         """
         cutoff = self._now() - float(max_idle_seconds)
+        targets: List[Tuple[str, str]] = []
         with self._cache_lock:
-            targets = [
-                (client_id, session_id)
-                for (client_id, session_id), entry in self._sessions.items()
-                if entry.final_since is not None and entry.final_since <= cutoff
-            ]
+            while self._final_heap and self._final_heap[0][0] <= cutoff:
+                final_since, cache_key = heapq.heappop(self._final_heap)
+                entry = self._sessions.get(cache_key)
+                if entry is not None and entry.final_since == final_since:
+                    targets.append(cache_key)
 
         serialized = 0
-        for client_id, session_id in targets:
-            if self.close_session(
-                session_id,
-                client_id=client_id or None,
-                durable=True,
-                require_final_since_at_or_before=cutoff,
-            ):
+        for index, (client_id, session_id) in enumerate(targets):
+            try:
+                closed = self.close_session(
+                    session_id,
+                    client_id=client_id or None,
+                    durable=True,
+                    require_final_since_at_or_before=cutoff,
+                )
+            except Exception:
+                # Keep the rest expirable: the next sweep retries them
+                with self._cache_lock:
+                    for cache_key in targets[index:]:
+                        entry = self._sessions.get(cache_key)
+                        if entry is not None and entry.final_since is not None:
+                            self._track_final(cache_key, entry)
+                raise
+            if closed:
                 serialized += 1
         return serialized
 
+    def _track_final(self, cache_key: Tuple[str, str], entry: SessionEntry) -> None:
+        """Caller holds _cache_lock. Schedule a final session for expiry."""
+        heapq.heappush(self._final_heap, (entry.final_since, cache_key))
+        if len(self._final_heap) > 2 * len(self._sessions) + FINAL_HEAP_SLACK:
+            self._final_heap = [
+                (item.final_since, key)
+                for key, item in self._sessions.items()
+                if item.final_since is not None
+            ]
+            heapq.heapify(self._final_heap)
+
     def close_all_sessions(self, *, durable: bool = True) -> int:
         """Serialize and remove all cached sessions."""
         with self._cache_lock:
@@ -580,6 +694,184 @@ class SessionManager:
                 closed += 1
         return closed
 
+    # =========================================================================
+    # LRU CAPACITY
+    # =========================================================================
+
+    def _store_entry(self, cache_key: Tuple[str, str], entry: SessionEntry) -> None:
+        entry.approx_bytes = self._size_estimator(entry.bot)
+        with self._cache_lock:
+            self._pop_entry(cache_key)
+            self._sessions[cache_key] = entry
+            self._resident_bytes += entry.approx_bytes
+            if entry.final_since is not None:
+                self._track_final(cache_key, entry)
+        self._request_capacity(protect=cache_key)
+
+    def _pop_entry(self, cache_key: Tuple[str, str]) -> Optional[SessionEntry]:
+        """Caller holds _cache_lock. Remove an entry and its bytes from the total."""
+        entry = self._sessions.pop(cache_key, None)
+        if entry is not None:
+            self._resident_bytes -= entry.approx_bytes
+        return entry
+
+    def _over_capacity(self) -> bool:
+        """Caller holds _cache_lock."""
+        if self._max_sessions is not None and len(self._sessions) > self._max_sessions:
+            return True
+        if self._max_memory_bytes is not None:
+            return self._resident_bytes > self._max_memory_bytes
+        return False
+
+    def _request_capacity(self, *, protect: Optional[Tuple[str, str]] = None) -> None:
+        """Evict inline, or wake the evictor thread when eviction runs in background."""
+        if self._eviction_wakeup is None:
+            self._enforce_capacity(protect=protect)
+            return
+        with self._cache_lock:
+            over = self._over_capacity()
+        if over:
+            self._eviction_wakeup.set()
+
+    def _start_evictor(self) -> None:
+        wakeup = threading.Event()
+        stop_event = threading.Event()
+
+        def _loop() -> None:
+            while True:
+                wakeup.wait()
+                wakeup.clear()
+                if stop_event.is_set():
+                    return
+                try:
+                    self._enforce_capacity()
+                except Exception:
+                    logger.exception("Background session eviction failed")
+
+        self._eviction_wakeup = wakeup
+        self._eviction_stop = stop_event
+        self._eviction_thread = threading.Thread(
+            target=_loop,
+            name="crm-sales-bot-session-evictor",
+            daemon=True,
+        )
+        self._eviction_thread.start()
+
+    def stop_background_eviction(self, timeout: float = 2.0) -> None:
+        """Stop the evictor thread (no-op without background eviction)."""
+        if self._eviction_stop is not None and self._eviction_wakeup is not None:
+            self._eviction_stop.set()
+            self._eviction_wakeup.set()
+        if self._eviction_thread is not None:
+            self._eviction_thread.join(timeout=timeout)
+        self._eviction_thread = None
+
+    def _enforce_capacity(self, *, protect: Optional[Tuple[str, str]] = None) -> int:
+        """
+        Evict least-recently-used sessions until the cache fits its limits.
+
+        `protect` (the session being served) is never evicted. Sessions whose
+        lock is held by an in-flight turn are skipped.
+        """
+        if self._max_sessions is None and self._max_memory_bytes is None:
+            return 0
+        evicted = 0
+        skipped = set()
+        while True:
+            with self._cache_lock:
+                if not self._over_capacity():
+                    break
+                victim = next(
+                    (key for key in self._sessions if key != protect and key not in skipped),
+                    None,
+                )
+            if victim is None:
+                break
+            if self._evict(victim):
+                evicted += 1
+            else:
+                skipped.add(victim)
+        return evicted
+
+    def _evict(self, cache_key: Tuple[str, str]) -> bool:
+        client_id, session_id = cache_key
+        lock_key = self._session_lock_key(session_id, client_id or None)
+        with self._lock.try_lock(lock_key) as acquired:
+            if not acquired:
+                return False
+            with self._cache_lock:
+                entry = self._sessions.get(cache_key)
+            if entry is None:
+                return False
+            try:
+                snapshot = entry.bot.to_snapshot(compact_history=True, history_tail_size=4)
+                self._persist_snapshot(
+                    session_id,
+                    client_id=client_id or None,
+                    snapshot=snapshot,
+                    durable=False,
+                )
+            except Exception:
+                self._eviction_failures += 1
+                logger.exception(
+                    "Session eviction failed",
+                    session_id=session_id,
+                    client_id=client_id or None,
+                )
+                return False
+            self._discard_compaction(cache_key)
+            with self._cache_lock:
+                self._pop_entry(cache_key)
+                self._evictions += 1
+                self._evicted_keys[cache_key] = self._now()
+                self._evicted_keys.move_to_end(cache_key)
+                while len(self._evicted_keys) > EVICTED_KEYS_LIMIT:
+                    self._evicted_keys.popitem(last=False)
+        logger.info(
+            "Session evicted from cache",
+            session_id=session_id,
+            client_id=client_id or None,
+            approx_bytes=entry.approx_bytes,
+        )
+        return True
+
+    def _discard_compaction(self, cache_key: Tuple[str, str]) -> None:
+        if self._compaction_worker is not None:
+            self._compaction_worker.discard(cache_key)
+
+    def _record_restore(self, cache_key: Tuple[str, str], latency_ms: float) -> None:
+        with self._cache_lock:
+            self._restores += 1
+            self._restore_latencies_ms.append(latency_ms)
+            if self._evicted_keys.pop(cache_key, None) is not None:
+                self._restores_after_eviction += 1
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Resident sessions, memory estimate, evictions and restore latency."""
+        with self._cache_lock:
+            latencies = sorted(self._restore_latencies_ms)
+            return {
+                "resident_sessions": len(self._sessions),
+                "approx_memory_bytes": self._resident_bytes,
+                "max_sessions": self._max_sessions,
+                "max_memory_bytes": self._max_memory_bytes,
+                "final_expiry_heap": len(self._final_heap),
+                "evictions": self._evictions,
+                "eviction_failures": self._eviction_failures,
+                "restores": self._restores,
+                "restores_after_eviction": self._restores_after_eviction,
+                "restore_latency_ms": {
+                    "avg": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+                    "p95": round(latencies[int(0.95 * (len(latencies) - 1))], 2) if latencies else 0.0,
+                    "max": round(latencies[-1], 2) if latencies else 0.0,
+                },
+                "compaction": (
+                    self._compaction_worker.get_stats()
+                    if self._compaction_worker is not None
+                    else None
+                ),
+            }
+
     def save(self, session_id: str, client_id: Optional[str] = None) -> None:
         """Save session snapshot to local buffer (with compaction)."""
         target_keys: List[Tuple[str, str]] = []
@@ -672,8 +964,9 @@ class SessionManager:
             snapshot=snapshot,
             durable=durable,
         )
+        self._discard_compaction(cache_key)
         with self._cache_lock:
-            self._sessions.pop(cache_key, None)
+            self._pop_entry(cache_key)
         logger.info(
             "Session closed and snapshot created",
             session_id=session_id,
@@ -25,6 +25,36 @@ DEFAULTS = {
         "timeout": 600,  # Increased for larger structured-output calls
         "num_ctx": 16384,
         "stream": False,
+        "endpoints": [],  # >= 2 URLs enable the multi-endpoint pool (src/llm_pool.py)
+        "pool": {
+            "sticky_sessions": True,
+            "circuit_breaker_threshold": 3,
+            "circuit_breaker_timeout": 30,
+            "health_check_interval_seconds": 15,
+        },
+        "scheduler": {
+            "enabled": True,
+            "max_concurrency_per_backend": 4,
+            "background_max_concurrency": 1,
+            "aging_seconds": 10,
+            "admission_timeout_seconds": 120,
+        },
+        "structured_output": {
+            "retry_on_schema_violation": False,
+            "native_json_schema": True,
+            "constrained_decoding": True,
+        },
+    },
+    "turn_deadline": {
+        "enabled": True,
+        "budget_seconds": 90,
+        "min_call_timeout_seconds": 5,
+        "min_retry_budget_seconds": 10,
+        "stage_min_seconds": {
+            "factual_verifier": 20,
+            "semantic_relevance": 10,
+            "query_decomposition": 15,
+        },
     },
     "retriever": {
         "use_embeddings": True,
@@ -178,6 +208,9 @@ def validate_settings(settings: DotDict) -> List[str]:
         errors.append("llm.num_ctx должен быть целым числом")
     elif num_ctx < 2048:
         errors.append("llm.num_ctx должен быть >= 2048")
+    endpoints = settings.llm.get("endpoints") or []
+    if not isinstance(endpoints, list):
+        errors.append("llm.endpoints должен быть списком URL")
 
     # Retriever thresholds
     for name in ["exact", "lemma", "semantic"]:
@@ -1,12 +1,13 @@
 """
 LocalSnapshotBuffer - persistent local buffer for snapshots.
 
-Uses SQLite for multi-process safety and durability.
+Uses SQLite for multi-process safety and durability. Snapshots are stored as
+compressed codec frames (src/snapshot_codec.py); rows written as plain JSON
+by older versions are still read transparently.
 """
 
 from __future__ import annotations
 
-import json
 import os
 import sqlite3
 import time
@@ -14,6 +15,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from src.logger import logger
+from src.snapshot_codec import decode_snapshot, encode_snapshot, resolve_compression
 
 
 class LocalSnapshotBuffer:
@@ -23,10 +25,13 @@ class LocalSnapshotBuffer:
     LOCK_NAME = "snapshot_batch_flush"
     STORAGE_KEY_SEPARATOR = "::"
 
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(self, db_path: Optional[str] = None, compression: Optional[str] = None):
         self._db_path = Path(
             db_path or os.getenv("SNAPSHOT_BUFFER_PATH", self.DEFAULT_DB_NAME)
         ).resolve()
+        self._compression = resolve_compression(
+            compression or os.getenv("SNAPSHOT_COMPRESSION", "zlib")
+        )
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
         self._init_db()
 
@@ -99,7 +104,7 @@ class LocalSnapshotBuffer:
         for session_id, snapshot_json, updated_at in rows:
             client_id = ""
             try:
-                payload = json.loads(snapshot_json)
+                payload = decode_snapshot(snapshot_json)
                 client_id = self._normalize_client_id(payload.get("client_id"))
             except Exception:
                 client_id = ""
@@ -163,7 +168,7 @@ class LocalSnapshotBuffer:
         effective_client_id = self._normalize_client_id(
             client_id if client_id is not None else snapshot.get("client_id")
         )
-        payload = json.dumps(snapshot)
+        payload = encode_snapshot(snapshot, compression=self._compression)
         conn = self._connect()
         try:
             with conn:
@@ -195,7 +200,7 @@ class LocalSnapshotBuffer:
                 row = cur.fetchone()
                 if not row:
                     return None
-                return json.loads(row[0])
+                return decode_snapshot(row[0])
 
             rows = conn.execute(
                 """
@@ -215,7 +220,7 @@ class LocalSnapshotBuffer:
                     matches=len(rows),
                 )
                 return None
-            return json.loads(rows[0][1])
+            return decode_snapshot(rows[0][1])
         finally:
             conn.close()
 
@@ -254,7 +259,7 @@ class LocalSnapshotBuffer:
             )
             result = {}
             for client_id, session_id, payload in cur.fetchall():
-                result[self._storage_key(session_id, client_id)] = json.loads(payload)
+                result[self._storage_key(session_id, client_id)] = decode_snapshot(payload)
             return result
         finally:
             conn.close()
@@ -276,7 +281,7 @@ class LocalSnapshotBuffer:
                     {
                         "client_id": client_id or None,
                         "session_id": session_id,
-                        "snapshot": json.loads(payload),
+                        "snapshot": decode_snapshot(payload),
                     }
                 )
             return entries
@@ -0,0 +1,335 @@
+"""
+Snapshot codec - versioned, compressed binary frames for SalesBot snapshots.
+
+Snapshots used to be stored as ``json.dumps(snapshot)`` TEXT. A frame is a
+small fixed header followed by the (optionally compressed) JSON body:
+
+    offset  size  field
+    0       3     magic b"\\x00SB" (a NUL byte never starts a JSON text)
+    3       1     format version
+    4       1     compression: 0 none, 1 zlib, 2 zstd
+    5       1     kind: b"F" full snapshot, b"D" delta against a full frame
+    6       8     base id: identifies the full frame a delta applies to
+
+``decode_snapshot`` detects the format from the first bytes, so old JSON
+rows (TEXT or BLOB) keep loading unchanged. JSON goes through ``orjson``
+when it is installed and ``json`` otherwise; zstd needs ``zstandard`` and
+falls back to zlib when it is missing.
+
+Delta mode: ``SnapshotDeltaEncoder`` remembers, per storage key, a digest of
+every top-level section of the last full frame it produced. The next save
+only encodes the sections whose digest changed (cumulatively, relative to
+that full frame) and a new full frame is cut once the delta outgrows
+``max_delta_ratio`` of it. Deltas carry the base id, so a reader never
+applies a delta to the wrong base.
+
+Usage:
+    frame = encode_snapshot(bot.to_snapshot())
+    snapshot = decode_snapshot(frame)                      # or a legacy JSON str
+
+    encoder = SnapshotDeltaEncoder()
+    encoded = encoder.encode("user::session", bot.to_snapshot())
+    if encoded.is_delta:
+        ...  # store encoded.frame next to the full frame with id encoded.base_id
+    snapshot = decode_snapshot(full_frame, delta_frame)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from src.logger import logger
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+MAGIC = b"\x00SB"
+FORMAT_VERSION = 1
+KIND_FULL = b"F"
+KIND_DELTA = b"D"
+COMPRESSION_IDS = {"none": 0, "zlib": 1, "zstd": 2}
+_HEADER = struct.Struct(">3sBBc8s")
+_NO_BASE = b"\x00" * 8
+
+SnapshotData = Union[bytes, bytearray, memoryview, str]
+
+
+class SnapshotCodecError(ValueError):
+    """Frame is corrupt, of an unknown version, or needs a missing compressor."""
+
+
+# ── JSON and compression ──────────────────────────────
+
+def _dumps(value: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Legacy rows written by json.dumps may contain NaN/Infinity.
+            pass
+    return json.loads(data)
+
+
+def resolve_compression(name: Optional[str]) -> str:
+    """Normalize a compression name; zstd degrades to zlib without ``zstandard``."""
+    normalized = str(name or "zlib").strip().lower()
+    if normalized not in COMPRESSION_IDS:
+        raise ValueError(f"Unknown snapshot compression: {name!r}")
+    if normalized == "zstd" and zstandard is None:
+        logger.warning("zstandard is not installed, snapshot compression falls back to zlib")
+        return "zlib"
+    return normalized
+
+
+def _compress(compression_id: int, body: bytes) -> bytes:
+    if compression_id == 1:
+        return zlib.compress(body, 6)
+    if compression_id == 2:
+        return zstandard.ZstdCompressor(level=3).compress(body)
+    return body
+
+
+def _decompress(compression_id: int, body: bytes) -> bytes:
+    if compression_id == 0:
+        return body
+    if compression_id == 1:
+        return zlib.decompress(body)
+    if compression_id == 2:
+        if zstandard is None:
+            raise SnapshotCodecError("Snapshot frame is zstd-compressed but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(body)
+    raise SnapshotCodecError(f"Unknown snapshot compression id: {compression_id}")
+
+
+# ── Frames ────────────────────────────────────────────
+
+def new_base_id() -> bytes:
+    return os.urandom(8)
+
+
+def is_snapshot_frame(data: Any) -> bool:
+    return isinstance(data, (bytes, bytearray, memoryview)) and bytes(data[:3]) == MAGIC
+
+
+def _frame(kind: bytes, body: bytes, compression: str, base_id: bytes) -> bytes:
+    compression_id = COMPRESSION_IDS[compression]
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, compression_id, kind, base_id)
+    return header + _compress(compression_id, body)
+
+
+def _read_frame(data: SnapshotData) -> Tuple[bytes, bytes, Any]:
+    raw = bytes(data)
+    if len(raw) < _HEADER.size:
+        raise SnapshotCodecError("Snapshot frame is truncated")
+    magic, version, compression_id, kind, base_id = _HEADER.unpack_from(raw)
+    if magic != MAGIC:
+        raise SnapshotCodecError("Not a snapshot frame")
+    if version != FORMAT_VERSION:
+        raise SnapshotCodecError(f"Unsupported snapshot frame version: {version}")
+    try:
+        body = _decompress(compression_id, raw[_HEADER.size:])
+    except (zlib.error, ValueError) as err:
+        if isinstance(err, SnapshotCodecError):
+            raise
+        raise SnapshotCodecError(f"Corrupt snapshot frame: {err}") from err
+    return kind, base_id, _loads(body)
+
+
+def frame_base_id(data: SnapshotData) -> Optional[bytes]:
+    """Base id of a frame without decompressing it (None for legacy JSON)."""
+    if not is_snapshot_frame(data):
+        return None
+    return bytes(data[6:14])
+
+
+def encode_snapshot(
+    snapshot: Dict[str, Any],
+    *,
+    compression: str = "zlib",
+    base_id: Optional[bytes] = None,
+) -> bytes:
+    """Encode a full snapshot frame."""
+    return _frame(KIND_FULL, _dumps(snapshot), compression, base_id or _NO_BASE)
+
+
+def decode_snapshot(data: SnapshotData, delta: Optional[SnapshotData] = None) -> Dict[str, Any]:
+    """
+    Decode a full frame or a legacy JSON snapshot, then apply ``delta`` if given.
+
+    A delta whose base id does not match the full frame is ignored with a
+    warning: the full frame alone is still a consistent (older) snapshot.
+    """
+    if is_snapshot_frame(data):
+        kind, base_id, snapshot = _read_frame(data)
+        if kind != KIND_FULL:
+            raise SnapshotCodecError("Expected a full snapshot frame")
+    else:
+        snapshot = _loads(bytes(data) if isinstance(data, (bytearray, memoryview)) else data)
+        base_id = None
+
+    if delta is None:
+        return snapshot
+
+    delta_kind, delta_base_id, payload = _read_frame(delta)
+    if delta_kind != KIND_DELTA:
+        raise SnapshotCodecError("Expected a delta snapshot frame")
+    if base_id is None or delta_base_id != base_id:
+        logger.warning("Snapshot delta does not match its base frame, ignoring delta")
+        return snapshot
+    return apply_delta(snapshot, payload)
+
+
+def apply_delta(snapshot: Dict[str, Any], payload: Dict[str, Any]) -> Dict[str, Any]:
+    merged = dict(snapshot)
+    merged.update(payload.get("set") or {})
+    for key in payload.get("del") or []:
+        merged.pop(key, None)
+    return merged
+
+
+# ── Delta encoder ─────────────────────────────────────
+
+@dataclass(frozen=True)
+class EncodedSnapshot:
+    frame: bytes
+    base_id: Optional[bytes]
+    is_delta: bool
+
+
+@dataclass
+class _Base:
+    base_id: bytes
+    digests: Dict[str, bytes]
+    size: int
+
+
+def _join_object(parts: Dict[str, bytes]) -> bytes:
+    return b"{" + b",".join(_dumps(key) + b":" + part for key, part in parts.items()) + b"}"
+
+
+class SnapshotDeltaEncoder:
+    """
+    Per-key full/delta frame selection.
+
+    ``encode`` is safe to call from several threads; callers serialize saves
+    of the same key (the session lock does). The remembered base is
+    optimistic: storage must only apply a delta when its stored full frame
+    has the same base id, and call ``forget`` (or just write a full frame)
+    otherwise.
+    """
+
+    def __init__(
+        self,
+        *,
+        compression: str = "zlib",
+        enabled: bool = True,
+        max_delta_ratio: float = 0.5,
+        max_keys: int = 10000,
+    ):
+        self.compression = resolve_compression(compression)
+        self.enabled = enabled
+        self.max_delta_ratio = max_delta_ratio
+        self.max_keys = max_keys
+        self._bases: "OrderedDict[str, _Base]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.full_frames = 0
+        self.delta_frames = 0
+
+    def encode(self, key: str, snapshot: Dict[str, Any]) -> EncodedSnapshot:
+        if not self.enabled:
+            self.full_frames += 1
+            return EncodedSnapshot(encode_snapshot(snapshot, compression=self.compression), None, False)
+
+        parts = {str(section): _dumps(value) for section, value in snapshot.items()}
+        digests = {section: hashlib.blake2b(part, digest_size=16).digest() for section, part in parts.items()}
+
+        with self._lock:
+            base = self._bases.get(key)
+            if base is not None:
+                self._bases.move_to_end(key)
+
+        if base is not None:
+            changed = {s: p for s, p in parts.items() if base.digests.get(s) != digests[s]}
+            removed = [s for s in base.digests if s not in parts]
+            body = b'{"set":' + _join_object(changed) + b',"del":' + _dumps(removed) + b"}"
+            frame = _frame(KIND_DELTA, body, self.compression, base.base_id)
+            if len(frame) <= self.max_delta_ratio * base.size:
+                self.delta_frames += 1
+                return EncodedSnapshot(frame, base.base_id, True)
+
+        return self.encode_full(key, snapshot, parts=parts, digests=digests)
+
+    def encode_full(
+        self,
+        key: str,
+        snapshot: Dict[str, Any],
+        *,
+        parts: Optional[Dict[str, bytes]] = None,
+        digests: Optional[Dict[str, bytes]] = None,
+    ) -> EncodedSnapshot:
+        """Cut a new full frame for ``key`` and make it the base for later deltas."""
+        if parts is None:
+            parts = {str(section): _dumps(value) for section, value in snapshot.items()}
+        if digests is None:
+            digests = {s: hashlib.blake2b(p, digest_size=16).digest() for s, p in parts.items()}
+        base_id = new_base_id()
+        frame = _frame(KIND_FULL, _join_object(parts), self.compression, base_id)
+        self.full_frames += 1
+        if self.enabled:
+            with self._lock:
+                self._bases[key] = _Base(base_id, digests, len(frame))
+                self._bases.move_to_end(key)
+                while len(self._bases) > self.max_keys:
+                    self._bases.popitem(last=False)
+        return EncodedSnapshot(frame, base_id, False)
+
+    def forget(self, key: str) -> None:
+        with self._lock:
+            self._bases.pop(key, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "compression": self.compression,
+            "delta_enabled": self.enabled,
+            "tracked_keys": len(self._bases),
+            "full_frames": self.full_frames,
+            "delta_frames": self.delta_frames,
+        }
+
+
+__all__: List[str] = [
+    "EncodedSnapshot",
+    "SnapshotCodecError",
+    "SnapshotDeltaEncoder",
+    "apply_delta",
+    "decode_snapshot",
+    "encode_snapshot",
+    "frame_base_id",
+    "is_snapshot_frame",
+    "resolve_compression",
+]
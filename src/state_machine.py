@@ -32,6 +32,7 @@ from src.conditions.state_machine.context import EvaluatorContext
 from src.conditions.state_machine.registry import sm_registry
 from src.rules.resolver import RuleResolver
 from src.conditions.trace import EvaluationTrace, TraceCollector, Resolution
+from src.conditions.cache import ConditionCache, VersionedDict
 
 # YAML config constants (single source of truth)
 from src.yaml_config.constants import (
@@ -330,7 +331,7 @@ class StateMachine:
         Legacy Python constants are deprecated.
         """
         self.state = "greeting"
-        self.collected_data = {}
+        self.collected_data = VersionedDict()
         self.current_phase = None  # Current phase name from flow
 
         # Auto-load config and flow if not provided (v2.0: YAML is the source of truth)
@@ -612,10 +613,11 @@ class StateMachine:
             logger.warning("DAG executor not available")
             return None
 
-        # Build evaluator context
+        # Build evaluator context (branches of a fork share condition results)
         config = self.states_config.get(self.state, {})
         ctx = EvaluatorContext.from_state_machine(
-            self, intent, config, context_envelope=context_envelope
+            self, intent, config, context_envelope=context_envelope,
+            condition_cache=ConditionCache(),
         )
 
         # Execute DAG node
@@ -659,7 +661,7 @@ class StateMachine:
     def reset(self):
         """Reset for new conversation."""
         self.state = self._get_initial_state()
-        self.collected_data = {}
+        self.collected_data = VersionedDict()
         self.current_phase = self._flow.get_phase_for_state(self.state) if self._flow else None
         self.circular_flow.reset()
 
@@ -1417,7 +1419,7 @@ class StateMachine:
             return sm
         sm.state = data.get("state", sm.state)
         sm.current_phase = data.get("current_phase", sm.current_phase)
-        sm.collected_data = data.get("collected_data", {}) or {}
+        sm.collected_data = VersionedDict(data.get("collected_data", {}) or {})
 
         sm.in_disambiguation = bool(data.get("in_disambiguation", False))
         sm.disambiguation_context = data.get("disambiguation_context")
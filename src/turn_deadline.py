@@ -0,0 +1,135 @@
+"""
+TurnDeadline - overall latency budget for one dialogue turn.
+
+`SalesBot.process` opens a deadline for every turn. The deadline travels with
+the turn through a context variable, so the classifier, orchestrator,
+generator, FactualVerifier and ResponseBoundaryValidator all see the same
+budget without threading an extra argument through every signature:
+
+- `OllamaClient` caps each HTTP timeout and each scheduler admission wait by
+  the remaining budget, does not queue once the budget is spent, and stops
+  retrying when another attempt would not fit;
+- optional LLM stages (factual verifier, semantic relevance judge, query
+  decomposition) call `allows(stage)` and fall back to their deterministic
+  path when the remaining budget is below the stage minimum.
+
+Usage:
+    with turn_deadline(TurnDeadline.from_settings()) as deadline:
+        ...
+        deadline = current_turn_deadline()
+        if deadline is not None and not deadline.allows("factual_verifier"):
+            ...  # deterministic path
+"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+from src.logger import logger
+from src.settings import settings
+
+
+_current_deadline: contextvars.ContextVar[Optional["TurnDeadline"]] = contextvars.ContextVar(
+    "turn_deadline",
+    default=None,
+)
+
+
+@dataclass
+class TurnDeadline:
+    """Latency budget for one turn."""
+    budget_seconds: float
+    min_call_timeout_seconds: float = 5.0
+    min_retry_budget_seconds: float = 10.0
+    stage_min_seconds: Dict[str, float] = field(default_factory=dict)
+    started_at: float = field(default_factory=time.monotonic)
+    skipped_stages: List[str] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @classmethod
+    def from_settings(cls) -> Optional["TurnDeadline"]:
+        """Deadline from `settings.turn_deadline`; None when disabled."""
+        cfg = settings.get_nested("turn_deadline", {}) or {}
+        if not cfg.get("enabled", True):
+            return None
+        return cls(
+            budget_seconds=float(cfg.get("budget_seconds", 90)),
+            min_call_timeout_seconds=float(cfg.get("min_call_timeout_seconds", 5)),
+            min_retry_budget_seconds=float(cfg.get("min_retry_budget_seconds", 10)),
+            stage_min_seconds={
+                str(stage): float(seconds)
+                for stage, seconds in (cfg.get("stage_min_seconds") or {}).items()
+            },
+        )
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    def remaining(self) -> float:
+        return max(0.0, self.budget_seconds - self.elapsed())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+    def allows(self, stage: str) -> bool:
+        """
+        Check whether an optional stage still fits into the budget.
+
+        A refused stage is recorded in `skipped_stages` for the decision trace.
+        """
+        required = self.stage_min_seconds.get(stage, 0.0)
+        remaining = self.remaining()
+        if remaining > required:
+            return True
+        with self._lock:
+            self.skipped_stages.append(stage)
+        logger.info(
+            "Optional stage skipped: turn budget low",
+            stage=stage,
+            remaining_s=round(remaining, 2),
+            required_s=required,
+        )
+        return False
+
+    def call_timeout(self, default_timeout: float) -> float:
+        """HTTP timeout for the next LLM call: never past the deadline, never below the floor."""
+        return min(float(default_timeout), max(self.remaining(), self.min_call_timeout_seconds))
+
+    def allows_retry(self, backoff_seconds: float) -> bool:
+        """A retry is worth it only if backoff plus a useful attempt still fit."""
+        return self.remaining() - backoff_seconds >= self.min_retry_budget_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "budget_s": self.budget_seconds,
+            "elapsed_s": round(self.elapsed(), 3),
+            "remaining_s": round(self.remaining(), 3),
+            "skipped_stages": list(self.skipped_stages),
+        }
+
+
+@contextmanager
+def turn_deadline(deadline: Optional[TurnDeadline]) -> Iterator[Optional[TurnDeadline]]:
+    """Make `deadline` current for the duration of the block (None disables it)."""
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def current_turn_deadline() -> Optional[TurnDeadline]:
+    """Deadline of the turn being processed, or None outside a turn."""
+    return _current_deadline.get()
+
+
+def stage_allowed(stage: str) -> bool:
+    """True when there is no active deadline or it still has budget for `stage`."""
+    deadline = _current_deadline.get()
+    return deadline is None or deadline.allows(stage)
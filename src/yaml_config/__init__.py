@@ -30,6 +30,9 @@ from src.yaml_config.constants import (
     SPIN_PROGRESS_INTENT_LIST,
     NEGATIVE_INTENTS,
     INTENT_CATEGORIES,
+    INTENT_CATEGORY_SETS,
+    get_intent_category_set,
+    ANSWERABLE_QUESTION_INTENTS,
     # Policy
     OVERLAY_ALLOWED_STATES,
     PROTECTED_STATES,
@@ -85,6 +88,9 @@ __all__ = [
     "SPIN_PROGRESS_INTENT_LIST",
     "NEGATIVE_INTENTS",
     "INTENT_CATEGORIES",
+    "INTENT_CATEGORY_SETS",
+    "get_intent_category_set",
+    "ANSWERABLE_QUESTION_INTENTS",
     "OVERLAY_ALLOWED_STATES",
     "PROTECTED_STATES",
     "AGGRESSIVE_ACTIONS",
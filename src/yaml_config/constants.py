@@ -22,7 +22,7 @@ Usage:
 Part of Phase 1: State Machine Parameterization
 """
 
-from typing import Dict, List, Optional, Set, Any, Tuple
+from typing import Dict, FrozenSet, List, Optional, Set, Any, Tuple
 from pathlib import Path
 import yaml
 import logging
@@ -367,6 +367,25 @@ if logger.isEnabledFor(logging.DEBUG):
         f"{_total_count} total categories"
     )
 
+# Read-only membership views: per-turn code checks intents against these
+# instead of rebuilding set(INTENT_CATEGORIES.get(...)) on every call
+INTENT_CATEGORY_SETS: Dict[str, FrozenSet[str]] = {
+    category_name: frozenset(category_intents)
+    for category_name, category_intents in INTENT_CATEGORIES.items()
+}
+
+
+def get_intent_category_set(category: str) -> FrozenSet[str]:
+    """Intents of a category as a frozenset (empty if the category is unknown)."""
+    return INTENT_CATEGORY_SETS.get(category, frozenset())
+
+
+# Questions answered directly from the knowledge base (generic + pricing)
+ANSWERABLE_QUESTION_INTENTS: FrozenSet[str] = (
+    get_intent_category_set("question") | get_intent_category_set("price_related")
+)
+
+
 # Step 6: Validate no ghost intents in categories (all intents, both sources)
 def _validate_no_ghost_intents(categories: Dict[str, List[str]]) -> None:
     """Warn about intents in categories that no classifier can generate."""
@@ -5,8 +5,10 @@ import importlib.machinery
 import importlib.util
 import sys
 import threading
+import time
 import types
 from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 from src.media_preprocessor import PreparedMessage
@@ -185,6 +187,52 @@ class TestSessionManagerActiveRuntime:
         manager.get_or_create("s1", llm=mock_llm, client_id="c1")
         assert manager.touch("s1", client_id="c1", is_final=None) is True
 
+    def test_serialize_inactive_final_sessions_pops_only_expired_from_heap(self, mock_llm, tmp_path):
+        now = [1000.0]
+        manager, buf = _mk_manager(tmp_path, now_provider=lambda: now[0])
+        for index in range(5):
+            manager.get_or_create(f"s{index}", llm=mock_llm, client_id="c1")
+            manager.touch(f"s{index}", client_id="c1", is_final=True)
+            now[0] += 100
+        # s0 left the final state and re-entered it later: the old deadline is stale
+        manager.touch("s0", client_id="c1", is_final=False)
+        manager.touch("s0", client_id="c1", is_final=True)
+
+        now[0] = 1000.0 + 3600 + 150
+        assert manager.serialize_inactive_final_sessions(3600) == 1
+        assert buf.get("s1", client_id="c1") is not None
+        assert manager.get_cache_stats()["resident_sessions"] == 4
+        # Expired and stale items are gone, the remaining deadlines stay queued
+        assert manager.get_cache_stats()["final_expiry_heap"] == 4
+
+    def test_failed_serialization_keeps_session_expirable(self, mock_llm, tmp_path):
+        now = [1000.0]
+        failures = [RuntimeError("storage down")]
+
+        def save_snapshot(_storage_session_id, _snapshot):
+            if failures:
+                raise failures.pop()
+
+        manager, _ = _mk_manager(tmp_path, now_provider=lambda: now[0], save_snapshot=save_snapshot)
+        manager.get_or_create("s1", llm=mock_llm, client_id="c1")
+        manager.touch("s1", client_id="c1", is_final=True)
+        now[0] += 3600
+
+        with pytest.raises(RuntimeError):
+            manager.serialize_inactive_final_sessions(3600)
+        assert manager.serialize_inactive_final_sessions(3600) == 1
+
+    def test_final_heap_stays_bounded_under_final_flapping(self, mock_llm, tmp_path):
+        now = [1000.0]
+        manager, _ = _mk_manager(tmp_path, now_provider=lambda: now[0])
+        manager.get_or_create("s1", llm=mock_llm, client_id="c1")
+        for _ in range(500):
+            now[0] += 1
+            manager.touch("s1", client_id="c1", is_final=True)
+            manager.touch("s1", client_id="c1", is_final=False)
+
+        assert manager.get_cache_stats()["final_expiry_heap"] <= 2 + 64 + 1
+
     def test_restart_session_with_status_replaces_active_flow_with_fresh_bot(self, mock_llm, tmp_path):
         manager, _ = _mk_manager(tmp_path)
         first = manager.get_or_create_with_status(
@@ -306,6 +354,112 @@ class TestSessionManagerActiveRuntime:
         assert saved["c1::s1"]["client_id"] == "c1"
         assert buf.count() == 0
 
+    def test_lru_evicts_least_recently_used_session_to_local_buffer(self, mock_llm, tmp_path):
+        manager, buf = _mk_manager(tmp_path, max_sessions=2)
+        first = manager.get_or_create("s1", llm=mock_llm, client_id="c1")
+        first.state_machine.state = "spin_situation"
+        manager.get_or_create("s2", llm=mock_llm, client_id="c1")
+        manager.touch("s1", client_id="c1")
+
+        manager.get_or_create("s3", llm=mock_llm, client_id="c1")
+
+        assert buf.get("s2", client_id="c1") is not None
+        assert buf.get("s1", client_id="c1") is None
+        restored = manager.get_or_create_with_status("s2", llm=mock_llm, client_id="c1")
+        assert restored.source == "local_buffer"
+        stats = manager.get_cache_stats()
+        assert stats["resident_sessions"] == 2
+        assert stats["evictions"] == 2
+        assert stats["restores_after_eviction"] == 1
+        assert stats["restore_latency_ms"]["max"] > 0
+
+    def test_memory_budget_evicts_but_keeps_current_session(self, mock_llm, tmp_path):
+        manager, buf = _mk_manager(
+            tmp_path,
+            max_memory_bytes=150,
+            size_estimator=lambda bot: 100,
+        )
+        manager.get_or_create("s1", llm=mock_llm, client_id="c1")
+        current = manager.get_or_create_with_status("s2", llm=mock_llm, client_id="c1")
+
+        assert current.source == "new"
+        assert buf.get("s1", client_id="c1") is not None
+        assert manager.get_cache_stats()["approx_memory_bytes"] == 100
+
+    def test_resident_bytes_tracked_on_insert_refresh_and_removal(self, mock_llm, tmp_path):
+        sizes = {"s1": 100, "s2": 40}
+        manager, _ = _mk_manager(
+            tmp_path,
+            size_estimator=lambda bot: sizes[bot.conversation_id],
+        )
+        manager.get_or_create("s1", llm=mock_llm, client_id="c1")
+        manager.get_or_create("s2", llm=mock_llm, client_id="c1")
+        assert manager.get_cache_stats()["approx_memory_bytes"] == 140
+
+        sizes["s1"] = 300
+        manager.touch("s1", client_id="c1")
+        assert manager.get_cache_stats()["approx_memory_bytes"] == 340
+
+        manager.close_session("s1", client_id="c1")
+        assert manager.get_cache_stats()["approx_memory_bytes"] == 40
+
+    def test_background_eviction_keeps_request_path_free(self, mock_llm, tmp_path):
+        manager, buf = _mk_manager(
+            tmp_path,
+            max_memory_bytes=150,
+            size_estimator=lambda bot: 100,
+            background_eviction=True,
+        )
+        evicting_threads = []
+        evict = manager._evict
+
+        def _record_evict(cache_key):
+            evicting_threads.append(threading.current_thread().name)
+            return evict(cache_key)
+
+        try:
+            with patch.object(manager, "_evict", side_effect=_record_evict):
+                manager.get_or_create("s1", llm=mock_llm, client_id="c1")
+                manager.get_or_create("s2", llm=mock_llm, client_id="c1")
+
+                deadline = time.time() + 5
+                while buf.get("s1", client_id="c1") is None and time.time() < deadline:
+                    time.sleep(0.01)
+
+            assert buf.get("s1", client_id="c1") is not None
+            assert evicting_threads == ["crm-sales-bot-session-evictor"]
+            stats = manager.get_cache_stats()
+            assert stats["resident_sessions"] == 1
+            assert stats["approx_memory_bytes"] == 100
+        finally:
+            manager.stop_background_eviction()
+
+    def test_eviction_skips_sessions_with_turn_in_flight(self, mock_llm, tmp_path):
+        manager, buf = _mk_manager(tmp_path, max_sessions=1)
+        manager.get_or_create("s1", llm=mock_llm, client_id="c1")
+        busy = threading.Event()
+        release = threading.Event()
+
+        def _hold_turn():
+            busy.set()
+            release.wait(timeout=5)
+
+        worker = threading.Thread(
+            target=manager.run_session_job,
+            args=("s1",),
+            kwargs={"client_id": "c1", "job": _hold_turn},
+        )
+        worker.start()
+        busy.wait(timeout=5)
+        try:
+            manager.get_or_create("s2", llm=mock_llm, client_id="c1")
+        finally:
+            release.set()
+            worker.join(timeout=5)
+
+        assert buf.count() == 0
+        assert manager.get_cache_stats()["resident_sessions"] == 2
+
     def test_run_session_job_serializes_same_session_callbacks(self, tmp_path):
         manager, _ = _mk_manager(tmp_path, require_client_id=False)
         entered = threading.Event()
@@ -553,8 +707,12 @@ class TestApiActiveRuntime:
                 self.kwargs = kwargs
                 self.closed = 0
                 self.flushed = []
+                self.eviction_stopped = False
                 created_managers.append(self)
 
+            def stop_background_eviction(self):
+                self.eviction_stopped = True
+
             def close_all_sessions(self, *, durable=True):
                 self.closed += 1
                 self.closed_durable = durable
@@ -588,6 +746,8 @@ class TestApiActiveRuntime:
 
         asyncio.run(_run())
 
+        assert created_managers[0].kwargs["background_eviction"] is True
+        assert created_managers[0].eviction_stopped is True
         assert created_managers[0].closed == 1
         assert created_managers[0].closed_durable is True
         assert created_managers[0].flushed == [True]
@@ -611,6 +771,9 @@ class TestApiActiveRuntime:
             def __init__(self, **kwargs):
                 self.kwargs = kwargs
 
+            def stop_background_eviction(self):
+                pass
+
             def close_all_sessions(self, *, durable=True):
                 raise RuntimeError("boom")
 
@@ -723,7 +886,7 @@ class TestApiActiveRuntime:
         assert "live in-memory session runtime" in api_mod.process_message.__doc__
         assert "Snapshot используется только как cold-restore" in api_mod.process_message.__doc__
 
-    def test_process_request_logs_request_path_serialization_and_skips_bootstrap_for_cache(self, monkeypatch):
+    def test_process_request_leaves_serialization_to_sweeper_and_skips_bootstrap_for_cache(self, monkeypatch):
         _ensure_fastapi_stubs()
         import src.api as api_mod
 
@@ -763,13 +926,8 @@ class TestApiActiveRuntime:
         result = api_mod._process_message_request(req)
 
         assert result["answer"] == "echo:Здравствуйте"
-        assert manager.serialize_calls == [api_mod.ACTIVE_SESSION_FINAL_IDLE_SECONDS]
-        assert infos == [
-            (
-                "Serialized inactive final sessions on request path",
-                {"count": 3, "idle_seconds": api_mod.ACTIVE_SESSION_FINAL_IDLE_SECONDS},
-            )
-        ]
+        assert manager.serialize_calls == []
+        assert infos == []
 
     def test_process_request_channel_api_disables_cross_session_memory(self, monkeypatch):
         _ensure_fastapi_stubs()
@@ -0,0 +1,158 @@
+"""
+Tests for bounded admission on /api/v1/process (src/admission.py).
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.admission import AdmissionController, AdmissionRejected
+
+
+async def _turn(controller, key, started, release, log):
+    async with controller.admit(key):
+        log.append(("start", key))
+        started.set()
+        await release.wait()
+        log.append(("end", key))
+
+
+class TestGlobalAdmission:
+    def test_full_queue_is_rejected_immediately(self):
+        async def _run():
+            controller = AdmissionController(max_in_flight=1, max_queue=1, queue_timeout_seconds=5)
+            release = asyncio.Event()
+            log = []
+            running = asyncio.create_task(_turn(controller, "a", asyncio.Event(), release, log))
+            queued = asyncio.create_task(_turn(controller, "b", asyncio.Event(), release, log))
+            await asyncio.sleep(0)
+
+            assert controller.get_stats()["in_flight"] == 1
+            assert controller.get_stats()["queue_depth"] == 1
+            with pytest.raises(AdmissionRejected) as exc:
+                async with controller.admit("c"):
+                    pass
+
+            release.set()
+            await asyncio.gather(running, queued)
+            return controller, exc.value, log
+
+        controller, rejection, log = asyncio.run(_run())
+
+        assert rejection.code == "OVERLOADED"
+        assert rejection.retry_after >= 1
+        assert log == [("start", "a"), ("end", "a"), ("start", "b"), ("end", "b")]
+        stats = controller.get_stats()
+        assert stats["admitted"] == 2
+        assert stats["rejected"]["OVERLOADED"] == 1
+        assert stats["in_flight"] == 0 and stats["queue_depth"] == 0
+
+    def test_queue_wait_times_out(self):
+        async def _run():
+            controller = AdmissionController(max_in_flight=1, max_queue=4, queue_timeout_seconds=0.05)
+            release = asyncio.Event()
+            running = asyncio.create_task(_turn(controller, "a", asyncio.Event(), release, []))
+            await asyncio.sleep(0)
+            with pytest.raises(AdmissionRejected) as exc:
+                async with controller.admit("b"):
+                    pass
+            stats_after_timeout = controller.get_stats()
+            release.set()
+            await running
+            return exc.value, stats_after_timeout
+
+        rejection, stats = asyncio.run(_run())
+
+        assert rejection.code == "QUEUE_TIMEOUT"
+        assert stats["queue_depth"] == 0
+        assert stats["in_flight"] == 1
+
+    def test_cancelled_waiter_does_not_leak_slot(self):
+        async def _run():
+            controller = AdmissionController(max_in_flight=1, max_queue=4)
+            release = asyncio.Event()
+            running = asyncio.create_task(_turn(controller, "a", asyncio.Event(), release, []))
+            await asyncio.sleep(0)
+            waiter = asyncio.create_task(_turn(controller, "b", asyncio.Event(), asyncio.Event(), []))
+            await asyncio.sleep(0)
+            waiter.cancel()
+            release.set()
+            await running
+            await asyncio.gather(waiter, return_exceptions=True)
+            return controller.get_stats()
+
+        stats = asyncio.run(_run())
+
+        assert stats["in_flight"] == 0
+        assert stats["queue_depth"] == 0
+
+
+class TestSessionAdmission:
+    def test_same_session_waits_in_loop_then_rejects_beyond_pending(self):
+        async def _run():
+            controller = AdmissionController(max_in_flight=4, max_queue=4, session_max_pending=1)
+            release = asyncio.Event()
+            log = []
+            first = asyncio.create_task(_turn(controller, "u::s", asyncio.Event(), release, log))
+            await asyncio.sleep(0)
+            second = asyncio.create_task(_turn(controller, "u::s", asyncio.Event(), release, log))
+            await asyncio.sleep(0)
+
+            stats_while_busy = controller.get_stats()
+            with pytest.raises(AdmissionRejected) as exc:
+                async with controller.admit("u::s"):
+                    pass
+
+            release.set()
+            await asyncio.gather(first, second)
+            return controller, exc.value, stats_while_busy, log
+
+        controller, rejection, stats, log = asyncio.run(_run())
+
+        assert rejection.code == "SESSION_BUSY"
+        assert stats["in_flight"] == 1
+        assert stats["session_waiters"] == 1
+        assert log == [("start", "u::s"), ("end", "u::s"), ("start", "u::s"), ("end", "u::s")]
+        assert controller._sessions == {}
+
+    def test_other_sessions_are_not_blocked(self):
+        async def _run():
+            controller = AdmissionController(max_in_flight=4, session_max_pending=0)
+            release = asyncio.Event()
+            started = asyncio.Event()
+            busy = asyncio.create_task(_turn(controller, "u::s1", started, release, []))
+            await started.wait()
+            async with controller.admit("u::s2"):
+                in_flight = controller.get_stats()["in_flight"]
+            release.set()
+            await busy
+            return in_flight
+
+        assert asyncio.run(_run()) == 2
+
+
+class TestProcessEndpoint:
+    def test_overload_returns_429_with_retry_after(self, monkeypatch, tmp_path: Path):
+        import src.api as api_mod
+
+        controller = AdmissionController(max_in_flight=1, max_queue=0)
+        controller._slots.in_use = 1
+        monkeypatch.setattr(api_mod, "_start_startup_warmup", lambda: None)
+        monkeypatch.setattr(api_mod, "_create_admission_controller", lambda: controller)
+        monkeypatch.setattr(api_mod, "API_KEY", "test-key")
+        monkeypatch.setattr(api_mod, "DB_PATH", str(tmp_path / "admission.db"))
+
+        with TestClient(api_mod.app) as client:
+            resp = client.post(
+                "/api/v1/process",
+                headers={"Authorization": "Bearer test-key"},
+                json={"session_id": "s1", "user_id": "u1", "message": {"text": "Привет"}},
+            )
+            metrics = client.get("/api/v1/metrics", headers={"Authorization": "Bearer test-key"}).json()
+
+        assert resp.status_code == 429
+        assert resp.json()["error"]["code"] == "OVERLOADED"
+        assert int(resp.headers["retry-after"]) >= 1
+        assert metrics["admission"]["rejected"]["OVERLOADED"] == 1
@@ -414,6 +414,47 @@ class TestContextLayer:
         """Test collected_data returns empty dict before begin_turn."""
         assert blackboard.collected_data == {}
 
+    def test_unchanged_collected_data_shared_across_turns(self, blackboard):
+        """An unchanged collected_data reuses the previous snapshot's view."""
+        blackboard.begin_turn(intent="info", extracted_data={"company": {"size": 10}})
+        first = blackboard.get_context().collected_data
+
+        blackboard.begin_turn(intent="info", extracted_data={})
+        assert blackboard.get_context().collected_data is first
+
+        blackboard.begin_turn(intent="info", extracted_data={"industry": "IT"})
+        third = blackboard.get_context().collected_data
+        assert third is not first
+        assert third["company"] is first["company"]
+        assert third["industry"] == "IT"
+        assert "industry" not in first
+
+    def test_frozen_flow_dict_built_once(self):
+        """A frozen FlowConfig's dict is shared by every snapshot."""
+        from src.blackboard.blackboard import DialogueBlackboard
+
+        flow_config = MockFlowConfig()
+        flow_config.frozen = True
+        blackboard = DialogueBlackboard(
+            state_machine=MockStateMachine(state="greeting"),
+            flow_config=flow_config,
+            intent_tracker=MockIntentTracker(),
+        )
+
+        blackboard.begin_turn(intent="greeting", extracted_data={})
+        first = blackboard.get_context().flow_config
+        blackboard.begin_turn(intent="greeting", extracted_data={})
+        assert blackboard.get_context().flow_config is first
+        with pytest.raises(TypeError):
+            first["states"]["greeting"] = {}
+
+    def test_mutable_flow_dict_rebuilt_each_turn(self, blackboard):
+        """A mutable FlowConfig may change, so its dict is not cached."""
+        blackboard.begin_turn(intent="greeting", extracted_data={})
+        first = blackboard.get_context().flow_config
+        blackboard.begin_turn(intent="greeting", extracted_data={})
+        assert blackboard.get_context().flow_config is not first
+
 # =============================================================================
 # Test Proposal Layer
 # =============================================================================
@@ -614,6 +655,23 @@ class TestProposalLayer:
 
         assert proposals1 is not proposals2
 
+    def test_get_source_proposals_matches_filtered_proposals(self, blackboard):
+        """Test get_source_proposals equals filtering get_proposals by source."""
+        from src.blackboard.enums import Priority
+
+        blackboard.propose_transition("state1", Priority.LOW, source_name="S1")
+        blackboard.propose_action("action1", Priority.HIGH, source_name="S1")
+        blackboard.propose_action("action2", Priority.NORMAL, source_name="S2")
+        blackboard.propose_action("action3", Priority.NORMAL, source_name="S1")
+
+        for name in ("S1", "S2", "S3"):
+            expected = [p for p in blackboard.get_proposals() if p.source_name == name]
+            assert blackboard.get_source_proposals(name) == expected
+        assert [p.value for p in blackboard.get_source_proposals("S1")] == ["action1", "action3", "state1"]
+
+        blackboard.begin_turn(intent="greeting", extracted_data={})
+        assert blackboard.get_source_proposals("S1") == []
+
 # =============================================================================
 # Test Decision Layer
 # =============================================================================
@@ -1014,3 +1014,99 @@ class TestStage4ResolverCriteriaVerification:
 
         assert decision.next_state == "any_target"
         assert "fallback_any_transition" in decision.reason_codes
+
+
+
+# =============================================================================
+# Test Fast Path
+# =============================================================================
+
+def _random_proposals(rng, n_actions, n_transitions):
+    """Proposals with colliding priorities/ranks so tie-breaking is exercised."""
+    proposals = []
+    for i in range(n_actions):
+        proposals.append(Proposal(
+            type=ProposalType.ACTION,
+            value=f"action_{rng.randrange(3)}",
+            priority=rng.choice(list(Priority)),
+            source_name=f"Source{i}",
+            reason_code=f"action_code_{i}",
+            combinable=rng.random() < 0.7,
+            metadata={"i": i},
+            priority_rank=rng.choice([None, 1, 2]),
+        ))
+    for i in range(n_transitions):
+        proposals.append(Proposal(
+            type=ProposalType.TRANSITION,
+            value=f"state_{rng.randrange(3)}",
+            priority=rng.choice(list(Priority)),
+            source_name=f"Source{n_actions + i}",
+            reason_code=f"transition_code_{i}",
+            priority_rank=rng.choice([None, 1, 2]),
+        ))
+    rng.shuffle(proposals)
+    return proposals
+
+
+class TestConflictResolverFastPath:
+    """The fast path must produce exactly the full path's ResolvedDecision."""
+
+    @pytest.mark.parametrize("seed", range(300))
+    def test_fast_and_full_paths_resolve_identically(self, seed):
+        import random
+
+        rng = random.Random(seed)
+        proposals = _random_proposals(rng, rng.randrange(4), rng.randrange(4))
+        fallback = rng.choice([None, "any_target"])
+
+        decisions = [
+            resolver.resolve_with_fallback(
+                list(proposals),
+                current_state="current",
+                fallback_transition=fallback,
+                data_updates={"seed": seed},
+                flags_to_set={"flag": True},
+            )
+            for resolver in (
+                ConflictResolver(default_action="default"),
+                ConflictResolver(default_action="default", fast_path=False),
+            )
+        ]
+
+        assert decisions[0] == decisions[1]
+        assert list(decisions[0].resolution_trace) == list(decisions[1].resolution_trace)
+
+    def test_counters(self):
+        resolver = ConflictResolver()
+        action = Proposal(
+            type=ProposalType.ACTION, value="answer", priority=Priority.HIGH,
+            source_name="S1", reason_code="C1",
+        )
+        blocking = Proposal(
+            type=ProposalType.ACTION, value="reject", priority=Priority.CRITICAL,
+            source_name="S2", reason_code="C2", combinable=False,
+        )
+        transitions = [
+            Proposal(
+                type=ProposalType.TRANSITION, value=f"state_{i}", priority=Priority.NORMAL,
+                source_name="S3", reason_code=f"T{i}",
+            )
+            for i in range(2)
+        ]
+
+        resolver.resolve([], "current")
+        resolver.resolve([action, transitions[0]], "current")
+        decision = resolver.resolve([blocking] + transitions, "current")
+        resolver.resolve([action] + transitions, "current")
+        resolver.resolve([action, blocking], "current")
+
+        assert decision.resolution_trace["merge_decision"] == "BLOCKED"
+        assert decision.rejected_proposals == transitions
+        assert resolver.get_stats() == {"fast_path": 3, "full_path": 2}
+
+    def test_fast_path_disabled(self):
+        resolver = ConflictResolver(fast_path=False)
+
+        resolver.resolve([], "current")
+
+        assert resolver.get_stats() == {"fast_path": 0, "full_path": 1}
@@ -12,6 +12,7 @@ These tests verify:
 """
 
 import pytest
+import threading
 import time
 import logging
 from datetime import datetime
@@ -29,6 +30,7 @@ from src.blackboard.event_bus import (
     ErrorOccurredEvent,
     EventHandler,
     DialogueEventBus,
+    OverflowPolicy,
     MetricsCollector,
     DebugLogger,
 )
@@ -482,6 +484,43 @@ class TestDialogueEventBus:
         assert len(event_bus._history) == 0
         assert event_bus.get_history() == []
 
+    def test_has_subscribers(self, event_bus):
+        """has_subscribers should reflect type-specific and global handlers."""
+        assert event_bus.has_subscribers(EventType.TURN_STARTED) is False
+
+        handler = Mock()
+        event_bus.subscribe(EventType.TURN_STARTED, handler)
+        assert event_bus.has_subscribers(EventType.TURN_STARTED) is True
+        assert event_bus.has_subscribers(EventType.ERROR_OCCURRED) is False
+
+        event_bus.unsubscribe(EventType.TURN_STARTED, handler)
+        event_bus.subscribe_all(Mock())
+        assert event_bus.has_subscribers(EventType.ERROR_OCCURRED) is True
+
+    def test_emit_lazy_skips_factory_when_unobserved(self):
+        """emit_lazy should not build the event without subscribers and history."""
+        bus = DialogueEventBus(history_size=0)
+        factory = Mock()
+
+        bus.emit_lazy(EventType.TURN_STARTED, factory)
+        factory.assert_not_called()
+
+        handler = Mock()
+        bus.subscribe(EventType.TURN_STARTED, handler)
+        event = TurnStartedEvent(turn_number=1, intent="test", state="initial")
+        bus.emit_lazy(EventType.TURN_STARTED, lambda: event)
+
+        handler.assert_called_once_with(event)
+        assert bus.get_history() == []
+
+    def test_emit_lazy_builds_event_for_history(self, event_bus):
+        """emit_lazy should build the event when history is kept."""
+        event = TurnStartedEvent(turn_number=1, intent="test", state="initial")
+
+        event_bus.emit_lazy(EventType.TURN_STARTED, lambda: event)
+
+        assert event_bus.get_history() == [event]
+
 class TestDialogueEventBusAsync:
     """Test suite for DialogueEventBus async mode."""
 
@@ -536,6 +575,211 @@ class TestDialogueEventBusAsync:
         thread.join(timeout=3.0)
         assert not thread.is_alive()
 
+
+class TestDialogueEventBusBoundedQueue:
+    """Test suite for the bounded, batched async queue of DialogueEventBus."""
+
+    @staticmethod
+    def _event(turn):
+        return TurnStartedEvent(turn_number=turn, intent="test", state="initial")
+
+    @staticmethod
+    def _blocked_bus(**kwargs):
+        """Async bus whose worker is stuck in the handler of event 0 until released."""
+        release = threading.Event()
+        started = threading.Event()
+        seen = []
+
+        def handler(event):
+            if event.turn_number == 0:
+                started.set()
+                release.wait(timeout=5.0)
+            seen.append(event.turn_number)
+
+        bus = DialogueEventBus(async_mode=True, **kwargs)
+        bus.subscribe(EventType.TURN_STARTED, handler)
+        bus.emit(TestDialogueEventBusBoundedQueue._event(0))
+        assert started.wait(timeout=5.0)
+        return bus, release, seen
+
+    def test_drop_oldest_keeps_newest_events(self):
+        """DROP_OLDEST should evict queued events to admit new ones."""
+        bus, release, seen = self._blocked_bus(queue_size=2)
+        for turn in (1, 2, 3, 4):
+            bus.emit(self._event(turn))
+        release.set()
+
+        assert bus.flush(timeout=5.0)
+        assert seen == [0, 3, 4]
+        stats = bus.get_stats()
+        assert stats.dropped == 2
+        assert stats.processed == 3
+        bus.stop()
+
+    def test_drop_newest_keeps_queued_events(self):
+        """DROP_NEWEST should discard events emitted into a full queue."""
+        bus, release, seen = self._blocked_bus(queue_size=2, overflow_policy="drop_newest")
+        for turn in (1, 2, 3, 4):
+            bus.emit(self._event(turn))
+        release.set()
+
+        assert bus.flush(timeout=5.0)
+        assert seen == [0, 1, 2]
+        assert bus.get_stats().dropped == 2
+        bus.stop()
+
+    def test_block_waits_for_room(self):
+        """BLOCK should wait for the worker instead of dropping."""
+        bus, release, seen = self._blocked_bus(
+            queue_size=1, overflow_policy=OverflowPolicy.BLOCK, block_timeout_ms=5000,
+        )
+        bus.emit(self._event(1))
+        threading.Timer(0.05, release.set).start()
+        bus.emit(self._event(2))
+
+        assert bus.flush(timeout=5.0)
+        assert seen == [0, 1, 2]
+        assert bus.get_stats().dropped == 0
+        bus.stop()
+
+    def test_block_drops_after_timeout(self):
+        """BLOCK should drop the event when no room frees up in time."""
+        bus, release, seen = self._blocked_bus(
+            queue_size=1, overflow_policy=OverflowPolicy.BLOCK, block_timeout_ms=10,
+        )
+        bus.emit(self._event(1))
+        bus.emit(self._event(2))
+        release.set()
+
+        assert bus.flush(timeout=5.0)
+        assert seen == [0, 1]
+        assert bus.get_stats().dropped == 1
+        bus.stop()
+
+    def test_worker_dispatches_in_batches(self):
+        """Worker should take up to batch_size events per wakeup."""
+        bus, release, seen = self._blocked_bus(batch_size=3)
+        batches = []
+        original = bus._next_batch
+
+        def recording_next_batch():
+            batch = original()
+            batches.append(len(batch))
+            return batch
+
+        bus._next_batch = recording_next_batch
+        for turn in range(1, 8):
+            bus.emit(self._event(turn))
+        release.set()
+
+        assert bus.flush(timeout=5.0)
+        assert seen == list(range(8))
+        assert batches[:3] == [3, 3, 1]
+        bus.stop()
+
+    def test_stop_drains_queue(self):
+        """stop() should dispatch queued events before returning."""
+        bus, release, seen = self._blocked_bus()
+        for turn in (1, 2):
+            bus.emit(self._event(turn))
+        threading.Timer(0.05, release.set).start()
+
+        bus.stop(timeout=5.0)
+
+        assert seen == [0, 1, 2]
+        assert bus._worker_thread is None
+
+    def test_stop_without_drain_drops_queue(self):
+        """stop(drain=False) should discard queued events and count them."""
+        bus, release, seen = self._blocked_bus()
+        for turn in (1, 2):
+            bus.emit(self._event(turn))
+        threading.Timer(0.05, release.set).start()
+
+        bus.stop(drain=False, timeout=5.0)
+
+        assert seen == [0]
+        assert bus.get_stats().dropped == 2
+
+    def test_emit_after_stop_is_synchronous(self):
+        """Events emitted after stop() should still reach handlers."""
+        bus = DialogueEventBus(async_mode=True)
+        handler = Mock()
+        bus.subscribe(EventType.TURN_STARTED, handler)
+        bus.stop()
+
+        bus.emit(self._event(1))
+
+        handler.assert_called_once()
+
+    def test_lagging_events_are_counted(self):
+        """Events dispatched later than lag_threshold_ms should count as lagging."""
+        bus, release, seen = self._blocked_bus(lag_threshold_ms=10)
+        bus.emit(self._event(1))
+        time.sleep(0.05)
+        release.set()
+
+        assert bus.flush(timeout=5.0)
+        stats = bus.get_stats()
+        assert stats.lagging == 1
+        assert stats.max_lag_ms >= 10
+        assert stats.to_dict()["lagging"] == 1
+        bus.stop()
+
+    def test_handler_error_does_not_stop_worker(self):
+        """A failing handler should be logged and the worker keep running."""
+        bus = DialogueEventBus(async_mode=True)
+        handler = Mock(side_effect=[ValueError("boom"), None])
+        bus.subscribe(EventType.TURN_STARTED, handler)
+
+        bus.emit(self._event(1))
+        bus.emit(self._event(2))
+
+        assert bus.flush(timeout=5.0)
+        assert handler.call_count == 2
+        assert bus.get_stats().processed == 2
+        bus.stop()
+
+    def test_idle_worker_exits_and_restarts(self):
+        """Idle worker should exit and the next emit() should start a new one."""
+        bus = DialogueEventBus(async_mode=True)
+        bus.WORKER_IDLE_TIMEOUT_S = 0.01
+        handler = Mock()
+        bus.subscribe(EventType.TURN_STARTED, handler)
+        bus.emit(self._event(0))  # wake the worker so it re-reads the timeout
+        assert bus.flush(timeout=5.0)
+
+        deadline = time.monotonic() + 5.0
+        while bus._worker_thread is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert bus._worker_thread is None
+
+        bus.emit(self._event(1))
+        assert bus.flush(timeout=5.0)
+        assert handler.call_count == 2
+        bus.stop()
+
+    def test_from_config(self):
+        """from_config should map the constants.yaml section to the bus."""
+        bus = DialogueEventBus.from_config({
+            "async_mode": False,
+            "queue_size": 10,
+            "overflow_policy": "block",
+            "unknown_option": 1,
+        })
+
+        assert bus._async_mode is False
+        assert bus._queue_size == 10
+        assert bus._overflow_policy is OverflowPolicy.BLOCK
+        assert DialogueEventBus.from_config(None)._async_mode is False
+
+    def test_invalid_options_rejected(self):
+        """Invalid queue settings should fail fast."""
+        with pytest.raises(ValueError):
+            DialogueEventBus(queue_size=0)
+        with pytest.raises(ValueError):
+            DialogueEventBus(overflow_policy="drop_everything")
+
 class TestMetricsCollector:
     """Test suite for MetricsCollector."""
 
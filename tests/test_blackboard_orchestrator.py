@@ -643,6 +643,40 @@ class TestProcessTurn:
         assert EventType.TURN_STARTED in event_types
         assert EventType.DECISION_COMMITTED in event_types
 
+    def test_unobserved_events_are_not_built(self, mock_state_machine, mock_flow_config):
+        """Without subscribers and history, process_turn builds no events."""
+        SourceRegistry.reset()
+        orch = DialogueOrchestrator(
+            state_machine=mock_state_machine,
+            flow_config=mock_flow_config,
+            event_bus=DialogueEventBus(history_size=0),
+        )
+        orch._sources.clear()
+        orch.add_source(SimpleTestSource(action="custom_action"))
+
+        with patch("src.blackboard.orchestrator.SourceContributedEvent") as contributed, \
+                patch("src.blackboard.orchestrator.DecisionCommittedEvent") as committed, \
+                patch.object(orch._blackboard, "get_source_proposals") as get_source_proposals:
+            decision = orch.process_turn(intent="test", extracted_data={})
+
+        assert decision.action == "custom_action"
+        contributed.assert_not_called()
+        committed.assert_not_called()
+        get_source_proposals.assert_not_called()
+
+    def test_source_contributed_event_lists_own_proposals(self, orchestrator_no_sources):
+        """SourceContributedEvent summarizes only the proposals of its source."""
+        orchestrator_no_sources.add_source(SimpleTestSource(name="First", action="first_action"))
+        orchestrator_no_sources.add_source(SimpleTestSource(name="Second", action="second_action"))
+
+        orchestrator_no_sources.process_turn(intent="test", extracted_data={})
+
+        events = orchestrator_no_sources.event_bus.get_history(EventType.SOURCE_CONTRIBUTED)
+        summaries = {e.data["source_name"]: e.data["proposals_summary"] for e in events}
+        assert [len(summaries["First"]), len(summaries["Second"])] == [1, 1]
+        assert "first_action" in summaries["First"][0]
+        assert "second_action" in summaries["Second"][0]
+
     def test_process_turn_handles_source_error(self, orchestrator_no_sources):
         """Test that errors in sources are caught and logged."""
         error_source = ErrorSource()
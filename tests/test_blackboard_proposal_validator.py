@@ -977,3 +977,59 @@ class TestValidActionsSSOT:
         invalid_action_errors = [e for e in errors if e.error_code == "INVALID_ACTION"]
         assert len(invalid_action_errors) == 1
         assert invalid_action_errors[0].severity == "error"
+
+
+# =============================================================================
+# Test Fast Path
+# =============================================================================
+
+class TestProposalValidatorFastPath:
+    """The fast path must report exactly what the full pass reports."""
+
+    VALIDATOR_CONFIGS = [
+        {},
+        {"valid_actions": {"action_0", "action_1"}},
+        {"valid_states": {"state_0"}, "valid_reason_codes": {"code_0", "code_1"}},
+        {"valid_actions": {"action_0"}, "valid_states": {"state_0", "state_1"}, "strict_mode": True},
+    ]
+
+    @pytest.mark.parametrize("seed", range(200))
+    def test_fast_and_full_paths_report_identically(self, seed):
+        import random
+
+        rng = random.Random(seed)
+        proposals = [
+            Proposal(
+                type=rng.choice(list(ProposalType)),
+                value=rng.choice([f"action_{rng.randrange(2)}", f"state_{rng.randrange(2)}", None, 5]),
+                priority=rng.choice(list(Priority)),
+                source_name=rng.choice(["Source", "", "  "]),
+                reason_code=rng.choice(["code_0", "code_1", "code_2", ""]),
+                combinable=rng.random() < 0.8,
+            )
+            for _ in range(rng.randrange(4))
+        ]
+        config = rng.choice(self.VALIDATOR_CONFIGS)
+
+        fast = ProposalValidator(**config).validate(proposals)
+        full = ProposalValidator(**config, fast_path=False).validate(proposals)
+
+        assert [(e.proposal, e.error_code, e.message, e.severity) for e in fast] == [
+            (e.proposal, e.error_code, e.message, e.severity) for e in full
+        ]
+
+    def test_counters(self):
+        validator = ProposalValidator(valid_actions={"answer"})
+        valid = Proposal(
+            type=ProposalType.ACTION, value="answer", priority=Priority.NORMAL,
+            source_name="S1", reason_code="C1",
+        )
+        unknown = Proposal(
+            type=ProposalType.ACTION, value="unknown", priority=Priority.NORMAL,
+            source_name="S1", reason_code="C1",
+        )
+
+        assert validator.validate([valid]) == []
+        assert validator.validate([]) == []
+        assert [e.error_code for e in validator.validate([valid, unknown])] == ["INVALID_ACTION"]
+        assert validator.get_stats() == {"fast_path": 2, "full_path": 1}
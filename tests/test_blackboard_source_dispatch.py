@@ -0,0 +1,212 @@
+# tests/test_blackboard_source_dispatch.py
+
+"""
+Tests for intent-indexed Knowledge Source dispatch (SourceDispatchIndex).
+
+These tests verify:
+1. Sources are selected by intent, secondary intent, repeated question,
+   state and feature flag, in source order
+2. Sources without a trigger spec are always selected
+3. Specs are ignored when should_contribute() is overridden separately
+4. The index is rebuilt when a source's spec changes
+5. Orchestrator turns are identical with and without the index
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.blackboard.knowledge_source import KnowledgeSource, SourceTriggers
+from src.blackboard.source_scheduler import SourceDispatchIndex, source_triggers
+from src.blackboard.sources import (
+    ConversationGuardSource,
+    DataCollectorSource,
+    ObjectionReturnSource,
+    PriceQuestionSource,
+)
+from src.blackboard.sources.fact_question import FactQuestionSource
+from src.blackboard.sources.go_back_guard import GoBackGuardSource
+from src.blackboard.sources.objection_guard import ObjectionGuardSource
+from src.feature_flags import flags
+
+
+class DispatchBlackboard:
+    """Just enough blackboard for SourceDispatchIndex.select()."""
+
+    def __init__(self, intent, state="spin_situation", secondary_intents=None, repeated_question=None):
+        self.current_intent = intent
+        self.current_state = state
+        self._ctx = SimpleNamespace(context_envelope=SimpleNamespace(
+            secondary_intents=secondary_intents or [],
+            repeated_question=repeated_question,
+        ))
+
+    def get_context(self):
+        return self._ctx
+
+
+class AlwaysPriceSource(PriceQuestionSource):
+    """Overrides only the gate: the inherited spec must not be trusted."""
+
+    def should_contribute(self, blackboard):
+        return True
+
+
+def _names(sources):
+    return [source.name for source in sources]
+
+
+@pytest.fixture
+def sources():
+    return [
+        GoBackGuardSource(),
+        PriceQuestionSource(),
+        DataCollectorSource(),
+        ObjectionReturnSource(),
+    ]
+
+
+class TestSourceDispatchIndex:
+    def test_selects_by_intent_in_source_order(self, sources):
+        index = SourceDispatchIndex()
+
+        assert _names(index.select(sources, DispatchBlackboard("price_question"))) == [
+            "PriceQuestionSource", "DataCollectorSource",
+        ]
+        assert _names(index.select(sources, DispatchBlackboard("go_back"))) == [
+            "GoBackGuardSource", "DataCollectorSource",
+        ]
+        assert _names(index.select(sources, DispatchBlackboard("agreement"))) == ["DataCollectorSource"]
+
+    def test_secondary_intent_and_repeated_question(self, sources):
+        index = SourceDispatchIndex()
+
+        secondary = DispatchBlackboard("info_provided", secondary_intents=["price_question"])
+        assert "PriceQuestionSource" in _names(index.select(sources, secondary))
+
+        repeated = DispatchBlackboard("info_provided", repeated_question="price_question")
+        assert "PriceQuestionSource" in _names(index.select(sources, repeated))
+
+    def test_state_trigger(self, sources):
+        index = SourceDispatchIndex()
+
+        assert "ObjectionReturnSource" not in _names(index.select(sources, DispatchBlackboard("agreement")))
+        in_objection = DispatchBlackboard("agreement", state=ObjectionReturnSource.OBJECTION_STATE)
+        assert "ObjectionReturnSource" in _names(index.select(sources, in_objection))
+
+    def test_flag_trigger(self):
+        index = SourceDispatchIndex()
+        sources = [ConversationGuardSource()]
+
+        flags.set_override("conversation_guard_in_pipeline", False)
+        try:
+            assert index.select(sources, DispatchBlackboard("agreement")) == []
+        finally:
+            flags.clear_override("conversation_guard_in_pipeline")
+        flags.set_override("conversation_guard_in_pipeline", True)
+        try:
+            assert index.select(sources, DispatchBlackboard("agreement")) == sources
+        finally:
+            flags.clear_override("conversation_guard_in_pipeline")
+
+    def test_overridden_gate_ignores_inherited_spec(self):
+        subclassed = AlwaysPriceSource()
+        patched = PriceQuestionSource()
+        patched.should_contribute = lambda blackboard: True
+
+        assert source_triggers(PriceQuestionSource()) is not None
+        assert source_triggers(subclassed) is None
+        assert source_triggers(patched) is None
+
+        index = SourceDispatchIndex()
+        assert index.select([subclassed, patched], DispatchBlackboard("agreement")) == [subclassed, patched]
+
+    def test_rebuilt_when_spec_changes(self, sources):
+        index = SourceDispatchIndex()
+        blackboard = DispatchBlackboard("tariff_question")
+        assert "PriceQuestionSource" not in _names(index.select(sources, blackboard))
+
+        sources[1].add_price_intent("tariff_question")
+        assert "PriceQuestionSource" in _names(index.select(sources, blackboard))
+
+        sources[1].remove_price_intent("tariff_question")
+        assert "PriceQuestionSource" not in _names(index.select(sources, blackboard))
+
+    def test_trigger_intent_sets_are_read_only(self):
+        custom = {"go_back"}
+        sources = [
+            GoBackGuardSource(go_back_intents=custom),
+            ObjectionGuardSource(),
+            ObjectionReturnSource(),
+            PriceQuestionSource(),
+            FactQuestionSource(),
+        ]
+        intent_sets = [
+            sources[0].go_back_intents,
+            sources[1].objection_intents,
+            sources[2].return_intents,
+            sources[3].price_intents,
+            sources[4].fact_intents,
+        ]
+        for intents in intent_sets:
+            assert isinstance(intents, frozenset)
+            with pytest.raises(AttributeError):
+                intents.add("tariff_question")
+
+        custom.add("tariff_question")
+        blackboard = DispatchBlackboard("tariff_question")
+        assert "GoBackGuardSource" not in _names(SourceDispatchIndex().select(sources, blackboard))
+        assert "tariff_question" not in sources[0].go_back_intents
+
+    def test_spec_must_be_source_triggers(self):
+        class BadSpecSource(KnowledgeSource):
+            def get_triggers(self):
+                return {"intents": ["go_back"]}
+
+            def should_contribute(self, blackboard):
+                return True
+
+            def contribute(self, blackboard):
+                pass
+
+        source = BadSpecSource()
+        assert source_triggers(source) is None
+        assert SourceDispatchIndex().select([source], DispatchBlackboard("agreement")) == [source]
+
+    def test_triggers_without_intents_do_not_filter_intents(self):
+        assert not SourceTriggers(flags=frozenset({"x"})).has_intent_triggers
+        assert SourceTriggers(repeated_questions=frozenset({"x"})).has_intent_triggers
+
+
+class TestOrchestratorDispatch:
+    MESSAGES = ("Привет", "Сколько стоит?", "Это дорого", "Вернёмся назад", "У нас 10 сотрудников")
+
+    def _run(self, mock_llm, enabled):
+        from src.bot import SalesBot
+
+        flags.set_override("source_dispatch_index", enabled)
+        try:
+            bot = SalesBot(llm=mock_llm)
+            turns = []
+            for message in self.MESSAGES:
+                result = bot.process(message)
+                turns.append((
+                    result.get("action"),
+                    result.get("state"),
+                    bot._orchestrator.last_source_dispatch,
+                    sorted(bot._orchestrator.last_source_timings_ms),
+                ))
+            return turns
+        finally:
+            flags.clear_override("source_dispatch_index")
+
+    def test_same_turns_with_and_without_index(self, mock_llm):
+        indexed = self._run(mock_llm, True)
+        full = self._run(mock_llm, False)
+
+        assert [turn[:2] for turn in indexed] == [turn[:2] for turn in full]
+        assert [turn[2]["contributed"] for turn in indexed] == [turn[2]["contributed"] for turn in full]
+        assert all(turn[2]["skipped"] == 0 for turn in full)
+        assert any(turn[2]["skipped"] > 0 for turn in indexed)
+        for turn in indexed:
+            assert turn[2]["invoked"] == len(turn[3])
@@ -0,0 +1,174 @@
+# tests/test_blackboard_source_scheduler.py
+
+"""
+Tests for concurrent Knowledge Source execution (source_scheduler.py).
+
+These tests verify:
+1. Dependency planning from reads/writes declarations
+2. Buffered writes are merged in source order
+3. Independent sources overlap, dependent sources wait
+4. Orchestrator parallel and sequential modes produce the same turn
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.blackboard.enums import Priority
+from src.blackboard.knowledge_source import (
+    CHANNEL_ACTIONS,
+    CHANNEL_CONTEXT_SIGNALS,
+    KnowledgeSource,
+)
+from src.blackboard.source_scheduler import execute_sources, plan_dependencies
+from src.blackboard.sources import (
+    AutonomousDecisionSource,
+    PilotSurveyAnswerGateSource,
+    PriceQuestionSource,
+)
+
+
+class RecordingBlackboard:
+    """Minimal blackboard: appends every write to one ordered log."""
+
+    def __init__(self):
+        self.log = []
+        self.signals = []
+
+    def propose_action(self, action, priority, source_name, **kwargs):
+        self.log.append((source_name, action))
+
+    def add_context_signal(self, source_name, signal):
+        self.signals.append(signal)
+        self.log.append((source_name, "signal"))
+
+    def get_context_signals(self):
+        return list(self.signals)
+
+
+class SleepySource(KnowledgeSource):
+    reads = frozenset()
+    writes = frozenset({CHANNEL_ACTIONS})
+
+    def __init__(self, name, delay=0.0, signal=False):
+        super().__init__(name=name)
+        self._delay = delay
+        self._signal = signal
+        self.thread = None
+
+    def should_contribute(self, blackboard):
+        return True
+
+    def contribute(self, blackboard):
+        self.thread = threading.current_thread().name
+        time.sleep(self._delay)
+        if self._signal:
+            blackboard.add_context_signal(self.name, {"from": self.name})
+        blackboard.propose_action(action=f"{self.name}_action", priority=Priority.NORMAL, source_name=self.name)
+
+
+class SignalProducer(SleepySource):
+    writes = frozenset({CHANNEL_ACTIONS, CHANNEL_CONTEXT_SIGNALS})
+
+
+class SignalConsumer(SleepySource):
+    reads = frozenset({CHANNEL_CONTEXT_SIGNALS})
+
+    def contribute(self, blackboard):
+        self.seen = blackboard.get_context_signals()
+        super().contribute(blackboard)
+
+
+class UndeclaredSource(SleepySource):
+    reads = None
+    writes = None
+
+
+def _merge_all(blackboard):
+    merged = []
+
+    def on_merge(run):
+        run.merge()
+        merged.append(run.source.name)
+
+    return merged, on_merge
+
+
+class TestPlanDependencies:
+    def test_builtin_declarations(self):
+        sources = [PriceQuestionSource(), PilotSurveyAnswerGateSource(), AutonomousDecisionSource()]
+        # The gate and autonomous decision read signals written by earlier sources
+        assert plan_dependencies(sources) == [-1, 0, 1]
+
+    def test_undeclared_source_waits_for_everything_before_it(self):
+        sources = [SleepySource("a"), SleepySource("b"), UndeclaredSource("c"), SleepySource("d")]
+        assert plan_dependencies(sources) == [-1, -1, 1, -1]
+
+    def test_reader_depends_on_undeclared_writer(self):
+        sources = [UndeclaredSource("a"), SleepySource("b"), SignalConsumer("c")]
+        assert plan_dependencies(sources) == [-1, -1, 0]
+
+
+class TestExecuteSources:
+    def test_merge_follows_source_order(self):
+        blackboard = RecordingBlackboard()
+        sources = [SleepySource("slow", delay=0.05), SleepySource("fast")]
+        merged, on_merge = _merge_all(blackboard)
+
+        execute_sources(sources, blackboard, on_merge)
+
+        assert merged == ["slow", "fast"]
+        assert blackboard.log == [("slow", "slow_action"), ("fast", "fast_action")]
+
+    def test_independent_sources_overlap(self):
+        blackboard = RecordingBlackboard()
+        sources = [SleepySource(f"s{i}", delay=0.1) for i in range(4)]
+        merged, on_merge = _merge_all(blackboard)
+
+        started = time.perf_counter()
+        execute_sources(sources, blackboard, on_merge)
+        elapsed = time.perf_counter() - started
+
+        assert merged == ["s0", "s1", "s2", "s3"]
+        assert elapsed < 0.3
+        assert len({source.thread for source in sources}) > 1
+
+    def test_reader_sees_merged_signals(self):
+        blackboard = RecordingBlackboard()
+        producer = SignalProducer("producer", delay=0.05, signal=True)
+        consumer = SignalConsumer("consumer")
+        merged, on_merge = _merge_all(blackboard)
+
+        execute_sources([producer, consumer], blackboard, on_merge)
+
+        assert consumer.seen == [{"from": "producer"}]
+
+    def test_merge_error_propagates(self):
+        blackboard = RecordingBlackboard()
+        sources = [SleepySource("a"), SleepySource("b", delay=0.05)]
+
+        def on_merge(run):
+            raise ValueError(run.source.name)
+
+        with pytest.raises(ValueError, match="a"):
+            execute_sources(sources, blackboard, on_merge)
+
+
+class TestOrchestratorModes:
+    def test_parallel_and_sequential_turns_match(self, mock_llm):
+        from src.bot import SalesBot
+
+        results = {}
+        for parallel in (True, False):
+            bot = SalesBot(llm=mock_llm)
+            bot._orchestrator._parallel_sources = parallel
+            decisions = []
+            for message in ("Привет", "Сколько стоит?", "Это дорого", "У нас 10 сотрудников"):
+                result = bot.process(message)
+                timings = bot._orchestrator.last_source_timings_ms
+                assert timings and all(value >= 0 for value in timings.values())
+                decisions.append((result.get("action"), result.get("state"), sorted(timings)))
+            results[parallel] = decisions
+
+        assert results[True] == results[False]
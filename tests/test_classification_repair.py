@@ -208,7 +208,7 @@ class TestStructuredGenerateRepairHook:
         assert client.stats.failed_requests == 0
         assert client.stats.total_retries == 0
 
-    def test_generate_structured_retries_when_top_intent_stays_invalid(self):
+    def test_generate_structured_does_not_retry_when_top_intent_stays_invalid(self):
         client = OllamaClient(enable_retry=True, enable_circuit_breaker=False)
         client.MAX_RETRIES = 2
         client.INITIAL_DELAY = 0.001
@@ -230,12 +230,13 @@ class TestStructuredGenerateRepairHook:
 
         assert result is None
         assert trace.success is False
-        assert trace.retry_count == 2
+        assert trace.retry_count == 1
         assert trace.raw_response == ""
         assert trace.last_cleaned_structured_response == json.dumps(payload)
-        assert mock_post.call_count == 2
+        # Schema violation under constrained decoding is not retried
+        assert mock_post.call_count == 1
         assert client.stats.failed_requests == 1
-        assert client.stats.total_retries == 1
+        assert client.stats.total_retries == 0
 
     def test_generate_structured_keeps_behavior_without_repair_hook(self):
         client = OllamaClient(enable_retry=False, enable_circuit_breaker=False)
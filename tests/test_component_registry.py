@@ -0,0 +1,90 @@
+"""
+Tests for ComponentRegistry (shared engines across SalesBot sessions).
+"""
+
+import threading
+
+from src.component_registry import ComponentRegistry, get_component_registry
+
+
+class _Engine:
+    def __init__(self, *args):
+        self.args = args
+
+
+class TestComponentRegistry:
+    def test_builds_once_per_key(self):
+        registry = ComponentRegistry()
+
+        first = registry.get("engine", _Engine, "ru")
+        assert registry.get("engine", _Engine, "ru") is first
+        assert registry.get("engine", _Engine, "kz") is not first
+        assert first.args == ("ru",)
+        assert registry.get_stats()["builds"] == 2
+        assert registry.get_stats()["hits"] == 1
+
+    def test_factory_is_part_of_key(self):
+        registry = ComponentRegistry()
+
+        class _Patched(_Engine):
+            pass
+
+        real = registry.get("engine", _Engine)
+        patched = registry.get("engine", _Patched)
+
+        assert type(patched) is _Patched
+        assert registry.get("engine", _Engine) is real
+
+    def test_disabled_registry_builds_fresh_instances(self):
+        registry = ComponentRegistry(enabled=False)
+        assert registry.get("engine", _Engine) is not registry.get("engine", _Engine)
+        assert registry.get_stats()["components"] == 0
+
+    def test_concurrent_get_builds_once(self):
+        registry = ComponentRegistry()
+        built = []
+        barrier = threading.Barrier(8)
+
+        def _factory():
+            built.append(1)
+            return _Engine()
+
+        def _worker(results):
+            barrier.wait()
+            results.append(registry.get("engine", _factory))
+
+        results = []
+        threads = [threading.Thread(target=_worker, args=(results,)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(built) == 1
+        assert len({id(r) for r in results}) == 1
+
+    def test_clear_by_name(self):
+        registry = ComponentRegistry()
+        registry.get("a", _Engine)
+        registry.get("b", _Engine)
+
+        assert registry.clear("a") == 1
+        assert registry.names() == ["b"]
+
+
+class TestSalesBotSharing:
+    def test_sessions_share_engines_but_not_state(self, mock_llm):
+        from src.bot import SalesBot
+
+        first = SalesBot(llm=mock_llm)
+        second = SalesBot(llm=mock_llm)
+
+        assert first.classifier is not second.classifier
+        assert first.classifier.hybrid is second.classifier.hybrid
+        assert first.dialogue_policy._repair_protected == second.dialogue_policy._repair_protected
+        assert first.generator._product_overview is second.generator._product_overview
+        assert first._config is second._config
+        assert "hybrid_classifier" in get_component_registry().names()
+
+        assert first.guard is not second.guard
+        assert first.state_machine.collected_data is not second.state_machine.collected_data
@@ -0,0 +1,223 @@
+"""
+Tests for turn-scoped condition memoization (src/conditions/cache.py).
+
+These tests verify:
+1. VersionedDict changes version on every mutation
+2. ConditionRegistry.evaluate() memoizes per (condition, context version)
+3. Contexts built independently from one turn snapshot share results
+4. Failed evaluations are not cached
+5. Cache statistics are reported through trace.py
+
+Run with: pytest tests/test_condition_cache.py -v
+"""
+
+import pytest
+
+from src.conditions.cache import ConditionCache, VersionedDict, next_data_version
+from src.conditions.registry import ConditionEvaluationError, ConditionRegistry
+from src.conditions.state_machine.context import EvaluatorContext
+from src.conditions.trace import EvaluationTrace, TraceCollector
+
+
+@pytest.fixture
+def counting_registry():
+    """Registry whose conditions count how often they are really called."""
+    registry = ConditionRegistry("cache_test", EvaluatorContext)
+    registry.calls = {"has_company_size": 0, "is_angry": 0, "broken": 0}
+
+    @registry.condition("has_company_size", requires_fields={"company_size"})
+    def has_company_size(ctx: EvaluatorContext) -> bool:
+        registry.calls["has_company_size"] += 1
+        return bool(ctx.collected_data.get("company_size"))
+
+    @registry.condition("is_angry")
+    def is_angry(ctx: EvaluatorContext) -> bool:
+        registry.calls["is_angry"] += 1
+        return ctx.frustration_level >= 3
+
+    @registry.condition("broken")
+    def broken(ctx: EvaluatorContext) -> bool:
+        registry.calls["broken"] += 1
+        raise RuntimeError("boom")
+
+    return registry
+
+
+def _context(cache, data_version, **overrides):
+    fields = dict(
+        collected_data={"company_size": 10},
+        state="spin_situation",
+        turn_number=3,
+        current_intent="price_question",
+        condition_cache=cache,
+        data_version=data_version,
+    )
+    fields.update(overrides)
+    return EvaluatorContext(**fields)
+
+
+class TestVersionedDict:
+    def test_every_mutation_changes_version(self):
+        data = VersionedDict({"a": 1})
+        seen = {data.version}
+
+        for mutate in (
+            lambda d: d.__setitem__("b", 2),
+            lambda d: d.update(c=3),
+            lambda d: d.pop("a"),
+            lambda d: d.setdefault("e", 5),
+            lambda d: d.__delitem__("b"),
+            lambda d: d.clear(),
+        ):
+            mutate(data)
+            assert data.version not in seen
+            seen.add(data.version)
+
+    def test_reads_keep_version(self):
+        data = VersionedDict({"a": 1})
+        version = data.version
+        data.get("a")
+        data.setdefault("a", 2)
+        dict(data)
+        assert data.version == version
+
+    def test_from_state_machine_uses_collected_data_version(self):
+        from src.state_machine import StateMachine
+
+        sm = StateMachine()
+        sm.collected_data["company_size"] = 5
+        ctx = EvaluatorContext.from_state_machine(sm, "greeting")
+        assert ctx.data_version == sm.collected_data.version
+
+        sm.collected_data["role"] = "cto"
+        assert EvaluatorContext.from_state_machine(sm, "greeting").data_version != ctx.data_version
+
+
+class TestConditionCache:
+    def test_same_turn_contexts_share_results(self, counting_registry):
+        cache = ConditionCache()
+        version = next_data_version()
+
+        # Two builders (e.g. PriorityAssigner and a Knowledge Source) build
+        # separate contexts from the same snapshot
+        first = _context(cache, version)
+        second = _context(cache, version)
+
+        assert counting_registry.evaluate("has_company_size", first) is True
+        assert counting_registry.evaluate("has_company_size", second) is True
+        assert counting_registry.evaluate("has_company_size", first) is True
+        assert counting_registry.calls["has_company_size"] == 1
+
+    def test_differing_fields_are_not_shared(self, counting_registry):
+        cache = ConditionCache()
+        version = next_data_version()
+
+        calm = _context(cache, version, frustration_level=0)
+        angry = _context(cache, version, frustration_level=4)
+
+        assert counting_registry.evaluate("is_angry", calm) is False
+        assert counting_registry.evaluate("is_angry", angry) is True
+        assert counting_registry.calls["is_angry"] == 2
+
+    def test_new_data_version_misses(self, counting_registry):
+        cache = ConditionCache()
+
+        counting_registry.evaluate("has_company_size", _context(cache, next_data_version()))
+        counting_registry.evaluate("has_company_size", _context(cache, next_data_version()))
+        assert counting_registry.calls["has_company_size"] == 2
+
+    def test_registries_do_not_share_results(self, counting_registry):
+        other = ConditionRegistry("other", EvaluatorContext)
+
+        @other.condition("has_company_size")
+        def always_false(ctx: EvaluatorContext) -> bool:
+            return False
+
+        ctx = _context(ConditionCache(), next_data_version())
+        assert counting_registry.evaluate("has_company_size", ctx) is True
+        assert other.evaluate("has_company_size", ctx) is False
+
+    def test_without_version_always_evaluates(self, counting_registry):
+        cache = ConditionCache()
+        ctx = _context(cache, None)
+
+        counting_registry.evaluate("has_company_size", ctx)
+        counting_registry.evaluate("has_company_size", ctx)
+
+        assert counting_registry.calls["has_company_size"] == 2
+        assert cache.get_stats().uncached == 2
+        assert len(cache) == 0
+
+    def test_without_cache_always_evaluates(self, counting_registry):
+        ctx = _context(None, next_data_version())
+
+        counting_registry.evaluate("has_company_size", ctx)
+        counting_registry.evaluate("has_company_size", ctx)
+        assert counting_registry.calls["has_company_size"] == 2
+
+    def test_errors_are_not_cached(self, counting_registry):
+        ctx = _context(ConditionCache(), next_data_version())
+
+        for _ in range(2):
+            with pytest.raises(ConditionEvaluationError):
+                counting_registry.evaluate("broken", ctx)
+        assert counting_registry.calls["broken"] == 2
+
+
+class TestCacheStats:
+    def test_stats_and_trace_entries(self, counting_registry):
+        cache = ConditionCache()
+        version = next_data_version()
+        trace = EvaluationTrace(rule_name="test_rule")
+
+        for _ in range(3):
+            counting_registry.evaluate("has_company_size", _context(cache, version), trace)
+        counting_registry.evaluate("is_angry", _context(cache, version), trace)
+
+        stats = cache.get_stats()
+        assert stats.evaluations == 4
+        assert stats.hits == 2
+        assert stats.misses == 2
+        assert stats.hit_rate == pytest.approx(0.5)
+        assert stats.by_condition == {"has_company_size": (3, 2), "is_angry": (1, 0)}
+        assert stats.to_compact_string().startswith("[CONDITIONS] 4 evaluations, 2 cached (50%)")
+
+        assert [entry.cached for entry in trace.entries] == [False, True, True, False]
+        assert "[cached]" in trace.entries[1].to_compact_string()
+
+    def test_collector_aggregates_turns(self, counting_registry):
+        collector = TraceCollector()
+        for _ in range(2):
+            cache = ConditionCache()
+            ctx = _context(cache, next_data_version())
+            counting_registry.evaluate("has_company_size", ctx)
+            counting_registry.evaluate("has_company_size", ctx)
+            collector.add_cache_stats(cache.get_stats())
+
+        summary = collector.get_summary()
+        assert summary.cache_turns == 2
+        assert summary.cache_evaluations == 4
+        assert summary.cache_hits == 2
+        assert summary.to_dict()["condition_cache"]["hit_rate"] == pytest.approx(0.5)
+
+        collector.clear()
+        assert collector.get_cache_stats() == []
+
+
+class TestBlackboardIntegration:
+    def test_turn_shares_one_cache(self, mock_llm):
+        from src.bot import SalesBot
+
+        bot = SalesBot(llm=mock_llm)
+        bot.process("Привет")
+        first = bot._orchestrator._blackboard.get_context()
+        bot.process("Сколько стоит?")
+        second = bot._orchestrator._blackboard.get_context()
+
+        assert isinstance(first.condition_cache, ConditionCache)
+        assert first.condition_cache is not second.condition_cache
+        assert first.data_version != second.data_version
+
+        stats = bot._orchestrator._blackboard.get_condition_cache_stats()
+        assert stats.evaluations >= stats.hits
+        assert "condition_cache" in bot._orchestrator._blackboard.get_turn_summary()
@@ -0,0 +1,241 @@
+"""
+Tests for the process-wide shared config/flow bundle cache.
+
+ConfigLoader.load_bundle(shared=True) returns frozen LoadedConfig/FlowConfig
+objects by reference and rebuilds them only when YAML files or runtime
+overrides change.
+"""
+
+import copy
+import os
+import pickle
+import shutil
+from pathlib import Path
+
+import pytest
+
+import src.config_loader as config_loader_module
+from src.config_loader import (
+    ConfigLoader,
+    FrozenConfigError,
+    clear_all_config_overrides,
+    clear_config_bundle_cache,
+    get_config_bundle_cache_stats,
+    set_config_override,
+)
+
+YAML_CONFIG_DIR = Path(config_loader_module.__file__).parent / "yaml_config"
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(monkeypatch):
+    clear_config_bundle_cache()
+    clear_all_config_overrides()
+    monkeypatch.setattr(config_loader_module._bundle_cache, "check_interval", 0.0)
+    yield
+    clear_config_bundle_cache()
+    clear_all_config_overrides()
+
+
+@pytest.fixture
+def config_copy(tmp_path):
+    target = tmp_path / "yaml_config"
+    shutil.copytree(YAML_CONFIG_DIR, target)
+    return target
+
+
+class TestSharedBundle:
+    def test_same_objects_returned_by_reference(self):
+        config, flow = ConfigLoader().load_bundle(flow_name="spin_selling", shared=True)
+        config2, flow2 = ConfigLoader().load_bundle(flow_name="spin_selling", shared=True)
+
+        assert config2 is config
+        assert flow2 is flow
+        assert config.flow_name == flow.name == "spin_selling"
+        assert get_config_bundle_cache_stats() == {"bundles": 1, "hits": 1, "misses": 1}
+
+    def test_clear_resets_counters(self):
+        ConfigLoader().load_bundle(flow_name="spin_selling", shared=True)
+        ConfigLoader().load_bundle(flow_name="spin_selling", shared=True)
+
+        assert clear_config_bundle_cache() == 1
+        assert get_config_bundle_cache_stats() == {"bundles": 0, "hits": 0, "misses": 0}
+
+    def test_unshared_load_is_private_and_mutable(self):
+        shared_config, _ = ConfigLoader().load_bundle(flow_name="spin_selling", shared=True)
+        config, _ = ConfigLoader().load_bundle(flow_name="spin_selling")
+
+        assert config is not shared_config
+        config.constants["limits"]["max_gobacks"] = 99
+        assert shared_config.constants["limits"].get("max_gobacks") != 99
+
+    def test_flows_are_cached_separately(self):
+        _, spin = ConfigLoader().load_bundle(flow_name="spin_selling", shared=True)
+        _, bant = ConfigLoader().load_bundle(flow_name="bant", shared=True)
+
+        assert spin.name == "spin_selling"
+        assert bant.name == "bant"
+        assert get_config_bundle_cache_stats()["bundles"] == 2
+
+
+class TestInvalidation:
+    def test_rebuilt_when_yaml_file_changes(self, config_copy):
+        config, flow = ConfigLoader(config_copy).load_bundle(flow_name="spin_selling", shared=True)
+
+        constants = config_copy / "constants.yaml"
+        stat = constants.stat()
+        constants.write_text(constants.read_text(encoding="utf-8") + "\n# touched\n", encoding="utf-8")
+        os.utime(constants, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        config2, flow2 = ConfigLoader(config_copy).load_bundle(flow_name="spin_selling", shared=True)
+
+        assert config2 is not config
+        assert flow2 is not flow
+        assert get_config_bundle_cache_stats()["bundles"] == 1
+
+    def test_runtime_override_changes_key(self):
+        config, _ = ConfigLoader().load_bundle(flow_name="spin_selling", shared=True)
+
+        set_config_override("default", {"limits": {"max_gobacks": 7}})
+        overridden, _ = ConfigLoader().load_bundle(flow_name="spin_selling", shared=True)
+
+        assert overridden is not config
+        assert overridden.limits["max_gobacks"] == 7
+
+
+class TestFrozen:
+    def test_mutation_raises(self):
+        config, flow = ConfigLoader().load_bundle(flow_name="spin_selling", shared=True)
+        state_name = next(iter(flow.states))
+
+        with pytest.raises(FrozenConfigError):
+            config.constants["limits"]["max_gobacks"] = 1
+        with pytest.raises(FrozenConfigError):
+            flow.states[state_name].setdefault("new_key", {})
+        with pytest.raises(FrozenConfigError):
+            config.spin_phases.append("extra")
+        with pytest.raises(FrozenConfigError):
+            config.flow_name = "bant"
+
+    def test_copies_are_mutable(self):
+        config, flow = ConfigLoader().load_bundle(flow_name="spin_selling", shared=True)
+
+        config_copy = copy.deepcopy(config)
+        config_copy.flow_name = "bant"
+        config_copy.constants["limits"]["max_gobacks"] = 1
+        states = pickle.loads(pickle.dumps(flow.states))
+        states["new_state"] = {}
+        limits = copy.copy(config.constants["limits"])
+        limits["max_gobacks"] = 2
+
+        assert type(config_copy.constants) is dict
+        assert config.flow_name == "spin_selling"
+        assert "new_state" not in flow.states
+
+
+class TestDerivedViews:
+    def test_frozen_views_are_built_once_and_read_only(self):
+        config, flow = ConfigLoader().load_bundle(flow_name="spin_selling", shared=True)
+
+        assert flow.state_to_phase is flow.state_to_phase
+        assert flow.phase_to_state is flow.phase_to_state
+        assert flow.skip_map is flow.skip_map
+        assert config.intent_category_sets is config.intent_category_sets
+        with pytest.raises(FrozenConfigError):
+            flow.state_to_phase["new_state"] = "situation"
+        with pytest.raises(FrozenConfigError):
+            config.intent_category_sets["price_related"] = frozenset()
+        assert isinstance(flow.final_states, frozenset)
+        assert isinstance(config.get_intent_category_set("price_related"), frozenset)
+
+    def test_frozen_views_match_private_copy(self):
+        config, flow = ConfigLoader().load_bundle(flow_name="spin_selling", shared=True)
+        private_config, private_flow = ConfigLoader().load_bundle(flow_name="spin_selling")
+
+        for name in ("state_to_phase", "phase_to_state", "phase_order", "progress_intents",
+                     "skip_map", "goback_map", "final_states"):
+            assert getattr(flow, name) == getattr(private_flow, name), name
+        assert config.final_states == private_config.final_states
+        assert config.intent_category_sets == private_config.intent_category_sets
+
+    def test_mutable_config_rebuilds_views(self):
+        _, flow = ConfigLoader().load_bundle(flow_name="spin_selling")
+        state_name = next(iter(flow.states))
+
+        flow.states[state_name]["phase"] = "custom_phase"
+        flow.states[state_name]["is_final"] = True
+
+        assert flow.state_to_phase[state_name] == "custom_phase"
+        assert flow.phase_to_state["custom_phase"] == state_name
+        assert state_name in flow.final_states
+
+    def test_deepcopy_drops_cached_views(self):
+        _, flow = ConfigLoader().load_bundle(flow_name="spin_selling", shared=True)
+        assert flow.state_to_phase
+
+        flow_copy = copy.deepcopy(flow)
+        state_name = next(iter(flow_copy.states))
+        flow_copy.states[state_name]["phase"] = "custom_phase"
+
+        assert "_derived_views" not in flow_copy.__dict__
+        assert flow_copy.state_to_phase[state_name] == "custom_phase"
+        assert flow.state_to_phase.get(state_name) != "custom_phase"
+
+    def test_intent_category_sets_match_constants(self):
+        from src.yaml_config.constants import INTENT_CATEGORIES, get_intent_category_set
+
+        config, _ = ConfigLoader().load_bundle(flow_name="spin_selling", shared=True)
+
+        assert set(config.intent_category_sets) == set(INTENT_CATEGORIES)
+        for name, intents in INTENT_CATEGORIES.items():
+            assert config.get_intent_category_set(name) == frozenset(intents), name
+            assert get_intent_category_set(name) == frozenset(intents), name
+        assert config.get_intent_category_set("no_such_category") == frozenset()
+
+
+class TestNoPerTurnRebuilds:
+    """Per-turn code must use the cached views instead of rebuilding them."""
+
+    SRC_DIR = Path(config_loader_module.__file__).parent
+    # Where the views are defined, plus offline analysis tooling
+    EXEMPT = {"config_loader.py", "yaml_config/constants.py", "simulator"}
+
+    @classmethod
+    def _modules(cls):
+        import ast
+
+        for path in sorted(cls.SRC_DIR.rglob("*.py")):
+            rel = path.relative_to(cls.SRC_DIR).as_posix()
+            if rel in cls.EXEMPT or rel.split("/", 1)[0] in cls.EXEMPT:
+                continue
+            yield rel, ast.parse(path.read_text(encoding="utf-8"))
+
+    def test_no_intent_category_set_rebuilds(self):
+        import ast
+
+        violations = []
+        for rel, tree in self._modules():
+            for node in ast.walk(tree):
+                if (
+                    isinstance(node, ast.Call)
+                    and isinstance(node.func, ast.Name)
+                    and node.func.id in ("set", "frozenset")
+                    and node.args
+                    and "INTENT_CATEGORIES" in ast.unparse(node.args[0])
+                ):
+                    violations.append(f"{rel}:{node.lineno}")
+
+        assert violations == [], f"use get_intent_category_set(): {violations}"
+
+    def test_no_state_to_phase_rebuilds(self):
+        import ast
+
+        violations = []
+        for rel, tree in self._modules():
+            for node in ast.walk(tree):
+                if isinstance(node, ast.DictComp) and any(
+                    "phase_mapping" in ast.unparse(gen.iter) for gen in node.generators
+                ):
+                    violations.append(f"{rel}:{node.lineno}")
+
+        assert violations == [], f"use FlowConfig.state_to_phase: {violations}"
@@ -4,6 +4,7 @@ Tests for DAG State Machine.
 Tests cover:
 - DAG models (DAGBranch, DAGExecutionContext, DAGNodeConfig)
 - DAG executor (CHOICE, FORK, JOIN)
+- Compiled DAG graph and validation
 - Branch router
 - Sync points
 - History manager
@@ -24,6 +25,7 @@ from src.dag.models import (
     DAGNodeConfig,
 )
 from src.dag.executor import DAGExecutor, DAGExecutionResult
+from src.dag.graph import CompiledDAG, CompiledDAGNode, join_required_count
 from src.dag.branch_router import BranchRouter, BranchRouteResult, IntentBranchMapping
 from src.dag.sync_points import SyncPointManager, SyncStrategy, SyncResult
 from src.dag.history import HistoryManager, HistoryEntry, ConversationFlowTracker
@@ -265,6 +267,174 @@ class TestDAGNodeConfig:
         assert node.expects_branches == ["budget", "timeline"]
         assert node.on_join_action == "aggregate_results"
 
+# =============================================================================
+# Compiled DAG Graph Tests
+# =============================================================================
+
+BANT_STATES = {
+    "greeting": {"transitions": {"agreement": "router"}},
+    "router": {
+        "type": "choice",
+        "choices": [
+            {"condition": "is_enterprise", "next": "qualification"},
+            {"condition": "", "next": "ignored"},
+        ],
+        "default": "qualification",
+    },
+    "qualification": {
+        "type": "fork",
+        "branches": [
+            {"id": "budget", "start_at": "collect_budget"},
+            {"id": "timeline", "start_at": "collect_timeline", "condition": "has_timeline"},
+        ],
+        "join_at": "qual_complete",
+    },
+    "collect_budget": {"transitions": {"data_complete": "_branch_complete"}},
+    "collect_timeline": {"transitions": {"data_complete": [{"when": "x", "then": "_branch_complete"}]}},
+    "qual_complete": {
+        "type": "join",
+        "expects_branches": ["budget", "timeline"],
+        "join_condition": "majority",
+        "transitions": {"qualified": "presentation"},
+    },
+    "presentation": {},
+}
+
+
+class TestCompiledDAG:
+    """Tests for CompiledDAG and CompiledDAGNode."""
+
+    def test_integer_ids_and_adjacency(self):
+        """States get integer IDs in order; edges are index arrays."""
+        graph = CompiledDAG.compile(BANT_STATES)
+
+        assert graph.names[:graph.defined] == tuple(BANT_STATES)
+        assert graph.index["router"] == 1
+        router_edges = {graph.names[i] for i in graph.successors[graph.index["router"]]}
+        assert router_edges == {"qualification"}
+        fork_edges = {graph.names[i] for i in graph.successors[graph.index["qualification"]]}
+        assert fork_edges == {"collect_budget", "collect_timeline", "qual_complete"}
+        # Referenced but undefined states get IDs after the flow's states
+        assert graph.index["_branch_complete"] >= graph.defined
+        assert graph.node("greeting") is None
+
+    def test_nodes_are_normalized(self):
+        """Invalid choices are dropped and JOIN conditions become counters."""
+        graph = CompiledDAG.compile(BANT_STATES)
+
+        router = graph.node("router")
+        assert router.choices == (("is_enterprise", "qualification"),)
+        fork = graph.node("qualification")
+        assert fork.branches[1] == ("timeline", "collect_timeline", "has_timeline")
+        join = graph.node("qual_complete")
+        assert join.join_condition == JoinCondition.MAJORITY
+        assert join.join_required == 1
+
+    def test_index_is_read_only(self):
+        """The compiled graph cannot be mutated."""
+        graph = CompiledDAG.compile(BANT_STATES)
+
+        with pytest.raises(TypeError):
+            graph.index["new"] = 1
+        with pytest.raises(AttributeError):
+            graph.defined = 0
+
+    @pytest.mark.parametrize("condition", list(JoinCondition))
+    @pytest.mark.parametrize("expected_count", [0, 1, 2, 3, 4, 5])
+    def test_join_counter_matches_join_condition(self, condition, expected_count):
+        """join_required agrees with DAGExecutor._check_join_condition."""
+        executor = DAGExecutor(MagicMock(), condition_registry=MagicMock())
+        expected = {f"b{i}" for i in range(expected_count)}
+        required = join_required_count(condition, expected_count)
+
+        for done in range(expected_count + 1):
+            completed = {f"b{i}" for i in range(done)}
+            assert (done >= required) == executor._check_join_condition(
+                condition, completed, expected
+            )
+
+    def test_validate_valid_graph(self):
+        """A consistent flow has no errors."""
+        graph = CompiledDAG.compile(BANT_STATES)
+        registry = MagicMock()
+        registry.has.return_value = True
+
+        report = graph.validate(entry_states=["greeting"], registry=registry)
+
+        assert report.is_valid
+        assert report.unreachable == []
+
+    def test_validate_reports_problems(self):
+        """Undefined targets, unreachable nodes, cycles and mismatches are reported."""
+        states = {
+            "greeting": {},
+            "a": {"type": "choice", "choices": [{"condition": "c", "next": "b"}], "default": "missing"},
+            "b": {"type": "choice", "choices": [{"condition": "c", "next": "a"}]},
+            "fork": {
+                "type": "fork",
+                "branches": [{"id": "x", "start_at": "greeting"}, {"start_at": "greeting"}],
+                "join_at": "greeting",
+            },
+        }
+        registry = MagicMock()
+        registry.has.side_effect = lambda name: name != "c"
+
+        report = CompiledDAG.compile(states).validate(entry_states=["greeting"], registry=registry)
+
+        assert not report.is_valid
+        assert report.undefined_targets == [("a", "missing")]
+        assert sorted(report.unreachable) == ["a", "b", "fork"]
+        assert [sorted(cycle) for cycle in report.cycles] == [["a", "b"]]
+        assert len(report.join_mismatches) == 1
+        assert ("a", "c") in report.unknown_conditions
+        assert report.invalid_branches == ["fork"]
+        assert report.to_dict()["is_valid"] is False
+
+    def test_flow_config_compiles_graph_at_load(self):
+        """FlowConfig with DAG nodes compiles its graph in __post_init__."""
+        from src.config_loader import FlowConfig
+
+        flow = FlowConfig(name="bant", states=BANT_STATES, entry_points={"default": "greeting"})
+
+        assert flow._dag_graph is flow.dag_graph
+        assert flow.dag_graph.node("router").node_type == NodeType.CHOICE
+        assert flow.validate_dag().is_valid
+
+    def test_executor_uses_compiled_graph(self):
+        """DAGExecutor reads nodes from FlowConfig.dag_graph."""
+        from src.config_loader import FlowConfig
+
+        flow = FlowConfig(name="bant", states=BANT_STATES, entry_points={"default": "greeting"})
+        registry = MagicMock()
+        registry.evaluate.return_value = False
+        executor = DAGExecutor(flow, condition_registry=registry)
+        dag_ctx = DAGExecutionContext(primary_state="router")
+
+        with patch.object(flow, "get_dag_node", side_effect=AssertionError("config walked")):
+            choice = executor.execute_node("router", "intent", MagicMock(), dag_ctx)
+            fork = executor.execute_node("qualification", "intent", MagicMock(), dag_ctx)
+
+        assert choice.action == "choice_default"
+        assert choice.primary_state == "qualification"
+        assert fork.active_branches == ["budget"]
+        assert executor.execute_node("greeting", "intent", MagicMock(), dag_ctx).is_dag is False
+
+    def test_invalid_join_condition_is_dag_error(self):
+        """An invalid join_condition still fails at execution, not at load."""
+        node = CompiledDAGNode.from_config(DAGNodeConfig.from_state_config(
+            "join", {"type": "join", "expects_branches": ["a"], "join_condition": "bogus"},
+        ))
+        flow = MagicMock()
+        flow.get_dag_node.return_value = DAGNodeConfig.from_state_config(
+            "join", {"type": "join", "expects_branches": ["a"], "join_condition": "bogus"},
+        )
+        executor = DAGExecutor(flow)
+
+        result = executor.execute_node("join", "intent", MagicMock(), DAGExecutionContext(primary_state="join"))
+
+        assert node.join_condition is None
+        assert result.action == "dag_error"
+
 # =============================================================================
 # DAG Executor Tests
 # =============================================================================
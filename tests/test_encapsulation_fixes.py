@@ -148,6 +148,45 @@ class TestDeepFreezeDict:
         result = deep_freeze_dict({"a": inner})
         assert result["a"] is inner  # Same object, not re-wrapped
 
+
+class TestFreezeDictShared:
+    """Test copy-on-write freezing against the previous snapshot."""
+
+    def test_without_previous_is_deep_freeze(self):
+        from src.blackboard.models import freeze_dict_shared, FrozenDict
+        result = freeze_dict_shared({"a": {"b": 1}})
+        assert isinstance(result["a"], FrozenDict)
+        assert result == {"a": {"b": 1}}
+
+    def test_unchanged_returns_previous(self):
+        from src.blackboard.models import freeze_dict_shared
+        previous = freeze_dict_shared({"a": {"b": 1}, "c": [1, 2]})
+        assert freeze_dict_shared({"a": {"b": 1}, "c": [1, 2]}, previous) is previous
+
+    def test_changed_entry_refrozen_others_shared(self):
+        from src.blackboard.models import freeze_dict_shared, FrozenDict
+        previous = freeze_dict_shared({"a": {"b": 1}, "c": {"d": 2}})
+        result = freeze_dict_shared({"a": {"b": 1}, "c": {"d": 3}, "e": {}}, previous)
+        assert result is not previous
+        assert result["a"] is previous["a"]
+        assert isinstance(result["c"], FrozenDict)
+        assert result == {"a": {"b": 1}, "c": {"d": 3}, "e": {}}
+        assert previous["c"]["d"] == 2
+
+    def test_removed_key_not_shared(self):
+        from src.blackboard.models import freeze_dict_shared
+        previous = freeze_dict_shared({"a": 1, "b": 2})
+        result = freeze_dict_shared({"a": 1}, previous)
+        assert result == {"a": 1}
+        assert "b" in previous
+
+    def test_equal_values_of_other_type_not_shared(self):
+        from src.blackboard.models import freeze_dict_shared
+        previous = freeze_dict_shared({"flag": 1, "items": [1]})
+        result = freeze_dict_shared({"flag": True, "items": (1,)}, previous)
+        assert result["flag"] is True
+        assert isinstance(result["items"], tuple)
+
 # =============================================================================
 # GoBackInfo Tests
 # =============================================================================
@@ -0,0 +1,123 @@
+"""
+Tests for the session-affine front router (src/front_router.py).
+"""
+
+import json
+
+import httpx
+from fastapi.testclient import TestClient
+
+from src.front_router import FrontRouter, HashRing, create_router_app, routing_key
+
+
+WORKERS = ["http://w1:8101", "http://w2:8102", "http://w3:8103"]
+
+
+def _payload(user_id, session_id, text="привет"):
+    return {"session_id": session_id, "user_id": user_id, "message": {"text": text}}
+
+
+class _Workers:
+    """MockTransport backend: records which worker got each request."""
+
+    def __init__(self):
+        self.down = set()
+        self.calls = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        worker = f"{request.url.scheme}://{request.url.host}:{request.url.port}"
+        if worker in self.down:
+            raise httpx.ConnectError("connection refused", request=request)
+        self.calls.append((worker, request.url.path))
+        return httpx.Response(200, json={"worker": worker, "answer": "ok"})
+
+
+def _client(workers: _Workers, **kwargs) -> TestClient:
+    router = FrontRouter(
+        WORKERS,
+        client=httpx.AsyncClient(transport=httpx.MockTransport(workers.handler)),
+        **kwargs,
+    )
+    return TestClient(create_router_app(router))
+
+
+class TestHashRing:
+    def test_keys_spread_and_stay_stable(self):
+        ring = HashRing(WORKERS)
+        owners = [ring.node_for(f"user-{i}::s") for i in range(3000)]
+
+        assert owners == [ring.node_for(f"user-{i}::s") for i in range(3000)]
+        assert all(700 < owners.count(worker) < 1300 for worker in WORKERS)
+
+    def test_adding_worker_remaps_only_its_share(self):
+        before = HashRing(WORKERS)
+        after = HashRing(WORKERS + ["http://w4:8104"])
+        keys = [f"user-{i}::s" for i in range(4000)]
+
+        moved = [k for k in keys if before.node_for(k) != after.node_for(k)]
+
+        assert all(after.node_for(k) == "http://w4:8104" for k in moved)
+        assert 0.15 < len(moved) / len(keys) < 0.35
+
+    def test_nodes_for_lists_each_worker_once(self):
+        nodes = HashRing(WORKERS).nodes_for("u::s")
+        assert sorted(nodes) == sorted(WORKERS)
+
+
+class TestRoutingKey:
+    def test_default_and_sula_payloads(self):
+        path = "/api/v1/process"
+        assert routing_key(path, json.dumps(_payload("u1", "s1")).encode()) == "u1::s1"
+        sula = {"session": "s2", "client_text": "hi", "cleint_phone": "+7700"}
+        assert routing_key("/api/v1/process/sula", json.dumps(sula).encode()) == "+7700::s2"
+        assert routing_key(path, json.dumps([{"x": 1}, sula]).encode()) == "+7700::s2"
+
+    def test_other_paths_and_bad_bodies_are_unkeyed(self):
+        assert routing_key("/api/v1/users/u1/profile", b"") is None
+        assert routing_key("/api/v1/process", b"not json") is None
+
+
+class TestFrontRouter:
+    def test_session_always_reaches_same_worker(self):
+        workers = _Workers()
+        client = _client(workers)
+
+        for turn in range(5):
+            response = client.post("/api/v1/process", json=_payload("u1", "s1", f"turn {turn}"))
+            assert response.status_code == 200
+
+        assert len({worker for worker, _ in workers.calls}) == 1
+        assert workers.calls[0][0] == HashRing(WORKERS).node_for("u1::s1")
+
+    def test_failover_and_no_bounce_back_after_recovery(self):
+        workers = _Workers()
+        client = _client(workers, down_cooldown_seconds=0.0)
+        primary = HashRing(WORKERS).node_for("u1::s1")
+
+        workers.down.add(primary)
+        failover = client.post("/api/v1/process", json=_payload("u1", "s1")).json()["worker"]
+        workers.down.clear()
+        after_recovery = client.post("/api/v1/process", json=_payload("u1", "s1")).json()["worker"]
+
+        assert failover != primary
+        assert after_recovery == failover
+        assert client.app.state.router.get_stats()["failovers"] == 1
+
+    def test_all_workers_down_returns_503_with_retry_after(self):
+        workers = _Workers()
+        workers.down.update(WORKERS)
+        client = _client(workers)
+
+        response = client.post("/api/v1/process", json=_payload("u1", "s1"))
+
+        assert response.status_code == 503
+        assert response.headers["retry-after"]
+        assert response.json()["error"]["code"] == "SERVICE_UNAVAILABLE"
+
+    def test_unkeyed_requests_are_forwarded(self):
+        workers = _Workers()
+        client = _client(workers)
+
+        assert client.get("/api/v1/users/u1/profile").status_code == 200
+        assert workers.calls[-1][1] == "/api/v1/users/u1/profile"
+        assert client.get("/health").json()["workers_up"] == 3
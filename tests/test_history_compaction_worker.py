@@ -0,0 +1,169 @@
+"""
+Tests for background history compaction (src/history_compaction_worker.py).
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.bot import SalesBot
+from src.history_compaction_worker import HistoryCompactionWorker
+from src.session_manager import SessionManager
+from src.snapshot_buffer import LocalSnapshotBuffer
+
+
+LLM_COMPACT = {
+    "summary": ["Клиент обсуждал тарифы"],
+    "key_facts": ["10 сотрудников"],
+    "objections": [],
+    "decisions": [],
+    "open_questions": [],
+    "next_steps": ["Отправить КП"],
+}
+
+
+def _history(n):
+    return [{"user": f"u{i}", "bot": f"b{i}"} for i in range(n)]
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def worker():
+    # Compact after every turn so tests can drive the worker turn by turn
+    worker = HistoryCompactionWorker(min_new_turns=1)
+    yield worker
+    worker.close(timeout=2)
+
+
+class TestSnapshotPath:
+    def test_to_snapshot_never_calls_llm(self, mock_llm):
+        bot = SalesBot(llm=mock_llm)
+        bot.history = _history(6)
+
+        snapshot = bot.to_snapshot(compact_history=True, history_tail_size=4)
+
+        mock_llm.generate_structured.assert_not_called()
+        assert snapshot["history_compact"]["summary"] == ["Compacted 2 earlier turns."]
+        assert snapshot["history_compact_meta"]["compacted_turns"] == 2
+        # The fallback is not stored: the worker can still upgrade it
+        assert bot.history_compact is None
+
+    def test_snapshot_reuses_current_background_compact(self, mock_llm):
+        bot = SalesBot(llm=mock_llm)
+        bot.history = _history(6)
+        bot.apply_history_compact(LLM_COMPACT, {"compacted_turns": 2, "llm_model": "mock-model"})
+
+        snapshot = bot.to_snapshot(compact_history=True, history_tail_size=4)
+
+        assert snapshot["history_compact"] == LLM_COMPACT
+        assert snapshot["history_compact_meta"]["llm_model"] == "mock-model"
+
+    def test_apply_never_rolls_compact_back(self, mock_llm):
+        bot = SalesBot(llm=mock_llm)
+        assert bot.apply_history_compact({"summary": ["new"]}, {"compacted_turns": 5})
+        assert not bot.apply_history_compact({"summary": ["old"]}, {"compacted_turns": 3})
+        assert bot.history_compact == {"summary": ["new"]}
+
+
+class TestWorker:
+    def test_background_compaction_is_applied(self, mock_llm, worker):
+        mock_llm.generate_structured.return_value = LLM_COMPACT
+        bot = SalesBot(llm=mock_llm)
+        bot.history = _history(6)
+
+        assert worker.schedule("k", bot)
+        assert _wait_for(lambda: worker.get_stats()["applied"] == 1)
+
+        assert bot.history_compact == LLM_COMPACT
+        assert bot.history_compact_meta["compacted_turns"] == 2
+        # Already compacted: nothing new to schedule
+        assert not worker.schedule("k", bot)
+
+    def test_default_compacts_in_batches_of_turns(self, mock_llm):
+        mock_llm.generate_structured.return_value = LLM_COMPACT
+        worker = HistoryCompactionWorker()
+        bot = SalesBot(llm=mock_llm)
+        try:
+            bot.history = _history(7)
+            assert not worker.schedule("k", bot)
+
+            bot.history = _history(8)
+            assert worker.schedule("k", bot)
+            assert _wait_for(lambda: worker.get_stats()["applied"] == 1)
+            assert bot.history_compact_meta["compacted_turns"] == 4
+
+            bot.history = _history(11)
+            assert not worker.schedule("k", bot)
+            assert mock_llm.generate_structured.call_count == 1
+        finally:
+            worker.close(timeout=2)
+
+    def test_requests_for_busy_session_are_coalesced(self, mock_llm, worker):
+        release = threading.Event()
+        calls = []
+
+        def slow_generate(prompt, schema):
+            calls.append(prompt)
+            release.wait(5)
+            return LLM_COMPACT
+
+        mock_llm.generate_structured.side_effect = slow_generate
+        bot = SalesBot(llm=mock_llm)
+        bot.history = _history(5)
+        worker.schedule("k", bot)
+        assert _wait_for(lambda: worker.get_stats()["running"] == 1)
+
+        for n in (6, 7, 8):
+            bot.history = _history(n)
+            worker.schedule("k", bot)
+        stats = worker.get_stats()
+        assert stats["backlog"] == 1 and stats["coalesced"] == 2
+
+        release.set()
+        assert _wait_for(lambda: worker.get_stats()["completed"] == 2)
+        assert len(calls) == 2
+        assert bot.history_compact_meta["compacted_turns"] == 4
+
+    def test_close_drops_backlog(self, mock_llm):
+        release = threading.Event()
+        mock_llm.generate_structured.side_effect = lambda *_: release.wait(5) and LLM_COMPACT
+        worker = HistoryCompactionWorker(min_new_turns=1)
+        for key in ("a", "b", "c"):
+            bot = SalesBot(llm=mock_llm)
+            bot.history = _history(6)
+            worker.schedule(key, bot)
+        assert _wait_for(lambda: worker.get_stats()["running"] == 1)
+
+        assert worker.close(timeout=0.1) == 2
+        release.set()
+        assert not worker.schedule("d", bot)
+
+
+class TestSessionManagerIntegration:
+    def test_close_does_not_wait_for_llm(self, mock_llm, worker, tmp_path):
+        release = threading.Event()
+        mock_llm.generate_structured.side_effect = lambda *_: release.wait(5) and LLM_COMPACT
+        buffer = LocalSnapshotBuffer(db_path=str(tmp_path / "buffer.sqlite"))
+        manager = SessionManager(snapshot_buffer=buffer, compaction_worker=worker)
+        bot = manager.get_or_create("s1", llm=mock_llm, client_id="c1")
+        bot.history = _history(6)
+
+        manager.touch("s1", client_id="c1")
+        assert _wait_for(lambda: worker.get_stats()["running"] == 1)
+        started = time.monotonic()
+        assert manager.close_session("s1", client_id="c1")
+        elapsed = time.monotonic() - started
+        release.set()
+
+        assert elapsed < 2
+        assert buffer.get("s1", client_id="c1")["history_compact"] is not None
+        assert manager.get_cache_stats()["compaction"]["scheduled"] == 1
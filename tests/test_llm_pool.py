@@ -0,0 +1,228 @@
+"""
+Tests for LLMEndpointPool and OllamaClient multi-endpoint routing.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from src.llm import OllamaClient
+from src.llm_pool import (
+    EndpointStatus,
+    LLMEndpointPool,
+    NoHealthyEndpointError,
+    llm_session_affinity,
+)
+
+
+def _ollama_response(content: str) -> MagicMock:
+    response = MagicMock()
+    response.raise_for_status.return_value = None
+    response.json.return_value = {"message": {"content": content}}
+    return response
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRouting:
+    def test_requires_endpoints(self):
+        with pytest.raises(ValueError):
+            LLMEndpointPool([])
+
+    def test_least_outstanding_requests(self):
+        pool = LLMEndpointPool(["http://a", "http://b", "http://c"], sticky_sessions=False)
+
+        first = pool.acquire()
+        second = pool.acquire()
+        third = pool.acquire()
+
+        assert {first.base_url, second.base_url, third.base_url} == {
+            "http://a", "http://b", "http://c",
+        }
+
+        pool.release(second, success=True, latency_ms=10)
+        assert pool.acquire().base_url == second.base_url
+
+    def test_sticky_session_reuses_endpoint(self):
+        pool = LLMEndpointPool(["http://a", "http://b"])
+
+        with llm_session_affinity("user::s1"):
+            with pool.lease() as endpoint:
+                pinned = endpoint.base_url
+            # Endpoint with in-flight load is still preferred for the session
+            other = pool.acquire(session_key="other")
+            with pool.lease() as endpoint:
+                assert endpoint.base_url == pinned
+        pool.release(other, success=True)
+
+    def test_from_settings_requires_two_endpoints(self):
+        assert LLMEndpointPool.from_settings({"endpoints": ["http://a"]}) is None
+        pool = LLMEndpointPool.from_settings({
+            "endpoints": ["http://a", {"base_url": "http://b/", "name": "gpu-b"}],
+            "pool": {"sticky_sessions": False},
+        })
+        assert [ep.name for ep in pool.endpoints] == ["http://a", "gpu-b"]
+        assert pool.endpoints[1].base_url == "http://b"
+
+    def test_shared_pool_per_endpoint_set(self):
+        llm_settings = {"endpoints": ["http://shared-a", "http://shared-b"]}
+
+        pool = LLMEndpointPool.from_settings(llm_settings, shared=True)
+
+        assert LLMEndpointPool.from_settings(llm_settings, shared=True) is pool
+        assert LLMEndpointPool.from_settings(llm_settings) is not pool
+        assert LLMEndpointPool.from_settings(
+            {"endpoints": ["http://shared-a", "http://shared-c"]}, shared=True
+        ) is not pool
+
+    def test_failed_request_unpins_session(self):
+        pool = LLMEndpointPool(["http://a", "http://b"])
+
+        with llm_session_affinity("user::s1"):
+            with pool.lease() as endpoint:
+                pinned = endpoint.base_url
+            with pytest.raises(ConnectionError):
+                with pool.lease() as endpoint:
+                    assert endpoint.base_url == pinned
+                    raise ConnectionError("down")
+            with pool.lease() as endpoint:
+                assert endpoint.base_url != pinned
+            # The session is now pinned to the healthy endpoint
+            with pool.lease() as endpoint:
+                assert endpoint.base_url != pinned
+
+
+class TestCircuitBreaker:
+    def test_failed_endpoint_is_drained(self):
+        clock = _Clock()
+        pool = LLMEndpointPool(
+            ["http://a", "http://b"],
+            sticky_sessions=False,
+            circuit_breaker_threshold=2,
+            circuit_breaker_timeout=30,
+            now_provider=clock,
+        )
+        bad = pool.endpoints[0]
+        for _ in range(2):
+            pool.release(bad, success=False)
+
+        assert bad.status == EndpointStatus.OPEN
+        for _ in range(5):
+            endpoint = pool.acquire()
+            assert endpoint.base_url == "http://b"
+            pool.release(endpoint, success=True)
+
+    def test_half_open_probe_recovers(self):
+        clock = _Clock()
+        pool = LLMEndpointPool(
+            ["http://a"],
+            circuit_breaker_threshold=1,
+            circuit_breaker_timeout=30,
+            now_provider=clock,
+        )
+        endpoint = pool.acquire()
+        pool.release(endpoint, success=False)
+        with pytest.raises(NoHealthyEndpointError):
+            pool.acquire()
+
+        clock.now += 31
+        probe = pool.acquire()
+        assert probe.status == EndpointStatus.HALF_OPEN
+        with pytest.raises(NoHealthyEndpointError):
+            pool.acquire()
+        pool.release(probe, success=True, latency_ms=5)
+        assert probe.status == EndpointStatus.CLOSED
+
+    def test_health_checks_mark_unhealthy(self):
+        pool = LLMEndpointPool(["http://a", "http://b"], sticky_sessions=False)
+
+        results = pool.run_health_checks(lambda url: url == "http://b")
+
+        assert results == {"http://a": False, "http://b": True}
+        assert all(pool.acquire().base_url == "http://b" for _ in range(3))
+        assert pool.has_available_endpoint() is True
+
+    def test_stats_export_latency_and_queue_depth(self):
+        pool = LLMEndpointPool(["http://a"])
+        busy = pool.acquire()
+        done = pool.acquire()
+        pool.release(done, success=True, latency_ms=40)
+
+        stats = pool.get_stats()[0]
+
+        assert stats["in_flight"] == 1
+        assert stats["total_requests"] == 2
+        assert stats["p50_latency_ms"] == 40
+        pool.release(busy, success=True, latency_ms=60)
+
+
+class TestOllamaClientPool:
+    def test_single_endpoint_mode_has_no_pool(self):
+        client = OllamaClient(base_url="http://single")
+        assert client.endpoint_pool is None
+        assert client.get_stats_dict()["endpoints"] == []
+
+    def test_retry_fails_over_to_healthy_endpoint(self):
+        pool = LLMEndpointPool(
+            ["http://a", "http://b"],
+            sticky_sessions=False,
+            circuit_breaker_threshold=1,
+        )
+        client = OllamaClient(endpoint_pool=pool, enable_circuit_breaker=False)
+        client.INITIAL_DELAY = 0
+
+        def _post(url, json, timeout):
+            if url.startswith("http://a"):
+                raise requests.exceptions.ConnectionError("down")
+            return _ollama_response("ok")
+
+        with patch("requests.post", side_effect=_post) as mock_post:
+            assert client.generate("prompt") == "ok"
+            assert client.generate("prompt") == "ok"
+
+        called = [call.args[0] for call in mock_post.call_args_list]
+        assert called.count("http://a/api/chat") == 1
+        assert called[-1] == "http://b/api/chat"
+        stats = {ep["base_url"]: ep for ep in client.get_stats_dict()["endpoints"]}
+        assert stats["http://a"]["circuit_breaker_status"] == EndpointStatus.OPEN
+        assert stats["http://b"]["in_flight"] == 0
+
+    def test_sticky_retry_moves_off_failed_endpoint(self):
+        pool = LLMEndpointPool(["http://a", "http://b"])
+        client = OllamaClient(endpoint_pool=pool, enable_circuit_breaker=False)
+        client.INITIAL_DELAY = 0
+        down = set()
+
+        def _post(url, json, timeout):
+            if any(url.startswith(base) for base in down):
+                raise requests.exceptions.ConnectionError("down")
+            return _ollama_response("ok")
+
+        with llm_session_affinity("user::s1"), patch("requests.post", side_effect=_post) as mock_post:
+            assert client.generate("prompt") == "ok"
+            pinned = mock_post.call_args.args[0].split("/api/")[0]
+            down.add(pinned)
+            assert client.generate("prompt") == "ok"
+
+        called = [call.args[0].split("/api/")[0] for call in mock_post.call_args_list]
+        assert called[1:] == [pinned, ({"http://a", "http://b"} - {pinned}).pop()]
+        assert pool.endpoints[0].status == EndpointStatus.CLOSED
+        assert pool.endpoints[1].status == EndpointStatus.CLOSED
+
+    def test_all_endpoints_down_falls_back(self):
+        pool = LLMEndpointPool(["http://a", "http://b"], circuit_breaker_threshold=1)
+        pool.run_health_checks(lambda url: False)
+        client = OllamaClient(endpoint_pool=pool, enable_retry=False, enable_circuit_breaker=False)
+
+        with patch("requests.post") as mock_post:
+            response = client.generate("prompt", state="greeting")
+
+        mock_post.assert_not_called()
+        assert response == client._get_fallback("greeting")
@@ -0,0 +1,164 @@
+"""
+Tests for scripts/llm_replay_server.py (record/replay LLM + TEI stand-in).
+"""
+
+import json
+import threading
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import List, Literal
+from unittest.mock import MagicMock, patch
+
+from pydantic import BaseModel, Field
+
+from scripts.llm_replay_server import (
+    ReplayConfig,
+    ReplayStore,
+    canned_instance,
+    chat_key,
+    hash_embedding,
+    make_server,
+    parse_latency,
+)
+from src.decision_trace import LLMTrace, llm_request_key
+from src.knowledge.reranker import Reranker
+from src.knowledge.tei_client import embed_texts
+from src.llm import OllamaClient
+
+
+class Verdict(BaseModel):
+    verdict: Literal["pass", "fail"]
+    confidence: float = Field(ge=0.0, le=1.0)
+    reasons: List[str] = Field(min_length=1)
+
+
+@contextmanager
+def _serve(config):
+    server = make_server(config, host="127.0.0.1", port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _replay_config(store=None, **kwargs):
+    return ReplayConfig(
+        store=store or ReplayStore(),
+        model="replay-model",
+        embed_dim=8,
+        latency={kind: parse_latency("none") for kind in ("chat", "embed", "rerank")},
+        **kwargs,
+    )
+
+
+def _candidate(text):
+    return SimpleNamespace(section=SimpleNamespace(facts=text))
+
+
+class TestFallbacks:
+    def test_canned_instance_validates_against_schema(self):
+        schema = OllamaClient._grammar_schema(Verdict)
+        assert Verdict.model_validate(canned_instance(schema)).verdict == "pass"
+
+    def test_hash_embedding_is_deterministic_unit_vector(self):
+        first = hash_embedding("тариф Mini", 16)
+        assert first == hash_embedding("тариф Mini", 16)
+        assert first != hash_embedding("тариф Pro", 16)
+        assert abs(sum(v * v for v in first) - 1.0) < 1e-9
+
+    def test_unknown_requests_get_fallbacks(self):
+        config = _replay_config()
+        with _serve(config) as url:
+            client = OllamaClient(base_url=url, model="replay-model", enable_circuit_breaker=False)
+            assert client.health_check() is True
+            assert client.generate_structured("new prompt", Verdict).verdict == "pass"
+            assert client.generate("new prompt") == config.default_reply
+            vectors = embed_texts(["a", "b"], tei_url=url)
+            ranked = Reranker(url=url, timeout=5).rerank(
+                "цена тарифа", [_candidate("доставка"), _candidate("цена тарифа Mini")], top_k=1
+            )
+
+        assert len(vectors) == 2 and len(vectors[0]) == 8
+        assert ranked[0].section.facts == "цена тарифа Mini"
+        assert config.store.stats["chat"]["misses"] == 2
+
+
+class TestRecordReplay:
+    def test_recorded_traffic_is_replayed(self, tmp_path):
+        upstream = _replay_config(default_reply="upstream reply")
+        cassette = tmp_path / "perf.jsonl"
+
+        with _serve(upstream) as upstream_url:
+            recorder = _replay_config(
+                ReplayStore(cassette),
+                mode="record",
+                upstream_llm=upstream_url,
+                upstream_embed=upstream_url,
+                upstream_rerank=upstream_url,
+            )
+            with _serve(recorder) as url:
+                client = OllamaClient(base_url=url, enable_circuit_breaker=False)
+                assert client.generate("hello") == "upstream reply"
+                recorded_vectors = embed_texts(["kb section"], tei_url=url)
+
+        records = [json.loads(line) for line in cassette.read_text().splitlines()]
+        assert [r["kind"] for r in records] == ["chat", "embed"]
+
+        replay = _replay_config(ReplayStore(cassette), default_reply="fallback")
+        with _serve(replay) as url:
+            client = OllamaClient(base_url=url, enable_circuit_breaker=False)
+            assert client.generate("hello") == "upstream reply"
+            assert embed_texts(["kb section"], tei_url=url) == recorded_vectors
+
+        assert replay.store.stats["chat"]["hits"] == 1
+        assert replay.store.stats["embed"]["hits"] == 1
+
+    def test_llm_traces_replayed_by_prompt(self, tmp_path):
+        header = "Системный промпт. " * 20
+        verdict = {"verdict": "fail", "confidence": 0.5, "reasons": ["по хэшу"]}
+        dumped = [
+            LLMTrace(prompt_user=header + "первый", raw_response="первый ответ",
+                     prompt_hash=llm_request_key(header + "первый")),
+            LLMTrace(prompt_user=header + "второй", raw_response="второй ответ",
+                     prompt_hash=llm_request_key(header + "второй")),
+            LLMTrace(
+                prompt_user=header + "оценка",
+                raw_response=json.dumps(verdict, ensure_ascii=False),
+                prompt_hash=llm_request_key(
+                    header + "оценка", OllamaClient._grammar_schema(Verdict)
+                ),
+            ),
+        ]
+        traces = tmp_path / "traces.jsonl"
+        traces.write_text("\n".join([
+            json.dumps({"prompt_user": "короткий", "raw_response": "ответ", "latency_ms": 10}),
+            # legacy dump without prompt_hash: a truncated prompt is not indexed
+            json.dumps({"prompt_user": header[:200], "raw_response": "по префиксу"}),
+            json.dumps({"llm_traces": [trace.to_dict() for trace in dumped]}),
+        ]))
+        store = ReplayStore()
+        assert store.load_traces(traces) == 4
+
+        with _serve(_replay_config(store)) as url:
+            client = OllamaClient(base_url=url, enable_circuit_breaker=False)
+            assert client.generate("короткий") == "ответ"
+            assert client.generate(header + "второй") == "второй ответ"
+            assert client.generate(header + "первый") == "первый ответ"
+            assert client.generate(header + "третий") != "по префиксу"
+            result = client.generate_structured(header + "оценка", Verdict)
+            assert result.reasons == ["по хэшу"]
+
+    def test_trace_prompt_hash_matches_wire_request(self):
+        client = OllamaClient(base_url="http://replay", enable_circuit_breaker=False)
+        response = MagicMock(status_code=200)
+        response.json.return_value = {
+            "message": {"content": '{"verdict": "pass", "confidence": 1.0, "reasons": ["ok"]}'}
+        }
+        with patch.object(client, "_post", return_value=response) as post:
+            _, trace = client.generate_structured("промпт", Verdict, return_trace=True)
+
+        assert trace.prompt_hash == chat_key(post.call_args.args[1])
+        assert trace.prompt_hash != llm_request_key("промпт")
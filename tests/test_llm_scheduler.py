@@ -0,0 +1,174 @@
+"""
+Tests for LLMScheduler priority admission control and OllamaClient integration.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.llm import OllamaClient
+from src.llm_scheduler import (
+    LLMPriority,
+    LLMScheduler,
+    SchedulerTimeoutError,
+    get_llm_scheduler,
+    llm_priority,
+    reset_llm_schedulers,
+    resolve_priority,
+)
+from src.turn_deadline import TurnDeadline, turn_deadline
+
+
+def _acquire_in_thread(scheduler, priority, order, label):
+    def _run():
+        ticket = scheduler.acquire(priority, timeout=5)
+        order.append(label)
+        scheduler.release(ticket)
+
+    thread = threading.Thread(target=_run)
+    thread.start()
+    return thread
+
+
+def _wait_for_waiting(scheduler, count):
+    for _ in range(200):
+        if sum(scheduler.get_stats()["waiting"].values()) >= count:
+            return
+        time.sleep(0.005)
+    raise AssertionError("tickets did not enqueue")
+
+
+class TestPriorityResolution:
+    def test_purpose_mapping(self):
+        assert resolve_priority("generation") == LLMPriority.INTERACTIVE
+        assert resolve_priority("structured_generation") == LLMPriority.TURN_CRITICAL
+        assert resolve_priority("autonomous_decision") == LLMPriority.TURN_CRITICAL
+        assert resolve_priority("media_knowledge_card") == LLMPriority.BACKGROUND
+        assert resolve_priority("autonomous_profile_snapshot") == LLMPriority.BACKGROUND
+
+    def test_explicit_override_wins(self):
+        with llm_priority(LLMPriority.BACKGROUND):
+            assert resolve_priority("generation") == LLMPriority.BACKGROUND
+        assert resolve_priority("generation") == LLMPriority.INTERACTIVE
+
+    def test_unknown_priority_rejected(self):
+        with pytest.raises(ValueError):
+            with llm_priority("urgent"):
+                pass
+
+
+class TestAdmission:
+    def test_interactive_admitted_before_background(self):
+        scheduler = LLMScheduler(max_concurrency=1, background_max_concurrency=1)
+        holder = scheduler.acquire(LLMPriority.TURN_CRITICAL)
+        order = []
+
+        background = _acquire_in_thread(scheduler, LLMPriority.BACKGROUND, order, "bg")
+        _wait_for_waiting(scheduler, 1)
+        critical = _acquire_in_thread(scheduler, LLMPriority.TURN_CRITICAL, order, "critical")
+        _wait_for_waiting(scheduler, 2)
+        interactive = _acquire_in_thread(scheduler, LLMPriority.INTERACTIVE, order, "interactive")
+        _wait_for_waiting(scheduler, 3)
+
+        scheduler.release(holder)
+        for thread in (background, critical, interactive):
+            thread.join(timeout=5)
+
+        assert order == ["interactive", "critical", "bg"]
+
+    def test_background_delayed_under_foreground_load(self):
+        scheduler = LLMScheduler(max_concurrency=4, background_max_concurrency=2, aging_seconds=0)
+        held = [scheduler.acquire(LLMPriority.INTERACTIVE) for _ in range(3)]
+
+        with pytest.raises(SchedulerTimeoutError):
+            scheduler.acquire(LLMPriority.BACKGROUND, timeout=0.05)
+
+        scheduler.release(held.pop())
+        ticket = scheduler.acquire(LLMPriority.BACKGROUND, timeout=0.5)
+        assert ticket.granted
+        stats = scheduler.get_stats()
+        assert stats["classes"][LLMPriority.BACKGROUND]["timeouts"] == 1
+        assert stats["in_flight"][LLMPriority.BACKGROUND] == 1
+
+    def test_aging_prevents_background_starvation(self):
+        scheduler = LLMScheduler(max_concurrency=2, background_max_concurrency=1, aging_seconds=0.05)
+        scheduler.acquire(LLMPriority.INTERACTIVE)
+
+        ticket = scheduler.acquire(LLMPriority.BACKGROUND, timeout=2)
+
+        assert ticket.granted
+        assert ticket.wait_ms >= 100
+
+    def test_background_concurrency_cap(self):
+        scheduler = LLMScheduler(max_concurrency=4, background_max_concurrency=1, aging_seconds=0)
+        scheduler.acquire(LLMPriority.BACKGROUND)
+
+        with pytest.raises(SchedulerTimeoutError):
+            scheduler.acquire(LLMPriority.BACKGROUND, timeout=0.05)
+
+    def test_shared_scheduler_per_backend(self):
+        reset_llm_schedulers()
+        first = get_llm_scheduler("http://gpu-1", max_concurrency=2)
+        assert get_llm_scheduler("http://gpu-1", max_concurrency=8) is first
+        assert get_llm_scheduler("http://gpu-2") is not first
+        reset_llm_schedulers()
+
+
+class TestClientIntegration:
+    def test_trace_records_priority_and_queue_wait(self):
+        scheduler = LLMScheduler(max_concurrency=1)
+        client = OllamaClient(enable_retry=False, enable_circuit_breaker=False, scheduler=scheduler)
+        holder = scheduler.acquire(LLMPriority.TURN_CRITICAL)
+        threading.Timer(0.05, scheduler.release, args=(holder,)).start()
+
+        with patch.object(client, "_call_llm", return_value="ok"):
+            response, trace = client.generate("prompt", return_trace=True)
+
+        assert response == "ok"
+        assert trace.priority == LLMPriority.INTERACTIVE
+        assert trace.queue_wait_ms >= 40
+        assert trace.to_dict()["queue_wait_ms"] == round(trace.queue_wait_ms, 2)
+        assert client.get_stats_dict()["scheduler"]["in_flight"][LLMPriority.INTERACTIVE] == 0
+
+    def test_slot_released_on_failure(self):
+        scheduler = LLMScheduler(max_concurrency=1)
+        client = OllamaClient(enable_retry=False, enable_circuit_breaker=False, scheduler=scheduler)
+
+        with patch.object(client, "_call_llm", side_effect=RuntimeError("boom")):
+            client.generate("prompt", purpose="history_compaction")
+
+        stats = scheduler.get_stats()
+        assert sum(stats["in_flight"].values()) == 0
+        assert stats["classes"][LLMPriority.BACKGROUND]["admitted"] == 1
+
+    def test_admission_wait_bounded_by_turn_deadline(self):
+        scheduler = LLMScheduler(max_concurrency=1, aging_seconds=0)
+        client = OllamaClient(enable_retry=False, enable_circuit_breaker=False, scheduler=scheduler)
+        scheduler.acquire(LLMPriority.TURN_CRITICAL)
+
+        started = time.monotonic()
+        with patch.object(client, "_call_llm", return_value="ok") as mock_call:
+            with turn_deadline(TurnDeadline(budget_seconds=0.1)):
+                response = client.generate("prompt")
+
+        assert time.monotonic() - started < 5
+        assert response != "ok"
+        mock_call.assert_not_called()
+        classes = scheduler.get_stats()["classes"]
+        assert sum(stats["timeouts"] for stats in classes.values()) == 1
+
+    def test_exhausted_deadline_does_not_queue(self):
+        scheduler = LLMScheduler(max_concurrency=1)
+        client = OllamaClient(enable_retry=False, enable_circuit_breaker=False, scheduler=scheduler)
+        deadline = TurnDeadline(budget_seconds=1)
+        deadline.started_at -= 2
+
+        with patch.object(client, "_call_llm", return_value="ok") as mock_call:
+            with turn_deadline(deadline):
+                client.generate("prompt")
+
+        mock_call.assert_not_called()
+        classes = scheduler.get_stats()["classes"]
+        assert sum(stats["admitted"] + stats["timeouts"] for stats in classes.values()) == 0
@@ -0,0 +1,120 @@
+"""
+Tests for the indexed cross-session profile store (merged_user_profiles in src/api.py).
+"""
+
+import json
+import sqlite3
+
+import pytest
+
+
+PROFILE_COLUMNS = (
+    "session_id", "user_id",
+    "company_name", "company_size", "industry", "contact_name",
+    "contact_phone", "contact_email",
+    "business_type", "current_tools", "budget_range", "timeline",
+    "pain_category", "role", "users_count", "urgency", "preferred_channel",
+    "pain_points", "interested_features", "objection_types",
+    "lead_score", "lead_temperature", "updated_at",
+)
+
+
+def _params(session_id, user_id, updated_at, pain_points=(), **fields):
+    values = {column: None for column in PROFILE_COLUMNS}
+    values.update(fields)
+    values.update(
+        session_id=session_id,
+        user_id=user_id,
+        updated_at=updated_at,
+        pain_points=json.dumps(list(pain_points), ensure_ascii=False),
+        interested_features="[]",
+        objection_types="[]",
+    )
+    return tuple(values[column] for column in PROFILE_COLUMNS)
+
+
+@pytest.fixture
+def api_db(tmp_path, monkeypatch):
+    import src.api as api_mod
+
+    monkeypatch.setattr(api_mod, "DB_PATH", str(tmp_path / "profiles.db"))
+    monkeypatch.setattr(api_mod, "_persistence", None)
+    api_mod._init_db()
+    return api_mod
+
+
+def _save(api_mod, params):
+    conn = api_mod._db_connect()
+    api_mod._write_user_profile(conn, params)
+    conn.commit()
+    conn.close()
+
+
+def _full_merge(api_mod, user_id):
+    conn = api_mod._db_connect()
+    conn.row_factory = sqlite3.Row
+    rows = conn.execute(
+        "SELECT * FROM user_profiles WHERE user_id=? ORDER BY updated_at DESC",
+        (user_id,),
+    ).fetchall()
+    conn.close()
+    return api_mod._merge_profile_rows([dict(row) for row in rows])
+
+
+class TestIncrementalMerge:
+    def test_incremental_merge_matches_full_merge(self, api_db):
+        _save(api_db, _params("s1", "u1", 1.0, ["дорого"], company_name="Acme", lead_score=10))
+        _save(api_db, _params("s2", "u1", 2.0, ["долго"], industry="retail"))
+        _save(api_db, _params("s1", "u1", 3.0, ["дорого", "сложно"], company_name="Acme LLC", company_size="25"))
+        _save(api_db, _params("s3", "u2", 4.0, company_name="Other"))
+
+        merged = api_db._merge_user_profiles("u1")
+
+        assert merged == _full_merge(api_db, "u1")
+        assert merged["company_name"] == "Acme LLC"
+        assert merged["industry"] == "retail"
+        assert merged["company_size"] == 25
+        assert merged["lead_score"] == 10
+        assert merged["pain_points"] == ["дорого", "сложно", "долго"]
+        assert api_db._merge_user_profiles("missing") == {}
+
+    def test_lookups_use_user_id_index(self, api_db):
+        conn = api_db._db_connect()
+        plan = " ".join(
+            str(row[-1])
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM user_profiles WHERE user_id=? ORDER BY updated_at DESC",
+                ("u1",),
+            )
+        )
+        conn.close()
+
+        assert "idx_user_profiles_user_updated" in plan
+
+
+class TestMigration:
+    def test_init_db_backfills_existing_profiles(self, api_db):
+        _save(api_db, _params("s1", "u1", 1.0, ["дорого"], company_name="Acme"))
+        _save(api_db, _params("s2", "u1", 2.0, ["долго"], role="CEO"))
+        expected = _full_merge(api_db, "u1")
+
+        conn = api_db._db_connect()
+        conn.execute("DROP TABLE merged_user_profiles")
+        conn.commit()
+        conn.close()
+        api_db._init_db()
+
+        assert api_db._merge_user_profiles("u1") == expected
+
+    def test_backfill_logs_with_info_enabled(self, api_db, caplog):
+        _save(api_db, _params("s1", "u1", 1.0, company_name="Acme"))
+        conn = api_db._db_connect()
+        conn.execute("DROP TABLE merged_user_profiles")
+        conn.commit()
+        conn.close()
+
+        with caplog.at_level("INFO", logger=api_db.logger.name):
+            api_db._init_db()
+
+        assert "Backfilled merged user profiles: 1" in caplog.text
+        assert api_db._merge_user_profiles("u1")["company_name"] == "Acme"
@@ -0,0 +1,228 @@
+"""
+Tests for compiled flow rules (src/rules/compiler.py).
+
+These tests verify:
+1. RuleResolver caches compiled programs per (kind, state, intent); frozen
+   FlowConfig values are matched by identity
+2. Programs are recompiled when the rule or the expression parser changes
+3. Composite conditions are parsed once, not on every evaluation
+4. Invalid rules still raise only when reached
+5. Knowledge Source rule semantics (IntentProcessor, TransitionResolver)
+6. compile_flow() compiles every flow
+
+Run with: pytest tests/test_rule_compiler.py -v
+"""
+
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.conditions.base import SimpleContext
+from src.conditions.expression_parser import ConditionExpressionParser
+from src.conditions.registry import ConditionRegistry
+from src.conditions.trace import EvaluationTrace, Resolution
+from src.rules.compiler import RuleProgramCache, compile_source_rule
+from src.rules.resolver import InvalidRuleFormatError, RuleResolver, UnknownConditionError
+
+
+@pytest.fixture
+def registry():
+    registry = ConditionRegistry("compiler_test", SimpleContext)
+    registry.calls = 0
+
+    @registry.condition("always_true")
+    def always_true(ctx: SimpleContext) -> bool:
+        registry.calls += 1
+        return True
+
+    @registry.condition("always_false")
+    def always_false(ctx: SimpleContext) -> bool:
+        registry.calls += 1
+        return False
+
+    @registry.condition("has_company_size")
+    def has_company_size(ctx: SimpleContext) -> bool:
+        registry.calls += 1
+        return bool(ctx.collected_data.get("company_size"))
+
+    return registry
+
+
+@pytest.fixture
+def ctx():
+    return SimpleContext(collected_data={"company_size": 10}, state="spin_situation", turn_number=2)
+
+
+class TestResolverPrograms:
+    def test_program_is_reused(self, registry, ctx):
+        resolver = RuleResolver(registry)
+        rule = [{"when": "always_false", "then": "a"}, {"when": "has_company_size", "then": "b"}, "c"]
+        transitions = {"price_question": rule}
+
+        with patch.object(resolver, "_compile_rule", wraps=resolver._compile_rule) as compile_rule:
+            for _ in range(3):
+                assert resolver.resolve_transition("price_question", transitions, ctx, "spin") == "b"
+        assert compile_rule.call_count == 1
+
+    def test_changed_rule_is_recompiled(self, registry, ctx):
+        resolver = RuleResolver(registry)
+        assert resolver.resolve_transition("x", {"x": {"when": "always_true", "then": "a"}}, ctx, "s") == "a"
+        assert resolver.resolve_transition("x", {"x": {"when": "always_true", "then": "b"}}, ctx, "s") == "b"
+        assert resolver.resolve_transition("x", {"x": "c"}, ctx, "other") == "c"
+
+    def test_composite_condition_parsed_once(self, registry, ctx):
+        parser = ConditionExpressionParser(registry)
+        resolver = RuleResolver(registry, expression_parser=parser)
+        rules = {"greeting": {"when": {"and": ["always_true", {"not": "always_false"}]}, "then": "greet"}}
+
+        with patch.object(parser, "_make_cache_key", wraps=parser._make_cache_key) as make_key:
+            for _ in range(5):
+                result = resolver.resolve_action("greeting", rules, {}, ctx, state="greeting")
+                assert result.action == "greet"
+        assert make_key.call_count == 1
+
+    def test_new_parser_invalidates_programs(self, registry, ctx):
+        resolver = RuleResolver(registry)
+        rules = {"q": {"when": {"not": "always_false"}, "then": "answer"}}
+
+        with pytest.raises(InvalidRuleFormatError, match="expression_parser"):
+            resolver.resolve_action("q", rules, {}, ctx, state="s")
+
+        resolver.expression_parser = ConditionExpressionParser(registry)
+        assert resolver.resolve_action("q", rules, {}, ctx, state="s").action == "answer"
+
+    def test_invalid_entries_raise_only_when_reached(self, registry, ctx):
+        resolver = RuleResolver(registry)
+        rule = [{"when": "always_true", "then": "a"}, {"when": "missing_condition", "then": "b"}]
+        assert resolver.resolve_transition("x", {"x": rule}, ctx, "s") == "a"
+
+        rule = [{"when": "always_false", "then": "a"}, {"when": "missing_condition", "then": "b"}]
+        for _ in range(2):
+            with pytest.raises(UnknownConditionError):
+                resolver.resolve_transition("y", {"y": rule}, ctx, "s")
+
+    def test_trace_recorded_only_when_passed(self, registry, ctx):
+        resolver = RuleResolver(registry)
+        rule = [{"when": "always_false", "then": "a"}, None]
+
+        assert resolver.resolve_transition("x", {"x": rule}, ctx, "s") is None
+
+        trace = EvaluationTrace(rule_name="x")
+        assert resolver.resolve_transition("x", {"x": rule}, ctx, "s", trace) is None
+        assert trace.resolution == Resolution.DEFAULT
+        assert trace.conditions_checked == 1
+
+    def test_condition_not_evaluated_after_middle_default(self, registry, ctx):
+        resolver = RuleResolver(registry)
+        rule = [{"when": "always_false", "then": "a"}, "middle", {"when": "always_true", "then": "b"}]
+
+        assert resolver.resolve_transition("x", {"x": rule}, ctx, "s") == "middle"
+        assert registry.calls == 1
+
+
+class TestSourceRules:
+    def test_lenient_chain(self):
+        checks = {"yes": True, "no": False}
+        program = compile_source_rule(
+            [None, {"when": "no", "then": "a"}, {"when": "", "then": "b"}, {"when": "yes", "then": "c"}, "d"],
+            lambda condition: lambda eval_ctx: checks[condition],
+        )
+        assert program.needs_context is True
+        assert program.evaluate(None, None) == "c"
+
+    def test_default_only_chain_needs_no_context(self):
+        program = compile_source_rule(["d", {"when": "yes", "then": "c"}], Mock())
+        assert program.needs_context is False
+        assert program.evaluate(None, None) == "d"
+
+    def test_cache_compares_rule_values(self):
+        cache = RuleProgramCache()
+        compile_fn = Mock(side_effect=lambda rule: compile_source_rule(rule, Mock()))
+
+        cache.get(("s", "i"), ["a"], compile_fn)
+        cache.get(("s", "i"), ["a"], compile_fn)
+        assert compile_fn.call_count == 1
+
+        cache.get(("s", "i"), ["b"], compile_fn)
+        assert compile_fn.call_count == 2
+
+        cache.bind(object())
+        assert len(cache) == 0
+
+    def test_frozen_rule_hit_is_identity_only(self):
+        from src.config_loader import FrozenDict, FrozenList
+
+        class CountingList(FrozenList):
+            comparisons = 0
+
+            def __eq__(self, other):
+                CountingList.comparisons += 1
+                return list.__eq__(self, other)
+
+            __hash__ = None
+
+        cache = RuleProgramCache()
+        compile_fn = Mock(side_effect=lambda rule: compile_source_rule(rule, Mock()))
+        rule = CountingList([FrozenDict({"when": "c", "then": "a"}), "d"])
+
+        for _ in range(5):
+            cache.get(("s", "i"), rule, compile_fn)
+
+        assert compile_fn.call_count == 1
+        assert CountingList.comparisons == 0
+
+    def test_mutable_rule_mutated_in_place_is_recompiled(self):
+        cache = RuleProgramCache()
+        compile_fn = Mock(side_effect=lambda rule: compile_source_rule(rule, Mock()))
+        rule = ["a"]
+
+        cache.get(("s", "i"), rule, compile_fn)
+        rule[0] = "b"
+        assert cache.get(("s", "i"), rule, compile_fn).evaluate(None, None) == "b"
+        assert compile_fn.call_count == 2
+
+    def test_intent_processor_reuses_program_across_snapshots(self):
+        from src.blackboard.models import deep_freeze_dict
+        from src.blackboard.sources.intent_processor import IntentProcessorSource
+
+        source = IntentProcessorSource()
+        ctx = Mock(state="spin_situation", current_intent="price_question")
+        rule = {"when": "always_true_for_test", "then": "answer"}
+
+        with patch.object(source, "_compile_condition", return_value=lambda eval_ctx: True) as compile_condition, \
+                patch.object(source, "_build_eval_context", return_value=None):
+            # Each turn snapshot carries a fresh frozen copy of the state config
+            for _ in range(3):
+                assert source._resolve_rule(deep_freeze_dict({"r": rule})["r"], ctx) == "answer"
+        assert compile_condition.call_count == 1
+
+    def test_transition_resolver_simple_transition_skips_context(self):
+        from src.blackboard.sources.transition_resolver import TransitionResolverSource
+
+        source = TransitionResolverSource()
+        ctx = Mock(state="greeting", current_intent="agreement")
+        with patch.object(source, "_build_eval_context") as build:
+            assert source._resolve_transition("spin_situation", ctx) == "spin_situation"
+        build.assert_not_called()
+
+
+class TestCompileFlow:
+    def test_compile_all_flows(self):
+        from src.config_loader import ConfigLoader
+        from src.state_machine import StateMachine
+
+        flows_dir = os.path.join(os.path.dirname(__file__), "..", "src", "yaml_config", "flows")
+        flow_names = sorted(
+            name for name in os.listdir(flows_dir)
+            if not name.startswith("_") and name != "examples"
+            and os.path.isfile(os.path.join(flows_dir, name, "flow.yaml"))
+        )
+        assert len(flow_names) >= 21
+
+        loader = ConfigLoader()
+        config = loader.load()
+        for flow_name in flow_names:
+            flow = loader.load_flow(flow_name)
+            resolver = StateMachine(config=config, flow=flow)._resolver
+            assert resolver.compile_flow(flow) > 0, flow_name
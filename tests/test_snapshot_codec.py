@@ -0,0 +1,165 @@
+"""
+Tests for the versioned snapshot codec (src/snapshot_codec.py) and its storage paths.
+"""
+
+import json
+import math
+import sqlite3
+
+import pytest
+
+from src.snapshot_codec import (
+    SnapshotCodecError,
+    SnapshotDeltaEncoder,
+    decode_snapshot,
+    encode_snapshot,
+    is_snapshot_frame,
+)
+
+
+def _snapshot(turn=1):
+    return {
+        "version": "1.0",
+        "client_id": "u1",
+        "state_machine": {"state": "greeting", "collected_data": {"company_name": "Альфа"}},
+        "metrics": {"turns": turn, "intents": ["greeting"] * 50},
+        "context_window": [{"user": "привет", "bot": "здравствуйте"}] * 20,
+        "generator_response_history": ["Здравствуйте! Чем могу помочь?"] * 10,
+    }
+
+
+class TestFrames:
+    @pytest.mark.parametrize("compression", ["none", "zlib"])
+    def test_round_trip(self, compression):
+        frame = encode_snapshot(_snapshot(), compression=compression)
+
+        assert is_snapshot_frame(frame)
+        assert decode_snapshot(frame) == _snapshot()
+
+    def test_compressed_frame_is_smaller_than_json(self):
+        legacy = json.dumps(_snapshot(), ensure_ascii=False).encode("utf-8")
+        assert len(encode_snapshot(_snapshot())) < len(legacy) / 3
+
+    def test_legacy_json_text_and_bytes_still_decode(self):
+        legacy = json.dumps(_snapshot(), ensure_ascii=False)
+
+        assert not is_snapshot_frame(legacy)
+        assert decode_snapshot(legacy) == _snapshot()
+        assert decode_snapshot(legacy.encode("utf-8")) == _snapshot()
+        assert math.isnan(decode_snapshot('{"score": NaN}')["score"])
+
+    def test_unknown_version_is_rejected(self):
+        frame = bytearray(encode_snapshot(_snapshot()))
+        frame[3] = 99
+        with pytest.raises(SnapshotCodecError):
+            decode_snapshot(bytes(frame))
+
+
+class TestDeltaEncoder:
+    def test_delta_holds_only_changed_sections(self):
+        encoder = SnapshotDeltaEncoder()
+        base = encoder.encode("k", _snapshot(1))
+        changed = _snapshot(2)
+        del changed["generator_response_history"]
+        delta = encoder.encode("k", changed)
+
+        assert not base.is_delta
+        assert delta.is_delta and delta.base_id == base.base_id
+        assert len(delta.frame) < len(base.frame)
+        assert decode_snapshot(base.frame, delta.frame) == changed
+
+    def test_delta_for_another_base_is_ignored(self):
+        encoder = SnapshotDeltaEncoder()
+        first = encoder.encode("k", _snapshot(1))
+        encoder.forget("k")
+        second = encoder.encode("k", _snapshot(2))
+        delta = encoder.encode("k", _snapshot(3))
+
+        assert decode_snapshot(first.frame, delta.frame) == _snapshot(1)
+        assert decode_snapshot(second.frame, delta.frame) == _snapshot(3)
+
+    def test_large_delta_cuts_new_full_frame(self):
+        encoder = SnapshotDeltaEncoder(max_delta_ratio=0.5)
+        encoder.encode("k", _snapshot(1))
+        rewritten = {key: f"{key}-changed" * 200 for key in _snapshot(1)}
+
+        assert not encoder.encode("k", rewritten).is_delta
+
+    def test_disabled_encoder_always_writes_full_frames(self):
+        encoder = SnapshotDeltaEncoder(enabled=False)
+        encoder.encode("k", _snapshot(1))
+        encoded = encoder.encode("k", _snapshot(2))
+
+        assert not encoded.is_delta and encoded.base_id is None
+
+
+class TestStorage:
+    @pytest.fixture
+    def api_db(self, tmp_path, monkeypatch):
+        import src.api as api_mod
+
+        monkeypatch.setattr(api_mod, "DB_PATH", str(tmp_path / "codec.db"))
+        monkeypatch.setattr(api_mod, "_persistence", None)
+        monkeypatch.setattr(api_mod, "_snapshot_encoder", SnapshotDeltaEncoder(enabled=True))
+        api_mod._init_db()
+        return api_mod
+
+    def test_delta_rows_round_trip_through_conversations(self, api_db):
+        api_db._save_snapshot("s1", "u1", _snapshot(1))
+        api_db._save_snapshot("s1", "u1", _snapshot(2))
+
+        conn = sqlite3.connect(api_db.DB_PATH)
+        snapshot, delta = conn.execute("SELECT snapshot, snapshot_delta FROM conversations").fetchone()
+        conn.close()
+
+        assert is_snapshot_frame(snapshot) and is_snapshot_frame(delta)
+        assert api_db._load_snapshot("s1", "u1") == _snapshot(2)
+
+    def test_foreign_full_frame_forces_full_rewrite(self, api_db):
+        api_db._save_snapshot("s1", "u1", _snapshot(1))
+        conn = sqlite3.connect(api_db.DB_PATH)
+        conn.execute("UPDATE conversations SET snapshot=?, snapshot_base_id=NULL", (json.dumps(_snapshot(7)),))
+        conn.commit()
+        conn.close()
+
+        api_db._save_snapshot("s1", "u1", _snapshot(2))
+
+        assert api_db._load_snapshot("s1", "u1") == _snapshot(2)
+
+    def test_migration_keeps_legacy_rows_readable(self, api_db):
+        conn = sqlite3.connect(api_db.DB_PATH)
+        conn.execute("DROP TABLE conversations")
+        conn.execute(
+            "CREATE TABLE conversations (session_id TEXT NOT NULL, user_id TEXT NOT NULL, "
+            "snapshot TEXT, updated_at REAL, PRIMARY KEY (session_id, user_id))"
+        )
+        conn.execute(
+            "INSERT INTO conversations VALUES (?, ?, ?, ?)",
+            ("s1", "u1", json.dumps(_snapshot(1), ensure_ascii=False), 1.0),
+        )
+        conn.commit()
+        conn.close()
+
+        api_db._init_db()
+
+        assert api_db._load_snapshot("s1", "u1") == _snapshot(1)
+        api_db._save_snapshot("s1", "u1", _snapshot(2))
+        assert api_db._load_snapshot("s1", "u1") == _snapshot(2)
+
+    def test_snapshot_buffer_reads_legacy_and_writes_frames(self, tmp_path):
+        from src.snapshot_buffer import LocalSnapshotBuffer
+
+        buffer = LocalSnapshotBuffer(str(tmp_path / "buffer.sqlite"))
+        buffer.enqueue("s1", _snapshot(1), client_id="u1")
+        conn = sqlite3.connect(str(tmp_path / "buffer.sqlite"))
+        conn.execute(
+            "INSERT INTO snapshots (client_id, session_id, snapshot_json, updated_at) VALUES (?, ?, ?, ?)",
+            ("u2", "s2", json.dumps(_snapshot(2)), 1.0),
+        )
+        conn.commit()
+        stored = conn.execute("SELECT snapshot_json FROM snapshots WHERE client_id='u1'").fetchone()[0]
+        conn.close()
+
+        assert is_snapshot_frame(stored)
+        assert buffer.get("s1", client_id="u1") == _snapshot(1)
+        assert buffer.get("s2", client_id="u2") == _snapshot(2)
@@ -0,0 +1,210 @@
+"""
+Tests for the single-writer batched SQLite pipeline (src/persistence.py).
+"""
+
+import sqlite3
+import threading
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+import pytest
+
+from src.persistence import SQLitePersistence
+
+
+def _create_schema(path):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE kv (k TEXT PRIMARY KEY, v TEXT)")
+    conn.commit()
+    conn.close()
+
+
+def _put(conn, key, value):
+    conn.execute(
+        "INSERT INTO kv (k, v) VALUES (?, ?) ON CONFLICT(k) DO UPDATE SET v=excluded.v",
+        (key, value),
+    )
+
+
+def _fail(conn, key):
+    _put(conn, key, "partial")
+    raise ValueError("bad job")
+
+
+@pytest.fixture
+def persistence(tmp_path):
+    path = str(tmp_path / "kv.db")
+    _create_schema(path)
+    service = SQLitePersistence(path, batch_window_ms=20, batch_max_jobs=16, reader_pool_size=2)
+    yield service
+    service.close()
+
+
+def _read_all(service):
+    with service.reader() as conn:
+        return {row["k"]: row["v"] for row in conn.execute("SELECT k, v FROM kv")}
+
+
+class TestWriter:
+    def test_durable_write_is_visible_to_readers(self, persistence):
+        persistence.write(_put, "a", "1")
+        assert _read_all(persistence) == {"a": "1"}
+
+    def test_concurrent_submits_share_transactions(self, persistence):
+        barrier = threading.Barrier(8)
+        futures = []
+
+        def _worker(index):
+            barrier.wait()
+            for turn in range(10):
+                futures.append(persistence.submit(_put, f"{index}-{turn}", "x"))
+
+        threads = [threading.Thread(target=_worker, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for future in futures:
+            future.result(timeout=10)
+
+        stats = persistence.get_stats()
+        assert len(_read_all(persistence)) == 80
+        assert stats["jobs"] == 80
+        assert stats["batches"] < 80
+        assert stats["max_batch"] <= 16
+
+    def test_failing_job_does_not_roll_back_its_batch(self, persistence):
+        ok = persistence.submit(_put, "good", "1")
+        bad = persistence.submit(_fail, "bad")
+        after = persistence.submit(_put, "after", "2")
+
+        ok.result(timeout=10)
+        after.result(timeout=10)
+        with pytest.raises(ValueError):
+            bad.result(timeout=10)
+
+        assert _read_all(persistence) == {"good": "1", "after": "2"}
+        assert persistence.get_stats()["failed_jobs"] == 1
+
+    def test_close_drains_queued_writes(self, tmp_path):
+        path = str(tmp_path / "drain.db")
+        _create_schema(path)
+        service = SQLitePersistence(path, batch_window_ms=50)
+        for index in range(20):
+            service.submit(_put, str(index), "v")
+        service.close()
+
+        conn = sqlite3.connect(path)
+        assert conn.execute("SELECT COUNT(*) FROM kv").fetchone()[0] == 20
+        conn.close()
+        with pytest.raises(RuntimeError):
+            service.submit(_put, "late", "v")
+
+
+class TestWriterFailure:
+    def test_dead_writer_fails_pending_writes(self, tmp_path):
+        service = SQLitePersistence(str(tmp_path / "missing" / "kv.db"), write_timeout_seconds=5)
+
+        started = time.monotonic()
+        with pytest.raises(sqlite3.OperationalError):
+            service.write(_put, "a", "1")
+        with pytest.raises(RuntimeError):
+            service.submit(_put, "b", "2")
+        assert service.flush(timeout=1) is False
+        service.close(timeout=1)
+
+        assert time.monotonic() - started < 5
+
+    def test_write_wait_is_bounded(self, persistence):
+        release = threading.Event()
+        persistence.write_timeout_seconds = 0.05
+        persistence.submit(lambda conn: release.wait(5))
+
+        with pytest.raises(FutureTimeoutError):
+            persistence.write(_put, "a", "1")
+        release.set()
+
+    def test_close_does_not_block_on_full_queue(self, tmp_path):
+        path = str(tmp_path / "full.db")
+        _create_schema(path)
+        service = SQLitePersistence(path, max_pending=1, batch_max_jobs=1, batch_window_ms=0)
+        release = threading.Event()
+        started_job = threading.Event()
+
+        def _block(conn):
+            started_job.set()
+            release.wait(5)
+
+        service.submit(_block)
+        assert started_job.wait(5)
+        service.submit(_put, "queued", "v")
+
+        started = time.monotonic()
+        service.close(timeout=0.1)
+        assert time.monotonic() - started < 2
+        release.set()
+
+
+class TestApiIntegration:
+    def test_profile_and_snapshot_go_through_writer(self, tmp_path, monkeypatch):
+        import src.api as api_mod
+
+        monkeypatch.setattr(api_mod, "DB_PATH", str(tmp_path / "api.db"))
+        api_mod._init_db()
+        service = SQLitePersistence(api_mod.DB_PATH)
+        monkeypatch.setattr(api_mod, "_persistence", service)
+        params = (
+            "s1", "u1", "Acme", None, None, None, None, None, None, None, None, None,
+            None, None, None, None, None, "[]", "[]", "[]", None, None, 1.0,
+        )
+        monkeypatch.setattr(api_mod, "_user_profile_params", lambda **_kwargs: params)
+
+        try:
+            api_mod._save_snapshot("s1", "u1", {"turn": 1})
+            assert api_mod._load_snapshot("s1", "u1") == {"turn": 1}
+
+            api_mod._save_user_profile("s1", "u1", object())
+            assert service.flush(timeout=10)
+            assert api_mod._merge_user_profiles("u1")["company_name"] == "Acme"
+        finally:
+            service.close()
+
+    def test_profile_read_waits_for_queued_write(self, tmp_path, monkeypatch):
+        import src.api as api_mod
+
+        monkeypatch.setattr(api_mod, "DB_PATH", str(tmp_path / "api.db"))
+        api_mod._init_db()
+        service = SQLitePersistence(api_mod.DB_PATH, batch_window_ms=200)
+        monkeypatch.setattr(api_mod, "_persistence", service)
+        params = (
+            "s1", "u1", "Acme", None, None, None, None, None, None, None, None, None,
+            None, None, None, None, None, "[]", "[]", "[]", None, None, 1.0,
+        )
+        monkeypatch.setattr(api_mod, "_user_profile_params", lambda **_kwargs: params)
+
+        try:
+            future = api_mod._save_user_profile("s1", "u1", object())
+            assert api_mod._merge_user_profiles("u1")["company_name"] == "Acme"
+            assert future.done()
+            assert "u1" not in api_mod._pending_profile_writes
+        finally:
+            service.close()
+
+    def test_failed_profile_write_is_logged(self, tmp_path, monkeypatch, caplog):
+        import src.api as api_mod
+
+        monkeypatch.setattr(api_mod, "DB_PATH", str(tmp_path / "api.db"))
+        api_mod._init_db()
+        service = SQLitePersistence(api_mod.DB_PATH)
+        monkeypatch.setattr(api_mod, "_persistence", service)
+        monkeypatch.setattr(api_mod, "_user_profile_params", lambda **_kwargs: ("too", "short"))
+
+        try:
+            with caplog.at_level("WARNING", logger=api_mod.logger.name):
+                future = api_mod._save_user_profile("s1", "u1", object())
+                with pytest.raises(sqlite3.Error):
+                    future.result(timeout=10)
+                assert service.flush(timeout=10)
+            assert "User profile write failed" in caplog.text
+        finally:
+            service.close()
@@ -0,0 +1,208 @@
+"""
+Tests for schema-constrained decoding in OllamaClient.generate_structured().
+
+The JSON schema is sent as a decoding grammar to every backend, so:
+- schema violations are not retried (a retry under the same grammar does not help);
+- transport errors are still retried with backoff;
+- salvage / repair / retry events are counted per purpose;
+- output cut off at num_predict is still salvaged by the callers.
+"""
+
+from typing import Literal
+from unittest.mock import MagicMock, Mock, patch
+
+import requests
+from pydantic import BaseModel, Field
+
+from src.blackboard.sources.autonomous_decision import AutonomousDecisionSource
+from src.llm import OllamaClient
+from src.settings import settings
+
+
+class VerdictSchema(BaseModel):
+    verdict: Literal["pass", "fail"]
+    confidence: float = Field(ge=0.0, le=1.0)
+
+
+class Nested(BaseModel):
+    name: str
+
+
+class WithNested(BaseModel):
+    items: list[Nested]
+
+
+def _response(payload: dict) -> MagicMock:
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.json.return_value = payload
+    return resp
+
+
+def _ollama_response(content: str) -> MagicMock:
+    return _response({"message": {"content": content}})
+
+
+def _client(**kwargs) -> OllamaClient:
+    client = OllamaClient(enable_circuit_breaker=False, **kwargs)
+    client.INITIAL_DELAY = 0.001
+    return client
+
+
+class TestGrammarPayload:
+    def test_ollama_format_carries_closed_schema(self):
+        client = _client(api_format="ollama")
+        good = _ollama_response('{"items": [{"name": "a"}]}')
+
+        with patch("requests.post", return_value=good) as mock_post:
+            client.generate_structured("prompt", WithNested)
+
+        schema = mock_post.call_args.kwargs["json"]["format"]
+        assert schema["additionalProperties"] is False
+        assert schema["$defs"]["Nested"]["additionalProperties"] is False
+
+    def test_llama_server_gets_native_json_schema(self):
+        client = _client(api_format="openai")
+        good = _response({"choices": [{"message": {"content": '{"verdict": "pass", "confidence": 0.9}'}}]})
+
+        with patch("requests.post", return_value=good) as mock_post:
+            result = client.generate_structured("prompt", VerdictSchema)
+
+        body = mock_post.call_args.kwargs["json"]
+        assert result.verdict == "pass"
+        assert body["json_schema"] == body["response_format"]["json_schema"]["schema"]
+        assert body["json_schema"]["properties"]["verdict"]["enum"] == ["pass", "fail"]
+
+    def test_schema_is_cached_per_class(self):
+        assert OllamaClient._grammar_schema(VerdictSchema) is OllamaClient._grammar_schema(VerdictSchema)
+
+
+class TestRetryPolicy:
+    def test_schema_violation_is_not_retried(self):
+        client = _client()
+        bad = _ollama_response('{"verdict": "maybe", "confidence": 0.5}')
+
+        with patch("requests.post", return_value=bad) as mock_post:
+            result, trace = client.generate_structured(
+                "prompt", VerdictSchema, return_trace=True, purpose="factual_verifier"
+            )
+
+        assert result is None
+        assert mock_post.call_count == 1
+        assert trace.retry_count == 1
+        assert client.stats.total_retries == 0
+        counters = client.get_stats_dict()["structured_output"]["factual_verifier"]
+        assert counters["calls"] == 1
+        assert counters["schema_violations"] == 1
+        assert counters["transport_retries"] == 0
+
+    def test_transport_errors_are_retried(self):
+        client = _client()
+        good = _ollama_response('{"verdict": "pass", "confidence": 0.9}')
+
+        with patch(
+            "requests.post",
+            side_effect=[requests.exceptions.Timeout("slow"), requests.exceptions.ConnectionError("down"), good],
+        ) as mock_post:
+            result = client.generate_structured("prompt", VerdictSchema, purpose="classification")
+
+        assert result.verdict == "pass"
+        assert mock_post.call_count == 3
+        temperatures = {c.kwargs["json"]["options"]["temperature"] for c in mock_post.call_args_list}
+        assert temperatures == {0.05}
+        assert client.get_stats_dict()["structured_output"]["classification"]["transport_retries"] == 2
+
+    def test_repair_hook_is_counted(self):
+        client = _client()
+        bad = _ollama_response('{"verdict": "PASS", "confidence": 0.9}')
+
+        def _repair(payload, error):
+            return {**payload, "verdict": payload["verdict"].lower()}
+
+        with patch("requests.post", return_value=bad):
+            result = client.generate_structured(
+                "prompt", VerdictSchema, repair_payload=_repair, purpose="classification"
+            )
+
+        assert result.verdict == "pass"
+        assert client.get_stats_dict()["structured_output"]["classification"]["repairs"] == 1
+
+    def test_salvage_generation_is_counted_under_base_purpose(self):
+        client = _client()
+
+        with patch.object(client, "_call_llm", return_value="{}"):
+            client.generate("prompt", purpose="autonomous_decision_salvage")
+
+        counters = client.get_stats_dict()["structured_output"]["autonomous_decision"]
+        assert counters["salvage_calls"] == 1
+        assert counters["calls"] == 0
+
+
+class TestTruncation:
+    def test_constrained_decoding_follows_setting(self, monkeypatch):
+        assert _client().constrained_decoding is True
+        monkeypatch.setitem(settings["llm"]["structured_output"], "constrained_decoding", False)
+        assert _client().constrained_decoding is False
+
+    def test_length_stop_is_reported(self):
+        client = _client()
+        cut = _response({"message": {"content": '{"verdict": "pa'}, "done_reason": "length"})
+        good = _ollama_response('{"verdict": "pass", "confidence": 0.9}')
+
+        with patch("requests.post", return_value=cut):
+            assert client.generate_structured("prompt", VerdictSchema, purpose="classification") is None
+        assert client.last_structured_truncated is True
+        assert client.get_stats_dict()["structured_output"]["classification"]["truncated"] == 1
+
+        with patch("requests.post", return_value=good):
+            client.generate_structured("prompt", VerdictSchema, purpose="classification")
+        assert client.last_structured_truncated is False
+
+    def test_openai_finish_reason_length(self):
+        client = _client(api_format="openai")
+        cut = _response({"choices": [{"message": {"content": '{"verdict"'}, "finish_reason": "length"}]})
+
+        with patch("requests.post", return_value=cut):
+            client.generate_structured("prompt", VerdictSchema)
+
+        assert client.last_structured_truncated is True
+
+
+class TestCallerSalvage:
+    def test_autonomous_decision_skips_freeform_salvage_under_grammar(self):
+        source = AutonomousDecisionSource.__new__(AutonomousDecisionSource)
+        llm = Mock()
+        llm.constrained_decoding = True
+        llm.generate_structured.return_value = None
+        source._llm = llm
+
+        result = source._call_structured_with_salvage(
+            prompt="prompt",
+            schema=VerdictSchema,
+            purpose="autonomous_decision",
+            temperature=0.1,
+            num_predict=64,
+        )
+
+        assert result is None
+        llm.generate.assert_not_called()
+
+    def test_autonomous_decision_salvages_truncated_output(self):
+        source = AutonomousDecisionSource.__new__(AutonomousDecisionSource)
+        llm = Mock()
+        llm.constrained_decoding = True
+        llm.last_structured_truncated = True
+        llm.generate_structured.return_value = None
+        llm.generate.return_value = '{"verdict": "pass", "confidence": 0.7}'
+        source._llm = llm
+
+        result = source._call_structured_with_salvage(
+            prompt="prompt",
+            schema=VerdictSchema,
+            purpose="autonomous_decision",
+            temperature=0.1,
+            num_predict=64,
+        )
+
+        assert result.verdict == "pass"
+        llm.generate.assert_called_once()
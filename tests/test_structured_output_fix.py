@@ -6,6 +6,10 @@ Tests 3 improvements:
 2. Validation error no longer breaks retry loop — retries continue
 3. Temperature escalation on retries — 0.05 → 0.2 → 0.4
 
+(2) and (3) apply to llm.structured_output.retry_on_schema_violation mode, which
+every test in this module enables; the constrained-decoding default is covered
+in test_structured_constrained_decoding.py.
+
 Uses realistic production schemas (VerifierOutput, ClassificationResult, CategoryResult).
 """
 
@@ -18,6 +22,12 @@ import requests
 from pydantic import BaseModel, Field
 
 from src.llm import OllamaClient
+from src.settings import settings
+
+
+@pytest.fixture(autouse=True)
+def _retry_on_schema_violation(monkeypatch):
+    monkeypatch.setitem(settings["llm"]["structured_output"], "retry_on_schema_violation", True)
 
 
 # ---------------------------------------------------------------------------
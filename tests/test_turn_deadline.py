@@ -0,0 +1,118 @@
+"""
+Tests for TurnDeadline propagation and budget-aware LLM stages.
+"""
+
+from unittest.mock import patch
+
+import requests
+
+from src.factual_verifier import FactualVerifier
+from src.knowledge.enhanced_retrieval import QueryDecomposer
+from src.llm import OllamaClient
+from src.turn_deadline import (
+    TurnDeadline,
+    current_turn_deadline,
+    stage_allowed,
+    turn_deadline,
+)
+
+
+def _exhausted_deadline(**kwargs) -> TurnDeadline:
+    deadline = TurnDeadline(budget_seconds=10, **kwargs)
+    deadline.started_at -= 9.5
+    return deadline
+
+
+class _FailingLLM:
+    def __init__(self):
+        self.calls = 0
+
+    def generate_structured(self, *args, **kwargs):
+        self.calls += 1
+        raise AssertionError("optional stage must not call the LLM")
+
+
+class TestTurnDeadline:
+    def test_context_propagation(self):
+        assert current_turn_deadline() is None
+        deadline = TurnDeadline(budget_seconds=30)
+        with turn_deadline(deadline):
+            assert current_turn_deadline() is deadline
+            assert stage_allowed("factual_verifier") is True
+        assert current_turn_deadline() is None
+        assert stage_allowed("anything") is True
+
+    def test_stage_refused_when_budget_low(self):
+        deadline = _exhausted_deadline(stage_min_seconds={"factual_verifier": 5})
+
+        assert deadline.allows("factual_verifier") is False
+        assert deadline.allows("unlisted_stage") is True
+        assert deadline.to_dict()["skipped_stages"] == ["factual_verifier"]
+
+    def test_call_timeout_bounded_by_budget_and_floor(self):
+        deadline = TurnDeadline(budget_seconds=20, min_call_timeout_seconds=3)
+        assert 19 <= deadline.call_timeout(600) <= 20
+        assert deadline.call_timeout(10) == 10
+        assert _exhausted_deadline(min_call_timeout_seconds=3).call_timeout(600) == 3
+
+    def test_from_settings(self):
+        deadline = TurnDeadline.from_settings()
+        assert deadline is not None
+        assert deadline.budget_seconds > 0
+        assert "factual_verifier" in deadline.stage_min_seconds
+
+
+class TestOllamaClientBudget:
+    def test_timeout_capped_by_remaining_budget(self):
+        client = OllamaClient(enable_retry=False, enable_circuit_breaker=False)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"message": {"content": "ok"}}'
+
+        with patch("requests.post", return_value=response) as mock_post:
+            with turn_deadline(TurnDeadline(budget_seconds=30)):
+                client.generate("prompt")
+
+        assert mock_post.call_args.kwargs["timeout"] <= 30
+
+    def test_retries_stop_when_budget_exhausted(self):
+        client = OllamaClient(enable_circuit_breaker=False)
+
+        with patch.object(
+            client, "_call_llm", side_effect=requests.exceptions.Timeout("slow")
+        ) as mock_call, patch("time.sleep") as mock_sleep:
+            with turn_deadline(_exhausted_deadline(min_retry_budget_seconds=5)):
+                client.generate("prompt", state="greeting")
+
+        assert mock_call.call_count == 1
+        mock_sleep.assert_not_called()
+
+
+class TestOptionalStages:
+    def test_factual_verifier_skips_when_budget_low(self):
+        llm = _FailingLLM()
+        verifier = FactualVerifier(llm)
+        verifier.is_enabled = lambda: True
+
+        with turn_deadline(_exhausted_deadline(stage_min_seconds={"factual_verifier": 5})):
+            result = verifier.verify_and_rewrite(
+                user_message="Сколько стоит?",
+                candidate_response="Тариф стоит 5000 тенге.",
+                retrieved_facts="Тариф Mini: 5000 тенге в месяц.",
+                intent="price_question",
+                state="autonomous_discovery",
+            )
+
+        assert llm.calls == 0
+        assert result.verifier_used is False
+        assert result.final_response == "Тариф стоит 5000 тенге."
+        assert result.reason_codes == ["turn_budget_exhausted"]
+
+    def test_query_decomposition_skips_when_budget_low(self):
+        llm = _FailingLLM()
+        decomposer = QueryDecomposer(llm)
+
+        with turn_deadline(_exhausted_deadline(stage_min_seconds={"query_decomposition": 5})):
+            assert decomposer.decompose("Сравните тарифы и интеграции с 1С") is None
+
+        assert llm.calls == 0